@@ -6,10 +6,13 @@ the GeneratorAgent. It can be passed as an execution_callback to the
 OrchestratorAgent to enable automated script execution and validation.
 """
 
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+from ai_designer.core.admission import STAGE_EXECUTOR, get_latency_tracker
+from ai_designer.core.deadline import budget_timeout
 from ai_designer.core.logging_config import get_logger
 from ai_designer.core.sandbox import ExecutionResult, execute_safe_script
 from ai_designer.freecad.headless_runner import HeadlessRunner
@@ -199,13 +202,17 @@ class FreeCADExecutor:
                     logger.error("Headless execution failed", error=exec_result.error)
 
             else:
-                # Fallback to sandbox execution
+                # Fallback to sandbox execution (no execution slots to wait for)
+                service_start = time.perf_counter()
                 exec_result: ExecutionResult = execute_safe_script(
                     script=combined_script,
-                    timeout=self.timeout,
+                    timeout=budget_timeout(self.timeout),
                     document_name=document_name,
                     freecad_path=self.freecad_path,
                 )
+                get_latency_tracker().observe(
+                    STAGE_EXECUTOR, time.perf_counter() - service_start
+                )
 
                 if exec_result.success:
                     results["success"] = True
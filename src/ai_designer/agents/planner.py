@@ -10,6 +10,8 @@ Key Features:
 - DAG validation to prevent cycles
 - Topological sorting for execution order
 - Support for multiple LLM providers via UnifiedLLMProvider
+- Optional structural plan cache that reuses task graphs for prompts that
+  differ only in their dimensions
 
 Example:
     >>> planner = PlannerAgent(llm_provider=my_provider)
@@ -24,6 +26,7 @@ from uuid import UUID
 
 from ai_designer.agents.base import BaseAgent
 from ai_designer.core.llm_provider import LLMRequest, LLMRole, UnifiedLLMProvider
+from ai_designer.redis_utils.plan_cache import PlanCache
 from ai_designer.schemas.design_state import AgentType, DesignRequest
 from ai_designer.schemas.task_graph import (
     TaskDependency,
@@ -48,6 +51,7 @@ class PlannerAgent(BaseAgent):
         agent_type: Fixed to AgentType.PLANNER
         default_temperature: Temperature for LLM sampling (default: 0.3 for consistency)
         max_retries: Maximum retry attempts for LLM failures (default: 3)
+        plan_cache: Optional template cache consulted before the LLM
     """
 
     # System prompt for task decomposition
@@ -116,6 +120,7 @@ Decompose the following design prompt into a task graph:"""
         llm_provider: UnifiedLLMProvider,
         temperature: float = 0.3,
         max_retries: int = 3,
+        plan_cache: Optional[PlanCache] = None,
     ):
         """Initialize the Planner Agent."""
         super().__init__(
@@ -124,6 +129,7 @@ Decompose the following design prompt into a task graph:"""
             max_retries=max_retries,
             temperature=temperature,
         )
+        self.plan_cache = plan_cache
 
     async def execute(self, *args: Any, **kwargs: Any) -> Any:  # noqa: D102
         """Delegate to plan() to satisfy BaseAgent contract."""
@@ -133,6 +139,7 @@ Decompose the following design prompt into a task graph:"""
         self,
         design_request: DesignRequest,
         temperature: Optional[float] = None,
+        use_cache: bool = True,
     ) -> TaskGraph:
         """Decompose a design request into a hierarchical task graph.
 
@@ -140,9 +147,15 @@ Decompose the following design prompt into a task graph:"""
         structured tasks with dependencies. Validates the resulting graph for
         cycles and ensures topological ordering is possible.
 
+        When a plan cache is configured, a structurally identical earlier
+        prompt is answered from its stored template without an LLM call.  New
+        LLM plans are not cached here: the pipeline calls ``remember_plan``
+        once the design has validated.
+
         Args:
             design_request: The design request containing prompt and parameters
             temperature: Override default temperature for this planning call
+            use_cache: Consult the plan cache first (False when replanning)
 
         Returns:
             TaskGraph: A validated DAG of tasks with dependencies
@@ -153,6 +166,11 @@ Decompose the following design prompt into a task graph:"""
         """
         temp = temperature if temperature is not None else self.default_temperature
 
+        if use_cache:
+            cached_graph = await self.cached_plan(design_request)
+            if cached_graph is not None:
+                return cached_graph
+
         logger.info(
             f"Planning task graph for request {design_request.request_id} "
             f"with prompt: {design_request.user_prompt[:100]}..."
@@ -213,6 +231,50 @@ Decompose the following design prompt into a task graph:"""
         # Should never reach here due to the raise in the loop
         raise RuntimeError("Unexpected error in plan method")
 
+    async def cached_plan(self, design_request: DesignRequest) -> Optional[TaskGraph]:
+        """Return a task graph from the plan cache, or None on a miss.
+
+        Args:
+            design_request: The design request to look up
+
+        Returns:
+            TaskGraph re-bound to this request's dimensions, or None
+        """
+        if self.plan_cache is None:
+            return None
+        return await self.plan_cache.lookup_async(
+            design_request.user_prompt, design_request.request_id
+        )
+
+    async def remember_plan(
+        self, design_request: DesignRequest, task_graph: TaskGraph
+    ) -> bool:
+        """Offer a plan whose design passed validation to the plan cache.
+
+        Args:
+            design_request: The request the plan was made for
+            task_graph: The validated task graph
+
+        Returns:
+            True if the plan was stored
+        """
+        if self.plan_cache is None:
+            return False
+        return await self.plan_cache.store_async(design_request.user_prompt, task_graph)
+
+    async def forget_plan(self, design_request: DesignRequest) -> bool:
+        """Invalidate the cached plan for a request's prompt after it failed.
+
+        Args:
+            design_request: The request whose cached plan failed
+
+        Returns:
+            True if a cached plan was removed
+        """
+        if self.plan_cache is None:
+            return False
+        return await self.plan_cache.invalidate_async(design_request.user_prompt)
+
     def _parse_llm_response(self, content: str) -> Dict[str, Any]:
         """Parse and validate LLM JSON response.
 
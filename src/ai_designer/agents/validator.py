@@ -132,6 +132,7 @@ Review the following FreeCAD design:"""
         task_graph: TaskGraph,
         generated_scripts: Dict[str, str],
         execution_result: Optional[Dict[str, any]] = None,
+        skip_llm_review: bool = False,
     ) -> ValidationResult:
         """Validate a generated design.
 
@@ -143,6 +144,8 @@ Review the following FreeCAD design:"""
             task_graph: The task graph that was executed
             generated_scripts: Dictionary of task_id -> generated Python code
             execution_result: Optional execution results from FreeCAD
+            skip_llm_review: Skip the LLM review (degraded mode under load);
+                the overall score then uses geometric and semantic scores only
 
         Returns:
             Complete validation result with scores and recommendations
@@ -169,9 +172,12 @@ Review the following FreeCAD design:"""
         result.semantic_score = result.semantic.confidence_score
 
         # 3. LLM-based review
-        result.llm_review = await self._perform_llm_review(
-            design_request, task_graph, generated_scripts, execution_result
-        )
+        if skip_llm_review:
+            logger.info("Skipping LLM review (degraded mode)")
+        else:
+            result.llm_review = await self._perform_llm_review(
+                design_request, task_graph, generated_scripts, execution_result
+            )
 
         # 4. Calculate overall score
         result.calculate_overall_score()
@@ -340,6 +346,8 @@ Review the following FreeCAD design:"""
                 detected_features.append("create_cylinder")
             if "Sphere" in script or "makeSphere" in script:
                 detected_features.append("create_sphere")
+            if "Cone" in script or "makeCone" in script:
+                detected_features.append("create_cone")
             if "Cut" in script or ".cut(" in script:
                 detected_features.append("boolean_cut")
             if "Fuse" in script or ".fuse(" in script:
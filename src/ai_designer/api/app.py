@@ -13,8 +13,13 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from ai_designer.api.deps import (
+    get_audit_writer,
+    get_redis_client,
+    get_state_cache_maintenance,
+)
 from ai_designer.api.middleware import AuthMiddleware, RateLimitMiddleware
-from ai_designer.api.routes import design, health, ws
+from ai_designer.api.routes import design, events, health, ws
 from ai_designer.core.exceptions import (
     AgentError,
     ConfigurationError,
@@ -22,6 +27,8 @@ from ai_designer.core.exceptions import (
     LLMError,
 )
 from ai_designer.core.metrics import instrument_app
+from ai_designer.redis_utils.connection import close_pools
+from ai_designer.redis_utils.pubsub_bridge import PubSubBridge, set_pubsub_bridge
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +40,38 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown operations:
     - Initialize connections (Redis, etc.)
-    - Cleanup on shutdown
+    - Start background maintenance of the Redis state cache
+    - Start the buffered audit writer
+    - Start the Pub/Sub bridge forwarding design events to WebSocket clients
+    - Cleanup on shutdown (flushes queued audit events, closes Redis pools)
     """
     logger.info("Starting FreeCAD AI Designer API")
     # Startup: Initialize any global resources here
     # (Redis connections, model loading, etc.)
+    maintenance = get_state_cache_maintenance()
+    if maintenance is not None:
+        maintenance.start()
+    audit_writer = get_audit_writer()
+    if audit_writer is not None:
+        audit_writer.start()
+    bridge = None
+    redis_client = get_redis_client()
+    if redis_client is not None:
+        bridge = PubSubBridge(redis_client, ws.manager)
+        set_pubsub_bridge(bridge)
+        await bridge.start_listener()
 
     yield
 
     # Shutdown: Cleanup resources
+    if bridge is not None:
+        await bridge.stop_listener()
+        set_pubsub_bridge(None)
+    if audit_writer is not None:
+        await audit_writer.stop()
+    if maintenance is not None:
+        await maintenance.stop()
+    await close_pools()
     logger.info("Shutting down FreeCAD AI Designer API")
 
 
@@ -175,6 +205,7 @@ def create_app() -> FastAPI:
     # Include routers
     app.include_router(health.router, tags=["Health"])
     app.include_router(design.router, prefix="/api/v1", tags=["Design"])
+    app.include_router(events.router, prefix="/api/v1", tags=["Design"])
     app.include_router(ws.router, prefix="/ws", tags=["WebSocket"])
 
     # Prometheus middleware + /metrics route (must come after routers)
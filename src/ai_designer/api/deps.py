@@ -9,6 +9,8 @@ Provides reusable dependencies for:
 """
 
 import logging
+import os
+import time
 from typing import Optional
 
 from fastapi import Depends, Header, HTTPException, status
@@ -18,9 +20,19 @@ from ai_designer.agents.generator import GeneratorAgent
 from ai_designer.agents.orchestrator import OrchestratorAgent
 from ai_designer.agents.planner import PlannerAgent
 from ai_designer.agents.validator import ValidatorAgent
+from ai_designer.core.admission import AdmissionController
 from ai_designer.core.llm_provider import UnifiedLLMProvider
 from ai_designer.export.exporter import CADExporter
+from ai_designer.export.jobs import ExportJobManager
+from ai_designer.orchestration.callbacks import PipelineWebSocketCallback
 from ai_designer.orchestration.pipeline import PipelineExecutor
+from ai_designer.redis_utils.audit import AuditLogger
+from ai_designer.redis_utils.audit_writer import BufferedAuditWriter
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.design_store import DesignStore
+from ai_designer.redis_utils.maintenance import StateCacheMaintenance
+from ai_designer.redis_utils.plan_cache import PlanCache
+from ai_designer.redis_utils.state_cache import StateCache
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +46,16 @@ _orchestrator_agent: Optional[OrchestratorAgent] = None
 _freecad_executor: Optional[FreeCADExecutor] = None
 _pipeline_executor: Optional[PipelineExecutor] = None
 _cad_exporter: Optional[CADExporter] = None
+_admission_controller: Optional[AdmissionController] = None
+_redis_client: Optional[RedisClient] = None
+_redis_retry_at: float = 0.0
+_redis_retry_delay: float = 0.0
+_plan_cache: Optional[PlanCache] = None
+_design_store: Optional[DesignStore] = None
+_audit_logger: Optional[AuditLogger] = None
+_audit_writer: Optional[BufferedAuditWriter] = None
+_export_jobs: Optional[ExportJobManager] = None
+_state_cache_maintenance: Optional[StateCacheMaintenance] = None
 
 
 def get_llm_provider() -> UnifiedLLMProvider:
@@ -63,6 +85,153 @@ def get_llm_provider() -> UnifiedLLMProvider:
     return _llm_provider
 
 
+def get_redis_client() -> Optional[RedisClient]:
+    """
+    Get the shared Redis client.
+
+    Connection settings come from REDIS_URL (or REDIS_HOST, REDIS_PORT and
+    REDIS_DB); connections are drawn from the worker's shared pool.  While
+    Redis is unreachable, connecting is retried on later calls with
+    exponential backoff (REDIS_RECONNECT_MIN_SECONDS, default 1, up to
+    REDIS_RECONNECT_MAX_SECONDS, default 60); callers treat None as
+    "no Redis for now".
+
+    Returns:
+        Connected Redis client, or None if Redis is unreachable
+    """
+    global _redis_client, _redis_retry_at, _redis_retry_delay
+
+    if _redis_client is None and time.monotonic() >= _redis_retry_at:
+        client = RedisClient.from_env()
+        if client.connect():
+            _redis_client = client
+            _redis_retry_delay = 0.0
+            logger.info("Initialized RedisClient")
+        else:
+            _redis_retry_delay = min(
+                max(
+                    _redis_retry_delay * 2,
+                    float(os.getenv("REDIS_RECONNECT_MIN_SECONDS", "1")),
+                ),
+                float(os.getenv("REDIS_RECONNECT_MAX_SECONDS", "60")),
+            )
+            _redis_retry_at = time.monotonic() + _redis_retry_delay
+            logger.warning(
+                "Redis unavailable; Redis-backed caches are disabled "
+                f"(retrying in {_redis_retry_delay:.0f}s)"
+            )
+
+    return _redis_client
+
+
+def get_plan_cache() -> Optional[PlanCache]:
+    """
+    Get the planner template cache.
+
+    Disabled with PLAN_CACHE_ENABLED=0 or when Redis is unavailable.
+
+    Returns:
+        Plan cache instance, or None
+    """
+    global _plan_cache
+
+    if _plan_cache is None and os.getenv("PLAN_CACHE_ENABLED", "1") == "1":
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            _plan_cache = PlanCache(redis_client)
+            logger.info("Initialized PlanCache")
+
+    return _plan_cache
+
+
+def get_design_store() -> DesignStore:
+    """
+    Get the design store shared by the design endpoints.
+
+    Designs are persisted in Redis when it is reachable, otherwise kept in a
+    bounded in-process store.
+
+    Returns:
+        Design store instance
+    """
+    global _design_store
+
+    if _design_store is None:
+        redis_client = get_redis_client()
+        state_cache = StateCache(redis_client) if redis_client is not None else None
+        _design_store = DesignStore(state_cache=state_cache)
+        logger.info(
+            f"Initialized DesignStore ({'redis' if state_cache else 'local-only'})"
+        )
+    elif not _design_store.is_shared:
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            _design_store.attach(StateCache(redis_client))
+
+    return _design_store
+
+
+def get_state_cache_maintenance() -> Optional[StateCacheMaintenance]:
+    """
+    Get the background state-cache maintenance task.
+
+    Disabled with STATE_CACHE_MAINTENANCE_INTERVAL_SECONDS=0 or when Redis
+    is unavailable.
+
+    Returns:
+        Maintenance task (not yet started), or None
+    """
+    global _state_cache_maintenance
+
+    interval = float(os.getenv("STATE_CACHE_MAINTENANCE_INTERVAL_SECONDS", "86400"))
+    if _state_cache_maintenance is None and interval > 0:
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            _state_cache_maintenance = StateCacheMaintenance(
+                StateCache(redis_client), interval_seconds=interval
+            )
+            logger.info("Initialized StateCacheMaintenance")
+
+    return _state_cache_maintenance
+
+
+def get_audit_logger() -> Optional[AuditLogger]:
+    """
+    Get the audit trail logger.
+
+    Returns:
+        Audit logger writing to Redis Streams, or None if Redis is unavailable
+    """
+    global _audit_logger
+
+    if _audit_logger is None:
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            _audit_logger = AuditLogger(redis_client)
+            logger.info("Initialized AuditLogger")
+
+    return _audit_logger
+
+
+def get_audit_writer() -> Optional[BufferedAuditWriter]:
+    """
+    Get the buffered audit writer used on the pipeline hot path.
+
+    Returns:
+        Writer batching events into the audit logger's streams (started by
+        the app lifespan), or None if Redis is unavailable
+    """
+    global _audit_writer
+
+    if _audit_writer is None:
+        audit_logger = get_audit_logger()
+        if audit_logger is not None:
+            _audit_writer = BufferedAuditWriter(audit_logger)
+            logger.info("Initialized BufferedAuditWriter")
+
+    return _audit_writer
+
+
 def get_planner_agent(
     llm_provider: UnifiedLLMProvider = Depends(get_llm_provider),
 ) -> PlannerAgent:
@@ -78,7 +247,9 @@ def get_planner_agent(
     global _planner_agent
 
     if _planner_agent is None:
-        _planner_agent = PlannerAgent(llm_provider=llm_provider)
+        _planner_agent = PlannerAgent(
+            llm_provider=llm_provider, plan_cache=get_plan_cache()
+        )
         logger.info("Initialized PlannerAgent")
 
     return _planner_agent
@@ -225,12 +396,19 @@ def get_pipeline_executor(
     global _pipeline_executor
 
     if _pipeline_executor is None:
+        # Node events go through the buffered audit writer; its PUBLISH
+        # reaches WebSocket/SSE clients via the PubSubBridge.
+        audit_writer = get_audit_writer()
         _pipeline_executor = PipelineExecutor(
             planner=planner,
             generator=generator,
             validator=validator,
             executor=executor,
-            websocket_callback=None,  # Will be set when WebSocket manager is ready
+            websocket_callback=(
+                PipelineWebSocketCallback(None, audit_writer)
+                if audit_writer is not None
+                else None
+            ),
             max_iterations=5,
         )
         logger.info("Initialized PipelineExecutor with LangGraph")
@@ -257,6 +435,44 @@ def get_cad_exporter() -> CADExporter:
     return _cad_exporter
 
 
+def get_export_job_manager() -> ExportJobManager:
+    """
+    Get the background export job manager.
+
+    Job records are shared through Redis when it is reachable.
+
+    Returns:
+        Export job manager using the shared CAD exporter
+    """
+    global _export_jobs
+
+    if _export_jobs is None:
+        _export_jobs = ExportJobManager(
+            get_cad_exporter(), redis_client=get_redis_client()
+        )
+        logger.info("Initialized ExportJobManager")
+    elif _export_jobs.redis_client is None:
+        _export_jobs.redis_client = get_redis_client()
+
+    return _export_jobs
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Get the admission controller instance.
+
+    Returns:
+        Admission controller shared by design endpoints and health checks
+    """
+    global _admission_controller
+
+    if _admission_controller is None:
+        _admission_controller = AdmissionController()
+        logger.info("Initialized AdmissionController")
+
+    return _admission_controller
+
+
 def reset_dependencies() -> None:
     """
     Reset all global dependency instances.
@@ -265,6 +481,9 @@ def reset_dependencies() -> None:
     """
     global _llm_provider, _planner_agent, _generator_agent, _validator_agent
     global _orchestrator_agent, _freecad_executor, _pipeline_executor, _cad_exporter
+    global _admission_controller, _redis_client, _redis_retry_at, _redis_retry_delay
+    global _plan_cache, _design_store, _audit_logger, _audit_writer, _export_jobs
+    global _state_cache_maintenance
 
     _llm_provider = None
     _planner_agent = None
@@ -274,5 +493,15 @@ def reset_dependencies() -> None:
     _freecad_executor = None
     _pipeline_executor = None
     _cad_exporter = None
+    _admission_controller = None
+    _redis_client = None
+    _redis_retry_at = 0.0
+    _redis_retry_delay = 0.0
+    _plan_cache = None
+    _design_store = None
+    _audit_logger = None
+    _audit_writer = None
+    _export_jobs = None
+    _state_cache_maintenance = None
 
     logger.info("Reset all dependency instances")
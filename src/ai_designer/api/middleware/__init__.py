@@ -3,7 +3,7 @@ API middleware package.
 
 Provides:
 - auth: JWT Bearer token validation
-- rate_limit: Redis sliding-window rate limiter
+- rate_limit: Redis GCRA rate limiter with route costs and token leases
 """
 
 from .auth import AuthMiddleware, get_current_user, require_auth
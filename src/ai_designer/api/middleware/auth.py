@@ -22,17 +22,42 @@ AUTH_ALGORITHM    JWT algorithm (default: HS256).
 AUTH_DISABLED     Set to "1" to bypass authentication (dev only).
 AUTH_EXEMPT_PATHS Comma-separated URL prefixes that skip auth.
                   Defaults: /health, /docs, /redoc, /openapi.json, /metrics
+AUTH_TOKEN_CACHE_SIZE         Verified tokens kept in memory (default 4096, 0 = off).
+AUTH_TOKEN_CACHE_MAX_SECONDS  Upper bound on how long a verified token is
+                              reused, also for tokens without ``exp``
+                              (default 300).
+AUTH_REVOCATION_SET           Redis set of revoked token IDs (``jti`` claim, or
+                              the token's SHA-256 hex digest when it has none).
+                              Empty (default) disables revocation checks.
+AUTH_REVOCATION_CHECK_SECONDS How often a cached token is re-checked against
+                              the revocation set (default 5).
+AUTH_REDIS_URL                Redis for revocation checks (default the shared
+                              REDIS_URL, on the shared connection pool).
+
+Verified-token cache
+--------------------
+Signature verification runs once per token.  The claims of verified tokens
+are kept in a bounded LRU keyed by the token's SHA-256 digest (raw tokens
+are never stored) until the token's ``exp`` or ``AUTH_TOKEN_CACHE_MAX_SECONDS``,
+whichever comes first, so repeated requests such as status polls skip the
+crypto.  Revocation lookups fail open when Redis is unreachable.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from ai_designer.core.metrics import AUTH_TOKEN_CACHE_REQUESTS_TOTAL
+
 logger = logging.getLogger(__name__)
 
 # ── Config ────────────────────────────────────────────────────────────────────
@@ -47,6 +72,15 @@ _EXEMPT_PREFIXES: list[str] = [
     ).split(",")
     if p.strip()
 ]
+_TOKEN_CACHE_SIZE: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "4096"))
+_TOKEN_CACHE_MAX_SECONDS: float = float(
+    os.getenv("AUTH_TOKEN_CACHE_MAX_SECONDS", "300")
+)
+_REVOCATION_SET: str = os.getenv("AUTH_REVOCATION_SET", "")
+_REVOCATION_CHECK_SECONDS: float = float(
+    os.getenv("AUTH_REVOCATION_CHECK_SECONDS", "5")
+)
+_REDIS_URL: str | None = os.getenv("AUTH_REDIS_URL") or None
 
 # ── Optional jose import ──────────────────────────────────────────────────────
 try:
@@ -95,6 +129,120 @@ def _decode_token(token: str) -> dict[str, Any]:
         ) from exc
 
 
+# ── Verified-token cache ──────────────────────────────────────────────────────
+
+
+class _TokenCache:
+    """Bounded LRU of token digest -> (claims, valid_until, revocation_checked_at)."""
+
+    def __init__(self, max_entries: int, max_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.max_seconds = max_seconds
+        self._entries: OrderedDict[bytes, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: bytes) -> list | None:
+        """Cached entry of a still-valid token, or None."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return entry
+
+    def put(self, digest: bytes, claims: dict[str, Any]) -> list:
+        """Cache verified claims until ``exp`` (capped at ``max_seconds``)."""
+        now = time.time()
+        valid_until = now + self.max_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            valid_until = min(valid_until, float(exp))
+        entry = [claims, valid_until, 0.0]
+        if self.max_entries <= 0:
+            return entry
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def discard(self, digest: bytes) -> None:
+        with self._lock:
+            self._entries.pop(digest, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = _TokenCache(_TOKEN_CACHE_SIZE, _TOKEN_CACHE_MAX_SECONDS)
+_revocation_redis: Any | None = None  # override (tests); None -> per-loop client
+
+
+def _revocation_client() -> Any | None:
+    """
+    Async Redis client used for revocation checks, on the running loop's
+    shared pool (not memoised: async connections belong to one loop).
+    """
+    if _revocation_redis is not None:
+        return _revocation_redis
+    try:
+        from ai_designer.redis_utils.connection import get_async_redis
+
+        return get_async_redis(_REDIS_URL, decode_responses=True)
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Token revocation checks disabled: %s", exc)
+        return None
+
+
+async def _is_revoked(claims: dict[str, Any], digest: bytes) -> bool:
+    """Check the token against ``AUTH_REVOCATION_SET`` (fail-open)."""
+    client = _revocation_client()
+    if client is None:
+        return False
+    token_id = str(claims.get("jti") or digest.hex())
+    try:
+        return bool(await client.sismember(_REVOCATION_SET, token_id))
+    except Exception as exc:
+        logger.warning("Token revocation check failed (fail-open): %s", exc)
+        return False
+
+
+async def _authenticate(token: str) -> dict[str, Any]:
+    """
+    Verified claims of a token, from the cache when possible.
+
+    Raises
+    ------
+    HTTPException 401  on invalid / expired / revoked tokens.
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    entry = _token_cache.get(digest)
+    if entry is not None:
+        outcome = "hit"
+    else:
+        outcome = "miss"
+        entry = _token_cache.put(digest, _decode_token(token))
+
+    if _REVOCATION_SET and time.time() - entry[2] >= _REVOCATION_CHECK_SECONDS:
+        if await _is_revoked(entry[0], digest):
+            _token_cache.discard(digest)
+            AUTH_TOKEN_CACHE_REQUESTS_TOTAL.labels(outcome="revoked").inc()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked.",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        entry[2] = time.time()
+
+    AUTH_TOKEN_CACHE_REQUESTS_TOTAL.labels(outcome=outcome).inc()
+    return entry[0]
+
+
 # ── FastAPI dependency ────────────────────────────────────────────────────────
 
 _bearer_scheme = HTTPBearer(auto_error=False)
@@ -118,7 +266,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return _decode_token(credentials.credentials)
+    return await _authenticate(credentials.credentials)
 
 
 async def require_auth(
@@ -175,7 +323,7 @@ class AuthMiddleware:
 
         token = auth_value[7:].strip()
         try:
-            payload = _decode_token(token)
+            payload = await _authenticate(token)
         except HTTPException as exc:
             await self._send_401(send, exc.detail)
             return
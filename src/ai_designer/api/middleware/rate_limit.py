@@ -1,15 +1,32 @@
 """
-Redis sliding-window rate-limit middleware.
+Redis GCRA rate-limit middleware.
 
 Algorithm
 ---------
-For each (client_key, window_start) we keep a Redis sorted-set whose members
-are individual request timestamps (as floats).  On each request:
-
-1. Remove entries older than ``window_seconds``.
-2. Count remaining entries.
-3. If count >= ``max_requests``, respond with 429.
-4. Otherwise, add the current timestamp and set TTL.
+Each client is limited with the Generic Cell Rate Algorithm: a token bucket
+of ``max_requests`` tokens refilled evenly over ``window_seconds``.  The only
+state is the client's "theoretical arrival time" (TAT), one integer in
+Redis, so memory per client is constant whatever the limit.  On each
+request a Lua script (run with EVALSHA, one round trip, atomic):
+
+1. Reads the TAT (Redis server clock, so API workers need not agree on time).
+2. Rejects the request if it would push the TAT more than one window ahead,
+   returning how long until enough tokens have been refilled.
+3. Otherwise advances the TAT by the request's cost and sets a TTL.
+
+Route costs: a request consumes ``cost`` tokens, taken from
+``RATE_LIMIT_ROUTE_COSTS`` by method and route template, so starting a
+design counts more than polling its status.  Templates match whole paths
+segment by segment; a ``{param}`` segment matches any single segment, so
+``POST /api/v1/design`` neither covers ``/api/v1/designs:query`` nor
+``/api/v1/design/{id}/refine``.
+
+Token leases: with ``RATE_LIMIT_LEASE_TOKENS`` > 0 an allowed request also
+reserves up to that many extra tokens (only as many as are available) for
+``RATE_LIMIT_LEASE_SECONDS``.  Following requests of the same client spend
+the lease in-process without touching Redis.  Unused leased tokens are not
+returned, so a client may be limited up to one lease early; keep leases
+small relative to ``max_requests``.
 
 The client key is taken from (in priority order):
   - Authenticated user ``sub`` on ``request.state.user``
@@ -18,19 +35,29 @@ The client key is taken from (in priority order):
 
 Configuration (env vars or constructor kwargs)
 ----------------------------------------------
-RATE_LIMIT_MAX_REQUESTS   int, default 60
+RATE_LIMIT_MAX_REQUESTS   int, default 60 (tokens per window)
 RATE_LIMIT_WINDOW_SECONDS int, default 60
-RATE_LIMIT_REDIS_URL      str, default redis://localhost:6379/0
+RATE_LIMIT_REDIS_URL      str, default the shared REDIS_URL (see
+                          redis_utils.connection; same connection pool)
 RATE_LIMIT_DISABLED       "1" to bypass globally (dev/test)
 RATE_LIMIT_EXEMPT_PATHS   comma-separated prefixes that skip limiting
                           Defaults: /health, /metrics
+RATE_LIMIT_ROUTE_COSTS    comma-separated "METHOD /route/{param}=cost"
+                          entries, other requests cost 1.  Defaults:
+                          POST /api/v1/design=5,
+                          POST /api/v1/design/{request_id}/refine=5,
+                          POST /api/v1/designs:batch=20
+RATE_LIMIT_LEASE_TOKENS   int, default 0 (leases disabled)
+RATE_LIMIT_LEASE_SECONDS  float, default 1.0
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import os
 import time
+from collections import OrderedDict
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -38,17 +65,27 @@ logger = logging.getLogger(__name__)
 # ── Config ────────────────────────────────────────────────────────────────────
 _MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "60"))
 _WINDOW_SECONDS: int = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60"))
-_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+_REDIS_URL: str | None = os.getenv("RATE_LIMIT_REDIS_URL") or None
 _DISABLED: bool = os.getenv("RATE_LIMIT_DISABLED", "0") == "1"
 _EXEMPT_PREFIXES: list[str] = [
     p.strip()
     for p in os.getenv("RATE_LIMIT_EXEMPT_PATHS", "/health,/metrics").split(",")
     if p.strip()
 ]
+_ROUTE_COSTS_SPEC: str = os.getenv(
+    "RATE_LIMIT_ROUTE_COSTS",
+    "POST /api/v1/design=5,POST /api/v1/design/{request_id}/refine=5,"
+    "POST /api/v1/designs:batch=20",
+)
+_LEASE_TOKENS: int = int(os.getenv("RATE_LIMIT_LEASE_TOKENS", "0"))
+_LEASE_SECONDS: float = float(os.getenv("RATE_LIMIT_LEASE_SECONDS", "1.0"))
+
+# Clients whose lease is tracked in-process
+_MAX_LEASES = 10_000
 
 # ── Optional redis import ─────────────────────────────────────────────────────
 try:
-    import redis.asyncio as aioredis  # type: ignore[import]
+    from ai_designer.redis_utils.connection import get_async_redis
 
     _REDIS_AVAILABLE = True
 except ModuleNotFoundError:  # pragma: no cover
@@ -58,82 +95,131 @@ except ModuleNotFoundError:  # pragma: no cover
 
 def _get_redis_pool() -> Any | None:
     """
-    Lazily create a single async Redis connection pool.
+    Async Redis client on the worker's shared pool for the running loop.
     Returns None when Redis is unavailable.
     """
     if not _REDIS_AVAILABLE:
         return None
     try:
-        return aioredis.from_url(
-            _REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
-            socket_connect_timeout=1,
-        )
+        return get_async_redis(_REDIS_URL, decode_responses=True)
     except Exception as exc:  # pragma: no cover
         logger.warning("Could not create Redis connection pool: %s", exc)
         return None
 
 
-_redis_pool: Any | None = None  # module-level singleton
+_redis_pool: Any | None = None  # override (tests); None -> per-loop client
 
 
 def _redis() -> Any | None:
-    global _redis_pool
-    if _redis_pool is None:
-        _redis_pool = _get_redis_pool()
-    return _redis_pool
+    # Not memoised: async connections belong to one event loop, and
+    # get_async_redis already caches the pool per loop.
+    if _redis_pool is not None:
+        return _redis_pool
+    return _get_redis_pool()
 
 
 # ── Rate-limit logic ──────────────────────────────────────────────────────────
 
+# KEYS[1] client key; ARGV: emission interval (ms per token), window (ms),
+# cost, extra tokens to lease.  Returns {allowed, remaining, retry_after_ms,
+# leased}.
+_GCRA_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local lease = tonumber(ARGV[4])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+
+local available = math.floor((window - (tat - now)) / emission)
+if available < cost then
+    return {0, 0, math.ceil(tat + emission * cost - window - now), 0}
+end
+
+local granted = math.min(cost + lease, available)
+local new_tat = tat + emission * granted
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, available - granted, 0, granted - cost}
+"""
+
+_gcra_script: Any | None = None
+
+
+def _parse_route_costs(spec: str) -> list[tuple[str, str, int]]:
+    """
+    Parse ``"METHOD /route=cost,..."`` into (method, route, cost) entries,
+    routes with fewer ``{param}`` segments first.
+    """
+    costs = []
+    for entry in spec.split(","):
+        route, _, cost = entry.strip().rpartition("=")
+        method, _, prefix = route.strip().partition(" ")
+        if not method or not prefix.strip() or not cost.strip().isdigit():
+            if entry.strip():
+                logger.warning("Ignoring malformed rate-limit route cost %r", entry)
+            continue
+        costs.append((method.upper(), prefix.strip(), int(cost)))
+    return sorted(costs, key=lambda c: c[1].count("{"))
+
+
+def _route_matches(route: str, path: str) -> bool:
+    """True if ``path`` matches the ``route`` template segment by segment."""
+    route_parts = route.strip("/").split("/")
+    path_parts = path.strip("/").split("/")
+    if len(route_parts) != len(path_parts):
+        return False
+    return all(
+        (r.startswith("{") and r.endswith("}") and p) or r == p
+        for r, p in zip(route_parts, path_parts)
+    )
+
 
 async def _check_rate_limit(
     client_key: str,
     max_requests: int,
     window_seconds: int,
-) -> tuple[bool, int, int]:
+    cost: int = 1,
+    lease: int = 0,
+) -> tuple[bool, int, int, int]:
     """
-    Check whether the client has exceeded the rate limit.
+    Check whether the client has exceeded the rate limit, in one Redis call.
 
     Returns
     -------
-    (allowed, remaining, retry_after_seconds)
+    (allowed, remaining, retry_after_seconds, leased_tokens)
     """
+    global _gcra_script
     pool = _redis()
     if pool is None:
         # Fail-open: allow the request if Redis is unavailable
-        return True, max_requests, 0
+        return True, max_requests, 0, 0
 
-    now = time.time()
-    window_start = now - window_seconds
-    redis_key = f"rate_limit:{client_key}"
+    window_ms = window_seconds * 1000
+    cost = min(max(cost, 1), max_requests)
 
     try:
-        pipe = pool.pipeline()
-        # Remove old entries
-        pipe.zremrangebyscore(redis_key, "-inf", window_start)
-        # Count entries in current window
-        pipe.zcard(redis_key)
-        # Add current request
-        pipe.zadd(redis_key, {str(now): now})
-        # Reset TTL
-        pipe.expire(redis_key, window_seconds * 2)
-        results = await pipe.execute()
-
-        count: int = results[1]  # count BEFORE adding current request
-
-        if count >= max_requests:
-            remaining = 0
-            retry_after = int(window_seconds - (now - window_start))
-            return False, remaining, max(retry_after, 1)
-
-        remaining = max_requests - count - 1
-        return True, remaining, 0
-
+        if _gcra_script is None:
+            # EVALSHA, falling back to SCRIPT LOAD once if the script is not
+            # cached.  The script only holds its SHA, so it is run on the
+            # current loop's client rather than the one it was registered on.
+            _gcra_script = pool.register_script(_GCRA_SCRIPT)
+        allowed, remaining, retry_after_ms, leased = await _gcra_script(
+            keys=[f"rate_limit:{client_key}"],
+            args=[window_ms / max_requests, window_ms, cost, lease],
+            client=pool,
+        )
     except Exception as exc:  # pragma: no cover
         logger.warning("Rate-limit Redis error (fail-open): %s", exc)
-        return True, max_requests, 0
+        return True, max_requests, 0, 0
+
+    if not allowed:
+        return False, 0, max(math.ceil(int(retry_after_ms) / 1000), 1), 0
+    return True, int(remaining), 0, int(leased)
 
 
 # ── Middleware class ──────────────────────────────────────────────────────────
@@ -141,13 +227,16 @@ async def _check_rate_limit(
 
 class RateLimitMiddleware:
     """
-    ASGI middleware for sliding-window rate limiting backed by Redis.
+    ASGI middleware for GCRA rate limiting backed by Redis.
 
     Parameters
     ----------
     app             ASGI application.
-    max_requests    Requests allowed per window (overrides env var).
-    window_seconds  Rolling window duration in seconds (overrides env var).
+    max_requests    Tokens per window (overrides env var).
+    window_seconds  Time to refill the full bucket (overrides env var).
+    route_costs     "METHOD /route=cost" spec (overrides env var).
+    lease_tokens    Extra tokens reserved per Redis call (overrides env var).
+    lease_seconds   Lifetime of an in-process lease (overrides env var).
     """
 
     def __init__(
@@ -155,10 +244,18 @@ class RateLimitMiddleware:
         app: Any,
         max_requests: int = _MAX_REQUESTS,
         window_seconds: int = _WINDOW_SECONDS,
+        route_costs: str = _ROUTE_COSTS_SPEC,
+        lease_tokens: int = _LEASE_TOKENS,
+        lease_seconds: float = _LEASE_SECONDS,
     ) -> None:
         self.app = app
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self.route_costs = _parse_route_costs(route_costs)
+        self.lease_tokens = lease_tokens
+        self.lease_seconds = lease_seconds
+        # client_key -> [tokens, expires_at (monotonic), remaining in Redis]
+        self._leases: OrderedDict[str, list] = OrderedDict()
 
     async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
         if scope["type"] != "http":
@@ -172,10 +269,9 @@ class RateLimitMiddleware:
             return
 
         client_key = self._resolve_client_key(scope)
+        cost = self._route_cost(scope.get("method", "GET"), path)
 
-        allowed, remaining, retry_after = await _check_rate_limit(
-            client_key, self.max_requests, self.window_seconds
-        )
+        allowed, remaining, retry_after = await self._acquire(client_key, cost)
 
         if not allowed:
             await self._send_429(send, remaining, retry_after)
@@ -190,12 +286,53 @@ class RateLimitMiddleware:
                     (b"x-ratelimit-limit", str(self.max_requests).encode()),
                     (b"x-ratelimit-remaining", str(remaining).encode()),
                     (b"x-ratelimit-window", str(self.window_seconds).encode()),
+                    (b"x-ratelimit-cost", str(cost).encode()),
                 ]
                 message = {**message, "headers": headers}
             await send(message)
 
         await self.app(scope, receive, send_with_headers)
 
+    async def _acquire(self, client_key: str, cost: int) -> tuple[bool, int, int]:
+        """
+        Take ``cost`` tokens, from the client's lease when it covers them.
+
+        Returns
+        -------
+        (allowed, remaining, retry_after_seconds)
+        """
+        now = time.monotonic()
+        lease = self._leases.get(client_key)
+        if lease is not None:
+            tokens, expires_at, redis_remaining = lease
+            if expires_at > now and tokens >= cost:
+                lease[0] -= cost
+                self._leases.move_to_end(client_key)
+                return True, lease[0] + redis_remaining, 0
+            del self._leases[client_key]
+
+        allowed, remaining, retry_after, leased = await _check_rate_limit(
+            client_key,
+            self.max_requests,
+            self.window_seconds,
+            cost=cost,
+            lease=self.lease_tokens,
+        )
+        if leased > 0:
+            self._leases[client_key] = [leased, now + self.lease_seconds, remaining]
+            while len(self._leases) > _MAX_LEASES:
+                self._leases.popitem(last=False)
+            remaining += leased
+        return allowed, remaining, retry_after
+
+    def _route_cost(self, method: str, path: str) -> int:
+        """Tokens a request consumes (first matching route, default 1)."""
+        method = method.upper()
+        for route_method, route, cost in self.route_costs:
+            if route_method == method and _route_matches(route, path):
+                return cost
+        return 1
+
     # ── Helpers ──────────────────────────────────────────────────────────────
 
     @staticmethod
@@ -2,6 +2,6 @@
 API route modules.
 """
 
-from ai_designer.api.routes import design, health, ws
+from ai_designer.api.routes import design, events, health, ws
 
-__all__ = ["design", "health", "ws"]
+__all__ = ["design", "events", "health", "ws"]
@@ -2,31 +2,59 @@
 Design creation and management endpoints.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 
 from ai_designer.agents.executor import FreeCADExecutor
 from ai_designer.agents.orchestrator import OrchestratorAgent
 from ai_designer.api.deps import (
+    get_admission_controller,
+    get_audit_writer,
     get_cad_exporter,
+    get_design_store,
+    get_export_job_manager,
     get_freecad_executor,
     get_orchestrator_agent,
     get_pipeline_executor,
 )
+from ai_designer.api.middleware.rate_limit import RateLimitMiddleware
+from ai_designer.core.admission import AdmissionController, AdmissionDecision
+from ai_designer.core.deadline import DEFAULT_DEADLINE_SECONDS, Deadline
+from ai_designer.export.artifacts import load_artifact
 from ai_designer.export.exporter import CADExporter
+from ai_designer.export.jobs import ExportJob, ExportJobManager, ExportJobStatus
 from ai_designer.orchestration.pipeline import PipelineExecutor
 from ai_designer.redis_utils.audit import AuditEventType
+from ai_designer.redis_utils.design_store import DesignStore
 from ai_designer.schemas.api_schemas import (
+    MAX_BATCH_SIZE,
+    DesignBatchCreateRequest,
+    DesignBatchItem,
+    DesignBatchResponse,
+    DesignBulkStatusRequest,
+    DesignBulkStatusResponse,
     DesignCreateRequest,
     DesignResponse,
     DesignStatusResponse,
+    DesignSummary,
 )
 from ai_designer.schemas.design_state import DesignRequest as DesignRequestSchema
 from ai_designer.schemas.design_state import DesignState, ExecutionStatus
@@ -39,6 +67,16 @@ router = APIRouter()
 # Keep DesignRequest as alias for backward compatibility within this module
 DesignRequest = DesignCreateRequest
 
+# Upper bound for ?wait= long-polls on the status endpoint
+MAX_STATUS_WAIT_SECONDS = 60
+
+# Content types of downloadable export formats
+_EXPORT_MEDIA_TYPES = {
+    "step": "application/step",
+    "stl": "application/vnd.ms-pki.stl",
+    "fcstd": "application/octet-stream",
+}
+
 
 class RefinementRequest(BaseModel):
     """Request to refine a design based on feedback."""
@@ -63,8 +101,26 @@ class ExportResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
-# Temporary in-memory storage (will be replaced with Redis)
-_designs: Dict[str, DesignState] = {}
+class ExportJobResponse(BaseModel):
+    """Status of a background export job."""
+
+    job_id: str = Field(..., description="Export job ID")
+    request_id: str = Field(..., description="Design request ID")
+    format: str = Field(..., description="Export format")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    created_at: str = Field(..., description="Job creation timestamp")
+    finished_at: Optional[str] = Field(None, description="Job completion timestamp")
+    file_size_bytes: Optional[int] = Field(None, description="File size in bytes")
+    cache_hit: bool = Field(False, description="Whether the export was cached")
+    speculative: bool = Field(False, description="Started before it was requested")
+    error: Optional[str] = Field(None, description="Error message if failed")
+    download_url: Optional[str] = Field(None, description="Set once succeeded")
+
+
+class ExportJobsResponse(BaseModel):
+    """Jobs created or reused by an export request."""
+
+    jobs: List[ExportJobResponse]
 
 
 @router.post(
@@ -73,7 +129,12 @@ _designs: Dict[str, DesignState] = {}
 async def create_design(
     request: DesignRequest,
     background_tasks: BackgroundTasks,
+    response: Response,
+    http_request: Request,
     pipeline: PipelineExecutor = Depends(get_pipeline_executor),
+    admission: AdmissionController = Depends(get_admission_controller),
+    store: DesignStore = Depends(get_design_store),
+    export_jobs: ExportJobManager = Depends(get_export_job_manager),
 ) -> DesignResponse:
     """
     Submit a new design request.
@@ -86,53 +147,288 @@ async def create_design(
     5. Conditional routing: success/refine/replan/fail
     6. Iterate if needed (up to max_iterations)
 
+    The request gets an end-to-end deadline (PIPELINE_DEADLINE_SECONDS) that
+    bounds every node, LLM call and FreeCAD job in the pipeline.
+
+    Requests pass admission control first.  Under load they may be admitted
+    in degraded mode (no LLM review, fewer iterations; signalled by the
+    ``X-Admission-Mode: degraded`` header) or rejected with 503 and a
+    ``Retry-After`` header.
+
+    When the design completes, the export formats this client usually
+    requests are generated speculatively.
+
     Args:
         request: Design parameters
         background_tasks: FastAPI background tasks
+        response: Outgoing response (for admission headers)
+        http_request: Raw HTTP request (identifies the client)
         pipeline: LangGraph pipeline executor
+        admission: Admission controller
+        store: Design store
+        export_jobs: Export job manager for speculative exports
 
     Returns:
         Design request ID and initial status
+
+    Raises:
+        HTTPException: 503 if the request cannot be served within the SLO
     """
+    decision = _admit_or_reject(admission, request.max_iterations, response)
+
     request_id = uuid4()
     now = datetime.utcnow()
 
+    # End-to-end time budget; queueing time counts against it
+    deadline = Deadline.after(DEFAULT_DEADLINE_SECONDS).expires_at
+
     # Create initial design state
     design_state = DesignState(
         request_id=request_id,
         user_prompt=request.prompt,
-        max_iterations=request.max_iterations,
+        max_iterations=decision.max_iterations,
     )
 
-    # Store in temporary storage
-    _designs[str(request_id)] = design_state
+    await store.save_async(design_state)
 
     # Add background task to process the design via LangGraph pipeline
     background_tasks.add_task(
         _process_design_pipeline,
         request_id,
         request.prompt,
-        request.max_iterations,
+        decision.max_iterations,
         pipeline,
+        decision.skip_llm_review,
+        admission,
+        deadline,
+        store,
+        export_jobs,
+        _client_key(http_request),
     )
 
     logger.info(f"Created design request {request_id}: {request.prompt[:50]}...")
 
+    message = "Design request accepted and queued for processing (LangGraph pipeline)"
+    if decision.degraded:
+        message = (
+            "Design request accepted in degraded mode due to load "
+            f"(max_iterations={decision.max_iterations}, LLM review skipped)"
+        )
+
     return DesignResponse(
         request_id=str(request_id),
         status=ExecutionStatus.PENDING,
-        message="Design request accepted and queued for processing (LangGraph pipeline)",
+        message=message,
         created_at=now,
     )
 
 
-@router.get("/design/{request_id}", response_model=DesignStatusResponse)
-async def get_design_status(request_id: str) -> DesignStatusResponse:
+@router.post(
+    "/designs:batch",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=DesignBatchResponse,
+)
+async def create_design_batch(
+    batch: DesignBatchCreateRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    http_request: Request,
+    pipeline: PipelineExecutor = Depends(get_pipeline_executor),
+    admission: AdmissionController = Depends(get_admission_controller),
+    store: DesignStore = Depends(get_design_store),
+    export_jobs: ExportJobManager = Depends(get_export_job_manager),
+) -> DesignBatchResponse:
+    """
+    Submit many design requests that share the same options.
+
+    Identical prompts (ignoring surrounding and repeated whitespace) are
+    submitted once; their items point at the first occurrence through
+    ``duplicate_of`` and carry its request ID.  Every distinct prompt passes
+    admission control on its own, so under load a batch may be accepted
+    partially: rejected items have no request ID and a
+    ``retry_after_seconds``.  All accepted designs are persisted in one
+    pipelined write and processed concurrently.
+
+    Args:
+        batch: Prompts and shared design options
+        background_tasks: FastAPI background tasks
+        response: Outgoing response (for admission headers)
+        http_request: Raw HTTP request (identifies the client)
+        pipeline: LangGraph pipeline executor
+        admission: Admission controller
+        store: Design store
+        export_jobs: Export job manager for speculative exports
+
+    Returns:
+        Per-prompt outcome, in request order
+
+    Raises:
+        HTTPException: 503 if no prompt of the batch could be admitted
+    """
+    now = datetime.utcnow()
+    deadline = Deadline.after(DEFAULT_DEADLINE_SECONDS).expires_at
+
+    items: List[DesignBatchItem] = []
+    first_seen: Dict[str, int] = {}
+    jobs: List[Tuple[UUID, str, AdmissionDecision]] = []
+
+    for index, prompt in enumerate(batch.prompts):
+        key = " ".join(prompt.split())
+        if key in first_seen:
+            original = items[first_seen[key]]
+            items.append(
+                original.model_copy(
+                    update={"index": index, "duplicate_of": original.index}
+                )
+            )
+            continue
+        first_seen[key] = index
+
+        decision = admission.admit(batch.max_iterations)
+        if not decision.admitted:
+            items.append(
+                DesignBatchItem(
+                    index=index,
+                    accepted=False,
+                    retry_after_seconds=decision.retry_after_seconds,
+                )
+            )
+            continue
+
+        request_id = uuid4()
+        jobs.append((request_id, prompt, decision))
+        items.append(
+            DesignBatchItem(
+                index=index,
+                request_id=str(request_id),
+                accepted=True,
+                degraded=decision.degraded,
+            )
+        )
+
+    rejected = len(first_seen) - len(jobs)
+    if not jobs:
+        retry_after = max(item.retry_after_seconds or 1 for item in items)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is at capacity: no design of the batch was admitted",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    await store.save_many_async(
+        [
+            DesignState(
+                request_id=request_id,
+                user_prompt=prompt,
+                max_iterations=decision.max_iterations,
+            )
+            for request_id, prompt, decision in jobs
+        ]
+    )
+
+    background_tasks.add_task(
+        _process_design_batch,
+        jobs,
+        pipeline,
+        admission,
+        deadline,
+        store,
+        export_jobs,
+        _client_key(http_request),
+    )
+
+    if any(decision.degraded for _, _, decision in jobs):
+        response.headers["X-Admission-Mode"] = "degraded"
+
+    logger.info(
+        f"Created design batch: {len(jobs)} queued, {rejected} rejected, "
+        f"{len(batch.prompts) - len(first_seen)} duplicates"
+    )
+
+    return DesignBatchResponse(
+        items=items,
+        accepted=len(jobs),
+        rejected=rejected,
+        created_at=now,
+    )
+
+
+@router.get("/designs", response_model=DesignBulkStatusResponse)
+async def get_design_statuses(
+    ids: List[str] = Query(
+        ...,
+        description="Design IDs, comma-separated and/or as repeated parameters",
+    ),
+    store: DesignStore = Depends(get_design_store),
+) -> DesignBulkStatusResponse:
+    """
+    Get the compact status of many designs in one call.
+
+    Args:
+        ids: Design request IDs
+        store: Design store
+
+    Returns:
+        Status of every known design and the list of unknown IDs
+
+    Raises:
+        HTTPException: 400 if more than MAX_BATCH_SIZE IDs are requested
+    """
+    request_ids = [rid.strip() for value in ids for rid in value.split(",")]
+    return await _bulk_status([rid for rid in request_ids if rid], store)
+
+
+@router.post("/designs:query", response_model=DesignBulkStatusResponse)
+async def query_design_statuses(
+    query: DesignBulkStatusRequest,
+    store: DesignStore = Depends(get_design_store),
+) -> DesignBulkStatusResponse:
+    """
+    Get the compact status of many designs (body variant of ``GET /designs``).
+
+    Useful when the ID list is too long for a query string.
+
+    Args:
+        query: Design request IDs
+        store: Design store
+
+    Returns:
+        Status of every known design and the list of unknown IDs
+    """
+    return await _bulk_status(query.ids, store)
+
+
+@router.get(
+    "/design/{request_id}",
+    response_model=DesignStatusResponse,
+    responses={304: {"description": "Design unchanged since If-None-Match"}},
+)
+async def get_design_status(
+    request_id: str,
+    response: Response,
+    wait: int = Query(
+        0,
+        ge=0,
+        le=MAX_STATUS_WAIT_SECONDS,
+        description="Long-poll seconds to wait for a change (needs If-None-Match)",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    store: DesignStore = Depends(get_design_store),
+) -> DesignStatusResponse:
     """
     Get the current status of a design request.
 
+    Responses carry an ``ETag`` derived from the design's store version.
+    A request whose ``If-None-Match`` still matches gets ``304 Not Modified``
+    without the status being rebuilt.  With ``?wait=N`` such a request is
+    held for up to N seconds and answered as soon as the design changes.
+
     Args:
         request_id: Design request ID
+        response: Outgoing response (ETag header is set on it)
+        wait: Long-poll timeout in seconds (0 = answer immediately)
+        if_none_match: ETag from a previous response
+        store: Design store
 
     Returns:
         Detailed design status and results
@@ -140,7 +436,29 @@ async def get_design_status(request_id: str) -> DesignStatusResponse:
     Raises:
         HTTPException: If design request not found
     """
-    design_state = _designs.get(request_id)
+    version = await store.version_async(request_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Design request {request_id} not found",
+        )
+
+    if wait and if_none_match == _etag(version):
+        version = await store.wait_for_change(request_id, version, timeout=wait)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Design request {request_id} not found",
+            )
+
+    etag = _etag(version)
+    if if_none_match == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+
+    design_state = await store.get_async(request_id)
 
     if not design_state:
         raise HTTPException(
@@ -148,14 +466,15 @@ async def get_design_status(request_id: str) -> DesignStatusResponse:
             detail=f"Design request {request_id} not found",
         )
 
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
     # Extract relevant information
     plan_summary = None
     if design_state.task_graph_id:
         plan_summary = f"Task graph: {design_state.task_graph_id}"
 
-    validation_score = None
-    if design_state.validation_results:
-        validation_score = design_state.validation_results.get("overall_score")
+    validation_score = _validation_score(design_state)
 
     execution_result = None
     if design_state.freecad_script:
@@ -185,7 +504,10 @@ async def refine_design(
     request_id: str,
     refinement: RefinementRequest,
     background_tasks: BackgroundTasks,
+    response: Response,
     pipeline: PipelineExecutor = Depends(get_pipeline_executor),
+    admission: AdmissionController = Depends(get_admission_controller),
+    store: DesignStore = Depends(get_design_store),
 ) -> Dict[str, str]:
     """
     Submit refinement feedback for a design.
@@ -194,7 +516,10 @@ async def refine_design(
         request_id: Design request ID
         refinement: Refinement feedback
         background_tasks: FastAPI background tasks
+        response: Outgoing response (for admission headers)
         pipeline: LangGraph pipeline executor
+        admission: Admission controller
+        store: Design store
 
     Returns:
         Acknowledgment message
@@ -202,7 +527,7 @@ async def refine_design(
     Raises:
         HTTPException: If design not found or cannot be refined
     """
-    design_state = _designs.get(request_id)
+    design_state = await store.get_async(request_id)
 
     if not design_state:
         raise HTTPException(
@@ -216,16 +541,26 @@ async def refine_design(
             detail=f"Design must be completed before refinement (current status: {design_state.status})",
         )
 
+    decision = _admit_or_reject(admission, design_state.max_iterations, response)
+
     # Update prompt with refinement feedback
     updated_prompt = f"{design_state.user_prompt}\n\nRefinement: {refinement.feedback}"
 
+    # Not terminal again until the new run finishes (event streams tail it)
+    design_state.status = ExecutionStatus.REFINING
+    await store.save_async(design_state)
+
     # Add background task to reprocess via pipeline
     background_tasks.add_task(
         _process_design_pipeline,
         design_state.request_id,
         updated_prompt,
-        design_state.max_iterations,
+        decision.max_iterations,
         pipeline,
+        decision.skip_llm_review,
+        admission,
+        Deadline.after(DEFAULT_DEADLINE_SECONDS).expires_at,
+        store,
     )
 
     logger.info(f"Refinement requested for {request_id}: {refinement.feedback[:50]}...")
@@ -234,25 +569,26 @@ async def refine_design(
 
 
 @router.delete("/design/{request_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_design(request_id: str) -> None:
+async def delete_design(
+    request_id: str, store: DesignStore = Depends(get_design_store)
+) -> None:
     """
     Delete a design request and its artifacts.
 
     Args:
         request_id: Design request ID
+        store: Design store
 
     Raises:
         HTTPException: If design not found
     """
-    if request_id not in _designs:
+    # TODO: Also clean up files
+    if not await store.delete_async(request_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Design request {request_id} not found",
         )
 
-    # TODO: Also delete from Redis and clean up files
-    del _designs[request_id]
-
     logger.info(f"Deleted design request {request_id}")
 
 
@@ -265,6 +601,7 @@ async def export_design(
         pattern="^(step|stl|fcstd)(,(step|stl|fcstd))*$",
     ),
     exporter: CADExporter = Depends(get_cad_exporter),
+    store: DesignStore = Depends(get_design_store),
 ) -> Dict[str, ExportResponse]:
     """
     Export design to specified format(s).
@@ -276,6 +613,7 @@ async def export_design(
         request_id: Design request ID
         formats: Comma-separated list (e.g., "step,stl,fcstd")
         exporter: CAD exporter dependency
+        store: Design store
 
     Returns:
         Dictionary mapping format to export result
@@ -288,7 +626,7 @@ async def export_design(
         HTTPException: If design not found or not completed
     """
     # Validate design exists
-    design_state = _designs.get(request_id)
+    design_state = await store.get_async(request_id)
     if not design_state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -302,24 +640,8 @@ async def export_design(
             detail=f"Design must be completed before export (current status: {design_state.status})",
         )
 
-    # Find the generated FCStd document
-    # First check if there's an fcstd_path in the design state
-    doc_path = None
-    if hasattr(design_state, "fcstd_path") and design_state.fcstd_path:
-        doc_path = Path(design_state.fcstd_path)
-    else:
-        # Fall back to searching outputs directory for this request_id
-        outputs = exporter.outputs_dir
-        fcstd_files = list(outputs.glob(f"*{request_id}*.FCStd"))
-        if not fcstd_files:
-            # Try auto-save pattern
-            fcstd_files = list(outputs.glob("freecad_auto_save_*.FCStd"))
-
-        if fcstd_files:
-            # Use most recent
-            doc_path = sorted(fcstd_files, key=lambda p: p.stat().st_mtime)[-1]
-
-    if not doc_path or not doc_path.exists():
+    doc_path = _find_design_document(design_state, exporter, request_id)
+    if doc_path is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"FreeCAD document not found for design {request_id}",
@@ -391,17 +713,23 @@ async def export_design(
 async def download_design(
     request_id: str,
     format: str,
+    http_request: Request,
     exporter: CADExporter = Depends(get_cad_exporter),
-) -> FileResponse:
+    store: DesignStore = Depends(get_design_store),
+) -> Response:
     """
     Download exported design file.
 
     First calls export endpoint to ensure file exists, then returns file download.
+    Supports byte ranges, conditional requests and precompressed variants
+    (see ``_artifact_response``).
 
     Args:
         request_id: Design request ID
         format: Export format (step, stl, fcstd)
+        http_request: Incoming request (for Accept-Encoding / If-None-Match)
         exporter: CAD exporter dependency
+        store: Design store
 
     Returns:
         File download response
@@ -417,7 +745,9 @@ async def download_design(
         )
 
     # Trigger export (will use cache if available)
-    export_response = await export_design(request_id, formats=format, exporter=exporter)
+    export_response = await export_design(
+        request_id, formats=format, exporter=exporter, store=store
+    )
 
     # Check export succeeded
     export_result = export_response.get(format)
@@ -435,29 +765,394 @@ async def download_design(
             detail=f"Export file not found: {file_path}",
         )
 
-    # Determine media type
-    media_types = {
-        "step": "application/step",
-        "stl": "application/vnd.ms-pki.stl",
-        "fcstd": "application/octet-stream",
-    }
-
-    media_type = media_types.get(format, "application/octet-stream")
+    media_type = _EXPORT_MEDIA_TYPES.get(format, "application/octet-stream")
 
     logger.info(f"Downloading {format} for {request_id}: {file_path}")
 
+    return await _artifact_response(http_request, file_path, media_type)
+
+
+@router.post(
+    "/design/{request_id}/exports",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=ExportJobsResponse,
+)
+async def create_export_jobs(
+    request_id: str,
+    http_request: Request,
+    formats: str = Query(
+        "step",
+        description="Comma-separated export formats (step, stl, fcstd)",
+        pattern="^(step|stl|fcstd)(,(step|stl|fcstd))*$",
+    ),
+    store: DesignStore = Depends(get_design_store),
+    export_jobs: ExportJobManager = Depends(get_export_job_manager),
+) -> ExportJobsResponse:
+    """
+    Queue background exports of a design.
+
+    Returns immediately with one job per format; poll
+    ``GET /exports/{job_id}`` and fetch the artifact from
+    ``GET /exports/{job_id}/download``.  A format that is already being
+    exported for this design returns the in-flight job instead of a new one.
+
+    Args:
+        request_id: Design request ID
+        http_request: Raw HTTP request (identifies the client)
+        formats: Comma-separated list (e.g., "step,stl")
+        store: Design store
+        export_jobs: Export job manager
+
+    Returns:
+        Created or reused export jobs
+
+    Raises:
+        HTTPException: If design not found, not completed, or has no document
+    """
+    design_state = await store.get_async(request_id)
+    if not design_state:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Design request {request_id} not found",
+        )
+
+    if design_state.status != ExecutionStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                "Design must be completed before export "
+                f"(current status: {design_state.status})"
+            ),
+        )
+
+    doc_path = _find_design_document(design_state, export_jobs.exporter, request_id)
+    if doc_path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"FreeCAD document not found for design {request_id}",
+        )
+
+    format_list = list(dict.fromkeys(f.strip().lower() for f in formats.split(",")))
+    export_jobs.record_request(_client_key(http_request), format_list)
+
+    jobs = [
+        export_jobs.submit(request_id, fmt, doc_path, design_state.user_prompt)
+        for fmt in format_list
+    ]
+    return ExportJobsResponse(jobs=[_export_job_response(job) for job in jobs])
+
+
+@router.get("/exports/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    export_jobs: ExportJobManager = Depends(get_export_job_manager),
+) -> ExportJobResponse:
+    """
+    Get the status of an export job.
+
+    Args:
+        job_id: Export job ID
+        export_jobs: Export job manager
+
+    Returns:
+        Job status, with a download URL once it succeeded
+
+    Raises:
+        HTTPException: If the job is unknown or expired
+    """
+    job = await export_jobs.fetch(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export job {job_id} not found",
+        )
+    return _export_job_response(job)
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export(
+    job_id: str,
+    http_request: Request,
+    export_jobs: ExportJobManager = Depends(get_export_job_manager),
+) -> Response:
+    """
+    Download the artifact of a finished export job.
+
+    Args:
+        job_id: Export job ID
+        http_request: Incoming request (for Accept-Encoding / If-None-Match)
+        export_jobs: Export job manager
+
+    Returns:
+        File download response
+
+    Raises:
+        HTTPException: 404 if the job or file is missing, 409 if the job has
+            not succeeded
+    """
+    job = await export_jobs.fetch(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export job {job_id} not found",
+        )
+
+    if job.status != ExportJobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job {job_id} is {job.status.value}"
+            + (f": {job.error}" if job.error else ""),
+        )
+
+    file_path = Path(job.file_path)
+    if not file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export file not found: {file_path}",
+        )
+
+    return await _artifact_response(
+        http_request,
+        file_path,
+        _EXPORT_MEDIA_TYPES.get(job.format, "application/octet-stream"),
+    )
+
+
+async def _artifact_response(
+    http_request: Request, file_path: Path, media_type: str
+) -> Response:
+    """
+    Serve an exported file.
+
+    The file's artifact (content hash and precompressed siblings, normally
+    prepared at export time) selects the variant for the client's
+    Accept-Encoding and provides a strong, variant-specific ETag; a matching
+    If-None-Match gets 304.  FileResponse then handles Range / If-Range
+    (206, multipart ranges, 416) and hands the file to the server through the
+    ASGI ``http.response.pathsend`` extension where supported, so full
+    downloads are sent with sendfile instead of being copied through Python.
+
+    Args:
+        http_request: Incoming request
+        file_path: Exported file
+        media_type: Content type of the identity file
+
+    Returns:
+        File, or 304 Not Modified response
+    """
+    artifact = await asyncio.get_running_loop().run_in_executor(
+        None, load_artifact, file_path
+    )
+    encoding, send_path = artifact.variant(http_request.headers.get("accept-encoding"))
+    etag = artifact.etag(encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+
+    if _etag_matches(http_request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
     return FileResponse(
-        path=file_path,
+        path=send_path,
         media_type=media_type,
         filename=file_path.name,
+        headers=headers,
     )
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _find_design_document(
+    design_state: DesignState, exporter: CADExporter, request_id: str
+) -> Optional[Path]:
+    """
+    Locate the FreeCAD document generated for a design.
+
+    Args:
+        design_state: Design whose document is wanted
+        exporter: CAD exporter (its outputs directory is searched)
+        request_id: Design request ID
+
+    Returns:
+        Path to an existing .FCStd file, or None
+    """
+    # First check if there's an fcstd_path in the design state
+    doc_path = None
+    if hasattr(design_state, "fcstd_path") and design_state.fcstd_path:
+        doc_path = Path(design_state.fcstd_path)
+    else:
+        # Fall back to searching outputs directory for this request_id
+        outputs = exporter.outputs_dir
+        fcstd_files = list(outputs.glob(f"*{request_id}*.FCStd"))
+        if not fcstd_files:
+            # Try auto-save pattern
+            fcstd_files = list(outputs.glob("freecad_auto_save_*.FCStd"))
+
+        if fcstd_files:
+            # Use most recent
+            doc_path = sorted(fcstd_files, key=lambda p: p.stat().st_mtime)[-1]
+
+    if not doc_path or not doc_path.exists():
+        return None
+    return doc_path
+
+
+def _prefetch_exports(
+    export_jobs: ExportJobManager, design_state: DesignState, client_key: str
+) -> None:
+    """Queue speculative exports of a completed design (never raises)."""
+    try:
+        request_id = str(design_state.request_id)
+        doc_path = _find_design_document(design_state, export_jobs.exporter, request_id)
+        if doc_path is None:
+            return
+        jobs = export_jobs.prefetch(
+            request_id, client_key, doc_path, design_state.user_prompt
+        )
+        if jobs:
+            logger.info(
+                f"Speculative exports for {request_id}: {[j.format for j in jobs]}"
+            )
+    except Exception as e:
+        logger.warning(f"Speculative export failed for {design_state.request_id}: {e}")
+
+
+def _export_job_response(job: ExportJob) -> ExportJobResponse:
+    """API view of an export job."""
+    return ExportJobResponse(
+        job_id=job.job_id,
+        request_id=job.request_id,
+        format=job.format,
+        status=job.status.value,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        file_size_bytes=job.file_size_bytes,
+        cache_hit=job.cache_hit,
+        speculative=job.speculative,
+        error=job.error,
+        download_url=(
+            f"/api/v1/exports/{job.job_id}/download"
+            if job.status == ExportJobStatus.SUCCEEDED
+            else None
+        ),
+    )
+
+
+def _client_key(request: Request) -> str:
+    """Stable client identifier (same bucketing as the rate limiter)."""
+    return RateLimitMiddleware._resolve_client_key(request.scope)
+
+
+def _validation_score(design_state: DesignState) -> Optional[float]:
+    """Overall validation score of a design, if it has been validated."""
+    if design_state.validation_results:
+        return design_state.validation_results.get("overall_score")
+    return None
+
+
+async def _bulk_status(
+    request_ids: List[str], store: DesignStore
+) -> DesignBulkStatusResponse:
+    """
+    Build compact statuses for many designs from one bulk store read.
+
+    Args:
+        request_ids: Design request IDs (duplicates are reported once)
+        store: Design store
+
+    Returns:
+        Known designs in request order and the unknown IDs
+
+    Raises:
+        HTTPException: 400 if more than MAX_BATCH_SIZE IDs are requested
+    """
+    request_ids = list(dict.fromkeys(request_ids))
+    if len(request_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_SIZE} design IDs per request",
+        )
+
+    states = await store.get_many_async(request_ids)
+    designs = [
+        DesignSummary(
+            request_id=rid,
+            status=state.status,
+            current_iteration=state.current_iteration,
+            max_iterations=state.max_iterations,
+            updated_at=state.updated_at,
+            validation_score=_validation_score(state),
+            error_message=state.error_message,
+        )
+        for rid, state in ((rid, states.get(rid)) for rid in request_ids)
+        if state is not None
+    ]
+    missing = [rid for rid in request_ids if rid not in states]
+
+    return DesignBulkStatusResponse(designs=designs, missing=missing)
+
+
+def _etag(version: str) -> str:
+    """ETag header value for a design store version."""
+    return f'"{version}"'
+
+
+def _admit_or_reject(
+    admission: AdmissionController, max_iterations: int, response: Response
+) -> AdmissionDecision:
+    """
+    Run admission control for a pipeline request.
+
+    Args:
+        admission: Admission controller
+        max_iterations: Requested maximum iterations
+        response: Outgoing response (degraded-mode header is set on it)
+
+    Returns:
+        Admission decision for an admitted request
+
+    Raises:
+        HTTPException: 503 with Retry-After if the request is shed
+    """
+    decision = admission.admit(max_iterations)
+
+    if not decision.admitted:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Server is at capacity: {decision.reason}",
+            headers={"Retry-After": str(decision.retry_after_seconds)},
+        )
+
+    if decision.degraded:
+        response.headers["X-Admission-Mode"] = "degraded"
+
+    return decision
+
+
 async def _process_design_pipeline(
     request_id: UUID,
     prompt: str,
     max_iterations: int,
     pipeline: PipelineExecutor,
+    skip_llm_review: bool = False,
+    admission: Optional[AdmissionController] = None,
+    deadline: Optional[datetime] = None,
+    store: Optional[DesignStore] = None,
+    export_jobs: Optional[ExportJobManager] = None,
+    client_key: Optional[str] = None,
 ) -> None:
     """
     Background task to process a design request through the LangGraph pipeline.
@@ -467,13 +1162,24 @@ async def _process_design_pipeline(
         prompt: User's design prompt
         max_iterations: Maximum iterations
         pipeline: LangGraph pipeline executor instance
+        skip_llm_review: Skip LLM review during validation (degraded mode)
+        admission: Admission controller whose slot is released when done
+        deadline: End-to-end deadline (UTC) set when the request was accepted
+        store: Design store holding the request's state
+        export_jobs: Export job manager for speculative exports
+        client_key: Client that submitted the design
     """
+    store = store or get_design_store()
     str_request_id = str(request_id)
-    design_state = _designs.get(str_request_id)
+    design_state = await store.get_async(str_request_id)
     if not design_state:
         logger.error(f"Design {str_request_id} not found in processing")
+        if admission is not None:
+            admission.release()
         return
 
+    iterations = None
+
     try:
         logger.info(f"Processing design {str_request_id} with LangGraph pipeline...")
 
@@ -484,22 +1190,116 @@ async def _process_design_pipeline(
         )
 
         # Execute pipeline
-        result_state = await pipeline.execute(request_schema)
+        result_state = await pipeline.execute(
+            request_schema,
+            max_iterations=max_iterations,
+            skip_llm_review=skip_llm_review,
+            deadline=deadline,
+        )
+        iterations = result_state.current_iteration
 
         # Update stored state with results
-        _designs[str_request_id] = result_state
+        await store.save_async(result_state)
+        _log_pipeline_outcome(request_id, result_state)
+
+        if (
+            export_jobs is not None
+            and client_key
+            and result_state.status == ExecutionStatus.COMPLETED
+        ):
+            _prefetch_exports(export_jobs, result_state, client_key)
 
         logger.info(
-            f"Design {str_request_id} completed via pipeline",
-            status=result_state.status.value,
-            iterations=result_state.current_iteration,
-            is_valid=result_state.is_valid,
+            f"Design {str_request_id} completed via pipeline: "
+            f"status={result_state.status.value}, "
+            f"iterations={result_state.current_iteration}, "
+            f"is_valid={result_state.is_valid}"
         )
 
     except Exception as e:
         logger.exception(f"Error processing design {str_request_id} via pipeline: {e}")
         design_state.mark_failed(f"Pipeline execution failed: {str(e)}")
-        _designs[str_request_id] = design_state
+        await store.save_async(design_state)
+        _log_pipeline_outcome(request_id, design_state)
+
+    finally:
+        if admission is not None:
+            admission.release(iterations=iterations)
+
+
+def _log_pipeline_outcome(request_id: UUID, design_state: DesignState) -> None:
+    """
+    Record the terminal audit event that closes the design's event streams.
+
+    Written through the buffered writer, after the node events of the run.
+
+    Args:
+        request_id: Design request ID
+        design_state: Final, already persisted design state
+    """
+    audit_writer = get_audit_writer()
+    if audit_writer is None:
+        return
+
+    completed = design_state.status == ExecutionStatus.COMPLETED
+    try:
+        audit_writer.log_event(
+            event_type=(
+                AuditEventType.PIPELINE_COMPLETED
+                if completed
+                else AuditEventType.PIPELINE_FAILED
+            ),
+            request_id=request_id,
+            message=f"Pipeline {design_state.status.value}",
+            status=design_state.status.value,
+            metadata={
+                "iterations": design_state.current_iteration,
+                "is_valid": design_state.is_valid,
+            },
+            error=None if completed else design_state.error_message,
+        )
+    except Exception as e:
+        logger.warning(f"Audit logging failed for {request_id}: {e}")
+
+
+async def _process_design_batch(
+    jobs: List[Tuple[UUID, str, AdmissionDecision]],
+    pipeline: PipelineExecutor,
+    admission: AdmissionController,
+    deadline: Optional[datetime],
+    store: DesignStore,
+    export_jobs: Optional[ExportJobManager] = None,
+    client_key: Optional[str] = None,
+) -> None:
+    """
+    Background task running the pipelines of a batch concurrently.
+
+    Args:
+        jobs: (request ID, prompt, admission decision) per accepted design
+        pipeline: LangGraph pipeline executor instance
+        admission: Admission controller holding one slot per job
+        deadline: End-to-end deadline (UTC) shared by the batch
+        store: Design store holding the batch's states
+        export_jobs: Export job manager for speculative exports
+        client_key: Client that submitted the batch
+    """
+    await asyncio.gather(
+        *(
+            _process_design_pipeline(
+                request_id,
+                prompt,
+                decision.max_iterations,
+                pipeline,
+                decision.skip_llm_review,
+                admission,
+                deadline,
+                store,
+                export_jobs,
+                client_key,
+            )
+            for request_id, prompt, decision in jobs
+        )
+    )
 
 
 def _log_export_audit_event(
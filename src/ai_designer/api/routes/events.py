@@ -0,0 +1,251 @@
+"""
+Server-Sent Events stream of a design's audit trail.
+
+``GET /api/v1/design/{request_id}/events`` streams every event the
+``AuditLogger`` wrote to ``design:{request_id}:audit``.  Each frame carries
+the Redis Stream entry ID as its SSE ``id``, so a reconnecting client (the
+browser ``EventSource`` does this automatically) sends ``Last-Event-ID`` and
+resumes exactly where it stopped: history is replayed with ``XRANGE`` and
+live events are then tailed with a blocking ``XREAD``.
+
+The stream ends with the design's ``pipeline_completed`` or
+``pipeline_failed`` event.  A design that has already finished answers 204
+instead, which also stops ``EventSource`` from reconnecting; history stays
+available from the audit timeline endpoints.  Live tails re-check the stored
+status on every heartbeat, so a run that ended without a terminal event (a
+crashed worker) does not hold its stream slot forever.
+
+Heartbeat comments are sent whenever no event arrived for
+``SSE_HEARTBEAT_SECONDS`` so proxies keep the connection open.  Backpressure
+is per connection: the next batch is only read from Redis once the previous
+one has been written to the client, so a slow client lags behind on its own
+cursor instead of buffering events in the server.  Reads go through
+``redis.asyncio`` on a dedicated ``sse-tail`` pool of ``SSE_MAX_STREAMS``
+connections: a blocking XREAD holds a connection but no thread, and tailing
+streams cannot exhaust the pool shared by the other Redis consumers.  Streams
+are capped per process accordingly.
+
+Configuration (env vars)
+------------------------
+SSE_HEARTBEAT_SECONDS  float, default 15 (also the XREAD block timeout)
+SSE_BATCH_SIZE         int, default 100 (events per Redis read)
+SSE_MAX_STREAMS        int, default 32 (concurrent streams per process)
+SSE_RETRY_MS           int, default 3000 (client reconnect delay)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from ai_designer.api.deps import get_audit_logger, get_design_store
+from ai_designer.redis_utils.audit import AuditEvent, AuditEventType, AuditLogger
+from ai_designer.redis_utils.design_store import DesignStore
+from ai_designer.schemas.design_state import ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+_BATCH_SIZE: int = int(os.getenv("SSE_BATCH_SIZE", "100"))
+_MAX_STREAMS: int = int(os.getenv("SSE_MAX_STREAMS", "32"))
+_RETRY_MS: int = int(os.getenv("SSE_RETRY_MS", "3000"))
+
+# Events after which a design produces no further progress
+_TERMINAL_EVENTS = {
+    AuditEventType.PIPELINE_COMPLETED,
+    AuditEventType.PIPELINE_FAILED,
+}
+_TERMINAL_STATUSES = {
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+}
+
+_STREAM_ID_RE = re.compile(r"^\d+-\d+$")
+
+# ── Stream slots ──────────────────────────────────────────────────────────────
+_slots_lock = threading.Lock()
+_active_streams = 0
+
+
+class _StreamSlot:
+    """One of the ``SSE_MAX_STREAMS`` slots; release is idempotent."""
+
+    def __init__(self) -> None:
+        self._released = False
+
+    def release(self) -> None:
+        global _active_streams
+        with _slots_lock:
+            if not self._released:
+                self._released = True
+                _active_streams -= 1
+
+
+def _acquire_slot() -> Optional[_StreamSlot]:
+    global _active_streams
+    with _slots_lock:
+        if _active_streams >= _MAX_STREAMS:
+            return None
+        _active_streams += 1
+    return _StreamSlot()
+
+
+def _tail_client(audit_logger: AuditLogger) -> Any:
+    """Async client on the dedicated pool for blocking XREADs."""
+    return audit_logger.redis_client.dedicated_async_connection(
+        "sse-tail", max_connections=_MAX_STREAMS
+    )
+
+
+# ── Endpoint ──────────────────────────────────────────────────────────────────
+
+
+@router.get("/design/{request_id}/events")
+async def stream_design_events(
+    request_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    since: Optional[str] = Query(
+        None, description="Resume after this event ID (for clients without headers)"
+    ),
+    store: DesignStore = Depends(get_design_store),
+    audit_logger: Optional[AuditLogger] = Depends(get_audit_logger),
+) -> Response:
+    """
+    Stream a design's progress events as Server-Sent Events.
+
+    Args:
+        request_id: Design request ID
+        request: Incoming request (used to detect client disconnects)
+        last_event_id: ``Last-Event-ID`` header sent by reconnecting clients
+        since: Query-string alternative to ``Last-Event-ID``
+        store: Design store
+        audit_logger: Audit logger (None when Redis is unavailable)
+
+    Returns:
+        ``text/event-stream`` response, or 204 if the design has finished
+
+    Raises:
+        HTTPException: If the design is unknown, the cursor is malformed, or
+            streaming is unavailable
+    """
+    cursor = last_event_id or since
+    if cursor is not None and not _STREAM_ID_RE.match(cursor):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid event ID: {cursor}",
+        )
+
+    design_state = await store.get_async(request_id)
+    if design_state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Design request {request_id} not found",
+        )
+    if design_state.status in _TERMINAL_STATUSES:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    if audit_logger is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Event streaming requires Redis",
+        )
+
+    slot = _acquire_slot()
+    if slot is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open event streams",
+            headers={"Retry-After": str(max(1, _RETRY_MS // 1000))},
+        )
+
+    return StreamingResponse(
+        _event_stream(request, store, audit_logger, request_id, cursor, slot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Frees the slot even if the body was never iterated
+        background=BackgroundTask(slot.release),
+    )
+
+
+async def _event_stream(
+    request: Request,
+    store: DesignStore,
+    audit_logger: AuditLogger,
+    request_id: str,
+    cursor: Optional[str],
+    slot: _StreamSlot,
+) -> AsyncIterator[str]:
+    """Replay events after ``cursor``, then tail the stream until done."""
+    block_ms = max(1, int(_HEARTBEAT_SECONDS * 1000))
+
+    try:
+        yield f"retry: {_RETRY_MS}\n\n"
+        client = _tail_client(audit_logger)
+
+        # Replay history in bounded batches
+        while True:
+            events = await audit_logger.read_after_async(
+                request_id, cursor, count=_BATCH_SIZE, client=client
+            )
+            for event in events:
+                yield _format_event(event)
+                cursor = event.event_id
+                if event.event_type in _TERMINAL_EVENTS:
+                    return
+            if len(events) < _BATCH_SIZE:
+                break
+
+        # Never tail a design that has already finished
+        if await _is_finished(store, request_id):
+            return
+
+        # Tail live events; an empty read means a heartbeat is due
+        while not await request.is_disconnected():
+            events = await audit_logger.read_after_async(
+                request_id,
+                cursor,
+                count=_BATCH_SIZE,
+                block_ms=block_ms,
+                client=client,
+            )
+            if not events:
+                if await _is_finished(store, request_id):
+                    return
+                yield ": heartbeat\n\n"
+                continue
+            for event in events:
+                yield _format_event(event)
+                cursor = event.event_id
+                if event.event_type in _TERMINAL_EVENTS:
+                    return
+
+    except Exception as e:
+        # The client reconnects with Last-Event-ID, so nothing is lost
+        logger.warning(f"Event stream for {request_id} aborted: {e}")
+        yield "event: error\ndata: {}\n\n"
+
+    finally:
+        slot.release()
+
+
+async def _is_finished(store: DesignStore, request_id: str) -> bool:
+    """Check whether the stored design reached a terminal status (or is gone)."""
+    design_state = await store.get_async(request_id)
+    return design_state is None or design_state.status in _TERMINAL_STATUSES
+
+
+def _format_event(event: AuditEvent) -> str:
+    """Render an audit event as an SSE frame."""
+    data = json.dumps(event.model_dump(mode="json"))
+    return f"id: {event.event_id}\nevent: {event.event_type.value}\ndata: {data}\n\n"
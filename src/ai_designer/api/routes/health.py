@@ -5,7 +5,11 @@ Health check endpoints for monitoring and orchestration.
 import logging
 from typing import Any, Dict
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from ai_designer.api.deps import get_admission_controller
+from ai_designer.core.admission import AdmissionController
 
 logger = logging.getLogger(__name__)
 
@@ -13,22 +17,39 @@ router = APIRouter()
 
 
 @router.get("/health", status_code=status.HTTP_200_OK)
-async def health_check() -> Dict[str, Any]:
+async def health_check(
+    admission: AdmissionController = Depends(get_admission_controller),
+) -> Dict[str, Any]:
     """
     Basic health check endpoint.
 
+    Always returns 200 while the process is alive; pipeline saturation is
+    reported for information only (see ``/ready`` for load shedding).
+
+    Args:
+        admission: Admission controller dependency
+
     Returns:
         Health status information
     """
+    saturation = admission.saturation()
+
     return {
         "status": "healthy",
         "service": "freecad-ai-designer",
         "version": "0.1.0",
+        "saturation": {
+            "state": saturation["state"],
+            "pipelines_in_flight": saturation["pipelines_in_flight"],
+            "estimated_wait_seconds": saturation["estimated_wait_seconds"],
+        },
     }
 
 
 @router.get("/ready", status_code=status.HTTP_200_OK)
-async def readiness_check() -> Dict[str, Any]:
+async def readiness_check(
+    admission: AdmissionController = Depends(get_admission_controller),
+) -> Any:
     """
     Readiness check for Kubernetes/orchestration.
 
@@ -36,6 +57,10 @@ async def readiness_check() -> Dict[str, Any]:
     - Redis connection
     - LLM provider access (optional, can degrade gracefully)
     - FreeCAD availability
+    - Pipeline capacity (503 while saturated so load balancers back off)
+
+    Args:
+        admission: Admission controller dependency
 
     Returns:
         Readiness status with component checks
@@ -44,14 +69,21 @@ async def readiness_check() -> Dict[str, Any]:
         "redis": "unknown",  # TODO: Add actual Redis health check
         "llm": "unknown",  # TODO: Add LLM provider ping
         "freecad": "unknown",  # TODO: Add FreeCAD availability check
+        "admission": admission.saturation(),
     }
 
-    # For now, return ready (implement actual checks in deps.py)
-    overall_status = "ready"
+    overall_status = "saturated" if admission.is_saturated() else "ready"
 
-    return {
+    body = {
         "status": overall_status,
         "service": "freecad-ai-designer",
         "version": "0.1.0",
         "checks": checks,
     }
+
+    if overall_status != "ready":
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body
+        )
+
+    return body
@@ -1,23 +1,132 @@
-"""WebSocket endpoints for real-time design updates."""
+"""
+WebSocket endpoints for real-time design updates.
 
+Updates are fanned out without the producer waiting on any client: every
+connection has a bounded outbound queue drained by its own writer task, so
+``ConnectionManager.send_update`` only enqueues.  The writer task is the
+only sender of a connection, so replies of the endpoint itself (connected,
+ack, stream chunks) go through the same queue and keep their order.
+
+When a client falls behind, an unsent ``progress`` frame is replaced by a
+newer one of the same node (terminal ``completed``/``error`` frames are
+always kept); a client whose queue still overflows, or whose send fails or
+times out, is disconnected.  The endpoint's own frames wait for queue space
+instead.
+
+Configuration (env vars)
+------------------------
+WS_SEND_QUEUE_SIZE        int, default 64 (frames queued per connection)
+WS_SEND_TIMEOUT_SECONDS   float, default 10 (per frame, then disconnect)
+"""
+
+import asyncio
 import json
 import logging
-from typing import Any, Dict
+import os
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from ai_designer.core.metrics import WEBSOCKET_CONNECTIONS
+from ai_designer.redis_utils.pubsub_bridge import get_pubsub_bridge
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# ── Config ────────────────────────────────────────────────────────────────────
+_SEND_QUEUE_SIZE: int = int(os.getenv("WS_SEND_QUEUE_SIZE", "64"))
+_SEND_TIMEOUT_SECONDS: float = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "10"))
+
+# Frames superseded by a newer frame of the same type and node
+_COALESCED_TYPES = {"progress"}
+
+# Close code for clients dropped for falling behind ("try again later")
+_SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _Outbox:
+    """Bounded outbound queue of one connection."""
+
+    def __init__(self, websocket: WebSocket, maxsize: int):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.frames: Deque[Dict[str, Any]] = deque()
+        self.ready = asyncio.Event()
+        self.sent = asyncio.Event()
+        self.failed = False
+        self.task: Optional[asyncio.Task] = None
+
+    def put(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue a frame without waiting.
+
+        Returns:
+            False if the client is too far behind to keep
+        """
+        if message.get("type") in _COALESCED_TYPES:
+            self._drop_coalesced(_coalesce_key(message))
+        if len(self.frames) >= self.maxsize:
+            return False
+        self.frames.append(message)
+        self.ready.set()
+        return True
+
+    async def put_wait(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue a frame, waiting for queue space.
+
+        Returns:
+            False if the writer task has failed
+        """
+        while len(self.frames) >= self.maxsize and not self.failed:
+            self.sent.clear()
+            await self.sent.wait()
+        return not self.failed and self.put(message)
+
+    def _drop_coalesced(self, key: Any) -> None:
+        # At most one coalesced frame per key is ever queued
+        for frame in self.frames:
+            if frame.get("type") in _COALESCED_TYPES and _coalesce_key(frame) == key:
+                self.frames.remove(frame)
+                return
+
+    async def drain(self, on_failure: Callable[[Exception], None]) -> None:
+        """Writer task: send queued frames in order until the client fails."""
+        try:
+            while True:
+                await self.ready.wait()
+                self.ready.clear()
+                while self.frames:
+                    frame = self.frames.popleft()
+                    await asyncio.wait_for(
+                        self.websocket.send_json(frame), _SEND_TIMEOUT_SECONDS
+                    )
+                    self.sent.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed = True
+            self.sent.set()
+            on_failure(e)
+
+
+def _coalesce_key(frame: Dict[str, Any]) -> Any:
+    data = frame.get("data")
+    node = data.get("node") if isinstance(data, dict) else None
+    return frame.get("type"), node
+
 
 # Connection manager for WebSocket clients
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
 
-    def __init__(self):
+    def __init__(self, send_queue_size: int = _SEND_QUEUE_SIZE):
         # Map: request_id -> list of WebSocket connections
-        self.active_connections: Dict[str, list[WebSocket]] = {}
+        self.active_connections: Dict[str, list] = {}
+        self.send_queue_size = send_queue_size
+        self._outboxes: Dict[WebSocket, _Outbox] = {}
 
     async def connect(self, websocket: WebSocket, request_id: str) -> None:
         """Accept and register a WebSocket connection."""
@@ -25,24 +134,84 @@ class ConnectionManager:
         if request_id not in self.active_connections:
             self.active_connections[request_id] = []
         self.active_connections[request_id].append(websocket)
+
+        outbox = _Outbox(websocket, self.send_queue_size)
+        outbox.task = asyncio.create_task(
+            outbox.drain(lambda e: self._on_send_failure(websocket, request_id, e))
+        )
+        self._outboxes[websocket] = outbox
+        WEBSOCKET_CONNECTIONS.inc()
+
+        bridge = get_pubsub_bridge()
+        if bridge is not None:
+            bridge.subscribe_to_design(request_id)
         logger.info(f"WebSocket connected for request {request_id}")
 
     def disconnect(self, websocket: WebSocket, request_id: str) -> None:
-        """Remove a WebSocket connection."""
-        if request_id in self.active_connections:
-            self.active_connections[request_id].remove(websocket)
-            if not self.active_connections[request_id]:
-                del self.active_connections[request_id]
+        """Remove a WebSocket connection (safe to call more than once)."""
+        connections = self.active_connections.get(request_id)
+        if not connections or websocket not in connections:
+            return
+        connections.remove(websocket)
+        if not connections:
+            del self.active_connections[request_id]
+
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is not None:
+            # Wake an endpoint blocked in send() waiting for queue space
+            outbox.failed = True
+            outbox.sent.set()
+            if outbox.task is not asyncio.current_task():
+                outbox.task.cancel()
+        WEBSOCKET_CONNECTIONS.dec()
+
+        bridge = get_pubsub_bridge()
+        if bridge is not None:
+            bridge.unsubscribe_from_design(request_id)
         logger.info(f"WebSocket disconnected for request {request_id}")
 
+    async def send(
+        self, websocket: WebSocket, request_id: str, message: Dict[str, Any]
+    ) -> None:
+        """
+        Queue a frame for one connection behind the frames already queued,
+        waiting for queue space (used by the endpoint for its own replies).
+
+        Raises:
+            WebSocketDisconnect: If the connection is gone
+        """
+        outbox = self._outboxes.get(websocket)
+        if outbox is None or not await outbox.put_wait(message):
+            raise WebSocketDisconnect(code=1006)
+
     async def send_update(self, request_id: str, message: Dict[str, Any]) -> None:
-        """Send an update to all connected clients for a request."""
-        if request_id in self.active_connections:
-            for connection in self.active_connections[request_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending WebSocket update: {e}")
+        """
+        Queue an update for all connected clients for a request.
+
+        Never waits on a client; slow clients are coalesced or dropped.
+        """
+        for connection in list(self.active_connections.get(request_id, ())):
+            outbox = self._outboxes.get(connection)
+            if outbox is not None and not outbox.put(message):
+                logger.warning(f"Dropping slow WebSocket consumer for {request_id}")
+                self.disconnect(connection, request_id)
+                asyncio.create_task(
+                    _close_quietly(connection, _SLOW_CONSUMER_CLOSE_CODE)
+                )
+
+    def _on_send_failure(
+        self, websocket: WebSocket, request_id: str, error: Exception
+    ) -> None:
+        logger.warning(f"Error sending WebSocket update for {request_id}: {error!r}")
+        self.disconnect(websocket, request_id)
+        asyncio.create_task(_close_quietly(websocket))
+
+
+async def _close_quietly(websocket: WebSocket, code: int = 1000) -> None:
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        pass  # Already closed by the client
 
 
 # Global connection manager
@@ -76,12 +245,14 @@ async def websocket_endpoint(websocket: WebSocket, request_id: str):
 
     try:
         # Send initial connection confirmation
-        await websocket.send_json(
+        await manager.send(
+            websocket,
+            request_id,
             {
                 "type": "connected",
                 "request_id": request_id,
                 "message": "WebSocket connected successfully",
-            }
+            },
         )
 
         # Keep connection alive and listen for client messages (if any)
@@ -91,12 +262,14 @@ async def websocket_endpoint(websocket: WebSocket, request_id: str):
             logger.debug(f"Received WebSocket message for {request_id}: {data}")
 
             # Echo back as acknowledgment
-            await websocket.send_json(
+            await manager.send(
+                websocket,
+                request_id,
                 {
                     "type": "ack",
                     "request_id": request_id,
                     "received": data,
-                }
+                },
             )
 
             # Handle stream_design messages
@@ -122,13 +295,21 @@ async def websocket_endpoint(websocket: WebSocket, request_id: str):
                     )
                     try:
                         async for chunk in llm_provider.complete_stream(llm_request):
-                            await websocket.send_json(
-                                {"type": "stream_chunk", "content": chunk}
+                            await manager.send(
+                                websocket,
+                                request_id,
+                                {"type": "stream_chunk", "content": chunk},
                             )
-                        await websocket.send_json({"type": "stream_done"})
+                        await manager.send(
+                            websocket, request_id, {"type": "stream_done"}
+                        )
+                    except WebSocketDisconnect:
+                        raise
                     except Exception as stream_err:  # noqa: BLE001
-                        await websocket.send_json(
-                            {"type": "error", "message": str(stream_err)}
+                        await manager.send(
+                            websocket,
+                            request_id,
+                            {"type": "error", "message": str(stream_err)},
                         )
 
     except WebSocketDisconnect:
@@ -100,7 +100,7 @@ class FreeCADCLI:
 
         # Try to initialize Redis for state management
         try:
-            redis_client = RedisClient()
+            redis_client = RedisClient.from_env()
             if redis_client.connect():
                 self.state_cache = StateCache(redis_client)
                 print("✓ Redis connection established for state caching")
@@ -437,7 +437,7 @@ class FreeCADCLI:
                         # Send stop signal
                         asyncio.run_coroutine_threadsafe(
                             self.websocket_manager.stop_server(),
-                            asyncio.get_event_loop(),
+                            self.websocket_manager.loop,
                         )
                 except:
                     pass
@@ -99,7 +99,7 @@ class FreeCADCLIApp:
 
         # Redis
         try:
-            redis_client = RedisClient()
+            redis_client = RedisClient.from_env()
             if redis_client.connect():
                 self.state_cache = StateCache(redis_client)
                 print("✓ Redis connection established for state caching")
@@ -233,7 +233,7 @@ class FreeCADCLIApp:
                     if self.websocket_thread and self.websocket_thread.is_alive():
                         asyncio.run_coroutine_threadsafe(
                             self.websocket_manager.stop_server(),
-                            asyncio.get_event_loop(),
+                            self.websocket_manager.loop,
                         )
                 except Exception:
                     pass
@@ -0,0 +1,383 @@
+"""
+Admission control and load shedding for design pipelines.
+
+Every ``POST /design`` is evaluated before it is accepted.  The controller
+estimates how long the new request would take to finish from:
+
+- the number of pipelines already admitted and not yet finished,
+- recent per-stage latencies (planner, generator, executor, validator),
+- recent wait times for a FreeCAD execution slot.
+
+If the estimate fits the configured SLO the request is admitted as-is.  If
+only a cheaper run fits (LLM review skipped, fewer iterations) it is admitted
+in degraded mode.  Otherwise it is shed and the caller gets a ``Retry-After``
+hint.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+ADMISSION_DISABLED                 "1" to admit everything (dev/test)
+ADMISSION_SLO_SECONDS              float, default 300
+ADMISSION_MAX_CONCURRENT_PIPELINES int, default 8 (pipelines served in parallel)
+ADMISSION_MAX_IN_FLIGHT            int, default 64 (hard cap on admitted pipelines)
+ADMISSION_DEGRADED_MAX_ITERATIONS  int, default 2
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+from ai_designer.core.metrics import (
+    ADMISSION_DECISIONS_TOTAL,
+    ADMISSION_ESTIMATED_WAIT_SECONDS,
+    PIPELINES_IN_FLIGHT,
+)
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_DISABLED: bool = os.getenv("ADMISSION_DISABLED", "0") == "1"
+_SLO_SECONDS: float = float(os.getenv("ADMISSION_SLO_SECONDS", "300"))
+_MAX_CONCURRENT_PIPELINES: int = int(
+    os.getenv("ADMISSION_MAX_CONCURRENT_PIPELINES", "8")
+)
+_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "64"))
+_DEGRADED_MAX_ITERATIONS: int = int(os.getenv("ADMISSION_DEGRADED_MAX_ITERATIONS", "2"))
+
+# ── Stage names ───────────────────────────────────────────────────────────────
+STAGE_PLANNER = "planner"
+STAGE_GENERATOR = "generator"
+STAGE_EXECUTOR = "executor"
+STAGE_VALIDATOR = "validator"
+STAGE_SLOT_WAIT = "freecad_slot_wait"
+
+# Used until enough samples have been observed for a stage
+_DEFAULT_STAGE_SECONDS: Dict[str, float] = {
+    STAGE_PLANNER: 8.0,
+    STAGE_GENERATOR: 15.0,
+    STAGE_EXECUTOR: 10.0,
+    STAGE_VALIDATOR: 6.0,
+    STAGE_SLOT_WAIT: 0.0,
+}
+
+# Share of the validator stage left when the LLM review is skipped
+_DEGRADED_VALIDATOR_FACTOR = 0.3
+
+# Decision labels
+DECISION_ADMIT = "admit"
+DECISION_DEGRADE = "degrade"
+DECISION_REJECT = "reject"
+
+
+class LatencyTracker:
+    """
+    Rolling window of recent latencies per pipeline stage.
+
+    Cheap enough to call from every node exit; estimates are the mean of the
+    last ``window`` samples.
+    """
+
+    def __init__(self, window: int = 50) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record one latency sample for a stage."""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._samples[stage] = samples
+            samples.append(max(seconds, 0.0))
+
+    def estimate(self, stage: str, default: Optional[float] = None) -> float:
+        """
+        Mean of recent samples for a stage.
+
+        Falls back to ``default`` (or the built-in default for known stages)
+        when nothing has been observed yet.
+        """
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples:
+                return sum(samples) / len(samples)
+        if default is not None:
+            return default
+        return _DEFAULT_STAGE_SECONDS.get(stage, 0.0)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage sample count, mean and max for health reporting."""
+        with self._lock:
+            return {
+                stage: {
+                    "count": len(samples),
+                    "mean_seconds": round(sum(samples) / len(samples), 3),
+                    "max_seconds": round(max(samples), 3),
+                }
+                for stage, samples in self._samples.items()
+                if samples
+            }
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._samples.clear()
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of evaluating a design request against the SLO."""
+
+    admitted: bool
+    degraded: bool = False
+    max_iterations: int = 5
+    skip_llm_review: bool = False
+    estimated_wait_seconds: float = 0.0
+    estimated_total_seconds: float = 0.0
+    retry_after_seconds: int = 0
+    reason: str = ""
+
+    @property
+    def label(self) -> str:
+        """Decision label used for metrics and logs."""
+        if not self.admitted:
+            return DECISION_REJECT
+        return DECISION_DEGRADE if self.degraded else DECISION_ADMIT
+
+
+class AdmissionController:
+    """
+    Decides whether a new design pipeline may start.
+
+    Admitted pipelines are counted until ``release()`` is called, so the
+    controller sees both queued and running work.
+    """
+
+    def __init__(
+        self,
+        slo_seconds: float = _SLO_SECONDS,
+        max_concurrent_pipelines: int = _MAX_CONCURRENT_PIPELINES,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        degraded_max_iterations: int = _DEGRADED_MAX_ITERATIONS,
+        latency_tracker: Optional[LatencyTracker] = None,
+        enabled: bool = not _DISABLED,
+    ) -> None:
+        if max_concurrent_pipelines < 1:
+            raise ValueError("max_concurrent_pipelines must be >= 1")
+
+        self.slo_seconds = slo_seconds
+        self.max_concurrent_pipelines = max_concurrent_pipelines
+        self.max_in_flight = max_in_flight
+        self.degraded_max_iterations = max(degraded_max_iterations, 1)
+        self.latency_tracker = latency_tracker or get_latency_tracker()
+        self.enabled = enabled
+
+        self._in_flight = 0
+        self._iterations: Deque[int] = deque(maxlen=50)
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Pipelines admitted and not yet released."""
+        return self._in_flight
+
+    # ── Estimation ───────────────────────────────────────────────────────────
+
+    def _expected_iterations(self, max_iterations: int) -> float:
+        """Mean iterations of recent pipelines, capped at ``max_iterations``."""
+        with self._lock:
+            observed = list(self._iterations)
+        if not observed:
+            return float(max_iterations)
+        return min(float(max_iterations), max(sum(observed) / len(observed), 1.0))
+
+    def estimate_pipeline_seconds(
+        self, max_iterations: int, skip_llm_review: bool = False
+    ) -> float:
+        """Expected service time of one pipeline, excluding queueing."""
+        tracker = self.latency_tracker
+        validator = tracker.estimate(STAGE_VALIDATOR)
+        if skip_llm_review:
+            validator *= _DEGRADED_VALIDATOR_FACTOR
+
+        per_iteration = (
+            tracker.estimate(STAGE_GENERATOR)
+            + tracker.estimate(STAGE_EXECUTOR)
+            + validator
+        )
+        return tracker.estimate(STAGE_PLANNER) + per_iteration * (
+            self._expected_iterations(max_iterations)
+        )
+
+    def estimate_queue_wait(self, max_iterations: int = 5) -> float:
+        """
+        Expected wait before a new pipeline gets served.
+
+        Pipelines beyond ``max_concurrent_pipelines`` wait for a turn; FreeCAD
+        slot contention adds the larger of the recently observed slot wait and
+        the backlog currently queued on the execution semaphore.  Executor
+        samples are service times from slot acquisition, so the slot wait is
+        only counted here.
+        """
+        excess = max(0, self._in_flight + 1 - self.max_concurrent_pipelines)
+        pipeline_wait = (
+            excess
+            / self.max_concurrent_pipelines
+            * self.estimate_pipeline_seconds(max_iterations)
+        )
+
+        slot_stats = _execution_slot_stats()
+        backlog_wait = (
+            slot_stats["waiting"]
+            / max(slot_stats["capacity"], 1)
+            * self.latency_tracker.estimate(STAGE_EXECUTOR)
+        )
+        slot_wait = max(self.latency_tracker.estimate(STAGE_SLOT_WAIT), backlog_wait)
+
+        return pipeline_wait + slot_wait
+
+    # ── Decisions ────────────────────────────────────────────────────────────
+
+    def evaluate(self, max_iterations: int) -> AdmissionDecision:
+        """Evaluate a request without reserving capacity."""
+        if not self.enabled:
+            return AdmissionDecision(
+                admitted=True, max_iterations=max_iterations, reason="disabled"
+            )
+
+        wait = self.estimate_queue_wait(max_iterations)
+
+        if self._in_flight >= self.max_in_flight:
+            return self._reject(
+                wait,
+                f"{self._in_flight} pipelines in flight (cap {self.max_in_flight})",
+            )
+
+        total = wait + self.estimate_pipeline_seconds(max_iterations)
+        if total <= self.slo_seconds:
+            return AdmissionDecision(
+                admitted=True,
+                max_iterations=max_iterations,
+                estimated_wait_seconds=wait,
+                estimated_total_seconds=total,
+                reason="within SLO",
+            )
+
+        degraded_iterations = min(max_iterations, self.degraded_max_iterations)
+        degraded_total = wait + self.estimate_pipeline_seconds(
+            degraded_iterations, skip_llm_review=True
+        )
+        if degraded_total <= self.slo_seconds:
+            return AdmissionDecision(
+                admitted=True,
+                degraded=True,
+                max_iterations=degraded_iterations,
+                skip_llm_review=True,
+                estimated_wait_seconds=wait,
+                estimated_total_seconds=degraded_total,
+                reason=(
+                    f"estimated {total:.0f}s exceeds SLO {self.slo_seconds:.0f}s; "
+                    "degraded run fits"
+                ),
+            )
+
+        return self._reject(
+            wait,
+            f"estimated {degraded_total:.0f}s exceeds SLO {self.slo_seconds:.0f}s "
+            "even in degraded mode",
+        )
+
+    def _reject(self, wait: float, reason: str) -> AdmissionDecision:
+        return AdmissionDecision(
+            admitted=False,
+            estimated_wait_seconds=wait,
+            retry_after_seconds=max(int(math.ceil(wait)), 1),
+            reason=reason,
+        )
+
+    def admit(self, max_iterations: int) -> AdmissionDecision:
+        """
+        Evaluate a request and, when admitted, reserve a pipeline slot.
+
+        Every admitted decision must be paired with a ``release()`` call.
+        """
+        decision = self.evaluate(max_iterations)
+
+        if decision.admitted:
+            with self._lock:
+                self._in_flight += 1
+            PIPELINES_IN_FLIGHT.set(self._in_flight)
+
+        ADMISSION_DECISIONS_TOTAL.labels(decision=decision.label).inc()
+        ADMISSION_ESTIMATED_WAIT_SECONDS.set(decision.estimated_wait_seconds)
+
+        if decision.label != DECISION_ADMIT:
+            logger.warning(
+                "Admission %s: %s (in_flight=%d, wait=%.1fs)",
+                decision.label,
+                decision.reason,
+                self._in_flight,
+                decision.estimated_wait_seconds,
+            )
+
+        return decision
+
+    def release(self, iterations: Optional[int] = None) -> None:
+        """Release a slot reserved by ``admit()``."""
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if iterations:
+                self._iterations.append(iterations)
+        PIPELINES_IN_FLIGHT.set(self._in_flight)
+
+    # ── Reporting ────────────────────────────────────────────────────────────
+
+    def is_saturated(self) -> bool:
+        """True when a default request would be rejected outright."""
+        if not self.enabled:
+            return False
+        return self.evaluate(max_iterations=5).label == DECISION_REJECT
+
+    def saturation(self) -> Dict[str, Any]:
+        """Saturation snapshot for health/readiness endpoints."""
+        decision = self.evaluate(max_iterations=5)
+        return {
+            "enabled": self.enabled,
+            "state": {
+                DECISION_ADMIT: "ok",
+                DECISION_DEGRADE: "degraded",
+                DECISION_REJECT: "saturated",
+            }[decision.label],
+            "pipelines_in_flight": self._in_flight,
+            "max_concurrent_pipelines": self.max_concurrent_pipelines,
+            "max_in_flight": self.max_in_flight,
+            "slo_seconds": self.slo_seconds,
+            "estimated_wait_seconds": round(decision.estimated_wait_seconds, 2),
+            "execution_slots": _execution_slot_stats(),
+            "stage_latencies": self.latency_tracker.snapshot(),
+        }
+
+
+def _execution_slot_stats() -> Dict[str, int]:
+    """FreeCAD execution-slot usage (imported lazily to avoid a cycle)."""
+    from ai_designer.freecad.headless_runner import get_execution_slot_stats
+
+    return get_execution_slot_stats()
+
+
+# Global tracker shared by pipeline nodes, the headless runner and the API
+_latency_tracker: Optional[LatencyTracker] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get or create the process-wide stage latency tracker."""
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
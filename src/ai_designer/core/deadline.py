@@ -0,0 +1,114 @@
+"""
+End-to-end request deadlines for the design pipeline.
+
+A deadline is fixed when a design request is accepted and travels with the
+request: ``PipelineState.deadline`` carries it between LangGraph nodes, and a
+context variable exposes it to code that never sees the state (LLM calls,
+FreeCAD subprocesses).  Each of those clips its own timeout to the remaining
+budget, so the total latency of a request is bounded by its deadline no
+matter how many iterations or retries happen inside it.
+
+Configuration (env vars)
+------------------------
+PIPELINE_DEADLINE_SECONDS  float, default 300 (end-to-end budget per request)
+"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+from ai_designer.core.exceptions import DeadlineExceededError
+
+# ── Config ────────────────────────────────────────────────────────────────────
+DEFAULT_DEADLINE_SECONDS: float = float(os.getenv("PIPELINE_DEADLINE_SECONDS", "300"))
+
+
+class Deadline:
+    """
+    Absolute point in time by which a request must finish.
+
+    Stored as a UTC wall-clock ``datetime`` so it can be carried in
+    serialisable pipeline state and checkpoints.
+    """
+
+    def __init__(self, expires_at: datetime) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Create a deadline ``seconds`` from now."""
+        return cls(datetime.utcnow() + timedelta(seconds=seconds))
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max((self.expires_at - datetime.utcnow()).total_seconds(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return self.remaining() <= 0.0
+
+    def timeout(self, default: float) -> float:
+        """
+        Clip a per-operation timeout to the remaining budget.
+
+        Args:
+            default: Timeout the operation would use without a deadline
+
+        Returns:
+            ``min(default, remaining)``
+
+        Raises:
+            DeadlineExceededError: If no budget is left
+        """
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceededError(
+                "Request deadline exceeded",
+                {"expires_at": self.expires_at.isoformat()},
+            )
+        return min(float(default), remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(expires_at={self.expires_at.isoformat()})"
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "ai_designer_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the request being processed in this context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make ``deadline`` the current deadline for the enclosed block.
+
+    Asyncio tasks created inside the block inherit it.
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def budget_timeout(default: float) -> float:
+    """
+    Timeout for an operation under the current deadline.
+
+    Returns ``default`` when no deadline is set.
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    return deadline.timeout(default)
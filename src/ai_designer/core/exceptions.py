@@ -122,6 +122,12 @@ class AgentValidationError(AgentError):
     pass
 
 
+class DeadlineExceededError(AIDesignerError):
+    """Raised when a request's end-to-end time budget is exhausted"""
+
+    pass
+
+
 # State Management Errors
 class StateError(AIDesignerError):
     """Base class for state management errors"""
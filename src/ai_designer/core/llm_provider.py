@@ -11,6 +11,7 @@ Features:
 - Automatic retry with exponential backoff
 - Provider fallback chains
 - Rate limiting and token tracking
+- Timeouts clipped to the current request deadline
 - Structured logging
 - Type-safe responses
 """
@@ -21,6 +22,7 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
 import litellm
 
+from ai_designer.core.deadline import budget_timeout, current_deadline
 from ai_designer.core.exceptions import LLMError
 from ai_designer.core.logging_config import get_logger
 from ai_designer.schemas.llm_schemas import (  # noqa: F401  re-exported for backward compat
@@ -131,6 +133,8 @@ class UnifiedLLMProvider:
 
         Raises:
             LLMError: If all attempts fail
+            DeadlineExceededError: If the request deadline passes before
+                a successful attempt
         """
         # Convert to LLMMessage if dicts provided
         if messages and isinstance(messages[0], dict):
@@ -149,6 +153,9 @@ class UnifiedLLMProvider:
         # Try each model with retries
         for model_name in models_to_try:
             for attempt in range(self.max_retries):
+                # Raises DeadlineExceededError once the request budget is spent
+                timeout = budget_timeout(self.timeout)
+
                 try:
                     logger.debug(
                         "Attempting LLM request",
@@ -168,7 +175,7 @@ class UnifiedLLMProvider:
                         messages=message_dicts,
                         temperature=temperature,
                         max_tokens=max_tokens,
-                        timeout=self.timeout,
+                        timeout=timeout,
                         **kwargs,
                     )
 
@@ -245,9 +252,12 @@ class UnifiedLLMProvider:
                         error_type=type(e).__name__,
                     )
 
-                    # Exponential backoff before retry
+                    # Exponential backoff before retry (never past the deadline)
                     if attempt < self.max_retries - 1:
                         backoff_time = 2**attempt
+                        deadline = current_deadline()
+                        if deadline is not None:
+                            backoff_time = min(backoff_time, deadline.remaining())
                         time.sleep(backoff_time)
 
             # If all retries failed for this model, try next fallback
@@ -332,7 +342,7 @@ class UnifiedLLMProvider:
                 messages=message_dicts,
                 temperature=request.temperature,
                 max_tokens=request.max_tokens,
-                timeout=self.timeout,
+                timeout=budget_timeout(self.timeout),
                 stream=True,
             )
             async for chunk in response:
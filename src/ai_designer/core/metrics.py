@@ -7,6 +7,11 @@ Provides
 - LLM call counters and duration histograms
 - FreeCAD execution counters and duration histograms
 - Agent execution gauges/counters
+- Admission-control gauges/counters (pipelines in flight, decisions)
+- Rule-based fast-path counters (hit / miss / fallback)
+- Planner template-cache counters (hit / miss / low_confidence)
+- State-cache cleanup progress and maintenance-run counters
+- Buffered audit-writer counters (written / spooled / dropped)
 - A ``/metrics`` text endpoint for Prometheus scraping
 
 Usage
@@ -135,6 +140,56 @@ if _PROM_AVAILABLE:
         "Number of active WebSocket connections",
     )
 
+    # Admission control
+    PIPELINES_IN_FLIGHT = Gauge(
+        "pipelines_in_flight",
+        "Design pipelines admitted and not yet finished",
+    )
+    ADMISSION_DECISIONS_TOTAL = Counter(
+        "admission_decisions_total",
+        "Admission decisions for design requests",
+        ["decision"],
+    )
+    ADMISSION_ESTIMATED_WAIT_SECONDS = Gauge(
+        "admission_estimated_wait_seconds",
+        "Estimated queue wait at the last admission decision",
+    )
+    FAST_PATH_REQUESTS_TOTAL = Counter(
+        "fast_path_requests_total",
+        "Design requests seen by the rule-based fast path",
+        ["outcome"],  # hit | miss | fallback
+    )
+    PLAN_CACHE_REQUESTS_TOTAL = Counter(
+        "plan_cache_requests_total",
+        "Planner template-cache lookups",
+        ["outcome"],  # hit | miss | low_confidence
+    )
+    EXPORT_JOBS_TOTAL = Counter(
+        "export_jobs_total",
+        "Background export jobs by outcome",
+        ["outcome"],  # succeeded | failed | deduplicated
+    )
+    AUTH_TOKEN_CACHE_REQUESTS_TOTAL = Counter(
+        "auth_token_cache_requests_total",
+        "Bearer-token verifications by verified-token cache outcome",
+        ["outcome"],  # hit | miss | revoked
+    )
+    STATE_CACHE_CLEANUP_KEYS_TOTAL = Counter(
+        "state_cache_cleanup_keys_total",
+        "Entries removed by bulk state-cache cleanups",
+        ["kind"],  # state | analysis | design
+    )
+    STATE_CACHE_MAINTENANCE_RUNS_TOTAL = Counter(
+        "state_cache_maintenance_runs_total",
+        "Background state-cache maintenance runs",
+        ["outcome"],  # completed | failed | skipped
+    )
+    AUDIT_EVENTS_TOTAL = Counter(
+        "audit_events_total",
+        "Audit events handled by the buffered audit writer",
+        ["outcome"],  # written | spooled | dropped
+    )
+
 else:  # pragma: no cover — stubs so code won't crash if prom unavailable
 
     class _NoOp:
@@ -160,6 +215,16 @@ else:  # pragma: no cover — stubs so code won't crash if prom unavailable
     AGENT_ACTIVE = _noop  # type: ignore[assignment]
     AGENT_WORKFLOW_STEPS = _noop  # type: ignore[assignment]
     WEBSOCKET_CONNECTIONS = _noop  # type: ignore[assignment]
+    PIPELINES_IN_FLIGHT = _noop  # type: ignore[assignment]
+    ADMISSION_DECISIONS_TOTAL = _noop  # type: ignore[assignment]
+    ADMISSION_ESTIMATED_WAIT_SECONDS = _noop  # type: ignore[assignment]
+    FAST_PATH_REQUESTS_TOTAL = _noop  # type: ignore[assignment]
+    PLAN_CACHE_REQUESTS_TOTAL = _noop  # type: ignore[assignment]
+    EXPORT_JOBS_TOTAL = _noop  # type: ignore[assignment]
+    AUTH_TOKEN_CACHE_REQUESTS_TOTAL = _noop  # type: ignore[assignment]
+    STATE_CACHE_CLEANUP_KEYS_TOTAL = _noop  # type: ignore[assignment]
+    STATE_CACHE_MAINTENANCE_RUNS_TOTAL = _noop  # type: ignore[assignment]
+    AUDIT_EVENTS_TOTAL = _noop  # type: ignore[assignment]
 
 
 # ── Helper decorators ─────────────────────────────────────────────────────────
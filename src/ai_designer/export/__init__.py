@@ -6,13 +6,29 @@ Provides export functionality with metadata tracking, caching, and multi-format
 Features:
 - Multi-format export (STEP, STL, FCStd)
 - Metadata generation with prompt hashing
-- Export caching based on prompt hash
+- Export caching based on prompt hash (bounded, process-safe SQLite index)
 - Audit logging integration
 - FastAPI endpoint integration
+- Background export jobs with in-flight deduplication and speculative exports
+- Download artifacts: content-hash ETags and precompressed .gz/.zst siblings
 
 Version: 1.0.0
 """
 
+from .artifacts import ExportArtifact, load_artifact, prepare_artifact
+from .cache_index import ExportCacheIndex
 from .exporter import CADExporter, ExportMetadata, ExportResult
+from .jobs import ExportJob, ExportJobManager, ExportJobStatus
 
-__all__ = ["CADExporter", "ExportMetadata", "ExportResult"]
+__all__ = [
+    "CADExporter",
+    "ExportMetadata",
+    "ExportResult",
+    "ExportJob",
+    "ExportJobManager",
+    "ExportJobStatus",
+    "ExportArtifact",
+    "ExportCacheIndex",
+    "load_artifact",
+    "prepare_artifact",
+]
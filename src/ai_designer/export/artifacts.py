@@ -0,0 +1,290 @@
+"""
+Download-ready export artifacts.
+
+An export is written once and downloaded many times, so the work a download
+needs is done at export time instead of on every request:
+
+- A SHA-256 of the file contents, used as a strong ETag.  Unlike the
+  mtime/size tag of a plain FileResponse it only changes when the bytes do,
+  so re-exporting identical geometry keeps client caches valid.
+- Precompressed siblings (``part.stl.gz`` and, when the optional
+  ``zstandard`` package is installed, ``part.stl.zst``) for the text-heavy
+  formats (STEP, ASCII STL).  A sibling is kept only if it is at least
+  ``EXPORT_PRECOMPRESS_MIN_SAVING`` smaller than the original; FCStd files
+  are zip archives and are never recompressed.
+
+The result is recorded in a manifest next to the file
+(``part.stl.artifact.json``) so every worker and later process reuses it.
+A manifest whose size or mtime no longer matches the file is rebuilt.
+
+Configuration (env vars or function kwargs)
+-------------------------------------------
+EXPORT_PRECOMPRESS_ENABLED      "0" to skip writing compressed siblings
+EXPORT_PRECOMPRESS_MIN_BYTES    int, default 1024 (smaller files are served as-is)
+EXPORT_PRECOMPRESS_MIN_SAVING   float, default 0.1 (share of the size a sibling must save)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Collection, Dict, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_PRECOMPRESS_ENABLED: bool = os.getenv("EXPORT_PRECOMPRESS_ENABLED", "1") == "1"
+_PRECOMPRESS_MIN_BYTES: int = int(os.getenv("EXPORT_PRECOMPRESS_MIN_BYTES", "1024"))
+_PRECOMPRESS_MIN_SAVING: float = float(
+    os.getenv("EXPORT_PRECOMPRESS_MIN_SAVING", "0.1")
+)
+
+# Content codings we can precompress, in server preference order
+ENCODING_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+_INCOMPRESSIBLE_SUFFIXES = {".fcstd"}
+_CHUNK_SIZE = 1024 * 1024
+_MAX_CACHED_ARTIFACTS = 1024
+
+_artifacts: "OrderedDict[str, ExportArtifact]" = OrderedDict()
+_artifacts_lock = threading.Lock()
+
+
+@dataclass
+class ExportArtifact:
+    """An exported file with its content hash and precompressed siblings."""
+
+    path: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    encodings: Dict[str, str] = field(default_factory=dict)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """Strong ETag of the identity file or one of its encoded variants."""
+        tag = self.sha256[:32]
+        if encoding is not None:
+            tag += "-" + ENCODING_SUFFIXES[encoding].lstrip(".")
+        return f'"{tag}"'
+
+    def variant(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], Path]:
+        """
+        Pick the file to send for an ``Accept-Encoding`` header.
+
+        Args:
+            accept_encoding: Request header value (None = identity only)
+
+        Returns:
+            (content coding or None for identity, path of the file to send)
+        """
+        available = {
+            encoding: path
+            for encoding, path in self.encodings.items()
+            if os.path.exists(path)
+        }
+        encoding = negotiate_encoding(accept_encoding, available)
+        if encoding is None:
+            return None, Path(self.path)
+        return encoding, Path(available[encoding])
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """True if the artifact still describes a file with this stat."""
+        return (
+            self.size == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+        )
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], available: Collection[str]
+) -> Optional[str]:
+    """
+    Choose the best available content coding for an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding: Request header value
+        available: Codings a precompressed variant exists for
+
+    Returns:
+        The coding with the highest q-value (ties broken by
+        ``ENCODING_SUFFIXES`` order), or None to send the identity file
+    """
+    if not accept_encoding or not available:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if name == "x-gzip":
+            name = "gzip"
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODING_SUFFIXES:
+        if encoding not in available:
+            continue
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def prepare_artifact(
+    path: Union[str, Path],
+    precompress: bool = _PRECOMPRESS_ENABLED,
+    min_bytes: int = _PRECOMPRESS_MIN_BYTES,
+    min_saving: float = _PRECOMPRESS_MIN_SAVING,
+) -> ExportArtifact:
+    """
+    Hash an exported file, write its compressed siblings and manifest.
+
+    Blocking; call it from a worker thread inside the event loop.
+
+    Args:
+        path: Exported file
+        precompress: Write ``.gz``/``.zst`` siblings
+        min_bytes: Files smaller than this are not compressed
+        min_saving: Share of the size a sibling must save to be kept
+
+    Returns:
+        The prepared artifact
+    """
+    path = Path(path)
+    stat_result = path.stat()
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    artifact = ExportArtifact(
+        path=str(path),
+        sha256=digest.hexdigest(),
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+    )
+
+    if (
+        precompress
+        and stat_result.st_size >= min_bytes
+        and path.suffix.lower() not in _INCOMPRESSIBLE_SUFFIXES
+    ):
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = path.with_name(path.name + suffix)
+            if not _compress(path, sibling, encoding):
+                continue
+            if sibling.stat().st_size <= stat_result.st_size * (1 - min_saving):
+                artifact.encodings[encoding] = str(sibling)
+            else:
+                sibling.unlink()
+
+    try:
+        _manifest_path(path).write_text(json.dumps(asdict(artifact)))
+    except OSError as e:
+        logger.warning(f"Failed to write artifact manifest for {path}: {e}")
+
+    logger.info(
+        f"Prepared artifact {path.name}: {stat_result.st_size} bytes, "
+        f"encodings={sorted(artifact.encodings) or 'none'}"
+    )
+    _remember(artifact)
+    return artifact
+
+
+def load_artifact(path: Union[str, Path]) -> ExportArtifact:
+    """
+    Artifact of an exported file, preparing it if needed.
+
+    Served from a per-process cache, then the on-disk manifest; files
+    exported before manifests existed (or changed since) are prepared now.
+    Blocking; call it from a worker thread inside the event loop.
+
+    Args:
+        path: Exported file
+
+    Returns:
+        The artifact
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(path)
+    stat_result = path.stat()
+
+    with _artifacts_lock:
+        cached = _artifacts.get(str(path))
+    if cached is not None and cached.matches(stat_result):
+        return cached
+
+    artifact = _read_manifest(path)
+    if artifact is None or not artifact.matches(stat_result):
+        return prepare_artifact(path)
+
+    _remember(artifact)
+    return artifact
+
+
+def _manifest_path(path: Path) -> Path:
+    return path.with_name(path.name + ".artifact.json")
+
+
+def _read_manifest(path: Path) -> Optional[ExportArtifact]:
+    try:
+        return ExportArtifact(**json.loads(_manifest_path(path).read_text()))
+    except FileNotFoundError:
+        return None
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable artifact manifest for {path}: {e}")
+        return None
+
+
+def _remember(artifact: ExportArtifact) -> None:
+    with _artifacts_lock:
+        _artifacts[artifact.path] = artifact
+        _artifacts.move_to_end(artifact.path)
+        while len(_artifacts) > _MAX_CACHED_ARTIFACTS:
+            _artifacts.popitem(last=False)
+
+
+def _compress(source: Path, target: Path, encoding: str) -> bool:
+    """Write ``source`` compressed to ``target`` atomically; False if unsupported."""
+    if encoding == "zstd" and zstandard is None:
+        return False
+
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(source, "rb") as fin, open(tmp, "wb") as fout:
+            if encoding == "gzip":
+                # mtime=0 keeps the output (and its ETag) reproducible
+                with gzip.GzipFile(
+                    filename="", mode="wb", fileobj=fout, compresslevel=9, mtime=0
+                ) as gz:
+                    shutil.copyfileobj(fin, gz, _CHUNK_SIZE)
+            else:
+                zstandard.ZstdCompressor(level=19).copy_stream(fin, fout)
+        os.replace(tmp, target)
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to write {encoding} variant of {source}: {e}")
+        tmp.unlink(missing_ok=True)
+        return False
@@ -0,0 +1,244 @@
+"""
+SQLite index of cached exports.
+
+Maps (cache key, format) to an exported file together with its size,
+content hash and last access time.  The index lives in one SQLite database
+in WAL mode, so:
+
+- Every change is a small row write instead of rewriting a JSON file.
+- Several API workers can share one cache directory: readers never block,
+  and writers serialize on SQLite's lock (``BEGIN IMMEDIATE``) instead of
+  overwriting each other's index.
+- The cache is bounded.  When the files recorded exceed ``max_bytes``, the
+  least recently used entries are removed from the index and their files
+  (with sidecars and precompressed siblings) are deleted.
+
+Last access times are only rewritten when they are older than
+``touch_interval_seconds``, so hot cache hits stay read-only.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+EXPORT_CACHE_MAX_BYTES              int, default 5368709120 (5 GiB; 0 = unbounded)
+EXPORT_CACHE_TOUCH_INTERVAL_SECONDS float, default 60
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_MAX_BYTES: int = int(os.getenv("EXPORT_CACHE_MAX_BYTES", str(5 * 1024**3)))
+_TOUCH_INTERVAL_SECONDS: float = float(
+    os.getenv("EXPORT_CACHE_TOUCH_INTERVAL_SECONDS", "60")
+)
+
+# Files written next to an export that belong to it
+_COMPANION_SUFFIXES = (".json", ".artifact.json", ".gz", ".zst")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    cache_key   TEXT NOT NULL,
+    format      TEXT NOT NULL,
+    file_path   TEXT NOT NULL,
+    size_bytes  INTEGER NOT NULL,
+    sha256      TEXT,
+    created_at  REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (cache_key, format)
+);
+CREATE INDEX IF NOT EXISTS exports_last_access ON exports (last_access);
+"""
+
+
+class ExportCacheIndex:
+    """Process-safe, size-bounded index of cached export files."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        touch_interval_seconds: float = _TOUCH_INTERVAL_SECONDS,
+    ):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            db_path: SQLite database file
+            max_bytes: Total size of cached files to keep (0 = unbounded,
+                None = EXPORT_CACHE_MAX_BYTES)
+            touch_interval_seconds: Minimum age of a last access time before
+                a cache hit rewrites it
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = _MAX_BYTES if max_bytes is None else max_bytes
+        self.touch_interval_seconds = touch_interval_seconds
+        self._local = threading.local()
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Connection of the calling thread (sqlite3 connections are per thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, cache_key: str, format: str) -> Optional[Path]:
+        """
+        Find a cached export and mark it as used.
+
+        Entries whose file has disappeared are removed.
+
+        Args:
+            cache_key: Export cache key (see ``CADExporter.compute_cache_key``)
+            format: Export format
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT file_path FROM exports WHERE cache_key = ? AND format = ?",
+            (cache_key, format),
+        ).fetchone()
+        if row is None:
+            return None
+
+        path = Path(row[0])
+        if not path.exists():
+            logger.warning(f"Stale cache entry for {cache_key}/{format}, removing")
+            self.remove(cache_key, format)
+            return None
+
+        now = time.time()
+        conn.execute(
+            "UPDATE exports SET last_access = ? "
+            "WHERE cache_key = ? AND format = ? AND last_access < ?",
+            (now, cache_key, format, now - self.touch_interval_seconds),
+        )
+        return path
+
+    def record(
+        self,
+        cache_key: str,
+        format: str,
+        file_path: Union[str, Path],
+        size_bytes: int,
+        sha256: Optional[str] = None,
+    ) -> List[Path]:
+        """
+        Add or replace an entry, then evict down to ``max_bytes``.
+
+        Args:
+            cache_key: Export cache key (see ``CADExporter.compute_cache_key``)
+            format: Export format
+            file_path: Exported file
+            size_bytes: Bytes the entry occupies on disk (including siblings)
+            sha256: Content hash of the file
+
+        Returns:
+            Files deleted by eviction
+        """
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO exports (cache_key, format, file_path, size_bytes, "
+                "sha256, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (cache_key, format) DO UPDATE SET "
+                "file_path = excluded.file_path, size_bytes = excluded.size_bytes, "
+                "sha256 = excluded.sha256, created_at = excluded.created_at, "
+                "last_access = excluded.last_access",
+                (cache_key, format, str(file_path), size_bytes, sha256, now, now),
+            )
+            evicted = self._evict(conn, keep=(cache_key, format))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        for path in evicted:
+            _delete_export_files(path)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} cached exports")
+        return evicted
+
+    def _evict(self, conn: sqlite3.Connection, keep: tuple) -> List[Path]:
+        """Drop least recently used entries over the size cap (transaction held)."""
+        if self.max_bytes <= 0:
+            return []
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM exports")
+        excess = total.fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return []
+
+        victims = []
+        rows = conn.execute(
+            "SELECT cache_key, format, file_path, size_bytes FROM exports "
+            "WHERE NOT (cache_key = ? AND format = ?) ORDER BY last_access",
+            keep,
+        )
+        for cache_key, format, file_path, size_bytes in rows:
+            if excess <= 0:
+                break
+            victims.append((cache_key, format, file_path))
+            excess -= size_bytes
+
+        conn.executemany(
+            "DELETE FROM exports WHERE cache_key = ? AND format = ?",
+            [(cache_key, format) for cache_key, format, _ in victims],
+        )
+        # A file may still be referenced by another entry
+        evicted = []
+        for _, _, file_path in victims:
+            shared = conn.execute(
+                "SELECT 1 FROM exports WHERE file_path = ? LIMIT 1", (file_path,)
+            ).fetchone()
+            if shared is None:
+                evicted.append(Path(file_path))
+        return evicted
+
+    def remove(self, cache_key: str, format: str) -> bool:
+        """
+        Remove an entry (the file is left alone).
+
+        Returns:
+            True if the entry existed
+        """
+        cursor = self._conn().execute(
+            "DELETE FROM exports WHERE cache_key = ? AND format = ?",
+            (cache_key, format),
+        )
+        return cursor.rowcount > 0
+
+    def total_bytes(self) -> int:
+        """Total size of the indexed files."""
+        row = self._conn().execute("SELECT COALESCE(SUM(size_bytes), 0) FROM exports")
+        return row.fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM exports").fetchone()[0]
+
+
+def _delete_export_files(path: Path) -> None:
+    """Delete an evicted export and the files written next to it."""
+    for target in [path] + [
+        path.with_name(path.name + suffix) for suffix in _COMPANION_SUFFIXES
+    ]:
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete evicted export file {target}: {e}")
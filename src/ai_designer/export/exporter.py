@@ -3,9 +3,11 @@ CAD Exporter with Metadata and Caching
 
 Wrapper around HeadlessRunner export functionality with:
 - Enhanced metadata tracking (prompt hash, timestamps, file sizes)
-- Export caching to avoid regenerating identical designs
+- Export caching keyed on geometry, so identical parts are exported once
+  (bounded SQLite index)
 - Multi-format export (STEP, STL, FCStd)
 - JSON sidecar files for metadata
+- Content hashes and precompressed siblings for downloads (see artifacts.py)
 - Audit logging integration
 
 Version: 1.0.0
@@ -15,16 +17,28 @@ import asyncio
 import hashlib
 import json
 import logging
+import re
+import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from ..freecad.headless_runner import HeadlessRunner
+from .artifacts import ExportArtifact, prepare_artifact
+from .cache_index import ExportCacheIndex
 
 logger = logging.getLogger(__name__)
 
+# Parts of an .FCStd archive that change on every save without changing geometry
+_VOLATILE_MEMBERS = {"GuiDocument.xml"}
+_VOLATILE_PROPERTIES = re.compile(
+    rb'<Property name="(?:CreationDate|LastModifiedDate|LastModifiedBy|CreatedBy|'
+    rb'Uid|Id|FileName|TransientDir)".*?</Property>',
+    re.DOTALL,
+)
+
 
 @dataclass
 class ExportMetadata:
@@ -40,6 +54,7 @@ class ExportMetadata:
     freecad_version: Optional[str] = None
     export_settings: Dict[str, any] = field(default_factory=dict)
     cache_hit: bool = False
+    cache_key: Optional[str] = None
 
 
 @dataclass
@@ -71,6 +86,7 @@ class CADExporter:
         outputs_dir: str = "outputs",
         enable_cache: bool = True,
         cache_dir: Optional[str] = None,
+        cache_max_bytes: Optional[int] = None,
     ):
         """
         Initialize CAD exporter.
@@ -80,6 +96,8 @@ class CADExporter:
             outputs_dir: Directory for exports (default: "outputs")
             enable_cache: Enable export caching (default: True)
             cache_dir: Cache directory (default: outputs_dir/.cache)
+            cache_max_bytes: Size cap of cached exports (default:
+                EXPORT_CACHE_MAX_BYTES, see cache_index.py)
         """
         self.runner = headless_runner or HeadlessRunner(outputs_dir=outputs_dir)
         self.outputs_dir = Path(outputs_dir)
@@ -89,38 +107,41 @@ class CADExporter:
         self.cache_dir = Path(cache_dir) if cache_dir else self.outputs_dir / ".cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Cache index: prompt_hash -> {format: file_path}
-        self.cache_index_path = self.cache_dir / "export_cache_index.json"
-        self._cache_index = self._load_cache_index()
-
-        # Ensure cache index file exists
-        if not self.cache_index_path.exists():
-            self._save_cache_index()
+        # Cache index: (cache_key, format) -> file, shared by all workers
+        self.cache_index_path = self.cache_dir / "export_cache.sqlite3"
+        self._remove_legacy_index()
+        self.cache_index = ExportCacheIndex(
+            self.cache_index_path, max_bytes=cache_max_bytes
+        )
+        # Exports currently running, by cache key
+        self._in_flight: Dict[str, asyncio.Future] = {}
 
         logger.info(
             f"Initialized CADExporter: outputs_dir={outputs_dir}, "
             f"cache_enabled={enable_cache}"
         )
 
-    def _load_cache_index(self) -> Dict[str, Dict[str, str]]:
-        """Load export cache index from disk."""
-        if not self.cache_index_path.exists():
-            return {}
-
-        try:
-            with open(self.cache_index_path, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load cache index: {e}")
-            return {}
+    def _remove_legacy_index(self) -> None:
+        """
+        Delete the prompt-keyed index of earlier versions.
 
-    def _save_cache_index(self):
-        """Save export cache index to disk."""
-        try:
-            with open(self.cache_index_path, "w") as f:
-                json.dump(self._cache_index, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save cache index: {e}")
+        ``export_cache_index.sqlite3`` keyed exports on the prompt text, so
+        none of its entries can be hit any more; left in place it would only
+        keep its files outside the size bound.  The export files themselves
+        are kept, as finished export jobs may still point at them.
+        """
+        legacy = self.cache_dir / "export_cache_index.sqlite3"
+        removed = False
+        for path in (legacy, Path(f"{legacy}-wal"), Path(f"{legacy}-shm")):
+            try:
+                path.unlink()
+                removed = True
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Cannot remove legacy export cache index {path}: {e}")
+        if removed:
+            logger.info(f"Removed legacy prompt-keyed export cache index {legacy}")
 
     @staticmethod
     def compute_prompt_hash(prompt: str) -> str:
@@ -140,12 +161,87 @@ class CADExporter:
         hash_obj = hashlib.sha256(prompt.encode("utf-8"))
         return hash_obj.hexdigest()[:16]  # Use first 16 chars for brevity
 
-    def _check_cache(self, prompt_hash: str, format: str) -> Optional[Path]:
+    def compute_cache_key(
+        self,
+        doc_path: Path,
+        format: str,
+        export_settings: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Cache key of an export: what is exported, in which format and how.
+
+        Combines the canonical geometry hash of the document (see
+        ``compute_geometry_hash``), the FreeCAD version and the export
+        settings, so different prompts producing the same part share one
+        export while a rerun producing different geometry misses the cache.
+
+        Blocking (reads the document); call it from a worker thread.
+
+        Args:
+            doc_path: Path to FreeCAD document (.FCStd)
+            format: Export format
+            export_settings: Format-specific export kwargs (e.g. resolution)
+
+        Returns:
+            Hex string of SHA-256 hash (first 32 chars)
+
+        Raises:
+            OSError: If the document cannot be read
+        """
+        key = hashlib.sha256()
+        key.update(self.compute_geometry_hash(doc_path).encode("ascii"))
+        key.update(f"\0{format}\0{self.runner.freecad_version}\0".encode("utf-8"))
+        key.update(
+            json.dumps(export_settings or {}, sort_keys=True, default=str).encode(
+                "utf-8"
+            )
+        )
+        return key.hexdigest()[:32]
+
+    @staticmethod
+    def compute_geometry_hash(doc_path: Path) -> str:
+        """
+        SHA-256 of a FreeCAD document's content, ignoring save-time noise.
+
+        An .FCStd file is a zip archive whose bytes change on every save
+        (member timestamps, creation/modification dates, UIDs).  The hash
+        covers the decompressed members in name order instead, skips the
+        GUI state and thumbnails, and blanks the volatile document
+        properties.  Files that are not zip archives are hashed as-is.
+
+        Args:
+            doc_path: Path to FreeCAD document
+
+        Returns:
+            Hex string of SHA-256 hash
+
+        Raises:
+            OSError: If the document cannot be read
+        """
+        digest = hashlib.sha256()
+        if not zipfile.is_zipfile(doc_path):
+            with open(doc_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+
+        with zipfile.ZipFile(doc_path) as archive:
+            for name in sorted(archive.namelist()):
+                if name in _VOLATILE_MEMBERS or name.startswith("thumbnails/"):
+                    continue
+                content = archive.read(name)
+                if name == "Document.xml":
+                    content = _VOLATILE_PROPERTIES.sub(b"", content)
+                digest.update(name.encode("utf-8") + b"\0")
+                digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def _check_cache(self, cache_key: str, format: str) -> Optional[Path]:
         """
         Check if export exists in cache.
 
         Args:
-            prompt_hash: Hash of user prompt
+            cache_key: Geometry cache key (see ``compute_cache_key``)
             format: Export format (step, stl, fcstd)
 
         Returns:
@@ -154,40 +250,46 @@ class CADExporter:
         if not self.enable_cache:
             return None
 
-        # Check index
-        cached_entry = self._cache_index.get(prompt_hash, {}).get(format)
-        if not cached_entry:
-            return None
-
-        # Verify file exists
-        cached_path = Path(cached_entry)
-        if cached_path.exists():
-            logger.info(f"Cache HIT: {format} for prompt_hash={prompt_hash}")
-            return cached_path
-
-        # Stale cache entry
-        logger.warning(f"Stale cache entry for {prompt_hash}/{format}, removing")
-        del self._cache_index[prompt_hash][format]
-        self._save_cache_index()
-        return None
+        cached_path = self.cache_index.lookup(cache_key, format)
+        if cached_path:
+            logger.info(f"Cache HIT: {format} for cache_key={cache_key}")
+        return cached_path
 
-    def _update_cache(self, prompt_hash: str, format: str, file_path: Path):
+    def _update_cache(
+        self,
+        cache_key: str,
+        format: str,
+        file_path: Path,
+        artifact: Optional[ExportArtifact] = None,
+    ):
         """
         Update cache index with new export.
 
         Args:
-            prompt_hash: Hash of user prompt
+            cache_key: Geometry cache key (see ``compute_cache_key``)
             format: Export format
             file_path: Path to exported file
+            artifact: Download artifact of the file (content hash and
+                precompressed siblings, counted towards the cache size)
         """
         if not self.enable_cache:
             return
 
-        if prompt_hash not in self._cache_index:
-            self._cache_index[prompt_hash] = {}
+        size_bytes = file_path.stat().st_size if file_path.exists() else 0
+        if artifact is not None:
+            size_bytes += sum(
+                Path(p).stat().st_size
+                for p in artifact.encodings.values()
+                if Path(p).exists()
+            )
 
-        self._cache_index[prompt_hash][format] = str(file_path)
-        self._save_cache_index()
+        self.cache_index.record(
+            cache_key,
+            format,
+            file_path,
+            size_bytes,
+            sha256=artifact.sha256 if artifact else None,
+        )
 
         logger.info(f"Cache updated: {format} -> {file_path}")
 
@@ -200,6 +302,7 @@ class CADExporter:
         file_path: Path,
         export_settings: Dict[str, any] = None,
         cache_hit: bool = False,
+        cache_key: Optional[str] = None,
     ) -> ExportMetadata:
         """
         Generate export metadata.
@@ -212,6 +315,7 @@ class CADExporter:
             file_path: Path to exported file
             export_settings: Format-specific export settings
             cache_hit: Whether this was a cache hit
+            cache_key: Geometry cache key the export is stored under
 
         Returns:
             ExportMetadata object
@@ -229,6 +333,7 @@ class CADExporter:
             freecad_version=self.runner.freecad_version,
             export_settings=export_settings or {},
             cache_hit=cache_hit,
+            cache_key=cache_key,
         )
 
     def _save_metadata_sidecar(self, file_path: Path, metadata: ExportMetadata):
@@ -255,6 +360,7 @@ class CADExporter:
                 "freecad_version": metadata.freecad_version,
                 "export_settings": metadata.export_settings,
                 "cache_hit": metadata.cache_hit,
+                "cache_key": metadata.cache_key,
             }
 
             with open(sidecar_path, "w") as f:
@@ -306,32 +412,133 @@ class CADExporter:
                 error=f"Unsupported format: {format}. Use step, stl, or fcstd.",
             )
 
-        # Compute prompt hash for caching
         prompt_hash = self.compute_prompt_hash(prompt)
+        loop = asyncio.get_running_loop()
 
-        # Check cache
-        cached_path = self._check_cache(prompt_hash, format)
+        # Cache on what is exported, not on the prompt text
+        try:
+            cache_key = await loop.run_in_executor(
+                None, self.compute_cache_key, Path(doc_path), format, export_kwargs
+            )
+        except OSError as e:
+            logger.warning(f"Cannot hash {doc_path} for export caching: {e}")
+            cache_key = None
+
+        # The index is SQLite shared between workers: its locks may wait
+        cached_path = (
+            await loop.run_in_executor(None, self._check_cache, cache_key, format)
+            if cache_key
+            else None
+        )
         if cached_path:
-            metadata = self._generate_metadata(
-                prompt=prompt,
-                prompt_hash=prompt_hash,
-                request_id=str(request_id),
-                format=format,
-                file_path=cached_path,
-                export_settings=export_kwargs,
-                cache_hit=True,
+            return self._cached_result(
+                cached_path,
+                prompt,
+                prompt_hash,
+                cache_key,
+                request_id,
+                format,
+                export_kwargs,
             )
-            return ExportResult(
-                success=True,
-                format=format,
-                file_path=cached_path,
-                metadata=metadata,
-                cache_hit=True,
+
+        # Identical geometry already being exported: share that export
+        in_flight = self._in_flight.get(cache_key) if cache_key else None
+        if in_flight is not None:
+            result = await asyncio.shield(in_flight)
+            if not result.success:
+                return result
+            return self._cached_result(
+                result.file_path,
+                prompt,
+                prompt_hash,
+                cache_key,
+                request_id,
+                format,
+                export_kwargs,
+            )
+
+        if cache_key is None:
+            return await self._export_uncached(
+                doc_path,
+                format,
+                prompt,
+                prompt_hash,
+                None,
+                request_id,
+                output_path,
+                export_kwargs,
             )
 
-        # Generate output path if not provided
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            result = await self._export_uncached(
+                doc_path,
+                format,
+                prompt,
+                prompt_hash,
+                cache_key,
+                request_id,
+                output_path,
+                export_kwargs,
+            )
+        except BaseException:
+            future.set_result(
+                ExportResult(success=False, format=format, error="Export cancelled")
+            )
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._in_flight.pop(cache_key, None)
+        return result
+
+    def _cached_result(
+        self,
+        cached_path: Path,
+        prompt: str,
+        prompt_hash: str,
+        cache_key: str,
+        request_id: UUID,
+        format: str,
+        export_kwargs: Dict[str, Any],
+    ) -> ExportResult:
+        """Result for a request served by an existing export."""
+        metadata = self._generate_metadata(
+            prompt=prompt,
+            prompt_hash=prompt_hash,
+            request_id=str(request_id),
+            format=format,
+            file_path=cached_path,
+            export_settings=export_kwargs,
+            cache_hit=True,
+            cache_key=cache_key,
+        )
+        return ExportResult(
+            success=True,
+            format=format,
+            file_path=cached_path,
+            metadata=metadata,
+            cache_hit=True,
+        )
+
+    async def _export_uncached(
+        self,
+        doc_path: Path,
+        format: str,
+        prompt: str,
+        prompt_hash: str,
+        cache_key: Optional[str],
+        request_id: UUID,
+        output_path: Optional[Path],
+        export_kwargs: Dict[str, Any],
+    ) -> ExportResult:
+        """Run the FreeCAD export and record it in the cache."""
+        # Generate output path if not provided.  Cached exports are named by
+        # cache key: a request/prompt name would be reused by a rerun with
+        # different geometry, overwriting a file another key still serves.
         if output_path is None:
-            base_name = f"{request_id}_{prompt_hash}"
+            base_name = cache_key or f"{request_id}_{prompt_hash}"
             suffix = {"step": ".step", "stl": ".stl", "fcstd": ".FCStd"}[format]
             output_path = self.outputs_dir / f"{base_name}{suffix}"
 
@@ -357,9 +564,6 @@ class CADExporter:
                     error=f"Export failed for format: {format}",
                 )
 
-            # Update cache
-            self._update_cache(prompt_hash, format, result_path)
-
             # Generate and save metadata
             metadata = self._generate_metadata(
                 prompt=prompt,
@@ -369,9 +573,25 @@ class CADExporter:
                 file_path=result_path,
                 export_settings=export_kwargs,
                 cache_hit=False,
+                cache_key=cache_key,
             )
             self._save_metadata_sidecar(result_path, metadata)
 
+            # Hash and precompress once here rather than on every download
+            artifact = None
+            try:
+                artifact = await asyncio.get_running_loop().run_in_executor(
+                    None, prepare_artifact, result_path
+                )
+            except Exception as e:
+                logger.warning(f"Failed to prepare download artifact: {e}")
+
+            # Update cache (may wait on the index lock and unlink evicted files)
+            if cache_key is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._update_cache, cache_key, format, result_path, artifact
+                )
+
             return ExportResult(
                 success=True,
                 format=format,
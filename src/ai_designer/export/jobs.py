@@ -0,0 +1,458 @@
+"""
+Asynchronous export jobs.
+
+FreeCAD exports (especially STL meshing of large parts) can take far longer
+than an HTTP request should stay open.  ``ExportJobManager`` turns each
+(design, format) export into a background job: ``submit`` returns at once
+with a job record that callers poll, and the finished artifact is served
+from the record's ``file_path``.
+
+- A job that is already queued or running for the same design and format
+  is returned instead of starting a second FreeCAD export.
+- At most ``max_concurrent_jobs`` exports run at a time per process.
+- Job records are mirrored to Redis (``export_job:{job_id}``) when a client
+  is given, so any API worker can answer status and download requests.
+  Redis I/O runs in the default executor, never on the event loop.
+- With Redis, a job first claims ``export_job:active:{request_id}:{format}``
+  (SET NX).  If another worker already exports that design and format, the
+  job follows that worker's job record instead of running FreeCAD again.
+
+Speculative exports: the manager counts which formats each client asks
+for (``record_request``).  When a design of that client completes,
+``prefetch`` queues the formats that make up at least
+``speculative_min_share`` of the client's requests, so the usual download
+is ready before it is requested.  Preferences are kept for the
+``EXPORT_PREFERENCES_MAX_CLIENTS`` most recently active clients.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+EXPORT_MAX_CONCURRENT_JOBS      int, default 2
+EXPORT_JOB_TTL_SECONDS          int, default 86400 (job records in Redis)
+EXPORT_LOCAL_MAX_JOBS           int, default 1000 (finished records kept in memory)
+EXPORT_SPECULATIVE_ENABLED      "0" to disable speculative exports
+EXPORT_SPECULATIVE_MIN_SHARE    float, default 0.5
+EXPORT_SPECULATIVE_MIN_REQUESTS int, default 3 (history needed before prefetching)
+EXPORT_PREFERENCES_MAX_CLIENTS  int, default 10000 (clients with tracked preferences)
+EXPORT_CLAIM_TTL_SECONDS        int, default 900 (cross-worker export claim)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from ..core.metrics import EXPORT_JOBS_TOTAL
+from .exporter import CADExporter
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_MAX_CONCURRENT_JOBS: int = int(os.getenv("EXPORT_MAX_CONCURRENT_JOBS", "2"))
+_JOB_TTL_SECONDS: int = int(os.getenv("EXPORT_JOB_TTL_SECONDS", "86400"))
+_LOCAL_MAX_JOBS: int = int(os.getenv("EXPORT_LOCAL_MAX_JOBS", "1000"))
+_SPECULATIVE_ENABLED: bool = os.getenv("EXPORT_SPECULATIVE_ENABLED", "1") == "1"
+_SPECULATIVE_MIN_SHARE: float = float(os.getenv("EXPORT_SPECULATIVE_MIN_SHARE", "0.5"))
+_SPECULATIVE_MIN_REQUESTS: int = int(os.getenv("EXPORT_SPECULATIVE_MIN_REQUESTS", "3"))
+_PREFERENCES_MAX_CLIENTS: int = int(
+    os.getenv("EXPORT_PREFERENCES_MAX_CLIENTS", "10000")
+)
+_CLAIM_TTL_SECONDS: int = int(os.getenv("EXPORT_CLAIM_TTL_SECONDS", "900"))
+
+# How often a job re-reads the record of the job it follows on another worker
+_FOLLOW_POLL_SECONDS = 1.0
+
+EXPORT_FORMATS = ("step", "stl", "fcstd")
+
+
+class ExportJobStatus(str, Enum):
+    """Lifecycle of an export job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class ExportJob:
+    """State of one (design, format) export."""
+
+    job_id: str
+    request_id: str
+    format: str
+    status: ExportJobStatus = ExportJobStatus.QUEUED
+    created_at: str = ""
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    file_path: Optional[str] = None
+    file_size_bytes: Optional[int] = None
+    cache_hit: bool = False
+    speculative: bool = False
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """True once the job succeeded or failed."""
+        return self.status in (ExportJobStatus.SUCCEEDED, ExportJobStatus.FAILED)
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["status"] = self.status.value
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ExportJob":
+        data = json.loads(raw)
+        data["status"] = ExportJobStatus(data["status"])
+        return cls(**data)
+
+
+class ExportJobManager:
+    """Runs exports in the background and tracks their jobs."""
+
+    def __init__(
+        self,
+        exporter: CADExporter,
+        redis_client: Optional[Any] = None,
+        max_concurrent_jobs: int = _MAX_CONCURRENT_JOBS,
+        job_ttl_seconds: int = _JOB_TTL_SECONDS,
+        local_max_jobs: int = _LOCAL_MAX_JOBS,
+        speculative_enabled: bool = _SPECULATIVE_ENABLED,
+        speculative_min_share: float = _SPECULATIVE_MIN_SHARE,
+        speculative_min_requests: int = _SPECULATIVE_MIN_REQUESTS,
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            exporter: CAD exporter that performs the exports
+            redis_client: RedisClient for shared job records (None = local only)
+            max_concurrent_jobs: Exports allowed to run at the same time
+            job_ttl_seconds: Expiration of job records in Redis
+            local_max_jobs: Finished job records kept in memory
+            speculative_enabled: Pre-generate exports on design completion
+            speculative_min_share: Minimum share of a client's requests a
+                format needs to be pre-generated
+            speculative_min_requests: Requests a client must have made
+                before its preferences are used
+        """
+        self.exporter = exporter
+        self.redis_client = redis_client
+        self.job_ttl_seconds = job_ttl_seconds
+        self.local_max_jobs = local_max_jobs
+        self.speculative_enabled = speculative_enabled
+        self.speculative_min_share = speculative_min_share
+        self.speculative_min_requests = speculative_min_requests
+
+        self._semaphore = asyncio.Semaphore(max(max_concurrent_jobs, 1))
+        self._jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
+        self._active: Dict[Tuple[str, str], str] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._preferences: "OrderedDict[str, Counter]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── Jobs ─────────────────────────────────────────────────────────────────
+
+    def submit(
+        self,
+        request_id: str,
+        format: str,
+        doc_path: Path,
+        prompt: str,
+        speculative: bool = False,
+    ) -> ExportJob:
+        """
+        Queue an export, reusing an in-flight job for the same design and format.
+
+        Must be called from a running event loop.
+
+        Args:
+            request_id: Design request ID
+            format: Export format (step, stl, fcstd)
+            doc_path: FreeCAD document to export
+            prompt: Design prompt (used for the exporter's cache key)
+            speculative: Whether the job was started by ``prefetch``
+
+        Returns:
+            The new or already running job
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        format = format.lower()
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+
+        key = (str(request_id), format)
+        with self._lock:
+            active_id = self._active.get(key)
+            if active_id is not None:
+                EXPORT_JOBS_TOTAL.labels(outcome="deduplicated").inc()
+                return self._jobs[active_id]
+
+            job = ExportJob(
+                job_id=uuid4().hex,
+                request_id=str(request_id),
+                format=format,
+                created_at=datetime.utcnow().isoformat(),
+                speculative=speculative,
+            )
+            self._active[key] = job.job_id
+            self._jobs[job.job_id] = job
+
+        task = asyncio.get_running_loop().create_task(
+            self._run(job, Path(doc_path), prompt)
+        )
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+
+        logger.info(
+            f"Queued {'speculative ' if speculative else ''}{format} export "
+            f"{job.job_id} for {request_id}"
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Look up a job by ID (blocking; use ``fetch`` on the event loop).
+
+        Args:
+            job_id: Export job ID
+
+        Returns:
+            Job record, or None if unknown or expired
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None or self.redis_client is None:
+            return job
+
+        try:
+            raw = self.redis_client.get(self._job_key(job_id))
+        except Exception as e:
+            logger.warning(f"Export job lookup failed for {job_id}: {e}")
+            return None
+        if raw is None:
+            return None
+        return ExportJob.from_json(
+            raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        )
+
+    async def fetch(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Look up a job by ID without blocking the event loop.
+
+        Args:
+            job_id: Export job ID
+
+        Returns:
+            Job record, or None if unknown or expired
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None or self.redis_client is None:
+            return job
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, job_id)
+
+    async def wait(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Wait for a job running in this process to finish.
+
+        Args:
+            job_id: Export job ID
+
+        Returns:
+            The job record once finished (or as stored, if not running here)
+        """
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return await self.fetch(job_id)
+
+    async def _run(self, job: ExportJob, doc_path: Path, prompt: str) -> None:
+        loop = asyncio.get_running_loop()
+        claimed = False
+        try:
+            await loop.run_in_executor(None, self._persist, job)
+            owner_id = await loop.run_in_executor(None, self._claim, job)
+            claimed = owner_id == job.job_id
+            if not claimed and await self._follow(job, owner_id):
+                return
+
+            async with self._semaphore:
+                job.status = ExportJobStatus.RUNNING
+                job.started_at = datetime.utcnow().isoformat()
+                await loop.run_in_executor(None, self._persist, job)
+
+                result = await self.exporter.export_format(
+                    doc_path=doc_path,
+                    format=job.format,
+                    prompt=prompt,
+                    request_id=UUID(job.request_id),
+                )
+
+            if result.success:
+                job.status = ExportJobStatus.SUCCEEDED
+                job.file_path = str(result.file_path)
+                job.file_size_bytes = (
+                    result.metadata.file_size_bytes if result.metadata else None
+                )
+                job.cache_hit = result.cache_hit
+            else:
+                job.status = ExportJobStatus.FAILED
+                job.error = result.error or "Export failed"
+        except Exception as e:
+            logger.error(f"Export job {job.job_id} crashed: {e}")
+            job.status = ExportJobStatus.FAILED
+            job.error = f"Export exception: {e}"
+        finally:
+            job.finished_at = datetime.utcnow().isoformat()
+            with self._lock:
+                self._active.pop((job.request_id, job.format), None)
+                self._trim()
+            await loop.run_in_executor(None, self._persist, job)
+            if claimed:
+                await loop.run_in_executor(None, self._release_claim, job)
+            EXPORT_JOBS_TOTAL.labels(outcome=job.status.value).inc()
+
+    async def _follow(self, job: ExportJob, owner_id: str) -> bool:
+        """
+        Mirror the outcome of the job exporting the same file on another worker.
+
+        Returns:
+            False if the owner's record vanished (the caller exports itself)
+        """
+        EXPORT_JOBS_TOTAL.labels(outcome="deduplicated").inc()
+        logger.info(f"Export job {job.job_id} follows {owner_id} on another worker")
+        while True:
+            owner = await self.fetch(owner_id)
+            if owner is None:
+                return False
+            if owner.finished:
+                job.status = owner.status
+                job.started_at = owner.started_at
+                job.file_path = owner.file_path
+                job.file_size_bytes = owner.file_size_bytes
+                job.cache_hit = owner.cache_hit
+                job.error = owner.error
+                return True
+            await asyncio.sleep(_FOLLOW_POLL_SECONDS)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"export_job:{job_id}"
+
+    def _claim_key(self, job: ExportJob) -> str:
+        return f"export_job:active:{job.request_id}:{job.format}"
+
+    def _claim(self, job: ExportJob) -> str:
+        """ID of the job exporting this design and format across workers."""
+        if self.redis_client is None:
+            return job.job_id
+        key = self._claim_key(job)
+        try:
+            if self.redis_client.set(key, job.job_id, ex=_CLAIM_TTL_SECONDS, nx=True):
+                return job.job_id
+            owner = self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Export claim failed for {job.job_id}: {e}")
+            return job.job_id
+        if owner is None:
+            return job.job_id
+        return owner.decode("utf-8") if isinstance(owner, bytes) else owner
+
+    def _release_claim(self, job: ExportJob) -> None:
+        key = self._claim_key(job)
+        try:
+            owner = self.redis_client.get(key)
+            if owner in (job.job_id, job.job_id.encode("utf-8")):
+                self.redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to release export claim {job.job_id}: {e}")
+
+    def _persist(self, job: ExportJob) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.set(
+                self._job_key(job.job_id), job.to_json(), ex=self.job_ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist export job {job.job_id}: {e}")
+
+    def _trim(self) -> None:
+        """Drop the oldest finished jobs beyond ``local_max_jobs`` (lock held)."""
+        excess = len(self._jobs) - self.local_max_jobs
+        if excess <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values() if j.finished][:excess]:
+            del self._jobs[job_id]
+
+    # ── Speculative exports ──────────────────────────────────────────────────
+
+    def record_request(self, client_key: str, formats: List[str]) -> None:
+        """
+        Remember which formats a client asked for.
+
+        Args:
+            client_key: Stable client identifier
+            formats: Formats of one export request
+        """
+        with self._lock:
+            counts = self._preferences.setdefault(client_key, Counter())
+            self._preferences.move_to_end(client_key)
+            counts["_requests"] += 1
+            counts.update(f for f in set(formats) if f in EXPORT_FORMATS)
+            while len(self._preferences) > _PREFERENCES_MAX_CLIENTS:
+                self._preferences.popitem(last=False)
+
+    def preferred_formats(self, client_key: str) -> List[str]:
+        """
+        Formats a client usually requests.
+
+        Args:
+            client_key: Stable client identifier
+
+        Returns:
+            Formats requested in at least ``speculative_min_share`` of the
+            client's export requests (empty until enough history exists)
+        """
+        with self._lock:
+            counts = Counter(self._preferences.get(client_key, ()))
+        requests = counts.pop("_requests", 0)
+        if requests < self.speculative_min_requests:
+            return []
+        return [
+            f
+            for f in EXPORT_FORMATS
+            if counts[f] / requests >= self.speculative_min_share
+        ]
+
+    def prefetch(
+        self, request_id: str, client_key: str, doc_path: Path, prompt: str
+    ) -> List[ExportJob]:
+        """
+        Queue speculative exports of a completed design.
+
+        Args:
+            request_id: Design request ID
+            client_key: Client that submitted the design
+            doc_path: FreeCAD document to export
+            prompt: Design prompt
+
+        Returns:
+            Jobs queued (or already in flight) for the client's usual formats
+        """
+        if not self.speculative_enabled:
+            return []
+        return [
+            self.submit(request_id, fmt, doc_path, prompt, speculative=True)
+            for fmt in self.preferred_formats(client_key)
+        ]
@@ -20,7 +20,11 @@ Usage:
     >>> print(f"Created {len(result.created_objects)} objects")
 """
 
-from .headless_runner import HeadlessRunner, get_execution_semaphore
+from .headless_runner import (
+    HeadlessRunner,
+    get_execution_semaphore,
+    get_execution_slot_stats,
+)
 from .path_resolver import FreeCADPathResolver
 from .state_extractor import StateExtractor
 
@@ -29,4 +33,5 @@ __all__ = [
     "StateExtractor",
     "FreeCADPathResolver",
     "get_execution_semaphore",
+    "get_execution_slot_stats",
 ]
@@ -296,7 +296,8 @@ if objects:
             return filename
         return f"output.{extension}"
 
-    def _generate_box_command(self, length=10, width=10, height=10, name="Box"):
+    @staticmethod
+    def _generate_box_command(length=10, width=10, height=10, name="Box"):
         """Generate FreeCAD command to create a box"""
         return f"""
 box = doc.addObject("Part::Box", "{name}")
@@ -307,7 +308,8 @@ doc.recompute()
 print("Box created: {name}")
 """
 
-    def _generate_cylinder_command(self, radius=5, height=10, name="Cylinder"):
+    @staticmethod
+    def _generate_cylinder_command(radius=5, height=10, name="Cylinder"):
         """Generate FreeCAD command to create a cylinder"""
         return f"""
 cylinder = doc.addObject("Part::Cylinder", "{name}")
@@ -317,7 +319,8 @@ doc.recompute()
 print("Cylinder created: {name}")
 """
 
-    def _generate_sphere_command(self, radius=5, name="Sphere"):
+    @staticmethod
+    def _generate_sphere_command(radius=5, name="Sphere"):
         """Generate FreeCAD command to create a sphere"""
         return f"""
 sphere = doc.addObject("Part::Sphere", "{name}")
@@ -341,7 +344,8 @@ print("Sphere created: {name}")
 
         return dimensions
 
-    def _generate_cone_command(self, radius1=5, radius2=2, height=10, name="Cone"):
+    @staticmethod
+    def _generate_cone_command(radius1=5, radius2=2, height=10, name="Cone"):
         """Generate FreeCAD command to create a cone"""
         return f"""
 cone = doc.addObject("Part::Cone", "{name}")
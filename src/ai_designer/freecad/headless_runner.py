@@ -9,6 +9,7 @@ Features:
 - Comprehensive stdout/stderr parsing
 - Auto-save with metadata tracking
 - Concurrent execution limiting via semaphore
+- Timeouts and retries bounded by the current request deadline
 - Multi-format export (STEP, STL, FCStd)
 - FreeCAD version detection and adaptation
 """
@@ -26,6 +27,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from ..core.admission import STAGE_EXECUTOR, STAGE_SLOT_WAIT, get_latency_tracker
+from ..core.deadline import budget_timeout, current_deadline
 from ..sandbox.result import ExecutionResult, ExecutionStatus
 from .path_resolver import FreeCADPathResolver
 
@@ -34,6 +37,11 @@ logger = logging.getLogger(__name__)
 # Global semaphore for limiting concurrent FreeCAD executions
 _execution_semaphore: Optional[asyncio.Semaphore] = None
 
+# Execution-slot usage, reported to admission control and health checks
+_slot_capacity: int = 4
+_slots_in_use: int = 0
+_slots_waiting: int = 0
+
 
 def get_execution_semaphore(max_concurrent: int = 4) -> asyncio.Semaphore:
     """
@@ -45,12 +53,27 @@ def get_execution_semaphore(max_concurrent: int = 4) -> asyncio.Semaphore:
     Returns:
         Asyncio semaphore for limiting concurrent executions
     """
-    global _execution_semaphore
+    global _execution_semaphore, _slot_capacity
     if _execution_semaphore is None:
         _execution_semaphore = asyncio.Semaphore(max_concurrent)
+        _slot_capacity = max_concurrent
     return _execution_semaphore
 
 
+def get_execution_slot_stats() -> Dict[str, int]:
+    """
+    Get current FreeCAD execution-slot usage.
+
+    Returns:
+        Dictionary with slot capacity, slots in use and executions waiting
+    """
+    return {
+        "capacity": _slot_capacity,
+        "in_use": _slots_in_use,
+        "waiting": _slots_waiting,
+    }
+
+
 class HeadlessRunner:
     """
     Headless FreeCAD script execution engine.
@@ -315,13 +338,45 @@ print("EXECUTION_COMPLETE")
         Returns:
             ExecutionResult with execution details
         """
+        global _slots_in_use, _slots_waiting
+
         # Use semaphore to limit concurrent executions
         semaphore = get_execution_semaphore()
 
-        async with semaphore:
+        # Track slot wait time so admission control can see FreeCAD contention
+        deadline = current_deadline()
+        wait_start = time.perf_counter()
+        _slots_waiting += 1
+        try:
+            if deadline is None:
+                await semaphore.acquire()
+            else:
+                await asyncio.wait_for(semaphore.acquire(), deadline.remaining())
+        except asyncio.TimeoutError:
+            logger.warning("Request deadline exceeded waiting for a FreeCAD slot")
+            return ExecutionResult(
+                success=False,
+                status=ExecutionStatus.TIMEOUT,
+                error="Request deadline exceeded while waiting for a FreeCAD slot",
+            )
+        finally:
+            _slots_waiting -= 1
+        get_latency_tracker().observe(STAGE_SLOT_WAIT, time.perf_counter() - wait_start)
+
+        # Service time is measured from slot acquisition: the wait above is
+        # already recorded as STAGE_SLOT_WAIT
+        service_start = time.perf_counter()
+        _slots_in_use += 1
+        try:
             return await self._execute_with_retry(
                 script, document_name, request_id, user_prompt
             )
+        finally:
+            _slots_in_use -= 1
+            semaphore.release()
+            get_latency_tracker().observe(
+                STAGE_EXECUTOR, time.perf_counter() - service_start
+            )
 
     async def _execute_with_retry(
         self,
@@ -338,7 +393,21 @@ print("EXECUTION_COMPLETE")
         attempt = 0
         last_error = None
 
+        deadline = current_deadline()
+
         while attempt < self.max_retries:
+            if deadline is not None and deadline.expired:
+                logger.warning(
+                    f"Request deadline exceeded after {attempt} attempt(s): "
+                    f"{document_name}"
+                )
+                return ExecutionResult(
+                    success=False,
+                    status=ExecutionStatus.TIMEOUT,
+                    error=f"Request deadline exceeded. Last error: {last_error}",
+                    metadata={"retries": attempt, "last_error": last_error},
+                )
+
             attempt += 1
             logger.info(
                 f"Executing script (attempt {attempt}/{self.max_retries}): {document_name}"
@@ -360,17 +429,17 @@ print("EXECUTION_COMPLETE")
                             f"Recompute failed, retrying in {backoff_seconds}s... "
                             f"(attempt {attempt}/{self.max_retries})"
                         )
-                        await asyncio.sleep(backoff_seconds)
+                        await asyncio.sleep(self._backoff(backoff_seconds))
                         continue
 
                 return result
 
-            except subprocess.TimeoutExpired:
-                last_error = f"Execution timeout ({self.timeout}s)"
+            except subprocess.TimeoutExpired as e:
+                last_error = f"Execution timeout ({e.timeout:.0f}s)"
                 logger.error(f"Attempt {attempt} timed out")
 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** (attempt - 1))
+                    await asyncio.sleep(self._backoff(2 ** (attempt - 1)))
                     continue
 
             except Exception as e:
@@ -378,7 +447,7 @@ print("EXECUTION_COMPLETE")
                 logger.error(f"Attempt {attempt} failed: {e}")
 
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** (attempt - 1))
+                    await asyncio.sleep(self._backoff(2 ** (attempt - 1)))
                     continue
 
         # All retries exhausted
@@ -389,6 +458,14 @@ print("EXECUTION_COMPLETE")
             metadata={"retries": attempt, "last_error": last_error},
         )
 
+    @staticmethod
+    def _backoff(seconds: float) -> float:
+        """Clip a retry backoff so it never sleeps past the request deadline."""
+        deadline = current_deadline()
+        if deadline is None:
+            return seconds
+        return min(seconds, deadline.remaining())
+
     async def _execute_single(
         self,
         script: str,
@@ -419,6 +496,9 @@ print("EXECUTION_COMPLETE")
             # Execute subprocess
             logger.debug(f"Running: {' '.join(cmd)}")
 
+            # Clip the subprocess timeout to the request deadline
+            timeout = budget_timeout(self.timeout)
+
             # Run in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             process = await loop.run_in_executor(
@@ -427,7 +507,7 @@ print("EXECUTION_COMPLETE")
                     cmd,
                     capture_output=True,
                     text=True,
-                    timeout=self.timeout,
+                    timeout=timeout,
                 ),
             )
 
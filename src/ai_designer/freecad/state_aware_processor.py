@@ -10,16 +10,13 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..services.state_history import StateHistory  # noqa: E402
 from .geometry_helpers import (  # noqa: E402
     analyze_geometry_requirements,
     build_circle_sketch_script,
     build_rectangle_sketch_script,
 )
-from .state_diff import (  # noqa: E402
-    build_checkpoint_key,
-    preflight_checks,
-    validate_final_state,
-)
+from .state_diff import preflight_checks, validate_final_state  # noqa: E402
 from .workflow_templates import (  # noqa: E402
     analyze_workflow_requirements,
     calculate_complexity_score,
@@ -36,6 +33,8 @@ class StateAwareCommandProcessor:
     def __init__(self, llm_client, state_cache, api_client, command_executor):
         self.llm_client = llm_client
         self.state_cache = state_cache
+        # Checkpoints are stored as deltas against the previous one
+        self.state_history = StateHistory(state_cache) if state_cache else None
         self.api_client = api_client
         self.command_executor = command_executor
         self.session_id = f"session_{int(time.time())}"
@@ -135,14 +134,18 @@ class StateAwareCommandProcessor:
             # Get live state from FreeCAD
             live_state = self.api_client.get_document_state()
 
-            # Get cached state from Redis
-            cached_states = self.state_cache.list_states(session_id=self.session_id)
-            latest_cached_state = {}
-
-            if cached_states:
-                # Get the most recent state
-                latest_key = max(cached_states)
-                latest_cached_state = self.state_cache.retrieve_state(latest_key) or {}
+            # Get the latest checkpoint of this session from Redis
+            latest = self.state_history.latest(session_id=self.session_id)
+            latest_cached_state = latest["state"] if latest else {}
+
+            if latest is None:
+                # Sessions recorded before the delta-encoded history
+                cached_states = self.state_cache.list_states(session_id=self.session_id)
+                if cached_states:
+                    latest_key = max(cached_states)
+                    latest_cached_state = (
+                        self.state_cache.retrieve_state(latest_key) or {}
+                    )
 
             # Combine live and cached state
             combined_state = {
@@ -1232,12 +1235,15 @@ Example for "create a cone and cylinder together":
                         print(f"✅ Step {step_number} completed successfully")
                         execution_state["completed_steps"] += 1
 
-                        # Update state in Redis
+                        # Record a checkpoint in the session history; the
+                        # previous checkpoint is not nested into the new one
                         updated_state = self._get_current_state()
-                        state_key = self.state_cache.cache_state(
+                        updated_state.pop("cached_state", None)
+                        state_key = self.state_history.append(
                             updated_state,
-                            session_id=self.session_id,
                             document_name=updated_state.get("document_name"),
+                            session_id=self.session_id,
+                            label=f"step_{step_number}",
                         )
 
                         # Track created objects
@@ -1586,11 +1592,15 @@ doc.recompute()"""
             }
 
     def _cache_state_update(self, state: Dict[str, Any], checkpoint_name: str):
-        """Cache state update with checkpoint name. Uses state_diff.build_checkpoint_key."""
+        """Record a state checkpoint in the session's delta-encoded history."""
         try:
-            if self.state_cache:
-                cache_key = build_checkpoint_key(self.session_id, checkpoint_name)
-                self.state_cache.store_state(cache_key, state)
+            if self.state_history:
+                self.state_history.append(
+                    state,
+                    document_name=state.get("document_name"),
+                    session_id=self.session_id,
+                    label=checkpoint_name,
+                )
                 print(f"📦 State cached at checkpoint: {checkpoint_name}")
         except Exception as e:
             print(f"⚠️ Warning: Failed to cache state at {checkpoint_name}: {e}")
@@ -22,17 +22,25 @@ def compute_state_diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[st
         Dict with keys:
             - ``objects_added`` (list of names)
             - ``objects_removed`` (list of names)
+            - ``objects_modified`` (list of names whose fields changed)
             - ``object_count_delta`` (int)
             - ``had_errors_before`` (bool)
             - ``had_errors_after`` (bool)
             - ``error_introduced`` (bool)
     """
-    before_names = {o.get("name") for o in before.get("objects", [])}
-    after_names = {o.get("name") for o in after.get("objects", [])}
+    before_objects = {o.get("name"): o for o in before.get("objects", [])}
+    after_objects = {o.get("name"): o for o in after.get("objects", [])}
+    before_names = set(before_objects)
+    after_names = set(after_objects)
 
     return {
         "objects_added": sorted(after_names - before_names),
         "objects_removed": sorted(before_names - after_names),
+        "objects_modified": sorted(
+            name
+            for name in before_names & after_names
+            if before_objects[name] != after_objects[name]
+        ),
         "object_count_delta": after.get("object_count", 0)
         - before.get("object_count", 0),
         "had_errors_before": before.get("live_state", {}).get("has_errors", False),
@@ -44,6 +52,120 @@ def compute_state_diff(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[st
     }
 
 
+def compute_state_delta(
+    before: Dict[str, Any], after: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Return a field-level delta that turns *before* into *after*.
+
+    Nested dicts are diffed key by key, and lists of objects identified by a
+    unique ``name`` (e.g. ``objects``) are diffed object by object, so a step
+    that adds one object yields a delta holding just that object.  Other
+    values are replaced whole.  The delta is JSON-compatible.
+
+    Args:
+        before: Earlier state snapshot.
+        after: Later state snapshot.
+
+    Returns:
+        Delta dict with optional keys ``set`` (key -> new value), ``unset``
+        (removed keys), ``nested`` (key -> delta of a nested dict) and
+        ``named`` (key -> delta of a named-object list); empty if equal.
+        Apply it with :func:`apply_state_delta`.
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in after.items():
+        if key not in before:
+            delta.setdefault("set", {})[key] = value
+            continue
+        old = before[key]
+        if old == value:
+            continue
+        if isinstance(old, dict) and isinstance(value, dict):
+            delta.setdefault("nested", {})[key] = compute_state_delta(old, value)
+            continue
+        old_items, new_items = _named_items(old), _named_items(value)
+        if old_items is not None and new_items is not None:
+            delta.setdefault("named", {})[key] = _named_list_delta(old_items, new_items)
+        else:
+            delta.setdefault("set", {})[key] = value
+
+    unset = [key for key in before if key not in after]
+    if unset:
+        delta["unset"] = unset
+    return delta
+
+
+def apply_state_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Return *state* with a :func:`compute_state_delta` delta applied.
+
+    *state* is not modified; unchanged values are shared with the result.
+
+    Args:
+        state: Snapshot the delta was computed against.
+        delta: Output of ``compute_state_delta(state, later)``.
+
+    Returns:
+        The later snapshot.
+    """
+    result = {
+        key: value for key, value in state.items() if key not in delta.get("unset", ())
+    }
+    for key, sub_delta in delta.get("nested", {}).items():
+        result[key] = apply_state_delta(result[key], sub_delta)
+    for key, list_delta in delta.get("named", {}).items():
+        result[key] = _apply_named_list_delta(result[key], list_delta)
+    result.update(delta.get("set", {}))
+    return result
+
+
+def _named_items(value: Any) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Map a list of uniquely named dicts by name, or None for any other value."""
+    if not isinstance(value, list):
+        return None
+    items: Dict[str, Dict[str, Any]] = {}
+    for item in value:
+        if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+            return None
+        if item["name"] in items:
+            return None
+        items[item["name"]] = item
+    return items
+
+
+def _named_list_delta(
+    before: Dict[str, Dict[str, Any]], after: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    delta: Dict[str, Any] = {}
+    removed = [name for name in before if name not in after]
+    if removed:
+        delta["removed"] = removed
+    for name, item in after.items():
+        if name not in before:
+            delta.setdefault("set", {})[name] = item
+        elif before[name] != item:
+            delta.setdefault("nested", {})[name] = compute_state_delta(
+                before[name], item
+            )
+    # Kept objects stay in place and new ones are appended unless told otherwise
+    expected = [name for name in before if name in after]
+    expected += [name for name in after if name not in before]
+    if expected != list(after):
+        delta["order"] = list(after)
+    return delta
+
+
+def _apply_named_list_delta(
+    items: List[Dict[str, Any]], delta: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    removed = set(delta.get("removed", ()))
+    by_name = {item["name"]: item for item in items if item["name"] not in removed}
+    for name, sub_delta in delta.get("nested", {}).items():
+        by_name[name] = apply_state_delta(by_name[name], sub_delta)
+    by_name.update(delta.get("set", {}))
+    order = delta.get("order") or list(by_name)
+    return [by_name[name] for name in order]
+
+
 def validate_final_state(
     final_state: Dict[str, Any], geometry_analysis: Dict[str, Any]
 ) -> Dict[str, Any]:
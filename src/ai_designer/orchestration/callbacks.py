@@ -5,12 +5,13 @@ Provides real-time progress updates to connected clients and logs all events
 to Redis Streams for immutable audit trail.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
 import structlog
 
 from ..redis_utils.audit import AuditEventType, AuditLogger
+from ..redis_utils.audit_writer import BufferedAuditWriter
 
 logger = structlog.get_logger(__name__)
 
@@ -21,23 +22,69 @@ class PipelineWebSocketCallback:
 
     Sends structured messages to WebSocket connections and logs events
     to Redis Streams as the pipeline progresses.
+
+    Instances are also the ``websocket_callback`` of the pipeline nodes:
+    calling one with ``(request_id, event)`` logs the node event, whose
+    audit PUBLISH reaches WebSocket and SSE clients through the PubSubBridge.
     """
 
     def __init__(
         self,
-        websocket_manager: Any,
-        audit_logger: Optional[AuditLogger] = None,
+        websocket_manager: Optional[Any],
+        audit_logger: Optional[Union[AuditLogger, BufferedAuditWriter]] = None,
     ):
         """
         Initialize callback with WebSocket manager and audit logger.
 
         Args:
-            websocket_manager: WebSocket connection manager instance
-            audit_logger: Optional AuditLogger for event persistence
+            websocket_manager: Optional WebSocket connection manager instance
+            audit_logger: Optional AuditLogger or BufferedAuditWriter for
+                event persistence
         """
         self.websocket_manager = websocket_manager
         self.audit_logger = audit_logger
 
+    async def __call__(self, request_id: UUID, event: Dict[str, Any]) -> None:
+        """
+        Handle a progress event emitted by a pipeline node.
+
+        Args:
+            request_id: Design request ID
+            event: Node event with ``node``, ``status`` and node-specific fields
+        """
+        node_name = event.get("node", "unknown")
+        status = event.get("status", "completed")
+        try:
+            if self.audit_logger:
+                event_type = {
+                    "started": AuditEventType.NODE_STARTED,
+                    "failed": AuditEventType.NODE_FAILED,
+                }.get(status, AuditEventType.NODE_COMPLETED)
+
+                self.audit_logger.log_event(
+                    event_type=event_type,
+                    request_id=request_id,
+                    message=f"{node_name} {status}",
+                    node=node_name,
+                    status=status,
+                    error=event.get("error"),
+                    metadata={
+                        k: v
+                        for k, v in event.items()
+                        if k not in ("node", "status", "error")
+                    },
+                )
+
+            await self._send_websocket_update(request_id, event)
+
+        except Exception as e:
+            logger.warning(
+                "Failed to handle pipeline progress event",
+                request_id=str(request_id),
+                node=node_name,
+                error=str(e),
+            )
+
     async def on_node_start(
         self,
         request_id: UUID,
@@ -263,6 +310,8 @@ class PipelineWebSocketCallback:
         self, request_id: UUID, event: Dict[str, Any]
     ) -> None:
         """Send event via WebSocket."""
+        if self.websocket_manager is None:
+            return
         try:
             message = {
                 "type": "pipeline_progress",
@@ -289,19 +338,20 @@ class PipelineWebSocketCallback:
 
 async def create_progress_callback(
     websocket_manager: Optional[Any],
-    audit_logger: Optional[AuditLogger] = None,
+    audit_logger: Optional[Union[AuditLogger, BufferedAuditWriter]] = None,
 ) -> Optional[PipelineWebSocketCallback]:
     """
     Create a WebSocket callback with audit logging.
 
     Args:
         websocket_manager: Optional WebSocket manager
-        audit_logger: Optional AuditLogger for event persistence
+        audit_logger: Optional AuditLogger or BufferedAuditWriter for
+            event persistence
 
     Returns:
-        Callback instance or None
+        Callback instance, or None without a manager or an audit logger
     """
-    if websocket_manager:
+    if websocket_manager or audit_logger:
         return PipelineWebSocketCallback(websocket_manager, audit_logger)
     return None
 
@@ -0,0 +1,472 @@
+"""
+Rule-based fast path for primitive design prompts.
+
+Prompts that describe a single primitive with explicit dimensions
+("box 50x30x20mm", "cylinder radius 10 height 40") do not need the planner,
+the generator or an LLM review: the task graph and the FreeCAD script are
+fully determined by the prompt.  ``classify_prompt`` recognises such prompts
+and ``PipelineExecutor`` answers them without any LLM call, falling back to
+the full pipeline if the fast-path design does not pass validation.
+
+Scripts come from the deterministic ``CommandExecutor`` generators and
+prompts are screened with ``analyze_workflow_requirements`` so only simple,
+single-step workflows qualify.  Anything ambiguous (missing dimensions,
+extra numbers, several shapes, features such as holes or fillets, a number
+followed by a unit that is not understood) is left to the LLM pipeline.
+Dimensions may be given in millimetres, centimetres, metres, inches or feet.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ai_designer.freecad.command_executor import CommandExecutor
+from ai_designer.freecad.workflow_templates import analyze_workflow_requirements
+from ai_designer.schemas.task_graph import TaskGraph, TaskNode
+
+# Minimum confidence for answering a prompt on the fast path
+FAST_PATH_MIN_CONFIDENCE = 0.85
+
+# Shape keywords → canonical primitive
+_SHAPE_KEYWORDS: Dict[str, str] = {
+    "box": "box",
+    "cube": "box",
+    "cuboid": "box",
+    "block": "box",
+    "cylinder": "cylinder",
+    "sphere": "sphere",
+    "ball": "sphere",
+    "cone": "cone",
+}
+
+# Words that mean the prompt asks for more than a bare primitive
+_EXTRA_OPERATIONS = {
+    "hole",
+    "holes",
+    "drill",
+    "bore",
+    "pocket",
+    "cut",
+    "slot",
+    "extrude",
+    "pad",
+    "revolve",
+    "sweep",
+    "loft",
+    "fillet",
+    "fillets",
+    "chamfer",
+    "chamfered",
+    "rounded",
+    "shell",
+    "hollow",
+    "mirror",
+    "thread",
+    "and",
+    "with",
+    "plus",
+    "on",
+    "inside",
+    "attached",
+}
+
+# Length units → millimetres
+_UNIT_SCALE: Dict[str, float] = {
+    "mm": 1.0,
+    "millimeter": 1.0,
+    "millimeters": 1.0,
+    "millimetre": 1.0,
+    "millimetres": 1.0,
+    "cm": 10.0,
+    "centimeter": 10.0,
+    "centimeters": 10.0,
+    "centimetre": 10.0,
+    "centimetres": 10.0,
+    "m": 1000.0,
+    "meter": 1000.0,
+    "meters": 1000.0,
+    "metre": 1000.0,
+    "metres": 1000.0,
+    "inch": 25.4,
+    "inches": 25.4,
+    '"': 25.4,
+    "ft": 304.8,
+    "foot": 304.8,
+    "feet": 304.8,
+}
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_UNIT = (
+    r"(?:\s*("
+    + "|".join(re.escape(u) for u in sorted(_UNIT_SCALE, key=len, reverse=True))
+    + r")(?![a-z]))?"
+)
+_NUMBER_RE = re.compile(_NUMBER + _UNIT)
+_TRIPLE_RE = re.compile(
+    _NUMBER + _UNIT + r"\s*(?:x|×|\*|by)\s*" + _NUMBER + _UNIT + r"\s*(?:x|×|\*|by)\s*"
+    r"" + _NUMBER + _UNIT
+)
+
+_MAX_DIMENSION_MM = 10000.0
+
+# Words that may follow a unitless number; any other word ("10 furlongs",
+# "2 yd") is an unknown unit and the prompt is left to the LLM pipeline
+_NEXT_WORD_RE = re.compile(r"\s*([a-z]+)")
+_DIMENSION_FOLLOWERS = frozenset(
+    {
+        "x",
+        "by",
+        "long",
+        "wide",
+        "deep",
+        "high",
+        "tall",
+        "thick",
+        "length",
+        "width",
+        "depth",
+        "height",
+        "radius",
+        "diameter",
+        "dia",
+        "side",
+        "sides",
+        "edge",
+        "size",
+        "l",
+        "w",
+        "h",
+        "r",
+        "d",
+    }
+    | set(_SHAPE_KEYWORDS)
+)
+
+# Confidence penalties
+_PENALTY_NO_UNIT = 0.05
+_PENALTY_LONG_PROMPT = 0.1
+_PENALTY_UNUSED_NUMBER = 0.3
+
+
+@dataclass
+class FastPathMatch:
+    """A prompt recognised as a single parametric primitive."""
+
+    shape: str
+    operation_type: str
+    parameters: Dict[str, float]
+    script: str
+    confidence: float
+    volume: float
+    bounding_box: Dict[str, float] = field(default_factory=dict)
+
+
+def classify_prompt(prompt: str) -> Optional[FastPathMatch]:
+    """
+    Recognise primitive prompts that can skip the LLM pipeline.
+
+    Args:
+        prompt: User's design prompt
+
+    Returns:
+        FastPathMatch with the generated script and a confidence in [0, 1],
+        or None if the prompt is not a single fully-specified primitive
+    """
+    text = prompt.lower().strip()
+    words = re.findall(r"[a-z]+", text)
+
+    shapes = {_SHAPE_KEYWORDS[w] for w in words if w in _SHAPE_KEYWORDS}
+    if len(shapes) != 1:
+        return None
+    if any(w in _EXTRA_OPERATIONS for w in words):
+        return None
+
+    analysis = analyze_workflow_requirements(prompt, {})
+    if (
+        analysis["is_complex_workflow"]
+        or analysis["is_multi_step"]
+        or analysis["has_pattern_indicators"]
+        or analysis["has_feature_indicators"]
+    ):
+        return None
+
+    if _has_unknown_unit(text):
+        return None
+
+    shape = shapes.pop()
+    parsed = _PARSERS[shape](text, "cube" in words)
+    if parsed is None:
+        return None
+    parameters, used_spans, all_units_given = parsed
+
+    # Every dimension must be positive except the apex radius of a cone
+    if any(
+        v > _MAX_DIMENSION_MM or (v <= 0 and key != "radius2")
+        for key, v in parameters.items()
+    ):
+        return None
+
+    confidence = 1.0
+    if not all_units_given:
+        confidence -= _PENALTY_NO_UNIT
+    if len(text.split()) > 8:
+        confidence -= _PENALTY_LONG_PROMPT
+    confidence -= _PENALTY_UNUSED_NUMBER * _count_unused_numbers(text, used_spans)
+
+    script, volume, bbox = _build_script(shape, parameters)
+
+    return FastPathMatch(
+        shape=shape,
+        operation_type=f"create_{shape}",
+        parameters=parameters,
+        script=script,
+        confidence=max(confidence, 0.0),
+        volume=volume,
+        bounding_box=bbox,
+    )
+
+
+def build_task_graph(request_id: UUID, match: FastPathMatch) -> TaskGraph:
+    """
+    Build the single-task graph for a fast-path match.
+
+    Args:
+        request_id: Design request ID
+        match: Classified prompt
+
+    Returns:
+        TaskGraph with one completed-by-construction primitive task
+    """
+    graph = TaskGraph(request_id=request_id)
+    graph.add_task(
+        TaskNode(
+            description=f"Create {match.shape} ({_describe(match.parameters)})",
+            operation_type=match.operation_type,
+            parameters=dict(match.parameters),
+        )
+    )
+    return graph
+
+
+# ── Dimension parsing ────────────────────────────────────────────────────────
+
+Span = Tuple[int, int]
+Parsed = Tuple[Dict[str, float], List[Span], bool]
+
+
+def _to_mm(value: str, unit: Optional[str]) -> float:
+    return round(float(value) * _UNIT_SCALE.get(unit or "mm", 1.0), 6)
+
+
+# Adjectives follow their number ("10mm long"); in "10mm long 20mm wide" the
+# 20 belongs to "wide", not to the "long" before it
+_POSTFIX_WORDS = frozenset({"long", "wide", "deep", "high", "tall"})
+
+
+def _keyed_value(
+    text: str, keywords: Tuple[str, ...]
+) -> Optional[Tuple[float, bool, Span]]:
+    """
+    Find ``<keyword> [=|:|of] <number>[unit]`` or ``<number>[unit] <keyword>``.
+
+    Adjectives in ``_POSTFIX_WORDS`` bind to the number before them first.
+    """
+    names = "|".join(re.escape(k) for k in keywords)
+    postfix = [k for k in keywords if k in _POSTFIX_WORDS]
+    patterns = [
+        rf"\b(?:{names})\s*(?:=|:|of|is)?\s*" + _NUMBER + _UNIT,
+        _NUMBER + _UNIT + rf"\s*(?:{names})\b",
+    ]
+    if postfix:
+        adjectives = "|".join(re.escape(k) for k in postfix)
+        patterns.insert(0, _NUMBER + _UNIT + rf"\s*(?:{adjectives})\b")
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            value = _to_mm(match.group(1), match.group(2))
+            return value, match.group(2) is not None, match.span()
+    return None
+
+
+def _parse_box(text: str, is_cube: bool) -> Optional[Parsed]:
+    triple = _TRIPLE_RE.search(text)
+    if triple:
+        units = [triple.group(i) for i in (2, 4, 6)]
+        # "50x30x20mm": a trailing unit applies to all three values
+        unit = units[2] or units[1] or units[0]
+        values = [
+            _to_mm(triple.group(i), units[(i - 1) // 2] or unit) for i in (1, 3, 5)
+        ]
+        params = {"length": values[0], "width": values[1], "height": values[2]}
+        return params, [triple.span()], unit is not None
+
+    keyed = {
+        "length": _keyed_value(text, ("length", "long", "l")),
+        "width": _keyed_value(text, ("width", "wide", "depth", "deep", "w")),
+        "height": _keyed_value(text, ("height", "high", "tall", "h")),
+    }
+    if all(keyed.values()):
+        return (
+            {k: v[0] for k, v in keyed.items()},
+            [v[2] for v in keyed.values()],
+            all(v[1] for v in keyed.values()),
+        )
+
+    if is_cube:
+        side = _keyed_value(text, ("side", "edge", "size", "cube"))
+        if side is None:
+            numbers = list(_NUMBER_RE.finditer(text))
+            if len(numbers) != 1:
+                return None
+            number = numbers[0]
+            side = (
+                _to_mm(number.group(1), number.group(2)),
+                number.group(2) is not None,
+                number.span(),
+            )
+        value, has_unit, span = side
+        return (
+            {"length": value, "width": value, "height": value},
+            [span],
+            has_unit,
+        )
+
+    return None
+
+
+def _parse_radius(text: str) -> Optional[Tuple[float, bool, Span]]:
+    radius = _keyed_value(text, ("radius", "r"))
+    if radius:
+        return radius
+    diameter = _keyed_value(text, ("diameter", "dia", "d", "ø"))
+    if diameter:
+        return diameter[0] / 2.0, diameter[1], diameter[2]
+    return None
+
+
+def _parse_cylinder(text: str, is_cube: bool) -> Optional[Parsed]:
+    radius = _parse_radius(text)
+    height = _keyed_value(text, ("height", "length", "high", "tall", "long", "h"))
+    if not radius or not height:
+        return None
+    return (
+        {"radius": radius[0], "height": height[0]},
+        [radius[2], height[2]],
+        radius[1] and height[1],
+    )
+
+
+def _parse_sphere(text: str, is_cube: bool) -> Optional[Parsed]:
+    radius = _parse_radius(text)
+    if not radius:
+        return None
+    return {"radius": radius[0]}, [radius[2]], radius[1]
+
+
+def _parse_cone(text: str, is_cube: bool) -> Optional[Parsed]:
+    height = _keyed_value(text, ("height", "high", "tall", "h"))
+    if not height:
+        return None
+
+    bottom = _keyed_value(text, ("radius1", "bottom radius", "base radius", "r1"))
+    top = _keyed_value(text, ("radius2", "top radius", "r2"))
+    spans = [height[2]]
+    units = [height[1]]
+
+    if bottom:
+        spans.append(bottom[2])
+        units.append(bottom[1])
+        if top:
+            spans.append(top[2])
+            units.append(top[1])
+        radius1, radius2 = bottom[0], top[0] if top else 0.0
+    else:
+        radius = _parse_radius(text)
+        if not radius:
+            return None
+        spans.append(radius[2])
+        units.append(radius[1])
+        radius1, radius2 = radius[0], 0.0
+
+    if radius2 >= radius1:
+        return None
+    return (
+        {"radius1": radius1, "radius2": radius2, "height": height[0]},
+        spans,
+        all(units),
+    )
+
+
+_PARSERS = {
+    "box": _parse_box,
+    "cylinder": _parse_cylinder,
+    "sphere": _parse_sphere,
+    "cone": _parse_cone,
+}
+
+
+def _has_unknown_unit(text: str) -> bool:
+    """Check for a number followed by a word that is neither a unit nor a dimension."""
+    for match in _NUMBER_RE.finditer(text):
+        if match.group(2) is not None:
+            continue
+        next_word = _NEXT_WORD_RE.match(text, match.end())
+        if next_word and next_word.group(1) not in _DIMENSION_FOLLOWERS:
+            return True
+    return False
+
+
+def _count_unused_numbers(text: str, used_spans: List[Span]) -> int:
+    """Count numbers in the prompt that no dimension accounted for."""
+    unused = 0
+    for match in _NUMBER_RE.finditer(text):
+        start = match.start()
+        if not any(s <= start < e for s, e in used_spans):
+            unused += 1
+    return unused
+
+
+# ── Script generation ────────────────────────────────────────────────────────
+
+
+def _fmt(value: float) -> str:
+    return f"{value:g}"
+
+
+def _describe(parameters: Dict[str, float]) -> str:
+    return ", ".join(f"{k}={_fmt(v)}mm" for k, v in parameters.items())
+
+
+def _build_script(
+    shape: str, p: Dict[str, float]
+) -> Tuple[str, float, Dict[str, float]]:
+    """Return the FreeCAD script, analytic volume and bounding box."""
+    if shape == "box":
+        script = CommandExecutor._generate_box_command(
+            length=_fmt(p["length"]),
+            width=_fmt(p["width"]),
+            height=_fmt(p["height"]),
+        )
+        volume = p["length"] * p["width"] * p["height"]
+        bbox = {"x": p["length"], "y": p["width"], "z": p["height"]}
+    elif shape == "cylinder":
+        script = CommandExecutor._generate_cylinder_command(
+            radius=_fmt(p["radius"]), height=_fmt(p["height"])
+        )
+        volume = math.pi * p["radius"] ** 2 * p["height"]
+        bbox = {"x": 2 * p["radius"], "y": 2 * p["radius"], "z": p["height"]}
+    elif shape == "sphere":
+        script = CommandExecutor._generate_sphere_command(radius=_fmt(p["radius"]))
+        volume = 4.0 / 3.0 * math.pi * p["radius"] ** 3
+        bbox = {axis: 2 * p["radius"] for axis in ("x", "y", "z")}
+    else:
+        r1, r2, h = p["radius1"], p["radius2"], p["height"]
+        script = CommandExecutor._generate_cone_command(
+            radius1=_fmt(r1), radius2=_fmt(r2), height=_fmt(h)
+        )
+        volume = math.pi * h * (r1**2 + r1 * r2 + r2**2) / 3.0
+        bbox = {"x": 2 * r1, "y": 2 * r1, "z": h}
+
+    return script, volume, bbox
@@ -7,10 +7,12 @@ Nodes are responsible for:
 - Updating state with results
 - Handling errors gracefully
 - Recording timing metrics
+- Bounding agent calls by the request deadline
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import structlog
 
@@ -18,7 +20,14 @@ from ai_designer.agents.executor import FreeCADExecutor
 from ai_designer.agents.generator import GeneratorAgent
 from ai_designer.agents.planner import PlannerAgent
 from ai_designer.agents.validator import ValidatorAgent
-from ai_designer.core.exceptions import AIDesignerError
+from ai_designer.core.deadline import deadline_scope
+from ai_designer.core.exceptions import AIDesignerError, DeadlineExceededError
+from ai_designer.orchestration.routing import (
+    ROUTE_FAIL,
+    ROUTE_REPLAN,
+    ROUTE_SUCCESS,
+    route_after_validation,
+)
 from ai_designer.orchestration.state import PipelineState
 from ai_designer.schemas.design_state import (
     AgentType,
@@ -29,6 +38,8 @@ from ai_designer.schemas.design_state import (
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class PipelineNodes:
     """
@@ -62,6 +73,53 @@ class PipelineNodes:
         self.executor = executor
         self.websocket_callback = websocket_callback
 
+    async def _call_within_deadline(
+        self, state: PipelineState, node: str, call: Awaitable[T]
+    ) -> T:
+        """
+        Await an agent call bounded by the request deadline.
+
+        The deadline is also made current for the call so LLM requests and
+        FreeCAD jobs inside it clip their own timeouts to the remaining budget.
+
+        Raises:
+            DeadlineExceededError: If the budget is exhausted before or
+                during the call
+        """
+        deadline = state.get_deadline()
+        if deadline is None:
+            return await call
+
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            if asyncio.iscoroutine(call):
+                call.close()
+            raise DeadlineExceededError(
+                f"Request deadline exceeded before {node}",
+                {"node": node},
+            )
+
+        with deadline_scope(deadline):
+            try:
+                return await asyncio.wait_for(call, timeout=remaining)
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(
+                    f"Request deadline exceeded during {node}",
+                    {"node": node, "budget_seconds": remaining},
+                )
+
+    def _record_deadline_exceeded(
+        self, state: PipelineState, node: str, error: DeadlineExceededError
+    ) -> None:
+        """Record a deadline hit; routing decides whether to fail or keep best-so-far."""
+        logger.warning(
+            "Node stopped by request deadline",
+            node=node,
+            request_id=str(state.design_state.request_id),
+            error=str(error),
+        )
+        state.record_error(str(error), node)
+
     async def planner_node(self, state: PipelineState) -> PipelineState:
         """
         Planning node: Decompose design into task graph.
@@ -96,8 +154,18 @@ class PipelineNodes:
                 user_prompt=state.design_state.user_prompt,
             )
 
-            # Call planner agent
-            task_graph = await self.planner.plan(request)
+            # Replans skip the plan cache: its plan is the one that just failed
+            task_graph = None
+            if state.workflow_iteration == 0:
+                task_graph = await self._call_within_deadline(
+                    state, "planner", self.planner.cached_plan(request)
+                )
+            state.plan_from_cache = task_graph is not None
+
+            if task_graph is None:
+                task_graph = await self._call_within_deadline(
+                    state, "planner", self.planner.plan(request, use_cache=False)
+                )
 
             # Update state
             state.task_graph = task_graph
@@ -128,6 +196,9 @@ class PipelineNodes:
                 complexity=task_graph.complexity_score,
             )
 
+        except DeadlineExceededError as e:
+            self._record_deadline_exceeded(state, "planner", e)
+
         except Exception as e:
             logger.error("Planner node failed", error=str(e), exc_info=True)
             state.record_error(f"Planning failed: {str(e)}", "planner")
@@ -177,8 +248,12 @@ class PipelineNodes:
             )
 
             # Call generator agent
-            scripts = await self.generator.generate(
-                task_graph=state.task_graph,
+            scripts = await self._call_within_deadline(
+                state,
+                "generator",
+                self.generator.generate(
+                    task_graph=state.task_graph,
+                ),
             )
 
             # Update state
@@ -206,6 +281,9 @@ class PipelineNodes:
                 has_feedback=feedback is not None,
             )
 
+        except DeadlineExceededError as e:
+            self._record_deadline_exceeded(state, "generator", e)
+
         except Exception as e:
             logger.error("Generator node failed", error=str(e), exc_info=True)
             state.record_error(f"Generation failed: {str(e)}", "generator")
@@ -253,7 +331,9 @@ class PipelineNodes:
             if not main_script:
                 raise AIDesignerError("No main script found in generated scripts")
 
-            result = await self.executor.execute(main_script)
+            result = await self._call_within_deadline(
+                state, "executor", self.executor.execute(main_script)
+            )
 
             # Update state
             state.execution_result = {
@@ -281,6 +361,13 @@ class PipelineNodes:
                 execution_time=result.get("execution_time", 0),
             )
 
+        except DeadlineExceededError as e:
+            self._record_deadline_exceeded(state, "executor", e)
+            state.execution_result = {
+                "success": False,
+                "error": str(e),
+            }
+
         except Exception as e:
             logger.error("Executor node failed", error=str(e), exc_info=True)
             state.record_error(f"Execution failed: {str(e)}", "executor")
@@ -315,6 +402,10 @@ class PipelineNodes:
         state.design_state.iterations.append(iteration)
         state.design_state.updated_at = datetime.utcnow()
 
+        # A new iteration starts here; never route on an earlier iteration's result
+        state.increment_iteration()
+        state.validation_result = None
+
         try:
             logger.info(
                 "Executing validator node",
@@ -334,19 +425,27 @@ class PipelineNodes:
             )
 
             # Call validator agent
-            validation = await self.validator.validate(
-                design_request=request,
-                task_graph=state.task_graph,
-                generated_scripts=state.generated_scripts,
-                execution_result=state.execution_result,
+            validation = await self._call_within_deadline(
+                state,
+                "validator",
+                self.validator.validate(
+                    design_request=request,
+                    task_graph=state.task_graph,
+                    generated_scripts=state.generated_scripts,
+                    execution_result=state.execution_result,
+                    skip_llm_review=state.skip_llm_review,
+                ),
             )
 
             # Update state
             state.validation_result = validation
-            state.design_state.validation_result = validation
+            state.design_state.validation_results = validation.model_dump(mode="json")
             state.design_state.is_valid = validation.is_valid
 
-            iteration.output_summary = f"Score: {validation.overall_score:.2f}"
+            # Track the best iteration for plateau early stopping
+            state.record_validation(validation)
+
+            iteration.output = {"overall_score": validation.overall_score}
             iteration.completed_at = datetime.utcnow()
 
             # WebSocket callback
@@ -368,13 +467,51 @@ class PipelineNodes:
                 should_refine=validation.should_refine,
             )
 
+        except DeadlineExceededError as e:
+            self._record_deadline_exceeded(state, "validator", e)
+
         except Exception as e:
             logger.error("Validator node failed", error=str(e), exc_info=True)
             state.record_error(f"Validation failed: {str(e)}", "validator")
-            iteration.error_message = str(e)
+            iteration.errors.append(str(e))
             state.design_state.mark_failed(f"Validation failed: {str(e)}")
 
         finally:
             state.exit_node()
 
+        # Decide here: LangGraph drops state changes made in edge functions
+        state.next_action = route_after_validation(state)
+        if state.next_action in (ROUTE_SUCCESS, ROUTE_FAIL) and state.restore_best():
+            logger.info(
+                "Restored best-scoring iteration",
+                best_iteration=state.best_iteration,
+                best_score=state.best_score,
+            )
+
+        await self._update_plan_cache(state)
+
         return state
+
+    async def _update_plan_cache(self, state: PipelineState) -> None:
+        """Cache a plan whose design validated; drop a cached plan that failed."""
+        request = DesignRequest(
+            request_id=state.design_state.request_id,
+            user_prompt=state.design_state.user_prompt,
+        )
+        validation = state.validation_result
+
+        try:
+            if state.next_action in (ROUTE_REPLAN, ROUTE_FAIL):
+                if state.plan_from_cache:
+                    await self.planner.forget_plan(request)
+                    state.plan_from_cache = False
+            elif (
+                state.next_action == ROUTE_SUCCESS
+                and not state.plan_from_cache
+                and state.task_graph is not None
+                and validation is not None
+                and validation.is_valid
+            ):
+                await self.planner.remember_plan(request, state.task_graph)
+        except Exception as e:
+            logger.warning("Plan cache update failed", error=str(e))
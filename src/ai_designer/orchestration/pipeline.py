@@ -4,10 +4,13 @@ LangGraph pipeline construction for the design workflow.
 Builds a StateGraph that orchestrates:
 - Planner → Generator → Executor → Validator
 - Conditional routing based on validation scores
-- Iteration limits and timeout management
+- Iteration limits and end-to-end deadline management
 - WebSocket progress callbacks
+- A rule-based fast path that answers fully specified primitive prompts
+  without any LLM call (see ``fast_path``)
 """
 
+from datetime import datetime
 from typing import Any, Callable, Optional
 
 import structlog
@@ -17,13 +20,20 @@ from ai_designer.agents.executor import FreeCADExecutor
 from ai_designer.agents.generator import GeneratorAgent
 from ai_designer.agents.planner import PlannerAgent
 from ai_designer.agents.validator import ValidatorAgent
+from ai_designer.core.deadline import DEFAULT_DEADLINE_SECONDS, Deadline, deadline_scope
+from ai_designer.core.metrics import FAST_PATH_REQUESTS_TOTAL
+from ai_designer.orchestration.fast_path import (
+    FAST_PATH_MIN_CONFIDENCE,
+    build_task_graph,
+    classify_prompt,
+)
 from ai_designer.orchestration.nodes import PipelineNodes
 from ai_designer.orchestration.routing import (
     ROUTE_FAIL,
     ROUTE_REFINE,
     ROUTE_REPLAN,
     ROUTE_SUCCESS,
-    route_after_validation,
+    route_next_action,
 )
 from ai_designer.orchestration.state import PipelineState
 from ai_designer.schemas.design_state import DesignRequest, DesignState, ExecutionStatus
@@ -106,7 +116,7 @@ def build_design_pipeline(
     # Conditional edges from validator
     workflow.add_conditional_edges(
         "validator",
-        route_after_validation,
+        route_next_action,
         {
             ROUTE_SUCCESS: END,  # Design passed validation
             ROUTE_REFINE: "generator",  # Loop back with feedback
@@ -120,6 +130,13 @@ def build_design_pipeline(
     return workflow.compile()
 
 
+def _as_pipeline_state(result: Any) -> PipelineState:
+    """LangGraph returns the final channel values as a dict; rebuild the state."""
+    if isinstance(result, PipelineState):
+        return result
+    return PipelineState.model_validate(result)
+
+
 async def run_design_pipeline(
     request: DesignRequest,
     planner: PlannerAgent,
@@ -128,6 +145,8 @@ async def run_design_pipeline(
     executor: Optional[FreeCADExecutor] = None,
     websocket_callback: Optional[Callable] = None,
     max_iterations: int = 5,
+    deadline: Optional[datetime] = None,
+    plateau_patience: int = 2,
 ) -> DesignState:
     """
     Execute the design pipeline for a request.
@@ -146,10 +165,15 @@ async def run_design_pipeline(
         executor: Optional FreeCAD executor
         websocket_callback: Optional WebSocket callback
         max_iterations: Maximum iterations
+        deadline: End-to-end deadline (UTC); defaults to
+            PIPELINE_DEADLINE_SECONDS from now
+        plateau_patience: Stop after this many iterations without score
+            improvement and return the best design (0 disables)
 
     Returns:
         Final design state with results
     """
+    deadline = deadline or Deadline.after(DEFAULT_DEADLINE_SECONDS).expires_at
     logger.info(
         "Starting design pipeline execution",
         request_id=str(request.request_id),
@@ -179,11 +203,14 @@ async def run_design_pipeline(
         pipeline_state = PipelineState.from_design_state(
             design_state=design_state,
             max_iterations=max_iterations,
+            deadline=deadline,
+            plateau_patience=plateau_patience,
         )
 
         # Execute pipeline
         logger.info("Invoking pipeline", request_id=str(request.request_id))
-        final_state = await pipeline.ainvoke(pipeline_state)
+        with deadline_scope(Deadline(deadline)):
+            final_state = _as_pipeline_state(await pipeline.ainvoke(pipeline_state))
 
         # Update design state based on final routing decision
         if final_state.next_action == ROUTE_SUCCESS:
@@ -239,6 +266,10 @@ class PipelineExecutor:
         executor: Optional[FreeCADExecutor] = None,
         websocket_callback: Optional[Callable] = None,
         max_iterations: int = 5,
+        plateau_patience: int = 2,
+        plateau_min_delta: float = 0.02,
+        enable_fast_path: bool = True,
+        fast_path_min_confidence: float = FAST_PATH_MIN_CONFIDENCE,
     ):
         """
         Initialize pipeline executor.
@@ -250,6 +281,13 @@ class PipelineExecutor:
             executor: Optional FreeCAD executor
             websocket_callback: Optional WebSocket callback
             max_iterations: Maximum iterations
+            plateau_patience: Stop after this many iterations without score
+                improvement and return the best design (0 disables)
+            plateau_min_delta: Minimum score gain that counts as improvement
+            enable_fast_path: Answer fully specified primitive prompts
+                without the LLM pipeline
+            fast_path_min_confidence: Minimum classifier confidence for the
+                fast path
         """
         self.planner = planner
         self.generator = generator
@@ -257,6 +295,10 @@ class PipelineExecutor:
         self.executor = executor
         self.websocket_callback = websocket_callback
         self.max_iterations = max_iterations
+        self.plateau_patience = plateau_patience
+        self.plateau_min_delta = plateau_min_delta
+        self.enable_fast_path = enable_fast_path
+        self.fast_path_min_confidence = fast_path_min_confidence
 
         # Compile pipeline once
         self.pipeline = build_design_pipeline(
@@ -270,19 +312,35 @@ class PipelineExecutor:
 
         logger.info("Pipeline executor initialized")
 
-    async def execute(self, request: DesignRequest) -> DesignState:
+    async def execute(
+        self,
+        request: DesignRequest,
+        max_iterations: Optional[int] = None,
+        skip_llm_review: bool = False,
+        deadline: Optional[datetime] = None,
+    ) -> DesignState:
         """
         Execute pipeline for a design request.
 
         Args:
             request: Design request
+            max_iterations: Per-request iteration cap (defaults to the
+                executor's max_iterations)
+            skip_llm_review: Skip LLM review during validation (degraded mode)
+            deadline: End-to-end deadline (UTC); defaults to
+                PIPELINE_DEADLINE_SECONDS from now
 
         Returns:
             Final design state
         """
+        iterations = max_iterations or self.max_iterations
+        deadline = deadline or Deadline.after(DEFAULT_DEADLINE_SECONDS).expires_at
         logger.info(
             "Executing pipeline",
             request_id=str(request.request_id),
+            max_iterations=iterations,
+            skip_llm_review=skip_llm_review,
+            deadline=deadline.isoformat(),
         )
 
         try:
@@ -290,16 +348,28 @@ class PipelineExecutor:
             design_state = DesignState(
                 request_id=request.request_id,
                 user_prompt=request.user_prompt,
-                max_iterations=self.max_iterations,
+                max_iterations=iterations,
             )
 
             pipeline_state = PipelineState.from_design_state(
                 design_state=design_state,
-                max_iterations=self.max_iterations,
+                max_iterations=iterations,
+                skip_llm_review=skip_llm_review,
+                deadline=deadline,
+                plateau_patience=self.plateau_patience,
+                plateau_min_delta=self.plateau_min_delta,
             )
 
             # Execute
-            final_state = await self.pipeline.ainvoke(pipeline_state)
+            with deadline_scope(Deadline(deadline)):
+                if self.enable_fast_path and await self._run_fast_path(
+                    request, design_state
+                ):
+                    return design_state
+
+                final_state = _as_pipeline_state(
+                    await self.pipeline.ainvoke(pipeline_state)
+                )
 
             # Update final status
             if final_state.next_action == ROUTE_SUCCESS:
@@ -317,7 +387,109 @@ class PipelineExecutor:
             design_state = DesignState(
                 request_id=request.request_id,
                 user_prompt=request.user_prompt,
-                max_iterations=self.max_iterations,
+                max_iterations=iterations,
             )
             design_state.mark_failed(f"Pipeline execution failed: {str(e)}")
             return design_state
+
+    async def _run_fast_path(
+        self, request: DesignRequest, design_state: DesignState
+    ) -> bool:
+        """
+        Answer a primitive prompt without planner, generator or LLM review.
+
+        The script is produced by rules, executed (when an executor is
+        configured) and validated with LLM review skipped.  Returns False
+        without touching ``design_state`` when the prompt does not qualify or
+        the result does not pass validation, so the caller falls back to the
+        full pipeline.
+
+        Args:
+            request: Design request
+            design_state: State to fill in on success
+
+        Returns:
+            True if the request was completed on the fast path
+        """
+        match = classify_prompt(request.user_prompt)
+        if match is None or match.confidence < self.fast_path_min_confidence:
+            FAST_PATH_REQUESTS_TOTAL.labels(outcome="miss").inc()
+            return False
+
+        task_graph = build_task_graph(request.request_id, match)
+        task_id = next(iter(task_graph.nodes))
+        scripts = {task_id: match.script}
+
+        try:
+            execution_result = None
+            if self.executor:
+                result = await self.executor.execute(
+                    scripts, request_id=str(request.request_id)
+                )
+                execution_result = {
+                    "success": result.get("success", False),
+                    "error": "; ".join(result.get("errors", [])) or None,
+                    "execution_time": result.get("execution_time", 0.0),
+                    "object_count": len(result.get("created_objects", [])),
+                    # Primitive geometry is known analytically
+                    "total_volume": match.volume,
+                    "bounding_box": match.bounding_box,
+                }
+
+            validation = await self.validator.validate(
+                request,
+                task_graph,
+                scripts,
+                execution_result,
+                skip_llm_review=True,
+            )
+        except Exception as e:
+            logger.warning(
+                "Fast path failed, falling back to full pipeline",
+                request_id=str(request.request_id),
+                error=str(e),
+            )
+            FAST_PATH_REQUESTS_TOTAL.labels(outcome="fallback").inc()
+            return False
+
+        if not validation.is_valid:
+            logger.info(
+                "Fast path result rejected, falling back to full pipeline",
+                request_id=str(request.request_id),
+                score=validation.overall_score,
+            )
+            FAST_PATH_REQUESTS_TOTAL.labels(outcome="fallback").inc()
+            return False
+
+        design_state.task_graph_id = task_graph.graph_id
+        design_state.execution_plan = {
+            "fast_path": True,
+            "shape": match.shape,
+            "parameters": match.parameters,
+            "confidence": match.confidence,
+        }
+        design_state.freecad_script = match.script
+        design_state.validation_results = validation.model_dump(mode="json")
+        design_state.is_valid = True
+        design_state.current_iteration = 1
+        design_state.mark_completed()
+
+        if self.websocket_callback:
+            await self.websocket_callback(
+                request.request_id,
+                {
+                    "node": "fast_path",
+                    "status": "completed",
+                    "score": validation.overall_score,
+                    "is_valid": True,
+                },
+            )
+
+        FAST_PATH_REQUESTS_TOTAL.labels(outcome="hit").inc()
+        logger.info(
+            "Design completed on fast path",
+            request_id=str(request.request_id),
+            shape=match.shape,
+            confidence=match.confidence,
+        )
+        return True
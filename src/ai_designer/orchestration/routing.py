@@ -6,12 +6,24 @@ Determines the next action based on validation results:
 - 0.4 <= score < 0.8: REFINE (regenerate with feedback)
 - 0.2 <= score < 0.4: REPLAN (planning issue, start over)
 - score < 0.2: FAIL (unrecoverable)
+
+The refine loop also stops early when scores plateau or regress for
+``plateau_patience`` iterations, or when the request deadline cannot fit
+another iteration.  The best-scoring iteration is then accepted if it is at
+least refinable, otherwise the pipeline fails.
 """
 
 from typing import Literal
 
 import structlog
 
+from ai_designer.core.admission import (
+    STAGE_EXECUTOR,
+    STAGE_GENERATOR,
+    STAGE_PLANNER,
+    STAGE_VALIDATOR,
+    get_latency_tracker,
+)
 from ai_designer.orchestration.state import PipelineState
 from ai_designer.schemas.validation import ValidationResult
 
@@ -52,6 +64,14 @@ def route_after_validation(state: PipelineState) -> RoutingDecision:
     validation = state.validation_result
 
     # Safety check
+    if state.best_snapshot is not None and not (validation and state.is_validated()):
+        # The current iteration was not validated; fall back to the best one
+        return _accept_best_or_fail(
+            state,
+            0.0,
+            f"Iteration {state.workflow_iteration} was not validated",
+        )
+
     if not validation:
         logger.error("No validation result available for routing")
         state.routing_reason = "No validation result"
@@ -59,19 +79,37 @@ def route_after_validation(state: PipelineState) -> RoutingDecision:
 
     score = validation.overall_score
 
-    # Check iteration limit first
-    if state.has_exceeded_iterations():
+    # Check iteration limit (a passing design on the last iteration still wins)
+    if score < THRESHOLD_SUCCESS and state.has_exceeded_iterations():
         logger.warning(
             "Maximum iterations exceeded",
             iterations=state.workflow_iteration,
             max_iterations=state.max_workflow_iterations,
             score=score,
+            best_score=state.best_score,
         )
         state.routing_reason = (
             f"Max iterations ({state.max_workflow_iterations}) exceeded"
         )
         return ROUTE_FAIL
 
+    # Stop early when scores plateau or regress
+    if score < THRESHOLD_SUCCESS and state.has_plateaued():
+        return _accept_best_or_fail(
+            state,
+            score,
+            f"Score plateaued for {state.plateau_count} iterations",
+        )
+
+    # Check the time budget before committing to another iteration
+    if score < THRESHOLD_SUCCESS and not fits_another_iteration(
+        state, replan=score < THRESHOLD_REFINE
+    ):
+        remaining = state.remaining_budget() or 0.0
+        return _accept_best_or_fail(
+            state, score, f"Deadline reached ({remaining:.0f}s left)"
+        )
+
     # Route based on score thresholds
     if score >= THRESHOLD_SUCCESS:
         logger.info(
@@ -114,6 +152,92 @@ def route_after_validation(state: PipelineState) -> RoutingDecision:
         return ROUTE_FAIL
 
 
+def _accept_best_or_fail(
+    state: PipelineState, score: float, cause: str
+) -> RoutingDecision:
+    """
+    End the refine loop, keeping the best design seen so far.
+
+    The best iteration is accepted if it is at least refinable; otherwise
+    the pipeline fails.
+    """
+    best = max(score, state.best_score or 0.0)
+
+    if best >= THRESHOLD_REFINE:
+        logger.warning(
+            "Stopping early - accepting best-so-far design",
+            cause=cause,
+            score=score,
+            best_score=best,
+            best_iteration=state.best_iteration,
+        )
+        state.routing_reason = (
+            f"{cause}, accepting best-so-far design (score: {best:.2f})"
+        )
+        return ROUTE_SUCCESS
+
+    logger.warning(
+        "Stopping early - no acceptable design",
+        cause=cause,
+        score=score,
+        best_score=best,
+    )
+    state.routing_reason = f"{cause} (best score: {best:.2f})"
+    return ROUTE_FAIL
+
+
+def route_next_action(state: PipelineState) -> RoutingDecision:
+    """
+    Conditional edge after the validator node.
+
+    LangGraph does not persist state changes made inside edge functions, so
+    the validator node records its routing decision in ``next_action``; this
+    edge follows it and falls back to ``route_after_validation``.
+    """
+    return state.next_action or route_after_validation(state)
+
+
+def estimate_iteration_seconds(state: PipelineState, replan: bool = False) -> float:
+    """
+    Estimate the duration of one more pipeline iteration.
+
+    Uses this request's own node durations where available and falls back
+    to recent latencies across all requests.
+
+    Args:
+        state: Current pipeline state
+        replan: Whether the iteration re-runs the planner
+
+    Returns:
+        Estimated seconds for generator + executor + validator (+ planner)
+    """
+    stages = [STAGE_GENERATOR, STAGE_EXECUTOR, STAGE_VALIDATOR]
+    if replan:
+        stages.append(STAGE_PLANNER)
+
+    tracker = get_latency_tracker()
+    return sum(
+        state.node_durations.get(stage, tracker.estimate(stage)) for stage in stages
+    )
+
+
+def fits_another_iteration(state: PipelineState, replan: bool = False) -> bool:
+    """
+    Check whether the remaining time budget can fit another iteration.
+
+    Args:
+        state: Current pipeline state
+        replan: Whether the iteration re-runs the planner
+
+    Returns:
+        True if there is no deadline or enough budget is left
+    """
+    remaining = state.remaining_budget()
+    if remaining is None:
+        return True
+    return remaining >= estimate_iteration_seconds(state, replan=replan)
+
+
 def should_continue_iteration(state: PipelineState) -> bool:
     """
     Check if another iteration should be attempted.
@@ -128,6 +252,10 @@ def should_continue_iteration(state: PipelineState) -> bool:
     if state.has_exceeded_iterations():
         return False
 
+    # Check time budget
+    if not fits_another_iteration(state):
+        return False
+
     # Check if we have validation result
     if not state.validation_result:
         return True  # First iteration
@@ -11,6 +11,8 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from ai_designer.core.admission import STAGE_EXECUTOR, get_latency_tracker
+from ai_designer.core.deadline import Deadline
 from ai_designer.schemas.design_state import DesignState, ExecutionStatus
 from ai_designer.schemas.task_graph import TaskGraph
 from ai_designer.schemas.validation import ValidationResult
@@ -40,12 +42,29 @@ class PipelineState(BaseModel):
     workflow_iteration: int = 0
     max_workflow_iterations: int = 5
 
+    # Degraded-mode control (set by admission control under load)
+    skip_llm_review: bool = False
+
+    # End-to-end time budget (UTC); None means unbounded
+    deadline: Optional[datetime] = None
+
     # Intermediate results (shared between nodes)
     task_graph: Optional[TaskGraph] = None
+    plan_from_cache: bool = False
     generated_scripts: Optional[Dict[str, str]] = None
     execution_result: Optional[Dict[str, Any]] = None
     validation_result: Optional[ValidationResult] = None
 
+    # Best-so-far tracking and plateau early stopping
+    score_history: List[float] = Field(default_factory=list)
+    best_score: Optional[float] = None
+    best_iteration: Optional[int] = None
+    best_snapshot: Optional[Dict[str, Any]] = None
+    validated_iteration: Optional[int] = None
+    plateau_count: int = 0
+    plateau_patience: int = 2  # 0 disables early stopping
+    plateau_min_delta: float = 0.02
+
     # Routing control
     next_action: Optional[str] = None  # "success", "refine", "replan", "fail"
     routing_reason: Optional[str] = None
@@ -74,6 +93,10 @@ class PipelineState(BaseModel):
         if self.current_node and self.node_start_time:
             duration = (datetime.utcnow() - self.node_start_time).total_seconds()
             self.node_durations[self.current_node] = duration
+            # The executor's service time is recorded where FreeCAD runs, from
+            # slot acquisition; this duration also includes the slot wait
+            if self.current_node != STAGE_EXECUTOR:
+                get_latency_tracker().observe(self.current_node, duration)
             self.node_start_time = None
 
     def increment_iteration(self) -> None:
@@ -85,6 +108,87 @@ class PipelineState(BaseModel):
         """Check if maximum iterations exceeded."""
         return self.workflow_iteration >= self.max_workflow_iterations
 
+    def record_validation(self, validation: ValidationResult) -> bool:
+        """
+        Record a validation score and keep the best-scoring iteration.
+
+        A score that beats the best by less than ``plateau_min_delta`` (or
+        does not beat it at all) counts towards the plateau.
+
+        Returns:
+            True if this iteration is the new best
+        """
+        score = validation.overall_score
+        self.score_history.append(score)
+        self.validated_iteration = self.workflow_iteration
+
+        improved = self.best_score is None or score > self.best_score
+        significant = (
+            self.best_score is None or score >= self.best_score + self.plateau_min_delta
+        )
+        self.plateau_count = 0 if significant else self.plateau_count + 1
+
+        if improved:
+            self.best_score = score
+            self.best_iteration = self.workflow_iteration
+            self.best_snapshot = {
+                "task_graph": self.task_graph,
+                "generated_scripts": self.generated_scripts,
+                "execution_result": self.execution_result,
+                "validation_result": validation,
+                "freecad_script": self.design_state.freecad_script,
+                "validation_results": self.design_state.validation_results,
+                "is_valid": self.design_state.is_valid,
+            }
+
+        return improved
+
+    def has_plateaued(self) -> bool:
+        """Check if scores stopped improving for ``plateau_patience`` iterations."""
+        return self.plateau_patience > 0 and self.plateau_count >= self.plateau_patience
+
+    def is_validated(self) -> bool:
+        """Check if the current iteration's scripts have been validated."""
+        return self.validated_iteration == self.workflow_iteration
+
+    def restore_best(self) -> bool:
+        """
+        Restore the best-scoring iteration's scripts and artifacts.
+
+        The best snapshot always replaces an iteration that was never
+        validated (validator error or deadline), whatever its scores.
+
+        Returns:
+            True if an earlier iteration was restored
+        """
+        if self.best_snapshot is None or not self.score_history:
+            return False
+        if self.is_validated() and self.score_history[-1] >= (self.best_score or 0.0):
+            return False
+
+        snapshot = self.best_snapshot
+        self.task_graph = snapshot["task_graph"]
+        self.generated_scripts = snapshot["generated_scripts"]
+        self.execution_result = snapshot["execution_result"]
+        self.validation_result = snapshot["validation_result"]
+        self.design_state.freecad_script = snapshot["freecad_script"]
+        self.design_state.validation_results = snapshot["validation_results"]
+        self.design_state.is_valid = snapshot["is_valid"]
+        self.design_state.updated_at = datetime.utcnow()
+        return True
+
+    def remaining_budget(self) -> Optional[float]:
+        """Seconds left before the request deadline, or None if unbounded."""
+        if self.deadline is None:
+            return None
+        return max((self.deadline - datetime.utcnow()).total_seconds(), 0.0)
+
+    def get_deadline(self) -> Optional[Deadline]:
+        """Request deadline as a Deadline object, or None if unbounded."""
+        if self.deadline is None:
+            return None
+        return Deadline(self.deadline)
+
     def record_error(self, error: str, node: Optional[str] = None) -> None:
         """Record an error in the pipeline."""
         self.error_count += 1
@@ -94,12 +198,22 @@ class PipelineState(BaseModel):
 
     @classmethod
     def from_design_state(
-        cls, design_state: DesignState, max_iterations: int = 5
+        cls,
+        design_state: DesignState,
+        max_iterations: int = 5,
+        skip_llm_review: bool = False,
+        deadline: Optional[datetime] = None,
+        plateau_patience: int = 2,
+        plateau_min_delta: float = 0.02,
     ) -> "PipelineState":
         """Create pipeline state from existing design state."""
         return cls(
             design_state=design_state,
             max_workflow_iterations=max_iterations,
+            skip_llm_review=skip_llm_review,
+            deadline=deadline,
+            plateau_patience=plateau_patience,
+            plateau_min_delta=plateau_min_delta,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -113,4 +227,9 @@ class PipelineState(BaseModel):
             "routing_reason": self.routing_reason,
             "error_count": self.error_count,
             "last_error": self.last_error,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "score_history": self.score_history,
+            "best_score": self.best_score,
+            "best_iteration": self.best_iteration,
+            "validated_iteration": self.validated_iteration,
         }
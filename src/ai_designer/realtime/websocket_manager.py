@@ -1,17 +1,28 @@
 """
 WebSocket Manager for Real-time Updates
 Provides live progress tracking and updates to connected clients
+
+Messages from the public ``send_*`` methods go through an ``asyncio.Queue``
+owned by the server's event loop.  Producers on other threads (such as
+``ProgressTracker`` driven from the CLI) enqueue with
+``loop.call_soon_threadsafe``; a single dispatcher task awaits the queue,
+so an idle server uses no CPU.  Everything queued for the same session by
+the time the dispatcher wakes up is encoded once and sent to clients that
+asked for batches (``{"type": "register_session", ..., "batch": true}``) as
+one ``batch`` frame:
+
+    {"type": "batch", "messages": [<message>, ...], "timestamp": ..., "session_id": ...}
+
+Other clients receive the same messages as individual frames.
 """
 
 import asyncio
 import json
-import threading
 import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
-from queue import Queue
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import websockets
 
@@ -26,6 +37,7 @@ class MessageType(Enum):
     SYSTEM_STATUS = "system_status"
     USER_NOTIFICATION = "user_notification"
     LIVE_PREVIEW = "live_preview"
+    BATCH = "batch"
 
 
 @dataclass
@@ -57,15 +69,18 @@ class WebSocketManager:
     Manages WebSocket connections and real-time updates
     """
 
-    def __init__(self, host="localhost", port=8765):
+    def __init__(self, host="localhost", port=8765, max_batch_size=50):
         self.host = host
         self.port = port
+        self.max_batch_size = max_batch_size
         self.clients: Dict[str, websockets.WebSocketServerProtocol] = {}
         self.session_clients: Dict[str, Set[str]] = {}  # session_id -> client_ids
+        self.batch_clients: Set[str] = set()  # clients accepting batch frames
 
-        # Message queues for async processing
-        self.message_queue = Queue()
-        self.broadcast_queue = Queue()
+        # Outgoing messages, owned by the server loop (created on start)
+        self.message_queue: Optional[asyncio.Queue] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
 
         # Server state
         self.server = None
@@ -80,28 +95,23 @@ class WebSocketManager:
             "active_connections": 0,
             "messages_sent": 0,
             "messages_received": 0,
+            "messages_dropped": 0,
             "start_time": None,
         }
 
-        # Background worker thread
-        self.worker_thread = None
-        self.stop_event = threading.Event()
-
     async def start_server(self):
         """Start the WebSocket server"""
         print(f"🌐 Starting WebSocket server on {self.host}:{self.port}")
 
         self.server = await websockets.serve(self.handle_client, self.host, self.port)
 
+        self.loop = asyncio.get_running_loop()
+        self.message_queue = asyncio.Queue()
+        self._dispatch_task = self.loop.create_task(self._dispatch_loop())
+
         self.running = True
         self.stats["start_time"] = datetime.now()
 
-        # Start background worker
-        self.worker_thread = threading.Thread(
-            target=self._background_worker, daemon=True
-        )
-        self.worker_thread.start()
-
         print(f"✅ WebSocket server started successfully")
 
     async def stop_server(self):
@@ -112,7 +122,13 @@ class WebSocketManager:
         print("🛑 Stopping WebSocket server...")
 
         self.running = False
-        self.stop_event.set()
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            try:
+                await self._dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatch_task = None
 
         # Close all client connections
         if self.clients:
@@ -168,6 +184,7 @@ class WebSocketManager:
             if client_id in self.clients:
                 del self.clients[client_id]
                 self.stats["active_connections"] -= 1
+            self.batch_clients.discard(client_id)
 
             # Remove from session mapping
             for session_id, client_ids in self.session_clients.items():
@@ -183,7 +200,9 @@ class WebSocketManager:
 
             if msg_type == "register_session":
                 session_id = data.get("session_id", "default")
-                self.register_client_session(client_id, session_id)
+                self.register_client_session(
+                    client_id, session_id, batch=bool(data.get("batch"))
+                )
 
                 response = WebSocketMessage(
                     type=MessageType.SYSTEM_STATUS,
@@ -191,6 +210,7 @@ class WebSocketManager:
                         "status": "session_registered",
                         "session_id": session_id,
                         "client_id": client_id,
+                        "batch": client_id in self.batch_clients,
                     },
                     timestamp=datetime.now(),
                     session_id=session_id,
@@ -215,12 +235,16 @@ class WebSocketManager:
         except Exception as e:
             print(f"❌ Error processing message from {client_id}: {e}")
 
-    def register_client_session(self, client_id: str, session_id: str):
-        """Register a client with a specific session"""
+    def register_client_session(
+        self, client_id: str, session_id: str, batch: bool = False
+    ):
+        """Register a client with a specific session (batch: accept batch frames)"""
         if session_id not in self.session_clients:
             self.session_clients[session_id] = set()
 
         self.session_clients[session_id].add(client_id)
+        if batch:
+            self.batch_clients.add(client_id)
         print(f"📝 Client {client_id} registered for session {session_id}")
 
     async def send_to_client(self, client_id: str, message: WebSocketMessage):
@@ -228,16 +252,18 @@ class WebSocketManager:
         if client_id not in self.clients:
             return False
 
+        return await self._send_frame(
+            client_id, json.dumps(_to_dict(message), default=str)
+        )
+
+    async def _send_frame(self, client_id: str, frame: str) -> bool:
+        """Send an encoded frame to a specific client"""
+        websocket = self.clients.get(client_id)
+        if websocket is None:
+            return False
+
         try:
-            websocket = self.clients[client_id]
-            message_data = {
-                "type": message.type.value,
-                "data": message.data,
-                "timestamp": message.timestamp.isoformat(),
-                "session_id": message.session_id,
-            }
-
-            await websocket.send(json.dumps(message_data))
+            await websocket.send(frame)
             self.stats["messages_sent"] += 1
             return True
 
@@ -332,7 +358,7 @@ class WebSocketManager:
             session_id=session_id,
         )
 
-        self.message_queue.put(("session", session_id, ws_message))
+        self._enqueue("session", session_id, ws_message)
 
     def send_command_status(
         self,
@@ -354,7 +380,7 @@ class WebSocketManager:
             session_id=session_id,
         )
 
-        self.message_queue.put(("session", session_id, message))
+        self._enqueue("session", session_id, message)
 
         # Remove from active commands if completed
         if status in ["completed", "failed", "cancelled"]:
@@ -369,7 +395,7 @@ class WebSocketManager:
             session_id=session_id,
         )
 
-        self.message_queue.put(("session", session_id, message))
+        self._enqueue("session", session_id, message)
 
     def send_error(
         self,
@@ -389,7 +415,7 @@ class WebSocketManager:
             session_id=session_id,
         )
 
-        self.message_queue.put(("session", session_id, message))
+        self._enqueue("session", session_id, message)
 
     def send_user_notification(
         self, notification: str, notification_type: str = "info", session_id: str = None
@@ -406,58 +432,79 @@ class WebSocketManager:
             session_id=session_id,
         )
 
-        self.message_queue.put(("session", session_id, message))
+        self._enqueue("session", session_id, message)
+
+    def _enqueue(
+        self, send_type: str, target: Optional[str], message: WebSocketMessage
+    ):
+        """Queue a message for the dispatcher (callable from any thread)"""
+        if not self.running or self.loop is None:
+            self.stats["messages_dropped"] += 1
+            return
+
+        item = (send_type, target, message)
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
 
-    def _background_worker(self):
-        """Background worker to process message queue"""
-        while not self.stop_event.is_set():
+        if on_loop:
+            self.message_queue.put_nowait(item)
+        else:
             try:
-                if not self.message_queue.empty():
-                    send_type, target, message = self.message_queue.get(timeout=0.1)
-
-                    # Schedule async sending with proper event loop handling
-                    if self.running:
-                        try:
-                            # Try to get the existing event loop
-                            loop = asyncio.get_event_loop()
-                            if loop.is_running():
-                                # Schedule the coroutine in the existing loop
-                                asyncio.run_coroutine_threadsafe(
-                                    self._send_queued_message(
-                                        send_type, target, message
-                                    ),
-                                    loop,
-                                )
-                            else:
-                                # If no loop is running, create a new one
-                                asyncio.create_task(
-                                    self._send_queued_message(
-                                        send_type, target, message
-                                    )
-                                )
-                        except RuntimeError:
-                            # No event loop in current thread, skip for now
-                            print(
-                                f"⚠️  Skipping message send (no event loop): {message.type.value}"
-                            )
-
-                time.sleep(0.01)  # Small delay to prevent busy waiting
-
-            except Exception as e:
-                print(f"❌ Background worker error: {e}")
-                time.sleep(1)
-
-    async def _send_queued_message(
-        self, send_type: str, target: str, message: WebSocketMessage
+                self.loop.call_soon_threadsafe(self.message_queue.put_nowait, item)
+            except RuntimeError:
+                self.stats["messages_dropped"] += 1  # Loop already closed
+
+    async def _dispatch_loop(self):
+        """Send queued messages, batching those queued for the same target"""
+        while True:
+            batch = [await self.message_queue.get()]
+            while len(batch) < self.max_batch_size and not self.message_queue.empty():
+                batch.append(self.message_queue.get_nowait())
+
+            # Group by target, keeping the order of first appearance
+            groups: Dict[Tuple[str, Optional[str]], List[WebSocketMessage]] = {}
+            for send_type, target, message in batch:
+                groups.setdefault((send_type, target), []).append(message)
+
+            for (send_type, target), messages in groups.items():
+                await self._send_queued_messages(send_type, target, messages)
+
+    async def _send_queued_messages(
+        self, send_type: str, target: Optional[str], messages: List[WebSocketMessage]
     ):
-        """Send queued message asynchronously"""
+        """Send queued messages to one target, as one frame to batch clients"""
         try:
+            payloads = [_to_dict(m) for m in messages]
+            single_frames = [json.dumps(p, default=str) for p in payloads]
+            batch_frames = single_frames
+            if len(payloads) > 1:
+                batch_frames = [
+                    json.dumps(
+                        {
+                            "type": MessageType.BATCH.value,
+                            "messages": payloads,
+                            "timestamp": datetime.now().isoformat(),
+                            "session_id": target if send_type == "session" else None,
+                        },
+                        default=str,
+                    )
+                ]
+
             if send_type == "session":
-                await self.send_to_session(target, message)
+                client_ids = list(self.session_clients.get(target, ()))
             elif send_type == "client":
-                await self.send_to_client(target, message)
-            elif send_type == "broadcast":
-                await self.broadcast_to_all(message)
+                client_ids = [target]
+            else:
+                client_ids = list(self.clients)
+
+            for client_id in client_ids:
+                frames = (
+                    batch_frames if client_id in self.batch_clients else single_frames
+                )
+                for frame in frames:
+                    await self._send_frame(client_id, frame)
 
         except Exception as e:
             print(f"❌ Failed to send queued message: {e}")
@@ -477,6 +524,16 @@ class WebSocketManager:
         }
 
 
+def _to_dict(message: WebSocketMessage) -> Dict[str, Any]:
+    """Wire format of a message"""
+    return {
+        "type": message.type.value,
+        "data": message.data,
+        "timestamp": message.timestamp.isoformat(),
+        "session_id": message.session_id,
+    }
+
+
 # Progress tracker that integrates with the WebSocket manager
 class ProgressTracker:
     """
@@ -2,23 +2,43 @@
 Redis utilities for state management, caching, and audit trail.
 
 Provides:
-- RedisClient: Connection pooling and Redis operations
+- RedisClient: Redis operations on the shared connection pool
+- get_redis / get_async_redis: Shared sync and asyncio connection pools
 - StateCache: Legacy FreeCAD state + DesignState Pydantic persistence
+- StateCodec: Compact binary encoding of cached state payloads
 - AuditLogger: Immutable audit trail via Redis Streams
+- BufferedAuditWriter: Batched, pipelined audit writes with local spooling
 - PubSubBridge: Redis Pub/Sub to WebSocket forwarding
+- DesignStore: Shared DesignState store with a local read-through cache
+- PlanCache: Planner task-graph templates keyed on prompt structure
+- StateCacheMaintenance: Background cleanup of completed designs
 """
 
 from .audit import AuditEvent, AuditEventType, AuditLogger
+from .audit_writer import BufferedAuditWriter
 from .client import RedisClient
+from .codec import StateCodec
+from .connection import close_pools, get_async_redis, get_redis
+from .design_store import DesignStore
+from .maintenance import StateCacheMaintenance
+from .plan_cache import PlanCache
 from .pubsub_bridge import PubSubBridge, get_pubsub_bridge, set_pubsub_bridge
 from .state_cache import StateCache
 
 __all__ = [
     "RedisClient",
+    "get_redis",
+    "get_async_redis",
+    "close_pools",
     "StateCache",
+    "StateCodec",
+    "DesignStore",
+    "PlanCache",
+    "StateCacheMaintenance",
     "AuditLogger",
     "AuditEvent",
     "AuditEventType",
+    "BufferedAuditWriter",
     "PubSubBridge",
     "get_pubsub_bridge",
     "set_pubsub_bridge",
@@ -6,10 +6,27 @@ Provides comprehensive event logging for all design lifecycle events with:
 - Event filtering and querying
 - Automatic stream trimming to prevent unbounded growth
 - Dual-write to Pub/Sub for real-time notifications
+- Write-time aggregates (per-type counts, milestones, node durations) and
+  per-type entry indexes, so summaries and type filters skip the full stream
+
+Redis layout (per design request)
+---------------------------------
+design:{id}:audit                    stream of events
+design:{id}:audit:summary            hash: total, count:{type}, first:{type},
+                                     first_event, last_event,
+                                     node_ms:{node}, node_runs:{node}
+design:{id}:audit:type:{type}        list of stream entry IDs of that type
+
+All keys of a request expire together, ``ttl_seconds`` after its last event.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+AUDIT_TTL_SECONDS   int, default 604800 (7 days; 0 = keep forever)
 """
 
 import json
 import logging
+import os
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -19,6 +36,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# ── Config ────────────────────────────────────────────────────────────────────
+_TTL_SECONDS: int = int(os.getenv("AUDIT_TTL_SECONDS", "604800"))
+
 
 class AuditEventType(str, Enum):
     """Types of audit events in the design lifecycle."""
@@ -144,6 +164,7 @@ class AuditLogger:
         redis_client,
         stream_max_length: int = 1000,
         enable_pubsub: bool = True,
+        ttl_seconds: int = _TTL_SECONDS,
     ):
         """
         Initialize audit logger.
@@ -152,15 +173,26 @@ class AuditLogger:
             redis_client: RedisClient instance
             stream_max_length: Maximum events per stream (default 1000)
             enable_pubsub: Also publish events to Pub/Sub for real-time notifications
+            ttl_seconds: Expiration of a request's audit keys after its last
+                event (0 = never expire)
         """
         self.redis_client = redis_client
         self.stream_max_length = stream_max_length
         self.enable_pubsub = enable_pubsub
+        self.ttl_seconds = ttl_seconds
 
     def _get_stream_key(self, request_id: UUID) -> str:
         """Get Redis Stream key for a design request."""
         return f"design:{request_id}:audit"
 
+    def _get_summary_key(self, request_id: UUID) -> str:
+        """Get the hash of write-time aggregates for a design request."""
+        return f"design:{request_id}:audit:summary"
+
+    def _get_type_index_key(self, request_id: UUID, event_type: AuditEventType) -> str:
+        """Get the list of stream entry IDs of one event type."""
+        return f"design:{request_id}:audit:type:{event_type.value}"
+
     def _get_pubsub_channel(self, request_id: UUID) -> str:
         """Get Pub/Sub channel for real-time notifications."""
         return f"design:{request_id}:events"
@@ -203,48 +235,129 @@ class AuditLogger:
             error=error,
         )
 
-        stream_key = self._get_stream_key(request_id)
-
         try:
-            # Write to Redis Stream with automatic trimming
-            entry_id = self.redis_client.xadd(
-                stream_key,
+            entry_id = self.log_events([event])[0]
+            logger.debug(f"Logged {event_type.value} for {request_id}: {message}")
+            return entry_id
+
+        except Exception as e:
+            logger.error(f"Failed to log audit event: {e}")
+            raise
+
+    def log_events(self, events: List[AuditEvent]) -> List[str]:
+        """
+        Write several audit events in one pipelined round trip.
+
+        Each event is appended to its request's stream (and published to
+        Pub/Sub when enabled) in list order, and the request's aggregates
+        are updated in the same pipeline.  A second pipeline adds the new
+        entry IDs to the per-type indexes; once the first one succeeded the
+        batch counts as written, so a failure of the second is logged rather
+        than raised (a retry would duplicate the events).  All touched keys
+        get the same expiration.
+
+        Args:
+            events: Events to write
+
+        Returns:
+            Redis Stream entry IDs, in the order of ``events``
+
+        Raises:
+            redis.exceptions.RedisError: If the events could not be written
+        """
+        if not events:
+            return []
+
+        pipe = self.redis_client.pipeline()
+        # XADDs first so their replies are the first len(events) results
+        for event in events:
+            pipe.xadd(
+                self._get_stream_key(event.request_id),
                 event.to_stream_fields(),
                 maxlen=self.stream_max_length,
                 approximate=True,  # ~maxlen for better performance
             )
-
-            event.event_id = (
-                entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
-            )
-
-            # Dual-write to Pub/Sub for real-time notifications
+        for event in events:
             if self.enable_pubsub:
-                try:
-                    channel = self._get_pubsub_channel(request_id)
-                    payload = json.dumps(
-                        {
-                            "event_type": event_type.value,
-                            "request_id": str(request_id),
-                            "timestamp": event.timestamp.isoformat(),
-                            "message": message,
-                            "agent": agent,
-                            "node": node,
-                            "status": status,
-                            "metadata": metadata or {},
-                            "error": error,
-                        }
-                    )
-                    self.redis_client.publish(channel, payload)
-                except Exception as e:
-                    logger.warning(f"Failed to publish event to Pub/Sub: {e}")
+                pipe.publish(
+                    self._get_pubsub_channel(event.request_id),
+                    self._pubsub_payload(event),
+                )
+            self._queue_aggregates(pipe, event)
+        if self.ttl_seconds:
+            for request_id in {event.request_id for event in events}:
+                pipe.expire(self._get_stream_key(request_id), self.ttl_seconds)
+                pipe.expire(self._get_summary_key(request_id), self.ttl_seconds)
+        results = pipe.execute()
+
+        entry_ids = [
+            entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id
+            for entry_id in results[: len(events)]
+        ]
+        for event, entry_id in zip(events, entry_ids):
+            event.event_id = entry_id
+
+        # The events are committed: failing now would make callers retry
+        # (and duplicate) them, so a lost index update is only logged
+        try:
+            self._index_events(events)
+        except Exception as e:
+            logger.warning(
+                f"Failed to index {len(events)} audit events by type "
+                f"(they stay in the streams): {e}"
+            )
 
-            logger.debug(f"Logged {event_type.value} for {request_id}: {message}")
-            return event.event_id
+        logger.debug(f"Logged {len(events)} audit events in one batch")
+        return entry_ids
 
-        except Exception as e:
-            logger.error(f"Failed to log audit event: {e}")
-            raise
+    def _index_events(self, events: List[AuditEvent]) -> None:
+        """Append written events' entry IDs to their per-type indexes."""
+        pipe = self.redis_client.pipeline()
+        index_keys = set()
+        for event in events:
+            index_key = self._get_type_index_key(event.request_id, event.event_type)
+            pipe.rpush(index_key, event.event_id)
+            index_keys.add(index_key)
+        for index_key in index_keys:
+            # The stream is trimmed to about the same length
+            pipe.ltrim(index_key, -self.stream_max_length, -1)
+            if self.ttl_seconds:
+                pipe.expire(index_key, self.ttl_seconds)
+        pipe.execute()
+
+    def _queue_aggregates(self, pipe, event: AuditEvent) -> None:
+        """Queue the summary-hash updates for one event on a pipeline."""
+        summary_key = self._get_summary_key(event.request_id)
+        event_type = event.event_type.value
+        timestamp = event.timestamp.isoformat()
+
+        pipe.hincrby(summary_key, "total", 1)
+        pipe.hincrby(summary_key, f"count:{event_type}", 1)
+        pipe.hsetnx(summary_key, f"first:{event_type}", timestamp)
+        pipe.hsetnx(summary_key, "first_event", timestamp)
+        pipe.hset(summary_key, "last_event", timestamp)
+
+        duration_ms = event.metadata.get("duration_ms")
+        if event.node and isinstance(duration_ms, (int, float)):
+            pipe.hincrbyfloat(summary_key, f"node_ms:{event.node}", duration_ms)
+            pipe.hincrby(summary_key, f"node_runs:{event.node}", 1)
+
+    @staticmethod
+    def _pubsub_payload(event: AuditEvent) -> str:
+        """Pub/Sub notification body for an event."""
+        return json.dumps(
+            {
+                "event_type": event.event_type.value,
+                "request_id": str(event.request_id),
+                "timestamp": event.timestamp.isoformat(),
+                "message": event.message,
+                "agent": event.agent,
+                "node": event.node,
+                "status": event.status,
+                "metadata": event.metadata,
+                "error": event.error,
+            }
+        )
 
     def get_history(
         self,
@@ -282,6 +395,98 @@ class AuditLogger:
             logger.error(f"Failed to retrieve audit history: {e}")
             return []
 
+    def read_after(
+        self,
+        request_id: UUID,
+        after_id: Optional[str] = None,
+        count: int = 100,
+        block_ms: Optional[int] = None,
+    ) -> List[AuditEvent]:
+        """
+        Read events strictly newer than ``after_id``.
+
+        Without ``block_ms`` this is a bounded ``XRANGE`` for replaying
+        history; with it, a blocking ``XREAD`` that waits for new entries.
+        Unlike ``get_history``, Redis errors are raised so streaming callers
+        can tell an outage from "no new events".
+
+        Args:
+            request_id: Design request ID
+            after_id: Last entry ID the caller has seen (None = from the start)
+            count: Maximum number of events to return
+            block_ms: Milliseconds to wait for new events (None = don't block)
+
+        Returns:
+            List of AuditEvent objects in chronological order
+        """
+        stream_key = self._get_stream_key(request_id)
+
+        if block_ms is not None:
+            response = self.redis_client.xread(
+                {stream_key: after_id or "0-0"}, count=count, block=block_ms
+            )
+            entries = response[0][1] if response else []
+        else:
+            # XRANGE is inclusive: fetch one extra and drop the cursor itself
+            entries = self.redis_client.xrange(
+                stream_key, after_id or "-", "+", count + 1 if after_id else count
+            )
+        return self._events_after(entries, after_id, count)
+
+    async def read_after_async(
+        self,
+        request_id: UUID,
+        after_id: Optional[str] = None,
+        count: int = 100,
+        block_ms: Optional[int] = None,
+        client: Any = None,
+    ) -> List[AuditEvent]:
+        """
+        ``read_after`` through a ``redis.asyncio`` client, so a blocking
+        ``XREAD`` waits without holding a thread.
+
+        Args:
+            request_id: Design request ID
+            after_id: Last entry ID the caller has seen (None = from the start)
+            count: Maximum number of events to return
+            block_ms: Milliseconds to wait for new events (None = don't block)
+            client: ``redis.asyncio`` client (default: the shared async pool)
+
+        Returns:
+            List of AuditEvent objects in chronological order
+        """
+        client = client if client is not None else self.redis_client.async_connection
+        stream_key = self._get_stream_key(request_id)
+
+        if block_ms is not None:
+            response = await client.xread(
+                {stream_key: after_id or "0-0"}, count=count, block=block_ms
+            )
+            entries = response[0][1] if response else []
+        else:
+            entries = await client.xrange(
+                stream_key,
+                after_id or "-",
+                "+",
+                count=count + 1 if after_id else count,
+            )
+        return self._events_after(entries, after_id, count)
+
+    @staticmethod
+    def _events_after(
+        entries: List[Any], after_id: Optional[str], count: int
+    ) -> List[AuditEvent]:
+        events = [
+            AuditEvent.from_stream_entry(
+                entry_id.decode("utf-8") if isinstance(entry_id, bytes) else entry_id,
+                fields,
+            )
+            for entry_id, fields in entries
+        ]
+        if after_id:
+            events = [e for e in events if e.event_id != after_id]
+        return events[:count]
+
     def get_recent_events(self, request_id: UUID, limit: int = 10) -> List[AuditEvent]:
         """
         Get the most recent audit events.
@@ -319,6 +524,9 @@ class AuditLogger:
         """
         Filter audit events by type.
 
+        Only the entries listed in the type index are fetched; streams
+        written before the index existed are scanned and filtered.
+
         Args:
             request_id: Design request ID
             event_type: Type of events to retrieve
@@ -326,8 +534,53 @@ class AuditLogger:
         Returns:
             List of matching AuditEvent objects
         """
-        all_events = self.get_history(request_id)
-        return [e for e in all_events if e.event_type == event_type]
+        try:
+            if not self.redis_client.exists(self._get_summary_key(request_id)):
+                all_events = self.get_history(request_id)
+                return [e for e in all_events if e.event_type == event_type]
+
+            index_key = self._get_type_index_key(request_id, event_type)
+            entry_ids = self.redis_client.lrange(index_key, 0, -1)
+            if not entry_ids:
+                return []
+
+            stream_key = self._get_stream_key(request_id)
+            pipe = self.redis_client.pipeline()
+            for entry_id in entry_ids:
+                pipe.xrange(stream_key, entry_id, entry_id)
+            events = []
+            for entries in pipe.execute():
+                # Entries trimmed from the stream come back empty
+                for entry_id, fields in entries:
+                    events.append(
+                        AuditEvent.from_stream_entry(
+                            entry_id.decode("utf-8")
+                            if isinstance(entry_id, bytes)
+                            else entry_id,
+                            fields,
+                        )
+                    )
+            return events
+        except Exception as e:
+            logger.error(f"Failed to retrieve events by type: {e}")
+            return []
+
+    def get_event_counts(self, request_id: UUID) -> Dict[str, int]:
+        """
+        Get the number of events of each type (one hash read).
+
+        Args:
+            request_id: Design request ID
+
+        Returns:
+            Mapping of event type value to count
+        """
+        summary = self._read_summary(request_id)
+        return {
+            field[len("count:") :]: int(value)
+            for field, value in summary.items()
+            if field.startswith("count:")
+        }
 
     def get_event_count(self, request_id: UUID) -> int:
         """
@@ -346,41 +599,106 @@ class AuditLogger:
             logger.error(f"Failed to get event count: {e}")
             return 0
 
-    def get_timeline_summary(self, request_id: UUID) -> Dict[str, Any]:
+    def get_timeline_summary(
+        self, request_id: UUID, include_timeline: bool = True
+    ) -> Dict[str, Any]:
         """
         Get a summary of the design timeline.
 
+        Counts, milestones and node durations come from the aggregates
+        maintained at write time; only the ``timeline`` list reads the
+        stream.  Streams written before the aggregates are scanned instead,
+        with the same result keys.
+
         Args:
             request_id: Design request ID
+            include_timeline: Also return every event (reads the whole stream)
 
         Returns:
             Dictionary with event counts, timeline, and key milestones
         """
-        events = self.get_history(request_id)
+        summary = self._read_summary(request_id)
+        if not summary:
+            # Stream written before aggregates were maintained
+            return self._scan_timeline_summary(request_id, include_timeline)
+
+        event_counts: Dict[str, int] = {}
+        milestones: Dict[str, str] = {}
+        node_durations: Dict[str, Dict[str, float]] = {}
+        for field, value in summary.items():
+            kind, _, name = field.partition(":")
+            if kind == "count":
+                event_counts[name] = int(value)
+            elif kind == "first":
+                milestones[name] = value
+            elif kind == "node_ms":
+                node_durations.setdefault(name, {})["total_ms"] = float(value)
+            elif kind == "node_runs":
+                node_durations.setdefault(name, {})["runs"] = int(value)
+
+        result = {
+            "request_id": str(request_id),
+            "total_events": int(summary.get("total", 0)),
+            "event_counts": event_counts,
+            "first_event": summary.get("first_event"),
+            "last_event": summary.get("last_event"),
+            "milestones": milestones,
+            "node_durations": node_durations,
+        }
+        if include_timeline:
+            result["timeline"] = self._timeline(self.get_history(request_id))
+        return result
 
-        if not events:
-            return {"request_id": str(request_id), "total_events": 0, "events": []}
+    def _read_summary(self, request_id: UUID) -> Dict[str, str]:
+        try:
+            return self.redis_client.hgetall(self._get_summary_key(request_id))
+        except Exception as e:
+            logger.error(f"Failed to read audit summary: {e}")
+            return {}
+
+    def _scan_timeline_summary(
+        self, request_id: UUID, include_timeline: bool
+    ) -> Dict[str, Any]:
+        """Summary aggregated from the full stream."""
+        events = self.get_history(request_id)
 
-        event_counts = {}
+        event_counts: Dict[str, int] = {}
+        milestones: Dict[str, str] = {}
+        node_durations: Dict[str, Dict[str, float]] = {}
         for event in events:
-            event_counts[event.event_type.value] = (
-                event_counts.get(event.event_type.value, 0) + 1
-            )
+            event_type = event.event_type.value
+            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+            milestones.setdefault(event_type, event.timestamp.isoformat())
+            duration_ms = event.metadata.get("duration_ms")
+            if event.node and isinstance(duration_ms, (int, float)):
+                durations = node_durations.setdefault(
+                    event.node, {"total_ms": 0.0, "runs": 0}
+                )
+                durations["total_ms"] += duration_ms
+                durations["runs"] += 1
 
-        return {
+        result = {
             "request_id": str(request_id),
             "total_events": len(events),
             "event_counts": event_counts,
             "first_event": events[0].timestamp.isoformat() if events else None,
             "last_event": events[-1].timestamp.isoformat() if events else None,
-            "timeline": [
-                {
-                    "event_type": e.event_type.value,
-                    "timestamp": e.timestamp.isoformat(),
-                    "message": e.message,
-                    "agent": e.agent,
-                    "node": e.node,
-                }
-                for e in events
-            ],
+            "milestones": milestones,
+            "node_durations": node_durations,
         }
+        if include_timeline:
+            result["timeline"] = self._timeline(events)
+        return result
+
+    @staticmethod
+    def _timeline(events: List[AuditEvent]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "event_type": e.event_type.value,
+                "timestamp": e.timestamp.isoformat(),
+                "message": e.message,
+                "agent": e.agent,
+                "node": e.node,
+            }
+            for e in events
+        ]
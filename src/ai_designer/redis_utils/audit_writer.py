@@ -0,0 +1,272 @@
+"""
+Buffered, pipelined writer for the audit trail.
+
+``AuditLogger.log_event`` issues a blocking XADD and a PUBLISH per event,
+which costs two round trips on the hot path of every pipeline node.
+``BufferedAuditWriter`` has the same ``log_event`` signature but only queues
+the event in memory; a background task flushes the queue every
+``flush_interval_ms`` (or as soon as ``max_batch`` events are waiting)
+through ``AuditLogger.log_events``, one pipelined XADD+PUBLISH batch per
+flush, run in a worker thread.
+
+A single flusher writes events in the order they were logged, so the
+per-request order of each stream is preserved.  If Redis is unreachable the
+batch is appended to a local JSON-lines spool file instead; spooled events
+are replayed ahead of newer ones on the next successful flush, also after a
+restart when the spool path is fixed.  Queued events are flushed on
+``stop()``.
+
+``log_event`` must be called from the event loop thread.  Before ``start()``
+(or after ``stop()``) it writes synchronously through the wrapped logger.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+AUDIT_FLUSH_INTERVAL_MS     float, default 5
+AUDIT_FLUSH_MAX_BATCH       int, default 200 (events per pipeline)
+AUDIT_SPOOL_PATH            str, default <tmpdir>/ai_designer_audit_spool_<pid>.jsonl
+AUDIT_SPOOL_MAX_EVENTS      int, default 100000 (oldest spooled events dropped beyond)
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from uuid import UUID
+
+from ..core.metrics import AUDIT_EVENTS_TOTAL
+from .audit import AuditEvent, AuditEventType, AuditLogger
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_FLUSH_INTERVAL_MS: float = float(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "5"))
+_FLUSH_MAX_BATCH: int = int(os.getenv("AUDIT_FLUSH_MAX_BATCH", "200"))
+_SPOOL_PATH: str = os.getenv(
+    "AUDIT_SPOOL_PATH",
+    os.path.join(tempfile.gettempdir(), f"ai_designer_audit_spool_{os.getpid()}.jsonl"),
+)
+_SPOOL_MAX_EVENTS: int = int(os.getenv("AUDIT_SPOOL_MAX_EVENTS", "100000"))
+
+
+class BufferedAuditWriter:
+    """Queue audit events and write them to Redis in pipelined batches."""
+
+    def __init__(
+        self,
+        audit_logger: AuditLogger,
+        flush_interval_ms: float = _FLUSH_INTERVAL_MS,
+        max_batch: int = _FLUSH_MAX_BATCH,
+        spool_path: str = _SPOOL_PATH,
+        spool_max_events: int = _SPOOL_MAX_EVENTS,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            audit_logger: Logger whose Redis client and streams are written
+            flush_interval_ms: Maximum time an event waits in the queue
+            max_batch: Events per pipeline; a full batch is flushed at once
+            spool_path: Local file holding events while Redis is down
+            spool_max_events: Spool size limit (oldest events are dropped)
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.audit_logger = audit_logger
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch = max_batch
+        self.spool_path = spool_path
+        self.spool_max_events = spool_max_events
+
+        self._buffer: Deque[AuditEvent] = deque()
+        # Created on start() so they belong to the serving event loop
+        self._pending: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        # Leftovers of a previous run are replayed on the first flush
+        self._spooled = os.path.exists(spool_path)
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._task is None or self._task.done():
+            self._pending = asyncio.Event()
+            self._full = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            if self._spooled:
+                self._pending.set()
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out everything still queued."""
+        if self._task is not None:
+            # Let an in-flight flush finish rather than cancelling it
+            self._stopping = True
+            self._pending.set()
+            self._full.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def log_event(
+        self,
+        event_type: AuditEventType,
+        request_id: UUID,
+        message: str,
+        agent: Optional[str] = None,
+        node: Optional[str] = None,
+        status: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Queue an audit event (same arguments as ``AuditLogger.log_event``).
+
+        Returns:
+            None while the writer is running (the stream entry ID is only
+            known after the flush), otherwise the entry ID of the
+            synchronous write
+        """
+        if self._task is None:
+            return self.audit_logger.log_event(
+                event_type=event_type,
+                request_id=request_id,
+                message=message,
+                agent=agent,
+                node=node,
+                status=status,
+                metadata=metadata,
+                error=error,
+            )
+
+        self._buffer.append(
+            AuditEvent(
+                event_type=event_type,
+                request_id=request_id,
+                message=message,
+                agent=agent,
+                node=node,
+                status=status,
+                metadata=metadata or {},
+                error=error,
+            )
+        )
+        self._pending.set()
+        if len(self._buffer) >= self.max_batch:
+            self._full.set()
+        return None
+
+    async def flush(self) -> int:
+        """
+        Write queued (and previously spooled) events now.
+
+        Returns:
+            Number of events written to Redis
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            events = list(self._buffer)
+            self._buffer.clear()
+            queued = len(events)
+            if self._spooled:
+                events = self._read_spool() + events
+            if not events:
+                return 0
+
+            loop = asyncio.get_running_loop()
+            written = 0
+            try:
+                for i in range(0, len(events), self.max_batch):
+                    batch = events[i : i + self.max_batch]
+                    await loop.run_in_executor(
+                        None, self.audit_logger.log_events, batch
+                    )
+                    written += len(batch)
+            except Exception as e:
+                logger.warning(
+                    f"Audit trail unavailable, spooling {len(events) - written} "
+                    f"events to {self.spool_path}: {e}"
+                )
+                if self._write_spool(events[written:]):
+                    spooled = min(queued, len(events) - written)
+                    AUDIT_EVENTS_TOTAL.labels(outcome="spooled").inc(spooled)
+            else:
+                if self._spooled:
+                    self._remove_spool()
+
+            AUDIT_EVENTS_TOTAL.labels(outcome="written").inc(written)
+            return written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._pending.wait()
+            if len(self._buffer) < self.max_batch:
+                await self._wait_full(self.flush_interval)
+            self._pending.clear()
+            self._full.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Audit flush failed: {e}")
+            if self._spooled and not self._buffer:
+                # Retry the spool without busy-looping while Redis is down
+                await self._wait_full(max(self.flush_interval, 1.0))
+                self._pending.set()
+
+    async def _wait_full(self, timeout: float) -> None:
+        """Wait until a batch is full (or the writer stops), at most ``timeout``."""
+        try:
+            await asyncio.wait_for(self._full.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    # ── Spool ─────────────────────────────────────────────────────────────────
+
+    def _read_spool(self) -> List[AuditEvent]:
+        events = []
+        try:
+            with open(self.spool_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        events.append(AuditEvent.model_validate_json(line))
+                    except ValueError:
+                        logger.warning("Skipping unreadable spooled audit event")
+        except FileNotFoundError:
+            self._spooled = False
+        return events
+
+    def _write_spool(self, events: List[AuditEvent]) -> bool:
+        """Replace the spool with ``events`` (which include its old content)."""
+        dropped = len(events) - self.spool_max_events
+        if dropped > 0:
+            logger.error(f"Audit spool full, dropping {dropped} oldest events")
+            AUDIT_EVENTS_TOTAL.labels(outcome="dropped").inc(dropped)
+            events = events[dropped:]
+
+        tmp_path = f"{self.spool_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for event in events:
+                    f.write(event.model_dump_json() + "\n")
+            os.replace(tmp_path, self.spool_path)
+        except OSError as e:
+            logger.error(f"Failed to spool {len(events)} audit events: {e}")
+            AUDIT_EVENTS_TOTAL.labels(outcome="dropped").inc(len(events))
+            return False
+        self._spooled = True
+        return True
+
+    def _remove_spool(self) -> None:
+        try:
+            os.remove(self.spool_path)
+        except FileNotFoundError:
+            pass
+        self._spooled = False
@@ -1,7 +1,18 @@
-from typing import Any, Dict, List, Optional, Tuple
+"""
+Synchronous Redis client used by the caches and the audit trail.
+
+Connections come from the worker's shared pools (see ``connection``), so any
+number of ``RedisClient`` instances for one server share one bounded pool.
+``async_connection`` is the ``redis.asyncio`` facade on the same server for
+coroutines that must not block the event loop.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import redis
-from redis.connection import ConnectionPool
+from redis.connection import ConnectionPool, parse_url
+
+from .connection import get_async_redis, get_sync_pool, ping, redis_url
 
 
 class RedisClient:
@@ -10,32 +21,79 @@ class RedisClient:
         host: str = "localhost",
         port: int = 6379,
         db: int = 0,
-        max_connections: int = 50,
+        max_connections: Optional[int] = None,
+        url: Optional[str] = None,
     ):
         self.host = host
         self.port = port
         self.db = db
+        self.url = url or redis_url(host, port, db)
         self.connection: Optional[redis.Redis] = None
         self.pool: Optional[ConnectionPool] = None
         self.max_connections = max_connections
+        self._async_connection: Any = None
+
+    @classmethod
+    def from_env(cls) -> "RedisClient":
+        """Client for ``REDIS_URL`` (or REDIS_HOST, REDIS_PORT and REDIS_DB)."""
+        url = redis_url()
+        kwargs = parse_url(url)
+        return cls(
+            host=kwargs.get("host", "localhost"),
+            port=kwargs.get("port", 6379),
+            db=kwargs.get("db", 0),
+            url=url,
+        )
 
     def connect(self) -> bool:
-        """Establish connection to Redis with connection pooling."""
+        """Connect through the shared connection pool of this server."""
         try:
-            # Create connection pool for efficient async/concurrent access
-            self.pool = ConnectionPool(
-                host=self.host,
-                port=self.port,
-                db=self.db,
-                max_connections=self.max_connections,
-                decode_responses=False,  # We handle decoding manually for flexibility
-            )
+            # decode_responses=False: we handle decoding manually for flexibility
+            self.pool = get_sync_pool(self.url, max_connections=self.max_connections)
             self.connection = redis.Redis(connection_pool=self.pool)
             return self.connection.ping()
         except Exception as e:
             print(f"Failed to connect to Redis: {e}")
             return False
 
+    def ping(self) -> bool:
+        """Health check: True if connected and Redis answers a PING."""
+        return self.connection is not None and ping(self.connection)
+
+    @property
+    def async_connection(self) -> Any:
+        """
+        ``redis.asyncio`` client for this server on the shared async pool.
+
+        Resolved on every access, as async pools belong to the running event
+        loop; assign a client to pin one (e.g. a fake in tests).
+        """
+        if self._async_connection is not None:
+            return self._async_connection
+        return get_async_redis(self.url)
+
+    @async_connection.setter
+    def async_connection(self, client: Any) -> None:
+        self._async_connection = client
+
+    def dedicated_async_connection(
+        self, name: str, max_connections: Optional[int] = None
+    ) -> Any:
+        """
+        ``redis.asyncio`` client on a separate named pool of this server.
+
+        For consumers that hold a connection for long (blocking reads), so
+        they cannot exhaust the shared pool.  A pinned ``async_connection``
+        is returned instead.
+
+        Args:
+            name: Pool name
+            max_connections: Pool size, only used by the call creating the pool
+        """
+        if self._async_connection is not None:
+            return self._async_connection
+        return get_async_redis(self.url, max_connections=max_connections, name=name)
+
     def _check_connection(self):
         """Raise an error if Redis is not connected."""
         if self.connection is None:
@@ -43,16 +101,44 @@ class RedisClient:
                 "❌ Redis client is not connected. Call connect() first."
             )
 
-    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
-        """Set a key-value pair with optional expiration time (in seconds)."""
+    def set(
+        self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False
+    ) -> bool:
+        """Set a key-value pair with optional expiration time (in seconds).
+
+        With ``nx`` the key is only set if it does not exist yet.
+        """
         self._check_connection()
-        return self.connection.set(key, value, ex=ex)
+        return self.connection.set(key, value, ex=ex, nx=nx)
 
     def get(self, key: str) -> Optional[bytes]:
         """Get the value of a key."""
         self._check_connection()
         return self.connection.get(key)
 
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Get the values of several keys in one round trip."""
+        self._check_connection()
+        if not keys:
+            return []
+        return self.connection.mget(keys)
+
+    def pipeline(self, transaction: bool = False) -> redis.client.Pipeline:
+        """Create a pipeline that sends queued commands in one round trip."""
+        self._check_connection()
+        return self.connection.pipeline(transaction=transaction)
+
+    def transaction(self, func: Callable[[Any], Any], *watches: str) -> Any:
+        """
+        Run ``func(pipe)`` as an optimistic MULTI/EXEC transaction.
+
+        ``func`` reads the ``watches`` keys, then calls ``pipe.multi()`` and
+        queues its writes; it is re-run if a watched key changed meanwhile.
+        Returns ``func``'s return value.
+        """
+        self._check_connection()
+        return self.connection.transaction(func, *watches, value_from_callable=True)
+
     def delete(self, key: str) -> int:
         """Delete a key."""
         self._check_connection()
@@ -71,6 +157,12 @@ class RedisClient:
             for k in self.connection.keys(pattern)
         ]
 
+    def scan_iter(self, match: str = "*", count: int = 1000) -> Iterator[str]:
+        """Iterate keys matching a pattern incrementally (SCAN, non-blocking)."""
+        self._check_connection()
+        for k in self.connection.scan_iter(match=match, count=count):
+            yield k.decode("utf-8") if isinstance(k, bytes) else k
+
     def flushdb(self) -> bool:
         """Delete all keys in the current database."""
         self._check_connection()
@@ -99,11 +191,80 @@ class RedisClient:
             for k, v in result.items()
         }
 
+    def hscan_iter(self, name: str, count: int = 1000) -> Iterator[Tuple[str, str]]:
+        """Iterate the fields of a hash incrementally (HSCAN, non-blocking)."""
+        self._check_connection()
+        for k, v in self.connection.hscan_iter(name, count=count):
+            yield (
+                k.decode("utf-8") if isinstance(k, bytes) else k,
+                v.decode("utf-8") if isinstance(v, bytes) else v,
+            )
+
     def hdel(self, name: str, key: str) -> int:
         """Delete a field from a hash."""
         self._check_connection()
         return self.connection.hdel(name, key)
 
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        """Increment an integer field in a hash."""
+        self._check_connection()
+        return self.connection.hincrby(name, key, amount)
+
+    # List operations
+    def llen(self, name: str) -> int:
+        """Return the length of a list."""
+        self._check_connection()
+        return self.connection.llen(name)
+
+    def lrange(self, name: str, start: int, end: int) -> List[bytes]:
+        """Return list elements between two indexes (inclusive), undecoded."""
+        self._check_connection()
+        return self.connection.lrange(name, start, end)
+
+    # Sorted set operations
+    def zadd(self, name: str, mapping: Dict[str, float]) -> int:
+        """Add members with scores to a sorted set (updating existing scores)."""
+        self._check_connection()
+        return self.connection.zadd(name, mapping)
+
+    def zrange(self, name: str, start: int, end: int) -> List[str]:
+        """Return members between two ranks, lowest score first."""
+        self._check_connection()
+        return [
+            m.decode("utf-8") if isinstance(m, bytes) else m
+            for m in self.connection.zrange(name, start, end)
+        ]
+
+    def zrevrange(self, name: str, start: int, end: int) -> List[str]:
+        """Return members between two ranks, highest score first."""
+        self._check_connection()
+        return [
+            m.decode("utf-8") if isinstance(m, bytes) else m
+            for m in self.connection.zrevrange(name, start, end)
+        ]
+
+    def zrevrangebyscore(
+        self, name: str, max: float, min: float, start: int = 0, num: int = 1
+    ) -> List[str]:
+        """Return members scored between max and min, highest score first."""
+        self._check_connection()
+        return [
+            m.decode("utf-8") if isinstance(m, bytes) else m
+            for m in self.connection.zrevrangebyscore(
+                name, max, min, start=start, num=num
+            )
+        ]
+
+    def zrem(self, name: str, *members: str) -> int:
+        """Remove members from a sorted set."""
+        self._check_connection()
+        return self.connection.zrem(name, *members)
+
+    def zcard(self, name: str) -> int:
+        """Number of members in a sorted set."""
+        self._check_connection()
+        return self.connection.zcard(name)
+
     # Redis Streams operations
     def xadd(
         self,
@@ -173,6 +334,26 @@ class RedisClient:
         self._check_connection()
         return self.connection.xrevrange(stream, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Tuple[bytes, List[Tuple[bytes, Dict[bytes, bytes]]]]]:
+        """
+        Read entries newer than the given IDs, optionally blocking.
+
+        Args:
+            streams: Mapping of stream name to last seen entry ID
+            count: Maximum entries per stream
+            block: Milliseconds to wait for new entries (None = don't block)
+
+        Returns:
+            List of (stream, entries) pairs; empty if the block timed out
+        """
+        self._check_connection()
+        return self.connection.xread(streams, count=count, block=block)
+
     def xlen(self, stream: str) -> int:
         """Get the number of entries in a stream."""
         self._check_connection()
@@ -240,7 +421,7 @@ class RedisClient:
 # Example usage:
 if __name__ == "__main__":
     # Create Redis client
-    client = RedisClient()
+    client = RedisClient.from_env()
 
     # Connect to Redis
     if client.connect():
@@ -0,0 +1,177 @@
+"""
+Binary encoding of cached state payloads.
+
+State entries (object lists, feature trees, whole ``DesignState`` documents
+with scripts and iterations) used to be stored as plain JSON text.  The
+codec packs them with msgpack (or orjson / stdlib JSON when msgpack is not
+installed) and compresses payloads above ``STATE_CODEC_COMPRESS_MIN_BYTES``
+with zstd (zlib when the optional ``zstandard`` package is missing).
+
+Every encoded value starts with a header byte naming its serializer and
+compression, so readers never depend on the writer's configuration.  Plain
+JSON written before the codec existed starts with ``{``/``[`` instead of a
+header byte and is still decoded, so old and new entries can coexist in
+Redis until the old ones expire.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+STATE_CODEC_SERIALIZER           "msgpack", "json" or "auto" (default: msgpack if installed)
+STATE_CODEC_COMPRESS_MIN_BYTES   int, default 1024 (smaller payloads stay uncompressed)
+STATE_CODEC_ZSTD_LEVEL           int, default 3
+"""
+
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_SERIALIZER: str = os.getenv("STATE_CODEC_SERIALIZER", "auto")
+_COMPRESS_MIN_BYTES: int = int(os.getenv("STATE_CODEC_COMPRESS_MIN_BYTES", "1024"))
+_ZSTD_LEVEL: int = int(os.getenv("STATE_CODEC_ZSTD_LEVEL", "3"))
+
+# Header byte -> (serializer, compression).  None of these can start a JSON
+# document, which is how legacy entries are told apart.
+_FORMATS: Dict[int, Tuple[str, Optional[str]]] = {
+    0x01: ("json", None),
+    0x02: ("json", "zlib"),
+    0x03: ("json", "zstd"),
+    0x04: ("msgpack", None),
+    0x05: ("msgpack", "zlib"),
+    0x06: ("msgpack", "zstd"),
+}
+_HEADERS = {fmt: header for header, fmt in _FORMATS.items()}
+
+_local = threading.local()
+
+
+class StateCodec:
+    """
+    Serialize cached values to compact bytes and back.
+
+    Anything with the same ``dumps``/``loads`` methods can be passed to
+    ``StateCache`` instead.
+    """
+
+    def __init__(
+        self,
+        serializer: str = _SERIALIZER,
+        compress_min_bytes: int = _COMPRESS_MIN_BYTES,
+        zstd_level: int = _ZSTD_LEVEL,
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            serializer: "msgpack", "json" or "auto"
+            compress_min_bytes: Payloads smaller than this are not compressed
+                (0 = compress everything, negative = never compress)
+            zstd_level: zstd compression level
+
+        Raises:
+            ValueError: If the serializer is unknown or not installed
+        """
+        if serializer == "auto":
+            serializer = "msgpack" if msgpack is not None else "json"
+        if serializer not in ("msgpack", "json"):
+            raise ValueError(f"Unknown state codec serializer: {serializer}")
+        if serializer == "msgpack" and msgpack is None:
+            raise ValueError("msgpack serializer requested but msgpack is missing")
+
+        self.serializer = serializer
+        self.compress_min_bytes = compress_min_bytes
+        self.zstd_level = zstd_level
+        self.compression = "zstd" if zstandard is not None else "zlib"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a JSON-compatible value with a format header byte."""
+        payload = _serialize(self.serializer, value)
+        compression = None
+        if 0 <= self.compress_min_bytes <= len(payload):
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                payload, compression = compressed, self.compression
+        return bytes((_HEADERS[(self.serializer, compression)],)) + payload
+
+    def loads(self, raw: Any) -> Any:
+        """
+        Decode a value written by any codec configuration or as plain JSON.
+
+        Raises:
+            ValueError: If the value is corrupt or needs a missing package
+        """
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        fmt = _FORMATS.get(raw[0]) if raw else None
+        if fmt is None:
+            return _deserialize("json", raw)  # Written before the codec existed
+
+        serializer, compression = fmt
+        payload = memoryview(raw)[1:]
+        if compression == "zstd":
+            if zstandard is None:
+                raise ValueError("zstd-compressed state but zstandard is missing")
+            try:
+                payload = _zstd_decompressor().decompress(payload)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"Corrupt zstd state payload: {e}") from e
+        elif compression == "zlib":
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error as e:
+                raise ValueError(f"Corrupt zlib state payload: {e}") from e
+        return _deserialize(serializer, bytes(payload))
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return _zstd_compressor(self.zstd_level).compress(payload)
+        return zlib.compress(payload, 6)
+
+
+def _serialize(serializer: str, value: Any) -> bytes:
+    if serializer == "msgpack":
+        return msgpack.packb(value, use_bin_type=True)
+    if orjson is not None:
+        # Match json.dumps, which turns int/float dict keys into strings
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _deserialize(serializer: str, payload: bytes) -> Any:
+    if serializer == "msgpack":
+        if msgpack is None:
+            raise ValueError("msgpack-encoded state but msgpack is missing")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# zstd (de)compressor objects are not thread-safe; keep one per thread
+def _zstd_compressor(level: int):
+    compressors = _local.__dict__.setdefault("compressors", {})
+    if level not in compressors:
+        compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressors[level]
+
+
+def _zstd_decompressor():
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = zstandard.ZstdDecompressor()
+    return _local.decompressor
@@ -0,0 +1,302 @@
+"""
+Shared Redis connection pools for every Redis consumer in the package.
+
+All Redis clients of a worker process are built here, so each worker holds
+at most ``REDIS_MAX_CONNECTIONS`` connections per Redis URL and response
+mode, whatever the number of caches, loggers and middlewares using them:
+
+- ``get_redis``: synchronous ``redis.Redis`` on a shared pool
+- ``get_async_redis``: ``redis.asyncio.Redis`` for coroutines, so async
+  code paths never block the event loop on a socket read
+
+Pools are ``BlockingConnectionPool``: when all connections are busy a caller
+waits up to ``REDIS_POOL_TIMEOUT`` for one instead of opening more.
+Connections idle longer than ``REDIS_HEALTH_CHECK_INTERVAL`` are PINGed
+before reuse, and commands failing with a connection error or timeout are
+retried with exponential backoff.  Async pools belong to one event loop and
+are therefore cached per loop.  Consumers that hold a connection for long
+(blocking XREADs) ask for a separately ``name``d async pool, so they cannot
+exhaust the pool shared by short commands.  Sync pools survive ``fork()``: redis-py drops
+inherited connections in the child.
+
+``execute_pipeline`` / ``execute_async_pipeline`` send a batch of commands in
+one round trip (optionally as MULTI/EXEC); ``ping`` / ``async_ping`` are
+health checks that never raise.
+
+Configuration (env vars or keyword arguments)
+---------------------------------------------
+REDIS_URL                    str, overrides REDIS_HOST/REDIS_PORT/REDIS_DB
+REDIS_HOST                   str, default localhost
+REDIS_PORT                   int, default 6379
+REDIS_DB                     int, default 0
+REDIS_MAX_CONNECTIONS        int, default 50 (per pool)
+REDIS_POOL_TIMEOUT           float, default 5 (wait for a free connection)
+REDIS_CONNECT_TIMEOUT        float, default 2
+REDIS_SOCKET_TIMEOUT         float, default unset (no read timeout, so
+                             blocking XREADs keep working)
+REDIS_HEALTH_CHECK_INTERVAL  int, default 30 (seconds idle before a PING)
+REDIS_RETRY_ATTEMPTS         int, default 3 (0 disables retries)
+REDIS_RETRY_BACKOFF_BASE     float, default 0.1 (first retry delay)
+REDIS_RETRY_BACKOFF_CAP      float, default 2 (maximum retry delay)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import redis
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
+
+try:
+    import redis.asyncio as aioredis
+    from redis.asyncio.retry import Retry as AsyncRetry
+except ImportError:  # pragma: no cover - redis < 4.2
+    aioredis = None
+    AsyncRetry = None
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+_POOL_TIMEOUT: float = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+_CONNECT_TIMEOUT: float = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+_SOCKET_TIMEOUT: Optional[float] = (
+    float(os.environ["REDIS_SOCKET_TIMEOUT"])
+    if os.getenv("REDIS_SOCKET_TIMEOUT")
+    else None
+)
+_HEALTH_CHECK_INTERVAL: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+_RETRY_ATTEMPTS: int = int(os.getenv("REDIS_RETRY_ATTEMPTS", "3"))
+_RETRY_BACKOFF_BASE: float = float(os.getenv("REDIS_RETRY_BACKOFF_BASE", "0.1"))
+_RETRY_BACKOFF_CAP: float = float(os.getenv("REDIS_RETRY_BACKOFF_CAP", "2"))
+
+_RETRY_ON = [ConnectionError, TimeoutError]
+
+# (url, decode_responses) -> pool
+_PoolKey = Tuple[str, bool]
+_sync_pools: Dict[_PoolKey, redis.BlockingConnectionPool] = {}
+# event loop -> (url, decode_responses, name) -> pool
+_AsyncPoolKey = Tuple[str, bool, str]
+_async_pools: "weakref.WeakKeyDictionary[Any, Dict[_AsyncPoolKey, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def redis_url(
+    host: Optional[str] = None, port: Optional[int] = None, db: Optional[int] = None
+) -> str:
+    """
+    URL of a Redis server.
+
+    Without arguments this is ``REDIS_URL``, or the URL built from
+    ``REDIS_HOST``, ``REDIS_PORT`` and ``REDIS_DB``.  Explicit arguments win
+    over the environment.
+    """
+    if host is None and port is None and db is None and os.getenv("REDIS_URL"):
+        return os.environ["REDIS_URL"]
+    host = host if host is not None else os.getenv("REDIS_HOST", "localhost")
+    port = port if port is not None else int(os.getenv("REDIS_PORT", "6379"))
+    db = db if db is not None else int(os.getenv("REDIS_DB", "0"))
+    return f"redis://{host}:{port}/{db}"
+
+
+def _pool_kwargs(max_connections: Optional[int]) -> Dict[str, Any]:
+    return {
+        "max_connections": max_connections or _MAX_CONNECTIONS,
+        "timeout": _POOL_TIMEOUT,
+        "socket_connect_timeout": _CONNECT_TIMEOUT,
+        "socket_timeout": _SOCKET_TIMEOUT,
+        "health_check_interval": _HEALTH_CHECK_INTERVAL,
+        "retry_on_error": _RETRY_ON,
+    }
+
+
+def _backoff() -> ExponentialBackoff:
+    return ExponentialBackoff(cap=_RETRY_BACKOFF_CAP, base=_RETRY_BACKOFF_BASE)
+
+
+# ── Sync facade ───────────────────────────────────────────────────────────────
+
+
+def get_sync_pool(
+    url: Optional[str] = None,
+    decode_responses: bool = False,
+    max_connections: Optional[int] = None,
+) -> redis.BlockingConnectionPool:
+    """
+    Shared synchronous connection pool for a Redis URL.
+
+    Args:
+        url: Redis URL (default: ``redis_url()``)
+        decode_responses: Return ``str`` instead of ``bytes``
+        max_connections: Pool size, only used by the call creating the pool
+
+    Returns:
+        The pool shared by all sync clients of this URL and response mode
+    """
+    key = (url or redis_url(), decode_responses)
+    with _lock:
+        pool = _sync_pools.get(key)
+        if pool is None:
+            pool = redis.BlockingConnectionPool.from_url(
+                key[0],
+                decode_responses=decode_responses,
+                retry=Retry(_backoff(), _RETRY_ATTEMPTS),
+                **_pool_kwargs(max_connections),
+            )
+            _sync_pools[key] = pool
+            logger.debug(f"Created Redis connection pool for {key[0]}")
+        return pool
+
+
+def get_redis(
+    url: Optional[str] = None,
+    decode_responses: bool = False,
+    max_connections: Optional[int] = None,
+) -> redis.Redis:
+    """Synchronous Redis client on the shared pool (see ``get_sync_pool``)."""
+    return redis.Redis(
+        connection_pool=get_sync_pool(url, decode_responses, max_connections)
+    )
+
+
+def ping(client: redis.Redis) -> bool:
+    """True if Redis answers a PING; never raises."""
+    try:
+        return bool(client.ping())
+    except Exception as e:
+        logger.debug(f"Redis health check failed: {e}")
+        return False
+
+
+def execute_pipeline(
+    client: redis.Redis,
+    queue: Callable[[Any], None],
+    transaction: bool = False,
+) -> List[Any]:
+    """
+    Send a batch of commands in one round trip.
+
+    Args:
+        client: Sync Redis client
+        queue: Called with the pipeline to queue the commands
+        transaction: Wrap the batch in MULTI/EXEC
+
+    Returns:
+        One result per queued command
+    """
+    with client.pipeline(transaction=transaction) as pipe:
+        queue(pipe)
+        return pipe.execute()
+
+
+# ── Async facade ──────────────────────────────────────────────────────────────
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_async_pool(
+    url: Optional[str] = None,
+    decode_responses: bool = False,
+    max_connections: Optional[int] = None,
+    name: str = "default",
+) -> Any:
+    """
+    Shared ``redis.asyncio`` connection pool for a Redis URL.
+
+    Pools are cached per running event loop, as asyncio connections cannot
+    move between loops.
+
+    Args:
+        url: Redis URL (default: ``redis_url()``)
+        decode_responses: Return ``str`` instead of ``bytes``
+        max_connections: Pool size, only used by the call creating the pool
+        name: Pool name; consumers holding connections for long use their own
+
+    Returns:
+        The pool shared by all async clients of this loop, URL, response mode
+        and name
+    """
+    if aioredis is None:
+        raise RuntimeError("redis.asyncio is not available (redis>=4.2)")
+    key = (url or redis_url(), decode_responses, name)
+    loop = _current_loop()
+    with _lock:
+        pools = _async_pools.setdefault(loop, {}) if loop is not None else {}
+        pool = pools.get(key)
+        if pool is None:
+            pool = aioredis.BlockingConnectionPool.from_url(
+                key[0],
+                decode_responses=decode_responses,
+                retry=AsyncRetry(_backoff(), _RETRY_ATTEMPTS),
+                **_pool_kwargs(max_connections),
+            )
+            pools[key] = pool
+            logger.debug(f"Created async Redis connection pool for {key[0]}")
+        return pool
+
+
+def get_async_redis(
+    url: Optional[str] = None,
+    decode_responses: bool = False,
+    max_connections: Optional[int] = None,
+    name: str = "default",
+) -> Any:
+    """``redis.asyncio.Redis`` client on the shared pool (see ``get_async_pool``)."""
+    return aioredis.Redis(
+        connection_pool=get_async_pool(url, decode_responses, max_connections, name)
+    )
+
+
+async def async_ping(client: Any) -> bool:
+    """True if Redis answers a PING; never raises."""
+    try:
+        return bool(await client.ping())
+    except Exception as e:
+        logger.debug(f"Redis health check failed: {e}")
+        return False
+
+
+async def execute_async_pipeline(
+    client: Any,
+    queue: Callable[[Any], None],
+    transaction: bool = False,
+) -> List[Any]:
+    """Async counterpart of ``execute_pipeline``."""
+    async with client.pipeline(transaction=transaction) as pipe:
+        queue(pipe)
+        return await pipe.execute()
+
+
+# ── Shutdown ──────────────────────────────────────────────────────────────────
+
+
+async def close_pools() -> None:
+    """
+    Disconnect the shared pools (call on worker shutdown).
+
+    Clients still holding a pool reconnect on their next command.
+    """
+    loop = _current_loop()
+    with _lock:
+        sync_pools = list(_sync_pools.values())
+        _sync_pools.clear()
+        async_pools = list(_async_pools.pop(loop, {}).values()) if loop else []
+    for pool in sync_pools:
+        pool.disconnect()
+    for pool in async_pools:
+        try:
+            await pool.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing Redis pool: {e}")
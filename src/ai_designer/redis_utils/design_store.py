@@ -0,0 +1,437 @@
+"""
+Redis-backed DesignState store with an in-process read-through cache.
+
+Design states are persisted through ``StateCache.cache_design_state`` so every
+API worker sees the same designs and they survive restarts.  Each write also
+stamps a short version token (``design:{request_id}:version``); workers keep
+recently read states in a small LRU together with the token they were read
+at.  A read only fetches the version token and returns the local copy when it
+still matches, so hot designs cost one tiny GET instead of a JSON fetch and
+Pydantic parse, while a write on any worker invalidates every other worker's
+copy.  A state and its version token are written in one MULTI/EXEC, so
+concurrent writers cannot pair a token with another writer's state.
+``get_many`` and ``save_many`` do the same for whole batches with ``MGET``
+and one transaction, so bulk endpoints cost a constant number of round trips
+instead of one per design.
+
+The version token doubles as the ETag of the design status endpoint, and
+``wait_for_change`` lets a long-poll request sleep until the token moves:
+writes on this worker wake waiters immediately, writes on other workers are
+picked up by a cheap version re-check every ``wait_poll_seconds``, made
+through the ``redis.asyncio`` client so waiters never block the event loop.
+
+Coroutines use the ``*_async`` variants of the store methods, which run the
+sync Redis calls in the default executor (the local-only store needs no
+I/O and answers inline).
+
+Without Redis the LRU becomes the only store (single-process development
+mode); it is bounded, so the oldest designs are dropped instead of growing
+forever.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+DESIGN_STORE_TTL_SECONDS         int, default 86400 (24h in Redis)
+DESIGN_STORE_LOCAL_MAX_ENTRIES   int, default 256 (per-process LRU size)
+DESIGN_STORE_WAIT_POLL_SECONDS   float, default 1.0 (cross-worker re-check)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+from uuid import uuid4
+
+from ..schemas.design_state import DesignState
+from .state_cache import StateCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_TTL_SECONDS: int = int(os.getenv("DESIGN_STORE_TTL_SECONDS", "86400"))
+_LOCAL_MAX_ENTRIES: int = int(os.getenv("DESIGN_STORE_LOCAL_MAX_ENTRIES", "256"))
+_WAIT_POLL_SECONDS: float = float(os.getenv("DESIGN_STORE_WAIT_POLL_SECONDS", "1.0"))
+
+
+class DesignStore:
+    """
+    Shared DesignState storage for the API.
+
+    States returned by ``get`` are shared with the local cache: callers that
+    modify one must ``save`` it for the change to be visible elsewhere.
+    """
+
+    def __init__(
+        self,
+        state_cache: Optional[StateCache] = None,
+        ttl_seconds: int = _TTL_SECONDS,
+        local_max_entries: int = _LOCAL_MAX_ENTRIES,
+        wait_poll_seconds: float = _WAIT_POLL_SECONDS,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            state_cache: Redis-backed state cache (None for local-only mode)
+            ttl_seconds: Expiration of persisted designs
+            local_max_entries: Size of the in-process LRU
+            wait_poll_seconds: Version re-check interval while long-polling
+        """
+        self.state_cache = state_cache
+        self.ttl_seconds = ttl_seconds
+        self.local_max_entries = local_max_entries
+        self.wait_poll_seconds = wait_poll_seconds
+        self._local: "OrderedDict[str, Tuple[str, DesignState]]" = OrderedDict()
+        self._waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_shared(self) -> bool:
+        """True when designs are persisted in Redis."""
+        return self.state_cache is not None
+
+    def attach(self, state_cache: StateCache) -> None:
+        """
+        Switch a local-only store to Redis once it becomes reachable.
+
+        Designs created meanwhile are persisted so other workers see them.
+
+        Args:
+            state_cache: Redis-backed state cache
+        """
+        if self.is_shared:
+            return
+        with self._lock:
+            local_states = [state for _, state in self._local.values()]
+        self.state_cache = state_cache
+        self.save_many(local_states)
+        logger.info(f"Design store attached to Redis ({len(local_states)} designs)")
+
+    def _version_key(self, request_id: str) -> str:
+        return f"{self.state_cache.design_prefix}:{request_id}:version"
+
+    def version(self, request_id: str) -> Optional[str]:
+        """
+        Current version token of a design, without loading it.
+
+        Args:
+            request_id: Design request ID
+
+        Returns:
+            Version token, or None if the design does not exist
+        """
+        request_id = str(request_id)
+        with self._lock:
+            cached = self._local.get(request_id)
+
+        if not self.is_shared:
+            return cached[0] if cached else None
+
+        try:
+            raw = self.state_cache.redis_client.get(self._version_key(request_id))
+        except Exception as e:
+            logger.warning(f"Design store version check failed for {request_id}: {e}")
+            return cached[0] if cached else None
+
+        return _decode_version(raw)
+
+    async def version_async(self, request_id: str) -> Optional[str]:
+        """``version`` read through the ``redis.asyncio`` client (non-blocking)."""
+        request_id = str(request_id)
+        with self._lock:
+            cached = self._local.get(request_id)
+
+        if not self.is_shared:
+            return cached[0] if cached else None
+
+        try:
+            raw = await self.state_cache.redis_client.async_connection.get(
+                self._version_key(request_id)
+            )
+        except Exception as e:
+            logger.warning(f"Design store version check failed for {request_id}: {e}")
+            return cached[0] if cached else None
+
+        return _decode_version(raw)
+
+    async def wait_for_change(
+        self, request_id: str, version: Optional[str], timeout: float
+    ) -> Optional[str]:
+        """
+        Wait until a design's version differs from ``version``.
+
+        Args:
+            request_id: Design request ID
+            version: Version the caller already has
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The current version (unchanged if the wait timed out)
+        """
+        request_id = str(request_id)
+        loop = asyncio.get_running_loop()
+        give_up_at = loop.time() + timeout
+
+        while True:
+            current = await self.version_async(request_id)
+            remaining = give_up_at - loop.time()
+            if current != version or remaining <= 0:
+                return current
+
+            waiter = loop.create_future()
+            with self._lock:
+                self._waiters.setdefault(request_id, set()).add(waiter)
+            try:
+                await asyncio.wait_for(
+                    waiter, timeout=min(remaining, self.wait_poll_seconds)
+                )
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    waiters = self._waiters.get(request_id)
+                    if waiters is not None:
+                        waiters.discard(waiter)
+                        if not waiters:
+                            del self._waiters[request_id]
+
+    def get(self, request_id: str) -> Optional[DesignState]:
+        """
+        Get a design by request ID.
+
+        Args:
+            request_id: Design request ID
+
+        Returns:
+            DesignState or None if unknown or expired
+        """
+        request_id = str(request_id)
+        with self._lock:
+            cached = self._local.get(request_id)
+            if cached is not None:
+                self._local.move_to_end(request_id)
+
+        if not self.is_shared:
+            return cached[1] if cached else None
+
+        try:
+            raw = self.state_cache.redis_client.get(self._version_key(request_id))
+        except Exception as e:
+            logger.warning(f"Design store version check failed for {request_id}: {e}")
+            return cached[1] if cached else None
+
+        if raw is None:
+            # Deleted or expired on another worker
+            self._forget(request_id)
+            return None
+
+        version = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        design_state = self.state_cache.retrieve_design_state(request_id)
+        if design_state is None:
+            self._forget(request_id)
+            return None
+
+        self._remember(request_id, version, design_state)
+        return design_state
+
+    def get_many(self, request_ids: List[str]) -> Dict[str, DesignState]:
+        """
+        Get several designs with at most two MGETs.
+
+        Version tokens of all IDs are fetched at once; only designs whose
+        local copy is missing or stale are then fetched and parsed.
+
+        Args:
+            request_ids: Design request IDs
+
+        Returns:
+            Mapping of request ID to DesignState; unknown IDs are omitted
+        """
+        request_ids = list(dict.fromkeys(str(rid) for rid in request_ids))
+        with self._lock:
+            cached = {rid: self._local.get(rid) for rid in request_ids}
+
+        if not self.is_shared:
+            return {rid: entry[1] for rid, entry in cached.items() if entry}
+
+        try:
+            raw_versions = self.state_cache.redis_client.mget(
+                [self._version_key(rid) for rid in request_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Design store bulk version check failed: {e}")
+            return {rid: entry[1] for rid, entry in cached.items() if entry}
+
+        states: Dict[str, DesignState] = {}
+        stale: Dict[str, str] = {}
+        for rid, raw in zip(request_ids, raw_versions):
+            if raw is None:
+                self._forget(rid)
+                continue
+            version = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+            entry = cached[rid]
+            if entry is not None and entry[0] == version:
+                states[rid] = entry[1]
+            else:
+                stale[rid] = version
+
+        if stale:
+            fetched = self.state_cache.retrieve_design_states(list(stale))
+            for rid, version in stale.items():
+                design_state = fetched.get(rid)
+                if design_state is None:
+                    self._forget(rid)
+                    continue
+                self._remember(rid, version, design_state)
+                states[rid] = design_state
+
+        return states
+
+    def save_many(self, design_states: List[DesignState]) -> None:
+        """
+        Persist several designs and their versions in one transaction.
+
+        Args:
+            design_states: Designs to store
+        """
+        versions = {str(s.request_id): uuid4().hex for s in design_states}
+
+        if self.is_shared and design_states:
+            try:
+                self._write(design_states, versions)
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(design_states)} designs: {e}")
+
+        for design_state in design_states:
+            request_id = str(design_state.request_id)
+            self._remember(request_id, versions[request_id], design_state)
+            self._notify(request_id)
+
+    def save(self, design_state: DesignState) -> None:
+        """
+        Persist a design and invalidate cached copies on other workers.
+
+        Args:
+            design_state: Design to store
+        """
+        request_id = str(design_state.request_id)
+        version = uuid4().hex
+
+        if self.is_shared:
+            try:
+                self._write([design_state], {request_id: version})
+            except Exception as e:
+                logger.warning(f"Failed to persist design {request_id}: {e}")
+
+        self._remember(request_id, version, design_state)
+        self._notify(request_id)
+
+    def _write(
+        self, design_states: List[DesignState], versions: Dict[str, str]
+    ) -> None:
+        """Write states and version tokens in one MULTI/EXEC.
+
+        Concurrent writers cannot interleave, so a version token is never
+        paired with another writer's state.
+        """
+        pipe = self.state_cache.redis_client.pipeline(transaction=True)
+        for design_state in design_states:
+            request_id = str(design_state.request_id)
+            self.state_cache.queue_design_state(
+                pipe, design_state, ttl_seconds=self.ttl_seconds
+            )
+            pipe.set(
+                self._version_key(request_id), versions[request_id], ex=self.ttl_seconds
+            )
+        pipe.execute()
+
+    def delete(self, request_id: str) -> bool:
+        """
+        Delete a design.
+
+        Args:
+            request_id: Design request ID
+
+        Returns:
+            True if the design existed
+        """
+        request_id = str(request_id)
+        existed = self.get(request_id) is not None
+        self._forget(request_id)
+
+        if self.is_shared:
+            try:
+                self.state_cache.redis_client.delete(self._version_key(request_id))
+                self.state_cache.delete_design_state(request_id)
+            except Exception as e:
+                logger.warning(f"Failed to delete design {request_id}: {e}")
+
+        self._notify(request_id)
+        return existed
+
+    # ── Async variants (off the event loop) ───────────────────────────────────
+
+    async def get_async(self, request_id: str) -> Optional[DesignState]:
+        """``get`` without blocking the event loop."""
+        return await self._offload(self.get, request_id)
+
+    async def get_many_async(self, request_ids: List[str]) -> Dict[str, DesignState]:
+        """``get_many`` without blocking the event loop."""
+        return await self._offload(self.get_many, request_ids)
+
+    async def save_async(self, design_state: DesignState) -> None:
+        """``save`` without blocking the event loop."""
+        await self._offload(self.save, design_state)
+
+    async def save_many_async(self, design_states: List[DesignState]) -> None:
+        """``save_many`` without blocking the event loop."""
+        await self._offload(self.save_many, design_states)
+
+    async def delete_async(self, request_id: str) -> bool:
+        """``delete`` without blocking the event loop."""
+        return await self._offload(self.delete, request_id)
+
+    async def _offload(self, func: Callable[..., T], *args: Any) -> T:
+        if not self.is_shared:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def __contains__(self, request_id: object) -> bool:
+        return self.get(str(request_id)) is not None
+
+    def _remember(self, request_id: str, version: str, state: DesignState) -> None:
+        with self._lock:
+            self._local[request_id] = (version, state)
+            self._local.move_to_end(request_id)
+            while len(self._local) > self.local_max_entries:
+                evicted, _ = self._local.popitem(last=False)
+                if not self.is_shared:
+                    logger.warning(f"Local design store full; dropped {evicted}")
+
+    def _forget(self, request_id: str) -> None:
+        with self._lock:
+            self._local.pop(request_id, None)
+
+    def _notify(self, request_id: str) -> None:
+        """Wake long-poll waiters of this worker (safe from any thread)."""
+        with self._lock:
+            waiters = self._waiters.pop(request_id, set())
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+
+
+def _decode_version(raw: Optional[bytes]) -> Optional[str]:
+    if raw is None:
+        return None
+    return raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
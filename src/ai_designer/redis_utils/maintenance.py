@@ -0,0 +1,138 @@
+"""
+Background maintenance of the Redis state cache.
+
+``StateCacheMaintenance`` periodically removes completed designs older than
+``max_age_hours`` through ``StateCache.cleanup_completed_designs`` (HSCAN,
+pipelined UNLINKs, rate-capped).  The blocking cleanup runs in a worker
+thread so the event loop keeps serving requests.
+
+With several API workers only one runs each cycle: a run first takes a
+Redis lock (``SET NX EX``) held for most of the interval, so the others
+skip.
+Progress is exported through ``state_cache_cleanup_keys_total`` and
+``state_cache_maintenance_runs_total`` and kept in ``status()``.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+STATE_CACHE_MAINTENANCE_INTERVAL_SECONDS  float, default 86400 (0 = disabled)
+STATE_CACHE_MAINTENANCE_MAX_AGE_HOURS     int, default 24 (completed designs kept)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+from ..core.metrics import STATE_CACHE_MAINTENANCE_RUNS_TOTAL
+from .state_cache import StateCache
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_INTERVAL_SECONDS: float = float(
+    os.getenv("STATE_CACHE_MAINTENANCE_INTERVAL_SECONDS", "86400")
+)
+_MAX_AGE_HOURS: int = int(os.getenv("STATE_CACHE_MAINTENANCE_MAX_AGE_HOURS", "24"))
+
+_LOCK_KEY = "freecad:maintenance:lock"
+
+
+class StateCacheMaintenance:
+    """Periodic, cluster-wide single-runner cleanup of the state cache."""
+
+    def __init__(
+        self,
+        state_cache: StateCache,
+        interval_seconds: float = _INTERVAL_SECONDS,
+        max_age_hours: int = _MAX_AGE_HOURS,
+    ):
+        """
+        Initialize the maintenance task.
+
+        Args:
+            state_cache: Cache to clean
+            interval_seconds: Time between runs
+            max_age_hours: Completed designs older than this are deleted
+        """
+        self.state_cache = state_cache
+        self.interval_seconds = interval_seconds
+        self.max_age_hours = max_age_hours
+        self._task: Optional[asyncio.Task] = None
+        self._status: Dict[str, Any] = {
+            "running": False,
+            "last_started": None,
+            "last_finished": None,
+            "last_deleted": 0,
+            "deleted_so_far": 0,
+        }
+
+    def start(self) -> None:
+        """Start the periodic loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info(
+                f"State-cache maintenance every {self.interval_seconds:.0f}s "
+                f"(designs kept {self.max_age_hours}h)"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it to exit."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """Progress of the current or last run."""
+        return dict(self._status)
+
+    async def run_once(self) -> Optional[int]:
+        """
+        Run one cleanup unless another worker holds this cycle's lock.
+
+        Returns:
+            Number of designs deleted, or None if the run was skipped
+        """
+        # Held for most of the interval; shorter than it so jitter cannot
+        # make the next run find its own previous lock
+        lock_seconds = max(1, int(self.interval_seconds * 0.8))
+        redis_client = self.state_cache.redis_client
+        if not redis_client.set(_LOCK_KEY, "1", ex=lock_seconds, nx=True):
+            STATE_CACHE_MAINTENANCE_RUNS_TOTAL.labels(outcome="skipped").inc()
+            return None
+
+        self._status.update(running=True, last_started=time.time(), deleted_so_far=0)
+        try:
+            deleted = await asyncio.get_running_loop().run_in_executor(
+                None,
+                lambda: self.state_cache.cleanup_completed_designs(
+                    self.max_age_hours, progress=self._on_progress
+                ),
+            )
+        except Exception:
+            STATE_CACHE_MAINTENANCE_RUNS_TOTAL.labels(outcome="failed").inc()
+            raise
+        finally:
+            self._status.update(running=False, last_finished=time.time())
+
+        self._status["last_deleted"] = deleted
+        STATE_CACHE_MAINTENANCE_RUNS_TOTAL.labels(outcome="completed").inc()
+        logger.info(f"State-cache maintenance deleted {deleted} completed designs")
+        return deleted
+
+    def _on_progress(self, deleted: int) -> None:
+        self._status["deleted_so_far"] = deleted
+
+    async def _loop(self) -> None:
+        while True:
+            # Jitter keeps restarted workers from all waking at once
+            await asyncio.sleep(self.interval_seconds * random.uniform(0.9, 1.1))
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"State-cache maintenance failed: {e}")
@@ -0,0 +1,493 @@
+"""
+Redis-backed planner template cache keyed on normalised prompt structure.
+
+Prompts that differ only in their dimensions ("plate 100x80 with 4 holes" vs
+"plate 120x60 with 4 holes") decompose into the same task graph.  The cache
+normalises a prompt into a structural key (dimensions replaced by slots,
+feature counts kept literally) and stores the planner's TaskGraph with every
+numeric parameter bound to the prompt slot it came from.  A later prompt with
+the same structure gets the stored graph back with its own dimensions
+re-bound, without an LLM call.
+
+Templates whose parameters cannot be traced back to the prompt (derived
+positions, ambiguous equal dimensions) get a low confidence and are never
+served; the planner falls back to the LLM for them.
+
+Only plans whose design passed validation are stored, and a cached plan that
+fails validation is invalidated (see ``PipelineNodes``).
+
+Eviction: every template expires ``ttl_seconds`` after it was stored, and a
+sorted set of last-access times evicts the least recently used templates
+beyond ``max_entries``.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+PLAN_CACHE_ENABLED         "0" to disable (read by api.deps), default "1"
+PLAN_CACHE_TTL_SECONDS     int, default 604800 (7 days)
+PLAN_CACHE_MAX_ENTRIES     int, default 1000
+PLAN_CACHE_MIN_CONFIDENCE  float, default 0.9
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from ..core.metrics import PLAN_CACHE_REQUESTS_TOTAL
+from ..schemas.task_graph import TaskGraph, TaskNode
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_TTL_SECONDS: int = int(os.getenv("PLAN_CACHE_TTL_SECONDS", "604800"))
+_MAX_ENTRIES: int = int(os.getenv("PLAN_CACHE_MAX_ENTRIES", "1000"))
+_MIN_CONFIDENCE: float = float(os.getenv("PLAN_CACHE_MIN_CONFIDENCE", "0.9"))
+
+# ── Prompt normalisation ─────────────────────────────────────────────────────
+_UNIT_SCALE: Dict[str, float] = {
+    "mm": 1.0,
+    "cm": 10.0,
+    "m": 1000.0,
+    "in": 25.4,
+    "inch": 25.4,
+    "inches": 25.4,
+    '"': 25.4,
+}
+_NUMBER_RE = re.compile(
+    r"(?<![a-wyz0-9._])(\d+(?:\.\d+)?)(?:\s*(mm|cm|m|inches|inch|in|\")(?![a-z]))?"
+)
+_NEXT_WORD_RE = re.compile(r"\s*([a-z]+)")
+_SLOT = "#"
+_SEPARATORS = {"x", "by"}
+
+# Dimension words never count as a counted feature ("10 long", "5 wide")
+_DIMENSION_WORDS = {
+    "long",
+    "wide",
+    "high",
+    "tall",
+    "deep",
+    "thick",
+    "diameter",
+    "radius",
+    "dia",
+    "x",
+    "by",
+}
+
+# Integer ratios between a prompt dimension and a plan parameter that are
+# bound automatically (e.g. diameter in the prompt, radius in the plan)
+_BIND_FACTORS = (1.0, 0.5, 2.0)
+
+
+@dataclass
+class PromptStructure:
+    """A prompt reduced to its structure and numeric dimensions."""
+
+    key: str
+    values: List[float] = field(default_factory=list)
+    counts: List[int] = field(default_factory=list)
+
+
+def normalize_prompt(prompt: str) -> PromptStructure:
+    """
+    Split a prompt into a structural key and its dimension values.
+
+    Dimensions become slots and are returned in millimetres; integers that
+    count a feature ("4 holes", "1 slot") stay in the key because they change
+    the shape of the task graph.
+
+    Args:
+        prompt: User's design prompt
+
+    Returns:
+        PromptStructure with a stable hash key
+    """
+    text = prompt.lower()
+    parts: List[str] = []
+    values: List[float] = []
+    counts: List[int] = []
+    last = 0
+
+    for match in _NUMBER_RE.finditer(text):
+        number, unit = match.group(1), match.group(2)
+        parts.append(text[last : match.start()])
+        last = match.end()
+
+        next_word = _NEXT_WORD_RE.match(text, match.end())
+        word = next_word.group(1) if next_word else ""
+        is_count = (
+            unit is None
+            and "." not in number
+            and word not in _DIMENSION_WORDS
+            and (word.endswith("s") or (number == "1" and word != ""))
+        )
+        if is_count:
+            counts.append(int(number))
+            parts.append(number)
+        else:
+            values.append(round(float(number) * _UNIT_SCALE.get(unit or "mm"), 6))
+            parts.append(f" {_SLOT} ")
+
+    parts.append(text[last:])
+    tokens = re.findall(r"[a-z0-9#]+", "".join(parts))
+    # "100x80", "100 x 80", "100 by 80" and "100×80" share one structure
+    tokens = [
+        token
+        for i, token in enumerate(tokens)
+        if not (
+            token in _SEPARATORS
+            and 0 < i < len(tokens) - 1
+            and tokens[i - 1] == _SLOT
+            and tokens[i + 1] == _SLOT
+        )
+    ]
+    structure = " ".join(tokens)
+    digest = hashlib.sha256(structure.encode("utf-8")).hexdigest()[:32]
+
+    return PromptStructure(key=digest, values=values, counts=counts)
+
+
+# ── Template binding ─────────────────────────────────────────────────────────
+
+
+def _fmt(value: float) -> str:
+    return f"{value:g}"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _Binder:
+    """Replace numeric plan parameters with references to prompt slots."""
+
+    def __init__(self, structure: PromptStructure):
+        self.values = structure.values
+        self.counts = structure.counts
+        self.bound = 0
+        self.unbound = 0
+        self.used_slots: set = set()
+
+    def _candidates(self, value: float) -> List[Tuple[int, float]]:
+        tolerance = 1e-6 * max(1.0, abs(value))
+        return [
+            (i, factor)
+            for factor in _BIND_FACTORS
+            for i, slot in enumerate(self.values)
+            if abs(slot * factor - value) <= tolerance
+        ]
+
+    def bind(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: self.bind(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.bind(v) for v in value]
+        if not _is_number(value):
+            return value
+        # Zeros and literal feature counts are structural constants
+        if value == 0 or value in self.counts:
+            return value
+
+        candidates = self._candidates(float(value))
+        if len(candidates) == 1:
+            slot, factor = candidates[0]
+            self.bound += 1
+            self.used_slots.add(slot)
+            return {"$slot": slot, "$factor": factor}
+
+        # Unrelated to the prompt, or ambiguous between equal dimensions
+        self.unbound += 1
+        return value
+
+    def bind_text(self, text: str) -> str:
+        def replace(match: "re.Match[str]") -> str:
+            value = float(match.group(1)) * _UNIT_SCALE.get(match.group(2) or "mm")
+            slots = [i for i, slot in enumerate(self.values) if slot == value]
+            if len(slots) != 1:
+                return match.group(0)
+            return "{slot:%d}%s" % (slots[0], match.group(0)[len(match.group(1)) :])
+
+        return _NUMBER_RE.sub(replace, text)
+
+    @property
+    def confidence(self) -> float:
+        params = self.bound + self.unbound
+        param_ratio = self.bound / params if params else 1.0
+        slot_ratio = len(self.used_slots) / len(self.values) if self.values else 1.0
+        return param_ratio * slot_ratio
+
+
+def _rebind(value: Any, values: List[float]) -> Any:
+    if isinstance(value, dict):
+        if "$slot" in value:
+            return round(values[value["$slot"]] * value["$factor"], 6)
+        return {k: _rebind(v, values) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_rebind(v, values) for v in value]
+    return value
+
+
+def _rebind_text(text: str, values: List[float]) -> str:
+    return re.sub(
+        r"\{slot:(\d+)\}(\s*(?:mm|cm|m|inches|inch|in|\"))?",
+        lambda m: _fmt(values[int(m.group(1))]) + ("mm" if m.group(2) else ""),
+        text,
+    )
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+
+
+class PlanCache:
+    """
+    Structural plan template cache for PlannerAgent.
+
+    Uses the synchronous RedisClient wrapper; every Redis failure is logged
+    and treated as a cache miss so planning never depends on Redis.  The
+    ``*_async`` variants run the same calls in the default executor for
+    callers on the event loop.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        ttl_seconds: int = _TTL_SECONDS,
+        max_entries: int = _MAX_ENTRIES,
+        min_confidence: float = _MIN_CONFIDENCE,
+    ):
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.min_confidence = min_confidence
+        self.key_prefix = "plan_cache"
+        self.lru_key = f"{self.key_prefix}:lru"
+        self.stats_key = f"{self.key_prefix}:stats"
+
+    def _template_key(self, structure_key: str) -> str:
+        return f"{self.key_prefix}:template:{structure_key}"
+
+    def lookup(self, prompt: str, request_id: UUID) -> Optional[TaskGraph]:
+        """
+        Return a task graph for ``prompt`` re-bound from a stored template.
+
+        Args:
+            prompt: User's design prompt
+            request_id: Request the returned graph belongs to
+
+        Returns:
+            TaskGraph on a confident hit, None otherwise
+        """
+        structure = normalize_prompt(prompt)
+        key = self._template_key(structure.key)
+
+        try:
+            raw = self.redis_client.get(key)
+            if raw is None:
+                # Expired templates linger in the LRU index until touched
+                self.redis_client.zrem(self.lru_key, key)
+                self._record("miss")
+                return None
+
+            template = json.loads(raw)
+            if template["confidence"] < self.min_confidence:
+                self._record("low_confidence")
+                return None
+
+            self.redis_client.zadd(self.lru_key, {key: time.time()})
+            graph = self._instantiate(template, structure.values, request_id)
+        except Exception as e:
+            logger.warning(f"Plan cache lookup failed: {e}")
+            self._record("miss")
+            return None
+
+        self._record("hit")
+        logger.info(
+            f"Plan cache hit for request {request_id} "
+            f"({len(graph.nodes)} tasks, confidence={template['confidence']:.2f})"
+        )
+        return graph
+
+    def store(self, prompt: str, task_graph: TaskGraph) -> bool:
+        """
+        Store a planner result as a template for structurally equal prompts.
+
+        Args:
+            prompt: Prompt the graph was planned for
+            task_graph: Graph returned by the LLM planner
+
+        Returns:
+            True if the template was confident enough to be stored
+        """
+        structure = normalize_prompt(prompt)
+        binder = _Binder(structure)
+
+        tasks = [
+            {
+                "task_id": task.task_id,
+                "operation_type": task.operation_type,
+                "description": binder.bind_text(task.description),
+                "parameters": binder.bind(task.parameters),
+            }
+            for task in task_graph.nodes.values()
+        ]
+        edges = [
+            {
+                "from_task": edge.from_task,
+                "to_task": edge.to_task,
+                "dependency_type": edge.dependency_type,
+            }
+            for edge in task_graph.edges
+        ]
+
+        confidence = binder.confidence
+        if confidence < self.min_confidence:
+            logger.debug(
+                f"Not caching plan template (confidence={confidence:.2f} "
+                f"< {self.min_confidence:.2f})"
+            )
+            return False
+
+        key = self._template_key(structure.key)
+        template = {
+            "tasks": tasks,
+            "edges": edges,
+            "confidence": confidence,
+            "slot_count": len(structure.values),
+            "stored_at": time.time(),
+        }
+
+        try:
+            self.redis_client.set(key, json.dumps(template), ex=self.ttl_seconds)
+            self.redis_client.zadd(self.lru_key, {key: time.time()})
+            self.redis_client.hincrby(self.stats_key, "stores")
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Plan cache store failed: {e}")
+            return False
+
+        return True
+
+    def invalidate(self, prompt: str) -> bool:
+        """
+        Drop the template for ``prompt``'s structure, e.g. after it failed.
+
+        Args:
+            prompt: Prompt whose structural template should be dropped
+
+        Returns:
+            True if a template was removed
+        """
+        key = self._template_key(normalize_prompt(prompt).key)
+
+        try:
+            removed = self.redis_client.delete(key)
+            self.redis_client.zrem(self.lru_key, key)
+            if removed:
+                self.redis_client.hincrby(self.stats_key, "invalidations")
+        except Exception as e:
+            logger.warning(f"Plan cache invalidation failed: {e}")
+            return False
+
+        return bool(removed)
+
+    # ── Async variants (off the event loop) ───────────────────────────────────
+
+    async def lookup_async(self, prompt: str, request_id: UUID) -> Optional[TaskGraph]:
+        """``lookup`` without blocking the event loop."""
+        return await self._offload(self.lookup, prompt, request_id)
+
+    async def store_async(self, prompt: str, task_graph: TaskGraph) -> bool:
+        """``store`` without blocking the event loop."""
+        return await self._offload(self.store, prompt, task_graph)
+
+    async def invalidate_async(self, prompt: str) -> bool:
+        """``invalidate`` without blocking the event loop."""
+        return await self._offload(self.invalidate, prompt)
+
+    async def _offload(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _instantiate(
+        self, template: Dict[str, Any], values: List[float], request_id: UUID
+    ) -> TaskGraph:
+        if template["slot_count"] != len(values):
+            raise ValueError("Template slot count does not match prompt")
+
+        graph = TaskGraph(request_id=request_id)
+        for task in template["tasks"]:
+            graph.add_task(
+                TaskNode(
+                    task_id=task["task_id"],
+                    operation_type=task["operation_type"],
+                    description=_rebind_text(task["description"], values),
+                    parameters=_rebind(task["parameters"], values),
+                )
+            )
+        for edge in template["edges"]:
+            graph.add_dependency(
+                from_task=edge["from_task"],
+                to_task=edge["to_task"],
+                dependency_type=edge["dependency_type"],
+            )
+        return graph
+
+    def _evict(self) -> int:
+        """Drop least recently used templates beyond ``max_entries``."""
+        excess = self.redis_client.zcard(self.lru_key) - self.max_entries
+        if excess <= 0:
+            return 0
+
+        victims = self.redis_client.zrange(self.lru_key, 0, excess - 1)
+        for key in victims:
+            self.redis_client.delete(key)
+        self.redis_client.zrem(self.lru_key, *victims)
+        self.redis_client.hincrby(self.stats_key, "evictions", len(victims))
+        return len(victims)
+
+    def _record(self, outcome: str) -> None:
+        PLAN_CACHE_REQUESTS_TOTAL.labels(outcome=outcome).inc()
+        try:
+            self.redis_client.hincrby(self.stats_key, outcome)
+        except Exception as e:
+            logger.debug(f"Could not update plan cache stats: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics shared by all workers.
+
+        Returns:
+            Dictionary with hits, misses, low_confidence, stores, evictions,
+            invalidations, entries and hit_rate
+        """
+        raw = self.redis_client.hgetall(self.stats_key)
+        stats = {
+            name: int(raw.get(name, 0))
+            for name in (
+                "hit",
+                "miss",
+                "low_confidence",
+                "stores",
+                "evictions",
+                "invalidations",
+            )
+        }
+        lookups = stats["hit"] + stats["miss"] + stats["low_confidence"]
+        return {
+            "hits": stats["hit"],
+            "misses": stats["miss"],
+            "low_confidence": stats["low_confidence"],
+            "stores": stats["stores"],
+            "evictions": stats["evictions"],
+            "invalidations": stats["invalidations"],
+            "entries": self.redis_client.zcard(self.lru_key),
+            "hit_rate": stats["hit"] / lookups if lookups else 0.0,
+        }
@@ -3,43 +3,81 @@ Redis Pub/Sub to WebSocket bridge for real-time design notifications.
 
 Listens to Redis Pub/Sub channels and forwards events to connected WebSocket clients,
 enabling real-time updates for design workflows.
+
+The listener runs on ``redis.asyncio`` with one ``PSUBSCRIBE design:*:events``
+(the channels ``AuditLogger`` publishes to), so waiting for messages never
+blocks the event loop.  A dropped connection is re-established with
+exponential backoff.  Every node receives every design event but only
+dispatches those whose request has live listeners on this node: WebSocket
+connections registered with ``subscribe_to_design`` and in-process queues
+(e.g. SSE streams) opened with ``add_subscriber``.
+
+Configuration (env vars)
+------------------------
+PUBSUB_RECONNECT_MIN_SECONDS   float, default 0.5 (first reconnect delay)
+PUBSUB_RECONNECT_MAX_SECONDS   float, default 30 (backoff cap)
+PUBSUB_SUBSCRIBER_QUEUE_SIZE   int, default 100 (oldest events dropped beyond)
 """
 
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import random
+from typing import Any, Dict, Optional, Set
 from uuid import UUID
 
+from .connection import get_async_redis
+
 logger = logging.getLogger(__name__)
 
+# ── Config ────────────────────────────────────────────────────────────────────
+_RECONNECT_MIN_SECONDS: float = float(os.getenv("PUBSUB_RECONNECT_MIN_SECONDS", "0.5"))
+_RECONNECT_MAX_SECONDS: float = float(os.getenv("PUBSUB_RECONNECT_MAX_SECONDS", "30"))
+_SUBSCRIBER_QUEUE_SIZE: int = int(os.getenv("PUBSUB_SUBSCRIBER_QUEUE_SIZE", "100"))
+
 
 class PubSubBridge:
     """
     Bridge between Redis Pub/Sub and WebSocket connections.
 
-    Subscribes to Redis channels for design events and forwards them to
-    WebSocket clients in real-time.
+    Pattern-subscribes to the design event channels and forwards events to
+    the WebSocket clients and local subscribers of this node in real-time.
     """
 
-    def __init__(self, redis_client, websocket_manager=None):
+    def __init__(self, redis_client, websocket_manager=None, async_redis=None):
         """
         Initialize Pub/Sub bridge.
 
         Args:
-            redis_client: RedisClient instance
+            redis_client: RedisClient instance (connection settings are reused)
             websocket_manager: WebSocket ConnectionManager from api/routes/ws.py (optional)
+            async_redis: ``redis.asyncio`` client to listen on (default:
+                ``redis_client.async_connection``, on the shared async pool)
         """
         self.redis_client = redis_client
         self.websocket_manager = websocket_manager
+        self.async_redis = async_redis
         self.pubsub = None
         self.running = False
         self._listener_task = None
+        # request_id -> number of local WebSocket connections
+        self._ws_listeners: Dict[str, int] = {}
+        # request_id -> queues of local in-process subscribers
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
 
     def _get_channel_pattern(self) -> str:
         """Get channel pattern for all design events."""
         return "design:*:events"
 
+    def _get_async_redis(self):
+        if self.async_redis is None:
+            if self.redis_client is not None:
+                self.async_redis = self.redis_client.async_connection
+            else:
+                self.async_redis = get_async_redis()
+        return self.async_redis
+
     async def start_listener(self) -> None:
         """
         Start listening to Redis Pub/Sub channels.
@@ -50,46 +88,50 @@ class PubSubBridge:
             logger.warning("Pub/Sub listener already running")
             return
 
-        try:
-            # Subscribe to all design event channels using pattern matching
-            self.pubsub = self.redis_client.subscribe("__keyevent@0__:*")
-            # Note: Pattern subscription requires CONFIG SET notify-keyspace-events
-            # For now, we'll manually subscribe to known channels
-
-            self.running = True
-            logger.info("Started Redis Pub/Sub listener")
-
-            # Run listener in background
-            self._listener_task = asyncio.create_task(self._listen_loop())
-
-        except Exception as e:
-            logger.error(f"Failed to start Pub/Sub listener: {e}")
-            self.running = False
+        self.running = True
+        self._listener_task = asyncio.create_task(self._listen_loop())
+        logger.info("Started Redis Pub/Sub listener")
 
     async def _listen_loop(self) -> None:
-        """Main loop for listening to Pub/Sub messages."""
-        if not self.pubsub:
-            logger.error("PubSub not initialized")
-            return
-
+        """Receive design events, reconnecting with backoff on errors."""
         logger.info("Pub/Sub listener loop started")
+        backoff = _RECONNECT_MIN_SECONDS
 
         try:
             while self.running:
-                # Get message with timeout to allow periodic checking of running flag
-                message = self.pubsub.get_message(timeout=1.0)
-
-                if message and message["type"] == "message":
-                    await self._handle_message(message)
-
-                # Small delay to prevent tight loop
-                await asyncio.sleep(0.01)
-
-        except Exception as e:
-            logger.error(f"Error in Pub/Sub listener loop: {e}")
+                try:
+                    self.pubsub = self._get_async_redis().pubsub(
+                        ignore_subscribe_messages=True
+                    )
+                    await self.pubsub.psubscribe(self._get_channel_pattern())
+                    backoff = _RECONNECT_MIN_SECONDS
+
+                    async for message in self.pubsub.listen():
+                        if message["type"] in ("message", "pmessage"):
+                            await self._handle_message(message)
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    delay = backoff * random.uniform(0.5, 1.0)
+                    logger.warning(
+                        f"Pub/Sub connection lost ({e}), reconnecting in {delay:.1f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    backoff = min(backoff * 2, _RECONNECT_MAX_SECONDS)
+                finally:
+                    await self._close_pubsub()
         finally:
             logger.info("Pub/Sub listener loop stopped")
 
+    async def _close_pubsub(self) -> None:
+        if self.pubsub is not None:
+            try:
+                await self.pubsub.reset()
+            except Exception as e:
+                logger.debug(f"Error closing PubSub: {e}")
+            self.pubsub = None
+
     async def _handle_message(self, message: Dict[str, Any]) -> None:
         """
         Handle incoming Pub/Sub message and forward to WebSocket.
@@ -104,8 +146,6 @@ class PubSubBridge:
             # Decode if bytes
             if isinstance(channel, bytes):
                 channel = channel.decode("utf-8")
-            if isinstance(data, bytes):
-                data = data.decode("utf-8")
 
             # Parse channel to extract request_id: design:{request_id}:events
             parts = channel.split(":")
@@ -114,6 +154,10 @@ class PubSubBridge:
                 return
 
             request_id = parts[1]
+            has_ws_listeners = request_id in self._ws_listeners
+            subscribers = self._subscribers.get(request_id)
+            if not has_ws_listeners and not subscribers:
+                return  # Nobody on this node watches this design
 
             # Parse event data (should be JSON)
             try:
@@ -122,11 +166,12 @@ class PubSubBridge:
                 logger.warning(f"Invalid JSON in Pub/Sub message: {data}")
                 return
 
+            for queue in list(subscribers or ()):
+                _put_latest(queue, event_data)
+
             # Forward to WebSocket if manager available
-            if self.websocket_manager:
+            if has_ws_listeners and self.websocket_manager:
                 await self._forward_to_websocket(request_id, event_data)
-            else:
-                logger.debug(f"No WebSocket manager, skipping forward: {request_id}")
 
         except Exception as e:
             logger.error(f"Error handling Pub/Sub message: {e}")
@@ -199,49 +244,77 @@ class PubSubBridge:
                 await self._listener_task
             except asyncio.CancelledError:
                 pass
+            self._listener_task = None
 
-        if self.pubsub:
-            try:
-                self.pubsub.close()
-            except Exception as e:
-                logger.error(f"Error closing PubSub: {e}")
-
+        await self._close_pubsub()
         logger.info("Stopped Redis Pub/Sub listener")
 
     def subscribe_to_design(self, request_id: UUID) -> None:
         """
-        Subscribe to events for a specific design request.
+        Register a local WebSocket listener for a design request.
 
         Args:
             request_id: Design request ID to subscribe to
         """
-        if not self.pubsub:
-            logger.warning("PubSub not initialized, cannot subscribe")
-            return
-
-        try:
-            channel = f"design:{request_id}:events"
-            self.pubsub.subscribe(channel)
-            logger.info(f"Subscribed to {channel}")
-        except Exception as e:
-            logger.error(f"Failed to subscribe to design channel: {e}")
+        key = str(request_id)
+        self._ws_listeners[key] = self._ws_listeners.get(key, 0) + 1
 
     def unsubscribe_from_design(self, request_id: UUID) -> None:
         """
-        Unsubscribe from events for a specific design request.
+        Drop a local WebSocket listener for a design request.
 
         Args:
             request_id: Design request ID to unsubscribe from
         """
-        if not self.pubsub:
-            return
+        key = str(request_id)
+        remaining = self._ws_listeners.get(key, 0) - 1
+        if remaining > 0:
+            self._ws_listeners[key] = remaining
+        else:
+            self._ws_listeners.pop(key, None)
+
+    def add_subscriber(
+        self, request_id: UUID, maxsize: int = _SUBSCRIBER_QUEUE_SIZE
+    ) -> asyncio.Queue:
+        """
+        Open a queue receiving the raw event dicts of a design request.
 
+        When the consumer falls behind, the oldest queued events are dropped.
+
+        Args:
+            request_id: Design request ID
+            maxsize: Queue capacity
+
+        Returns:
+            Queue to read events from; pass it to ``remove_subscriber`` when done
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._subscribers.setdefault(str(request_id), set()).add(queue)
+        return queue
+
+    def remove_subscriber(self, request_id: UUID, queue: asyncio.Queue) -> None:
+        """Close a queue opened with ``add_subscriber``."""
+        key = str(request_id)
+        queues = self._subscribers.get(key)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[key]
+
+    def has_listeners(self, request_id: UUID) -> bool:
+        """True if anything on this node watches the design request."""
+        key = str(request_id)
+        return key in self._ws_listeners or key in self._subscribers
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Enqueue without blocking, dropping the oldest item if the queue is full."""
+    if queue.full():
         try:
-            channel = f"design:{request_id}:events"
-            self.pubsub.unsubscribe(channel)
-            logger.info(f"Unsubscribed from {channel}")
-        except Exception as e:
-            logger.error(f"Failed to unsubscribe from design channel: {e}")
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(item)
 
 
 # Global PubSubBridge instance (initialized in FastAPI lifespan)
@@ -253,7 +326,7 @@ def get_pubsub_bridge() -> Optional[PubSubBridge]:
     return _bridge_instance
 
 
-def set_pubsub_bridge(bridge: PubSubBridge) -> None:
+def set_pubsub_bridge(bridge: Optional[PubSubBridge]) -> None:
     """Set the global PubSubBridge instance."""
     global _bridge_instance
     _bridge_instance = bridge
@@ -1,11 +1,35 @@
+"""
+Redis cache for FreeCAD state/analysis entries and DesignState documents.
+
+Bulk deletes (``clear_all_*``, ``cleanup_completed_designs``) collect keys
+from the indexes or with SCAN and remove them with pipelined UNLINKs in
+chunks, optionally paced to a maximum key rate so a large cleanup does not
+monopolize Redis.  ``StateCacheMaintenance`` runs the design cleanup as a
+background task.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+STATE_CACHE_CLEANUP_BATCH_SIZE            int, default 500 (keys per round trip)
+STATE_CACHE_CLEANUP_MAX_KEYS_PER_SECOND   float, default 0 (0 = unpaced)
+"""
+
 import json
+import os
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
+from ..core.metrics import STATE_CACHE_CLEANUP_KEYS_TOTAL
 from ..schemas.design_state import DesignState, ExecutionStatus
+from .codec import StateCodec
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_CLEANUP_BATCH_SIZE: int = int(os.getenv("STATE_CACHE_CLEANUP_BATCH_SIZE", "500"))
+_CLEANUP_MAX_KEYS_PER_SECOND: float = float(
+    os.getenv("STATE_CACHE_CLEANUP_MAX_KEYS_PER_SECOND", "0")
+)
 
 
 class StateCache:
@@ -15,15 +39,44 @@ class StateCache:
     Supports both:
     - DesignState (Pydantic) for multi-agent workflow state
     - Legacy FreeCAD state analysis data (dict-based)
+
+    Legacy entries are listed through sorted-set indexes (global, per
+    document, per session or analysis type, and their combinations) kept up
+    to date on every write and delete, so no lookup scans the keyspace with
+    KEYS.  Entries written before the indexes existed are picked up by
+    ``rebuild_indexes()``.
+
+    A write with an ``expiration`` trims the members of its indexes that are
+    older than that expiration (entries sharing an index are assumed to share
+    a lifetime), and the per-document and per-session indexes expire with
+    their newest entry, so indexes of finished sessions do not outlive them.
+
+    Payloads are encoded by a ``StateCodec`` (msgpack/JSON, zstd-compressed
+    when large); entries stored as plain JSON by older releases still decode.
     """
 
-    def __init__(self, redis_client):
+    # Index members checked per probe when looking for the latest live entry
+    LATEST_PROBE = 10
+
+    def __init__(
+        self,
+        redis_client,
+        codec: Optional[StateCodec] = None,
+        cleanup_batch_size: int = _CLEANUP_BATCH_SIZE,
+        cleanup_max_keys_per_second: float = _CLEANUP_MAX_KEYS_PER_SECOND,
+    ):
         self.redis_client = redis_client
+        self.codec = codec if codec is not None else StateCodec()
+        self.cleanup_batch_size = cleanup_batch_size
+        self.cleanup_max_keys_per_second = cleanup_max_keys_per_second
         # Legacy prefixes (preserved for backwards compatibility)
         self.key_prefix = "freecad"
         self.state_prefix = f"{self.key_prefix}:state"
         self.analysis_prefix = f"{self.key_prefix}:analysis"
         self.metadata_prefix = f"{self.key_prefix}:metadata"
+        # Sorted-set indexes of state/analysis keys, scored by write time
+        self.index_prefix = f"{self.key_prefix}:index"
+        self.documents_index = f"{self.index_prefix}:documents"
         # New DesignState prefix
         self.design_prefix = "design"
 
@@ -90,12 +143,13 @@ class StateCache:
             },
         }
 
-        # Serialize and store
-        serialized_data = json.dumps(enhanced_data)
-        self.redis_client.set(state_key, serialized_data, ex=expiration)
-
-        # Store in metadata index for easy retrieval
-        self._update_metadata_index(state_key, enhanced_data["metadata"])
+        # Store the entry, its metadata record and index entries in one round trip
+        pipe = self.redis_client.pipeline()
+        pipe.set(state_key, self.codec.dumps(enhanced_data), ex=expiration)
+        self._update_metadata_index(
+            state_key, enhanced_data["metadata"], pipe, expiration
+        )
+        pipe.execute()
 
         return state_key
 
@@ -136,12 +190,13 @@ class StateCache:
             },
         }
 
-        # Serialize and store
-        serialized_data = json.dumps(enhanced_data)
-        self.redis_client.set(analysis_key, serialized_data, ex=expiration)
-
-        # Store in metadata index for easy retrieval
-        self._update_metadata_index(analysis_key, enhanced_data["metadata"])
+        # Store the entry, its metadata record and index entries in one round trip
+        pipe = self.redis_client.pipeline()
+        pipe.set(analysis_key, self.codec.dumps(enhanced_data), ex=expiration)
+        self._update_metadata_index(
+            analysis_key, enhanced_data["metadata"], pipe, expiration
+        )
+        pipe.execute()
 
         return analysis_key
 
@@ -150,10 +205,9 @@ class StateCache:
         data = self.redis_client.get(state_key)
         if data:
             try:
-                decoded_data = data.decode("utf-8") if isinstance(data, bytes) else data
-                parsed_data = json.loads(decoded_data)
+                parsed_data = self.codec.loads(data)
                 return parsed_data.get("data") if "data" in parsed_data else parsed_data
-            except json.JSONDecodeError:
+            except ValueError:
                 return None
         return None
 
@@ -166,126 +220,366 @@ class StateCache:
         data = self.redis_client.get(key)
         if data:
             try:
-                decoded_data = data.decode("utf-8") if isinstance(data, bytes) else data
-                return json.loads(decoded_data)
-            except json.JSONDecodeError:
+                return self.codec.loads(data)
+            except ValueError:
                 return None
         return None
 
     def list_states(
-        self, document_name: str = None, session_id: str = None
+        self,
+        document_name: str = None,
+        session_id: str = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[str]:
-        """List all state keys, optionally filtered by document or session"""
-        pattern = f"{self.state_prefix}:*"
-        if document_name:
-            doc_key = document_name.replace(" ", "_").replace(".", "_")
-            pattern = f"{self.state_prefix}:{doc_key}:*"
-
-        keys = self.redis_client.keys(pattern)
-
-        if session_id:
-            keys = [k for k in keys if session_id in k]
+        """
+        List state keys oldest first, optionally filtered by document or session
 
-        return sorted(keys)
+        Reads one sorted-set index instead of scanning the keyspace, so a page
+        costs O(log n + limit).  Index members whose key has expired are
+        pruned as they are encountered.
+        """
+        index_key = self._state_index(document_name, session_id)
+        return self._live_members(index_key, offset, limit)
 
     def list_analyses(
-        self, document_name: str = None, analysis_type: str = None
+        self,
+        document_name: str = None,
+        analysis_type: str = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[str]:
-        """List all analysis keys, optionally filtered by document or type"""
-        pattern = f"{self.analysis_prefix}:*"
-        if analysis_type:
-            pattern = f"{self.analysis_prefix}:{analysis_type}:*"
-        if document_name:
-            doc_key = document_name.replace(" ", "_").replace(".", "_")
-            if analysis_type:
-                pattern = f"{self.analysis_prefix}:{analysis_type}:{doc_key}:*"
-            else:
-                pattern = f"{self.analysis_prefix}:*:{doc_key}:*"
-
-        return sorted(self.redis_client.keys(pattern))
+        """List analysis keys oldest first, optionally filtered by document or type"""
+        index_key = self._analysis_index(document_name, analysis_type)
+        return self._live_members(index_key, offset, limit)
 
     def get_latest_state(
         self, document_name: str = None, session_id: str = None
     ) -> Optional[str]:
         """Get the most recent state key for a document/session"""
-        keys = self.list_states(document_name, session_id)
-        return keys[-1] if keys else None
+        return self._latest_member(self._state_index(document_name, session_id))
 
     def get_latest_analysis(
         self, document_name: str = None, analysis_type: str = None
     ) -> Optional[str]:
         """Get the most recent analysis key for a document/type"""
-        keys = self.list_analyses(document_name, analysis_type)
-        return keys[-1] if keys else None
+        return self._latest_member(self._analysis_index(document_name, analysis_type))
 
     def delete_state(self, state_key: str) -> bool:
         """Delete a state entry"""
-        result = self.redis_client.delete(state_key)
-        self._remove_from_metadata_index(state_key)
-        return bool(result)
+        return self._delete_keys([state_key]) > 0
 
     def delete_analysis(self, analysis_key: str) -> bool:
         """Delete an analysis entry"""
         return self.delete_state(analysis_key)  # Same logic
 
-    def clear_all_states(self, document_name: str = None) -> int:
-        """Clear all states, optionally filtered by document"""
-        keys = self.list_states(document_name)
-        count = 0
-        for key in keys:
-            if self.delete_state(key):
-                count += 1
-        return count
+    def clear_all_states(
+        self,
+        document_name: str = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Clear all states, optionally filtered by document
 
-    def clear_all_analyses(self, document_name: str = None) -> int:
-        """Clear all analyses, optionally filtered by document"""
-        keys = self.list_analyses(document_name)
-        count = 0
-        for key in keys:
-            if self.delete_analysis(key):
-                count += 1
-        return count
+        ``progress`` is called with the running total after every chunk.
+        """
+        pattern = f"{self.state_prefix}:*"
+        if document_name:
+            pattern = f"{self.state_prefix}:{self._doc_key(document_name)}:*"
+        return self._clear(self._state_index(document_name), pattern, "state", progress)
+
+    def clear_all_analyses(
+        self,
+        document_name: str = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Clear all analyses, optionally filtered by document (see clear_all_states)"""
+        pattern = f"{self.analysis_prefix}:*"
+        if document_name:
+            pattern = f"{self.analysis_prefix}:*:{self._doc_key(document_name)}:*"
+        return self._clear(
+            self._analysis_index(document_name), pattern, "analysis", progress
+        )
 
     def get_metadata_summary(self) -> Dict[str, Any]:
-        """Get a summary of all cached data"""
-        state_keys = self.list_states()
-        analysis_keys = self.list_analyses()
+        """Get a summary of all cached data (totals may count expired entries)"""
+        states_index = self._state_index()
+        analyses_index = self._analysis_index()
 
         return {
-            "total_states": len(state_keys),
-            "total_analyses": len(analysis_keys),
-            "state_keys": state_keys[:10],  # Show first 10
-            "analysis_keys": analysis_keys[:10],  # Show first 10
-            "documents": list(
-                set(self._extract_document_names(state_keys + analysis_keys))
-            ),
+            "total_states": self.redis_client.zcard(states_index),
+            "total_analyses": self.redis_client.zcard(analyses_index),
+            "state_keys": self._live_members(states_index, 0, 10),
+            "analysis_keys": self._live_members(analyses_index, 0, 10),
+            "documents": self.redis_client.zrange(self.documents_index, 0, -1),
         }
 
-    def _update_metadata_index(self, key: str, metadata: Dict[str, Any]):
-        """Update metadata index for easy searching"""
-        metadata_key = f"{self.metadata_prefix}:{key}"
-        self.redis_client.set(
-            metadata_key, json.dumps(metadata), ex=86400
-        )  # 24 hour expiry
+    def rebuild_indexes(self) -> int:
+        """
+        Index state and analysis keys written before the indexes existed.
+
+        Walks the keyspace with SCAN (never KEYS), so it is safe to run
+        against a live server.  Entries are scored by their metadata
+        timestamp.
+
+        Returns:
+            Number of keys indexed
+        """
+        count = 0
+        for prefix in (self.state_prefix, self.analysis_prefix):
+            batch = []
+            for key in self.redis_client.scan_iter(f"{prefix}:*"):
+                batch.append(key)
+                if len(batch) >= self.cleanup_batch_size:
+                    count += self._reindex(batch)
+                    batch = []
+            count += self._reindex(batch)
+        return count
 
-    def _remove_from_metadata_index(self, key: str):
-        """Remove entry from metadata index"""
+    # =========================================================================
+    # Sorted-set indexes of legacy state/analysis keys
+    # =========================================================================
+
+    @staticmethod
+    def _doc_key(document_name: str) -> str:
+        return document_name.replace(" ", "_").replace(".", "_")
+
+    def _state_index(self, document_name: str = None, session_id: str = None) -> str:
+        """Index ZSET holding the states of a document and/or session"""
+        index_key = f"{self.index_prefix}:states"
+        if document_name:
+            index_key += f":doc:{self._doc_key(document_name)}"
+        if session_id:
+            index_key += f":session:{session_id}"
+        return index_key
+
+    def _analysis_index(
+        self, document_name: str = None, analysis_type: str = None
+    ) -> str:
+        """Index ZSET holding the analyses of a type and/or document"""
+        index_key = f"{self.index_prefix}:analyses"
+        if analysis_type:
+            index_key += f":type:{analysis_type}"
+        if document_name:
+            index_key += f":doc:{self._doc_key(document_name)}"
+        return index_key
+
+    def _indexes_for(self, metadata: Dict[str, Any]) -> List[str]:
+        """Every index ZSET an entry with this metadata belongs to"""
+        document_name = metadata.get("document_name")
+        if metadata.get("type") == "analysis":
+            analysis_type = metadata.get("analysis_type")
+            combinations = [(None, None), (document_name, None)]
+            combinations += [(None, analysis_type), (document_name, analysis_type)]
+            index = self._analysis_index
+        else:
+            session_id = metadata.get("session_id")
+            combinations = [(None, None), (document_name, None)]
+            combinations += [(None, session_id), (document_name, session_id)]
+            index = self._state_index
+        return list(dict.fromkeys(index(*c) for c in combinations))
+
+    def _scoped_indexes(self, metadata: Dict[str, Any]) -> List[str]:
+        """Indexes of one document or session, which expire with their entries"""
+        document_name = metadata.get("document_name")
+        if metadata.get("type") == "analysis":
+            if not document_name:
+                return []
+            analysis_type = metadata.get("analysis_type")
+            return list(
+                dict.fromkeys(
+                    [
+                        self._analysis_index(document_name),
+                        self._analysis_index(document_name, analysis_type),
+                    ]
+                )
+            )
+        session_id = metadata.get("session_id")
+        combinations = [(document_name, None), (None, session_id)]
+        combinations.append((document_name, session_id))
+        return list(
+            dict.fromkeys(self._state_index(*c) for c in combinations if c[0] or c[1])
+        )
+
+    def _add_to_indexes(
+        self,
+        key: str,
+        metadata: Dict[str, Any],
+        pipe,
+        score: float = None,
+        expiration: int = None,
+    ) -> None:
+        """
+        Queue ZADDs placing ``key`` in its indexes (scored by write time)
+
+        With an ``expiration``, members older than it are trimmed first and
+        the document/session indexes get the entry's TTL; without one those
+        indexes are made persistent again.
+        """
+        if score is None:
+            score = time.time()
+        index_keys = self._indexes_for(metadata)
+        for index_key in index_keys:
+            if expiration:
+                pipe.zremrangebyscore(index_key, "-inf", f"({score - expiration}")
+            pipe.zadd(index_key, {key: score})
+        for index_key in self._scoped_indexes(metadata):
+            if expiration:
+                pipe.expire(index_key, expiration)
+            else:
+                pipe.persist(index_key)
+        if metadata.get("document_name"):
+            pipe.zadd(self.documents_index, {metadata["document_name"]: score})
+
+    def _live_members(
+        self, index_key: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[str]:
+        """Page of index members whose key still exists, pruning expired ones"""
+        end = -1 if limit is None else offset + limit - 1
+        members = self.redis_client.zrange(index_key, offset, end)
+        return self._prune(index_key, members)
+
+    def _latest_member(self, index_key: str) -> Optional[str]:
+        """Highest-scored index member whose key still exists"""
+        while True:
+            members = self.redis_client.zrevrange(index_key, 0, self.LATEST_PROBE - 1)
+            if not members:
+                return None
+            live = self._prune(index_key, members)
+            if live:
+                return live[0]
+
+    def _prune(self, index_key: str, members: List[str]) -> List[str]:
+        """Drop members whose key has expired from the index; return the rest"""
+        if not members:
+            return []
+        pipe = self.redis_client.pipeline()
+        for member in members:
+            pipe.exists(member)
+        alive = pipe.execute()
+
+        dead = [m for m, exists in zip(members, alive) if not exists]
+        if dead:
+            self.redis_client.zrem(index_key, *dead)
+        return [m for m, exists in zip(members, alive) if exists]
+
+    def _delete_keys(self, keys: List[str]) -> int:
+        """Unlink entries with their metadata record and index membership"""
+        if not keys:
+            return 0
+        metadata_keys = [f"{self.metadata_prefix}:{key}" for key in keys]
+        # The small metadata records say which indexes hold a key; payloads
+        # are only fetched for entries whose record has expired
+        metadata = [
+            self._parse_metadata(record, wrapped=False)
+            for record in self.redis_client.mget(metadata_keys)
+        ]
+        missing = [i for i, m in enumerate(metadata) if m is None]
+        if missing:
+            values = self.redis_client.mget([keys[i] for i in missing])
+            for i, value in zip(missing, values):
+                metadata[i] = self._parse_metadata(value)
+
+        pipe = self.redis_client.pipeline()
+        pipe.unlink(*keys)
+        pipe.unlink(*metadata_keys)
+        for key, metadata in zip(keys, metadata):
+            if metadata is None:
+                # Owner unknown: at least drop it from the global index
+                is_analysis = key.startswith(f"{self.analysis_prefix}:")
+                metadata = {"type": "analysis" if is_analysis else "state"}
+            for index_key in self._indexes_for(metadata):
+                pipe.zrem(index_key, key)
+        return pipe.execute()[0]
+
+    def _clear(
+        self,
+        index_key: str,
+        pattern: str,
+        kind: str,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Delete the keys listed in an index plus unindexed keys matching a pattern"""
+        pacer = _CleanupPacer(self.cleanup_max_keys_per_second, kind, progress)
+        while True:
+            members = self.redis_client.zrange(
+                index_key, 0, self.cleanup_batch_size - 1
+            )
+            if not members:
+                break
+            deleted = self._delete_keys(members)
+            # Entries whose key expired are not removed by the delete above
+            self.redis_client.zrem(index_key, *members)
+            pacer.chunk_done(len(members), deleted)
+
+        batch = []
+        for key in self.redis_client.scan_iter(pattern, count=self.cleanup_batch_size):
+            batch.append(key)
+            if len(batch) >= self.cleanup_batch_size:
+                pacer.chunk_done(len(batch), self._delete_keys(batch))
+                batch = []
+        if batch:
+            pacer.chunk_done(len(batch), self._delete_keys(batch))
+        self._prune_documents()
+        return pacer.deleted
+
+    def _prune_documents(self) -> None:
+        """Drop documents without any indexed state or analysis"""
+        documents = self.redis_client.zrange(self.documents_index, 0, -1)
+        if not documents:
+            return
+        pipe = self.redis_client.pipeline()
+        for document_name in documents:
+            pipe.zcard(self._state_index(document_name))
+            pipe.zcard(self._analysis_index(document_name))
+        sizes = pipe.execute()
+        empty = [
+            document_name
+            for i, document_name in enumerate(documents)
+            if not sizes[2 * i] and not sizes[2 * i + 1]
+        ]
+        if empty:
+            self.redis_client.zrem(self.documents_index, *empty)
+
+    def _reindex(self, keys: List[str]) -> int:
+        """Add existing keys to their indexes, scored by their stored timestamp"""
+        if not keys:
+            return 0
+        pipe = self.redis_client.pipeline()
+        indexed = 0
+        for key, value in zip(keys, self.redis_client.mget(keys)):
+            metadata = self._parse_metadata(value)
+            if metadata is None:
+                continue
+            try:
+                score = datetime.fromisoformat(metadata["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                score = time.time()
+            self._add_to_indexes(key, metadata, pipe, score)
+            indexed += 1
+        pipe.execute()
+        return indexed
+
+    def _parse_metadata(self, value, wrapped: bool = True) -> Optional[Dict[str, Any]]:
+        """Metadata of a stored entry (or of a JSON metadata index record)"""
+        if not value:
+            return None
+        try:
+            parsed = self.codec.loads(value) if wrapped else json.loads(value)
+        except ValueError:
+            return None
+        if wrapped:
+            parsed = parsed.get("metadata") if isinstance(parsed, dict) else None
+        return parsed if isinstance(parsed, dict) else None
+
+    def _update_metadata_index(
+        self, key: str, metadata: Dict[str, Any], pipe, expiration: int = None
+    ):
+        """Queue the metadata record and sorted-set index entries of ``key``"""
         metadata_key = f"{self.metadata_prefix}:{key}"
-        self.redis_client.delete(metadata_key)
-
-    def _extract_document_names(self, keys: List[str]) -> List[str]:
-        """Extract document names from keys"""
-        documents = []
-        for key in keys:
-            parts = key.split(":")
-            if len(parts) >= 3:
-                # Extract document name (usually the 3rd part)
-                doc_part = parts[2]
-                if (
-                    not doc_part.isdigit() and len(doc_part) > 8
-                ):  # Not timestamp or UUID
-                    documents.append(doc_part.replace("_", " "))
-        return documents
+        # Kept as long as the entry, 24 hours for entries without expiration
+        pipe.set(metadata_key, json.dumps(metadata), ex=expiration or 86400)
+        self._add_to_indexes(key, metadata, pipe, expiration=expiration)
 
     def update_state(self, state_data: Dict[str, Any], state_key: str = None) -> str:
         """Update state data in Redis (alias for cache_state)"""
@@ -327,8 +621,7 @@ class StateCache:
         try:
             key = self._get_design_state_key(design_state.request_id)
 
-            # Serialize using Pydantic's model_dump_json for efficient JSON serialization
-            serialized = design_state.model_dump_json()
+            serialized = self.codec.dumps(design_state.model_dump(mode="json"))
 
             # Store with optional TTL
             self.redis_client.set(key, serialized, ex=ttl_seconds)
@@ -338,13 +631,7 @@ class StateCache:
             self.redis_client.hset(
                 index_key,
                 str(design_state.request_id),
-                json.dumps(
-                    {
-                        "status": design_state.status.value,
-                        "created_at": design_state.created_at.isoformat(),
-                        "updated_at": design_state.updated_at.isoformat(),
-                    }
-                ),
+                self._design_index_entry(design_state),
             )
 
             return True
@@ -352,6 +639,76 @@ class StateCache:
             print(f"Failed to cache DesignState: {e}")
             return False
 
+    def cache_design_states(
+        self,
+        design_states: List[DesignState],
+        ttl_seconds: Optional[int] = 86400,
+    ) -> bool:
+        """
+        Cache several DesignStates in one pipelined round trip.
+
+        Args:
+            design_states: DesignState objects to cache
+            ttl_seconds: Expiration time in seconds (None for no expiration)
+
+        Returns:
+            True if all states were cached
+        """
+        if not design_states:
+            return True
+        try:
+            pipe = self.redis_client.pipeline()
+            for design_state in design_states:
+                self.queue_design_state(pipe, design_state, ttl_seconds=ttl_seconds)
+            pipe.execute()
+            return True
+        except Exception as e:
+            print(f"Failed to cache DesignStates: {e}")
+            return False
+
+    def queue_design_state(
+        self,
+        pipe,
+        design_state: DesignState,
+        ttl_seconds: Optional[int] = 86400,
+    ) -> None:
+        """
+        Queue the writes of ``cache_design_state`` on a caller's pipeline.
+
+        Lets callers commit a DesignState together with their own keys in one
+        MULTI/EXEC transaction.
+
+        Args:
+            pipe: Redis pipeline (transactional for an atomic write)
+            design_state: DesignState object to cache
+            ttl_seconds: Expiration time in seconds (None for no expiration)
+        """
+        pipe.set(
+            self._get_design_state_key(design_state.request_id),
+            self.codec.dumps(design_state.model_dump(mode="json")),
+            ex=ttl_seconds,
+        )
+        pipe.hset(
+            f"{self.design_prefix}:index",
+            str(design_state.request_id),
+            self._design_index_entry(design_state),
+        )
+
+    def _design_index_entry(self, design_state: DesignState) -> str:
+        """Index record used by list_design_states."""
+        return json.dumps(
+            {
+                "status": design_state.status.value,
+                "created_at": design_state.created_at.isoformat(),
+                "updated_at": design_state.updated_at.isoformat(),
+                "completed_at": (
+                    design_state.completed_at.isoformat()
+                    if design_state.completed_at
+                    else None
+                ),
+            }
+        )
+
     def retrieve_design_state(self, request_id: UUID) -> Optional[DesignState]:
         """
         Retrieve DesignState with automatic Pydantic deserialization.
@@ -369,14 +726,43 @@ class StateCache:
             if not data:
                 return None
 
-            # Deserialize using Pydantic's model_validate_json
-            decoded = data.decode("utf-8") if isinstance(data, bytes) else data
-            return DesignState.model_validate_json(decoded)
+            return DesignState.model_validate(self.codec.loads(data))
 
         except Exception as e:
             print(f"Failed to retrieve DesignState: {e}")
             return None
 
+    def retrieve_design_states(self, request_ids: List[UUID]) -> Dict[str, DesignState]:
+        """
+        Retrieve several DesignStates with a single MGET.
+
+        Args:
+            request_ids: Design request IDs
+
+        Returns:
+            Mapping of request ID (as str) to DesignState; unknown IDs are omitted
+        """
+        if not request_ids:
+            return {}
+        try:
+            keys = [self._get_design_state_key(rid) for rid in request_ids]
+            values = self.redis_client.mget(keys)
+        except Exception as e:
+            print(f"Failed to retrieve DesignStates: {e}")
+            return {}
+
+        states = {}
+        for request_id, data in zip(request_ids, values):
+            if not data:
+                continue
+            try:
+                states[str(request_id)] = DesignState.model_validate(
+                    self.codec.loads(data)
+                )
+            except Exception as e:
+                print(f"Failed to parse DesignState {request_id}: {e}")
+        return states
+
     def update_design_state(
         self, design_state: DesignState, ttl_seconds: Optional[int] = 86400
     ) -> bool:
@@ -405,12 +791,10 @@ class StateCache:
             True if deleted successfully
         """
         try:
-            key = self._get_design_state_key(request_id)
-            self.redis_client.delete(key)
-
-            # Remove from index
-            index_key = f"{self.design_prefix}:index"
-            self.redis_client.hdel(index_key, str(request_id))
+            pipe = self.redis_client.pipeline()
+            pipe.unlink(self._get_design_state_key(request_id))
+            pipe.hdel(f"{self.design_prefix}:index", str(request_id))
+            pipe.execute()
 
             return True
         except Exception as e:
@@ -487,36 +871,122 @@ class StateCache:
             print(f"Failed to get TTL: {e}")
             return -2
 
-    def cleanup_completed_designs(self, older_than_hours: int = 24) -> int:
+    def cleanup_completed_designs(
+        self,
+        older_than_hours: int = 24,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
         """
         Cleanup completed designs older than specified hours.
 
+        Walks the design index with HSCAN and removes designs in pipelined
+        chunks, paced to ``cleanup_max_keys_per_second``.
+
         Args:
             older_than_hours: Delete designs completed more than this many hours ago
+            progress: Called with the running number of deleted designs
 
         Returns:
             Number of designs deleted
         """
         try:
-            deleted_count = 0
             cutoff_time = datetime.utcnow().timestamp() - (older_than_hours * 3600)
+            pacer = _CleanupPacer(self.cleanup_max_keys_per_second, "design", progress)
+            index_key = f"{self.design_prefix}:index"
 
-            # Get all completed designs
-            completed_ids = self.list_design_states(status=ExecutionStatus.COMPLETED)
-
-            for request_id in completed_ids:
-                state = self.retrieve_design_state(request_id)
-                if state and state.completed_at:
-                    if state.completed_at.timestamp() < cutoff_time:
-                        if self.delete_design_state(request_id):
-                            deleted_count += 1
+            batch = []
+            for request_id, metadata_str in self.redis_client.hscan_iter(
+                index_key, count=self.cleanup_batch_size
+            ):
+                try:
+                    metadata = json.loads(metadata_str)
+                except ValueError:
+                    continue
+                if metadata.get("status") != ExecutionStatus.COMPLETED.value:
+                    continue
+                batch.append((request_id, metadata.get("completed_at")))
+                if len(batch) >= self.cleanup_batch_size:
+                    self._delete_completed_designs(batch, cutoff_time, pacer)
+                    batch = []
+            if batch:
+                self._delete_completed_designs(batch, cutoff_time, pacer)
 
-            return deleted_count
+            return pacer.deleted
 
         except Exception as e:
             print(f"Failed to cleanup designs: {e}")
             return 0
 
+    def _delete_completed_designs(
+        self, candidates: List[tuple], cutoff_time: float, pacer: "_CleanupPacer"
+    ) -> None:
+        """Unlink the candidates completed before the cutoff in one pipeline."""
+        completed_at = dict(candidates)
+        # Index entries written before completed_at was recorded in them
+        unknown = [rid for rid, at in candidates if at is None]
+        stale = []
+        if unknown:
+            keys = [self._get_design_state_key(rid) for rid in unknown]
+            for request_id, data in zip(unknown, self.redis_client.mget(keys)):
+                if not data:
+                    stale.append(request_id)  # State expired, index entry remains
+                    continue
+                try:
+                    completed_at[request_id] = self.codec.loads(data).get(
+                        "completed_at"
+                    )
+                except (ValueError, AttributeError):
+                    continue
+
+        victims = []
+        for request_id, at in completed_at.items():
+            try:
+                if at and datetime.fromisoformat(at).timestamp() < cutoff_time:
+                    victims.append(request_id)
+            except (TypeError, ValueError):
+                continue
+
+        deleted = 0
+        if victims or stale:
+            pipe = self.redis_client.pipeline()
+            if victims:
+                pipe.unlink(*[self._get_design_state_key(rid) for rid in victims])
+            pipe.hdel(f"{self.design_prefix}:index", *(victims + stale))
+            results = pipe.execute()
+            # Index entries can outlive their (expired) states
+            deleted = results[0] if victims else 0
+        pacer.chunk_done(len(candidates), deleted)
+
     # =========================================================================
     # Legacy FreeCAD State Cache Methods (preserved for backwards compatibility)
     # =========================================================================
+
+
+class _CleanupPacer:
+    """Progress of a bulk delete, paced to a maximum key rate."""
+
+    def __init__(
+        self,
+        max_keys_per_second: float,
+        kind: str,
+        progress: Optional[Callable[[int], None]] = None,
+    ):
+        self.max_keys_per_second = max_keys_per_second
+        self.kind = kind
+        self.progress = progress
+        self.processed = 0
+        self.deleted = 0
+        self.started = time.monotonic()
+
+    def chunk_done(self, processed: int, deleted: int) -> None:
+        """Record a chunk, report progress and sleep if ahead of the rate cap."""
+        self.processed += processed
+        self.deleted += deleted
+        STATE_CACHE_CLEANUP_KEYS_TOTAL.labels(kind=self.kind).inc(deleted)
+        if self.progress is not None:
+            self.progress(self.deleted)
+        if self.max_keys_per_second > 0:
+            elapsed = time.monotonic() - self.started
+            delay = self.processed / self.max_keys_per_second - elapsed
+            if delay > 0:
+                time.sleep(delay)
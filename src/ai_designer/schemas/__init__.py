@@ -9,9 +9,15 @@ This package provides type-safe data structures for:
 """
 
 from ai_designer.schemas.api_schemas import (
+    DesignBatchCreateRequest,
+    DesignBatchItem,
+    DesignBatchResponse,
+    DesignBulkStatusRequest,
+    DesignBulkStatusResponse,
     DesignCreateRequest,
     DesignResponse,
     DesignStatusResponse,
+    DesignSummary,
 )
 from ai_designer.schemas.design_state import (
     AgentType,
@@ -69,4 +75,10 @@ __all__ = [
     "DesignCreateRequest",
     "DesignResponse",
     "DesignStatusResponse",
+    "DesignBatchCreateRequest",
+    "DesignBatchItem",
+    "DesignBatchResponse",
+    "DesignSummary",
+    "DesignBulkStatusRequest",
+    "DesignBulkStatusResponse",
 ]
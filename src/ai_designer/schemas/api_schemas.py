@@ -6,9 +6,9 @@ for API request/response structures that can be shared across routes and tests.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from ai_designer.schemas.design_state import ExecutionStatus
 
@@ -38,6 +38,95 @@ class DesignCreateRequest(BaseModel):
     )
 
 
+# Upper bound on designs per batch submission or bulk status query
+MAX_BATCH_SIZE = 500
+
+
+class DesignBatchCreateRequest(BaseModel):
+    """Request to create many designs that share the same options."""
+
+    prompts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Design prompts; identical prompts are submitted once",
+    )
+    max_iterations: int = Field(
+        default=5,
+        ge=1,
+        le=10,
+        description="Maximum refinement iterations (applies to every prompt)",
+    )
+    enable_execution: bool = Field(
+        default=True,
+        description="Whether to execute generated scripts in FreeCAD",
+    )
+
+    @field_validator("prompts")
+    @classmethod
+    def validate_prompts(cls, prompts: List[str]) -> List[str]:
+        """Apply the single-design prompt length limits to every prompt."""
+        for index, prompt in enumerate(prompts):
+            if not 10 <= len(prompt) <= 5000:
+                raise ValueError(
+                    f"prompts[{index}] must be between 10 and 5000 characters"
+                )
+        return prompts
+
+
+class DesignBatchItem(BaseModel):
+    """Outcome for one prompt of a batch submission."""
+
+    index: int = Field(..., description="Position of the prompt in the request")
+    request_id: Optional[str] = Field(
+        None, description="Design request ID (None if the prompt was rejected)"
+    )
+    accepted: bool = Field(..., description="Whether the prompt was queued")
+    duplicate_of: Optional[int] = Field(
+        None, description="Index of the identical prompt this one shares a design with"
+    )
+    degraded: bool = Field(False, description="Admitted in degraded mode")
+    retry_after_seconds: Optional[int] = Field(
+        None, description="When to resubmit a rejected prompt"
+    )
+
+
+class DesignBatchResponse(BaseModel):
+    """Response after submitting a batch of design requests."""
+
+    items: List[DesignBatchItem] = Field(..., description="One entry per prompt")
+    accepted: int = Field(..., description="Number of designs queued")
+    rejected: int = Field(..., description="Number of designs shed by admission")
+    created_at: datetime = Field(..., description="Batch creation timestamp")
+
+
+class DesignSummary(BaseModel):
+    """Compact status of a design for bulk polling."""
+
+    request_id: str
+    status: ExecutionStatus
+    current_iteration: int
+    max_iterations: int
+    updated_at: datetime
+    validation_score: Optional[float] = None
+    error_message: Optional[str] = None
+
+
+class DesignBulkStatusRequest(BaseModel):
+    """Body of a bulk status query."""
+
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class DesignBulkStatusResponse(BaseModel):
+    """Compact status of many designs."""
+
+    designs: List[DesignSummary] = Field(..., description="Known designs, in order")
+    missing: List[str] = Field(
+        default_factory=list, description="Requested IDs that were not found"
+    )
+
+
 class DesignResponse(BaseModel):
     """Response after submitting a design request."""
 
@@ -5,6 +5,7 @@ This module contains high-level services that integrate various components
 of the system to provide comprehensive functionality.
 """
 
+from .state_history import StateHistory
 from .state_service import FreeCADStateService
 
-__all__ = ["FreeCADStateService"]
+__all__ = ["FreeCADStateService", "StateHistory"]
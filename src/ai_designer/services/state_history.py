@@ -0,0 +1,389 @@
+"""
+Delta-encoded history of FreeCAD state checkpoints.
+
+Checkpoints used to be stored as one full snapshot each, although most steps
+only add or change a few objects.  The history of a document/session pair
+is now one Redis list: every ``snapshot_interval``-th entry holds a full
+snapshot and the entries in between hold the field-level delta from the
+previous state (``freecad.state_diff.compute_state_delta``).
+
+Any state is rebuilt from the snapshot at or before it plus at most
+``snapshot_interval - 1`` deltas, all fetched with a single LRANGE; reading
+the last N states replays one range the same way.  Point-in-time lookups go
+through a sorted set of entry times.
+
+Long sessions are capped at ``max_entries``: once a history grows past it,
+the oldest whole snapshot blocks are trimmed (LTRIM), so the list always
+starts with a snapshot.  Sequence numbers and entry keys stay stable; the
+sequence of the first remaining entry is kept in ``{stream}:offset``.
+
+Redis layout (``{stream}`` = ``freecad:history:{document}:{session}``)
+----------------------------------------------------------------------
+{stream}                           list of encoded entries,
+                                   index = sequence - offset
+{stream}:offset                    sequence of the first entry (default 0)
+{stream}:times                     zset of sequence -> unix time
+freecad:index:history[:doc:{d}|:session:{s}]   zsets of streams by last write
+
+Entry keys have the form ``{stream}#{sequence}``.
+
+Configuration (env vars or constructor kwargs)
+----------------------------------------------
+STATE_HISTORY_SNAPSHOT_INTERVAL   int, default 20 (entries per full snapshot)
+STATE_HISTORY_TTL_SECONDS         int, default 86400 (0 = keep forever)
+STATE_HISTORY_MAX_ENTRIES         int, default 1000 (0 = unbounded; at least
+                                  one snapshot interval)
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+from ..freecad.state_diff import apply_state_delta, compute_state_delta
+from ..redis_utils.state_cache import StateCache
+
+logger = logging.getLogger(__name__)
+
+# ── Config ────────────────────────────────────────────────────────────────────
+_SNAPSHOT_INTERVAL: int = int(os.getenv("STATE_HISTORY_SNAPSHOT_INTERVAL", "20"))
+_TTL_SECONDS: int = int(os.getenv("STATE_HISTORY_TTL_SECONDS", "86400"))
+_MAX_ENTRIES: int = int(os.getenv("STATE_HISTORY_MAX_ENTRIES", "1000"))
+
+# Latest state of recently written streams, so appends rarely read Redis
+_MAX_CACHED_HEADS = 64
+
+
+class StateHistory:
+    """Append-only, delta-encoded state history per document/session."""
+
+    def __init__(
+        self,
+        state_cache: StateCache,
+        snapshot_interval: int = _SNAPSHOT_INTERVAL,
+        ttl_seconds: int = _TTL_SECONDS,
+        max_entries: int = _MAX_ENTRIES,
+    ):
+        """
+        Initialize the history store.
+
+        Args:
+            state_cache: State cache whose Redis client and codec are used
+            snapshot_interval: Write a full snapshot every this many entries
+            ttl_seconds: Expiration of a history after its last write
+                (0 = never expire)
+            max_entries: Entries kept per history, trimmed oldest first in
+                whole snapshot blocks (0 = unbounded)
+        """
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")
+        self.redis_client = state_cache.redis_client
+        self.codec = state_cache.codec
+        self.prefix = f"{state_cache.key_prefix}:history"
+        self.index_prefix = f"{state_cache.index_prefix}:history"
+        self.snapshot_interval = snapshot_interval
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(max_entries, snapshot_interval) if max_entries else 0
+        self._heads: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def append(
+        self,
+        state: Dict[str, Any],
+        document_name: str = None,
+        session_id: str = None,
+        label: str = None,
+        expiration: Optional[int] = None,
+    ) -> str:
+        """
+        Record a state checkpoint.
+
+        Concurrent writers to the same history are serialized with
+        WATCH/MULTI, so every delta is computed against the real predecessor.
+        Past ``max_entries`` the oldest snapshot blocks are trimmed.
+
+        Args:
+            state: State snapshot (JSON-compatible)
+            document_name: Name of the FreeCAD document
+            session_id: Session identifier
+            label: Checkpoint name (e.g. "after_step_3")
+            expiration: Expiration in seconds (None = ``ttl_seconds``)
+
+        Returns:
+            Key of the new entry
+        """
+        stream = self._stream_key(document_name, session_id)
+        offset_key = f"{stream}:offset"
+        ttl = self.ttl_seconds if expiration is None else expiration
+        state = copy.deepcopy(state)
+
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(stream, offset_key)
+                    offset = int(pipe.get(offset_key) or 0)
+                    length = pipe.llen(stream)
+                    seq = offset + length
+                    now = time.time()
+                    entry = self._make_entry(
+                        stream, seq, state, document_name, session_id, label
+                    )
+
+                    pipe.multi()
+                    pipe.rpush(stream, self.codec.dumps(entry))
+                    pipe.zadd(f"{stream}:times", {str(seq): now})
+                    drop = self._trim_count(length + 1)
+                    if drop:
+                        pipe.ltrim(stream, drop, -1)
+                        pipe.incrby(offset_key, drop)
+                        pipe.zrem(
+                            f"{stream}:times",
+                            *[str(old) for old in range(offset, offset + drop)],
+                        )
+                    if ttl:
+                        pipe.expire(stream, ttl)
+                        pipe.expire(f"{stream}:times", ttl)
+                        pipe.expire(offset_key, ttl)
+                    for index_key in self._stream_indexes(document_name, session_id):
+                        pipe.zadd(index_key, {stream: now})
+                    pipe.execute()
+                    break
+                except WatchError:
+                    logger.debug(f"Concurrent append to {stream}, retrying")
+
+        self._remember(stream, seq, state)
+        return self._entry_key(stream, seq)
+
+    def _trim_count(self, length: int) -> int:
+        """Entries to drop from the front of a list of ``length`` entries."""
+        if not self.max_entries or length <= self.max_entries:
+            return 0
+        # Whole snapshot blocks, so the list still starts with a snapshot
+        blocks = -(-(length - self.max_entries) // self.snapshot_interval)
+        return blocks * self.snapshot_interval
+
+    def _make_entry(
+        self,
+        stream: str,
+        seq: int,
+        state: Dict[str, Any],
+        document_name: Optional[str],
+        session_id: Optional[str],
+        label: Optional[str],
+    ) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "metadata": {"timestamp": datetime.now().isoformat(), "label": label}
+        }
+        previous = self._head(stream, seq - 1) if seq else None
+        if previous is None or seq % self.snapshot_interval == 0:
+            entry["state"] = state
+            # Deltas inherit the rest of their metadata from the snapshot
+            entry["metadata"].update(
+                document_name=document_name, session_id=session_id, type="state"
+            )
+        else:
+            entry["delta"] = compute_state_delta(previous, state)
+        return entry
+
+    def _head(self, stream: str, seq: int) -> Optional[Dict[str, Any]]:
+        """State at ``seq``, from the local cache when it is current."""
+        with self._lock:
+            cached = self._heads.get(stream)
+        if cached is not None and cached[0] == seq:
+            return cached[1]
+        entries = self._replay(stream, seq, seq)
+        return entries[0]["state"] if entries else None
+
+    def _remember(self, stream: str, seq: int, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self._heads[stream] = (seq, state)
+            self._heads.move_to_end(stream)
+            while len(self._heads) > _MAX_CACHED_HEADS:
+                self._heads.popitem(last=False)
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def is_history_key(self, key: str) -> bool:
+        """True if ``key`` names an entry of this store."""
+        return key.startswith(f"{self.prefix}:") and "#" in key
+
+    def get(self, entry_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the state recorded under an entry key.
+
+        Returns:
+            The state, or None if the entry does not exist (or expired)
+        """
+        stream, _, seq = entry_key.rpartition("#")
+        try:
+            seq = int(seq)
+        except ValueError:
+            return None
+        entries = self._replay(stream, seq, seq)
+        return entries[0]["state"] if entries else None
+
+    def latest(
+        self, document_name: str = None, session_id: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Most recent entry of the most recently written matching history.
+
+        Returns:
+            ``{"key", "state", "metadata"}`` or None
+        """
+        entries = self.history(document_name, session_id, limit=1)
+        return entries[0] if entries else None
+
+    def history(
+        self, document_name: str = None, session_id: str = None, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Last ``limit`` entries of a history, most recent first.
+
+        Without both a document and a session, the most recently written
+        history matching the given filter is used.
+
+        Returns:
+            List of ``{"key", "state", "metadata"}`` dicts
+        """
+        stream = self._resolve_stream(document_name, session_id)
+        if stream is None or limit <= 0:
+            return []
+        pipe = self.redis_client.pipeline()
+        pipe.get(f"{stream}:offset")
+        pipe.llen(stream)
+        offset, length = pipe.execute()
+        if not length:
+            return []
+        offset = int(offset or 0)
+        last = offset + length - 1
+        entries = self._replay(stream, max(offset, last - limit + 1), last, offset)
+        return list(reversed(entries))
+
+    def state_at(
+        self, timestamp: float, document_name: str = None, session_id: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Entry that was current at a point in time.
+
+        Args:
+            timestamp: Unix time
+            document_name: Name of the FreeCAD document
+            session_id: Session identifier
+
+        Returns:
+            ``{"key", "state", "metadata"}`` of the last entry written at or
+            before ``timestamp``, or None
+        """
+        stream = self._resolve_stream(document_name, session_id)
+        if stream is None:
+            return None
+        found = self.redis_client.zrevrangebyscore(
+            f"{stream}:times", timestamp, "-inf", start=0, num=1
+        )
+        if not found:
+            return None
+        entries = self._replay(stream, int(found[0]), int(found[0]))
+        return entries[0] if entries else None
+
+    def delete(self, document_name: str = None, session_id: str = None) -> bool:
+        """Delete a whole history."""
+        stream = self._stream_key(document_name, session_id)
+        pipe = self.redis_client.pipeline()
+        pipe.delete(stream, f"{stream}:times", f"{stream}:offset")
+        for index_key in self._stream_indexes(document_name, session_id):
+            pipe.zrem(index_key, stream)
+        deleted = pipe.execute()[0]
+        with self._lock:
+            self._heads.pop(stream, None)
+        return bool(deleted)
+
+    def _replay(
+        self, stream: str, start: int, end: int, offset: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Rebuild entries ``start``..``end`` from the snapshot at or before start."""
+        if offset is None:
+            offset = int(self.redis_client.get(f"{stream}:offset") or 0)
+        start = max(start, offset)
+        if end < start:
+            return []
+        base = start - start % self.snapshot_interval
+        raw_entries = self.redis_client.lrange(stream, base - offset, end - offset)
+
+        entries = []
+        state: Optional[Dict[str, Any]] = None
+        snapshot_metadata: Dict[str, Any] = {}
+        for seq, raw in enumerate(raw_entries, start=base):
+            try:
+                entry = self.codec.loads(raw)
+            except ValueError as e:
+                logger.warning(f"Unreadable history entry {stream}#{seq}: {e}")
+                return entries
+            if "state" in entry:
+                state = entry["state"]
+                snapshot_metadata = entry.get("metadata", {})
+            elif state is None:
+                logger.warning(f"History {stream} has no snapshot before #{seq}")
+                return entries
+            else:
+                state = apply_state_delta(state, entry["delta"])
+            if seq >= start:
+                key = self._entry_key(stream, seq)
+                metadata = {**snapshot_metadata, **entry.get("metadata", {})}
+                metadata["key"] = key
+                entries.append({"key": key, "state": state, "metadata": metadata})
+        return entries
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _doc_key(document_name: str) -> str:
+        return document_name.replace(" ", "_").replace(".", "_")
+
+    def _stream_key(self, document_name: str = None, session_id: str = None) -> str:
+        doc_key = self._doc_key(document_name) if document_name else "-"
+        return f"{self.prefix}:{doc_key}:{session_id or '-'}"
+
+    @staticmethod
+    def _entry_key(stream: str, seq: int) -> str:
+        return f"{stream}#{seq}"
+
+    def _stream_indexes(
+        self, document_name: str = None, session_id: str = None
+    ) -> List[str]:
+        """Index zsets a history is listed in."""
+        indexes = [self.index_prefix]
+        if document_name:
+            indexes.append(f"{self.index_prefix}:doc:{self._doc_key(document_name)}")
+        if session_id:
+            indexes.append(f"{self.index_prefix}:session:{session_id}")
+        return indexes
+
+    def _resolve_stream(
+        self, document_name: str = None, session_id: str = None
+    ) -> Optional[str]:
+        """History to read for a (possibly partial) document/session filter."""
+        if document_name and session_id:
+            return self._stream_key(document_name, session_id)
+
+        index_key = self._stream_indexes(document_name, session_id)[-1]
+        while True:
+            streams = self.redis_client.zrevrange(index_key, 0, 9)
+            if not streams:
+                return None
+            pipe = self.redis_client.pipeline()
+            for stream in streams:
+                pipe.exists(stream)
+            alive = pipe.execute()
+            for stream, exists in zip(streams, alive):
+                if exists:
+                    return stream
+            self.redis_client.zrem(index_key, *streams)
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Union
 from ..freecad.state_manager import FreeCADStateAnalyzer
 from ..redis_utils.client import RedisClient
 from ..redis_utils.state_cache import StateCache
+from .state_history import StateHistory
 
 
 class FreeCADStateService:
@@ -21,7 +22,7 @@ class FreeCADStateService:
 
     This service provides:
     - Document state analysis and caching
-    - Historical state tracking
+    - Historical state tracking (delta-encoded, see StateHistory)
     - State comparison and monitoring
     - Easy retrieval and management of cached states
     """
@@ -41,6 +42,7 @@ class FreeCADStateService:
         # Initialize Redis client and connect
         self.redis_client = RedisClient(redis_host, redis_port, redis_db)
         self.state_cache = StateCache(self.redis_client)
+        self.state_history = StateHistory(self.state_cache)
         self.state_analyzer = FreeCADStateAnalyzer(api_client)
         self.connected = False
 
@@ -97,10 +99,10 @@ class FreeCADStateService:
             expiration=expiration,
         )
 
-        # Cache individual state components for quick access
+        # Record the state in the document/session history (stored as a delta)
         if "analysis" in analysis_result:
-            state_key = self.state_cache.cache_state(
-                state_data=analysis_result["analysis"],
+            state_key = self.state_history.append(
+                analysis_result["analysis"],
                 document_name=document_name,
                 session_id=session_id,
                 expiration=expiration,
@@ -124,11 +126,32 @@ class FreeCADStateService:
         if not self.connected:
             raise ConnectionError("Not connected to Redis")
 
+        latest = self.state_history.latest(document_name, session_id)
+        if latest:
+            return latest["state"]
+
+        # Snapshots cached before the delta-encoded history existed
         latest_key = self.state_cache.get_latest_state(document_name, session_id)
         if latest_key:
             return self.state_cache.retrieve_state(latest_key)
         return None
 
+    def get_state_at(
+        self, timestamp: float, document_name: str = None, session_id: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the state of a document/session as it was at a unix time"""
+        if not self.connected:
+            raise ConnectionError("Not connected to Redis")
+
+        entry = self.state_history.state_at(timestamp, document_name, session_id)
+        return entry["state"] if entry else None
+
+    def _retrieve_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a history entry or a legacy cached state by key"""
+        if self.state_history.is_history_key(key):
+            return self.state_history.get(key)
+        return self.state_cache.retrieve_state(key)
+
     def get_current_analysis(
         self, document_name: str = None
     ) -> Optional[Dict[str, Any]]:
@@ -146,10 +169,15 @@ class FreeCADStateService:
     def get_state_history(
         self, document_name: str = None, session_id: str = None, limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """Get historical states for a document/session"""
+        """Get historical states for a document/session, most recent first"""
         if not self.connected:
             raise ConnectionError("Not connected to Redis")
 
+        history = self.state_history.history(document_name, session_id, limit)
+        if history:
+            return history
+
+        # Snapshots cached before the delta-encoded history existed
         keys = self.state_cache.list_states(document_name, session_id)
 
         # Get the most recent entries (up to limit)
@@ -174,8 +202,8 @@ class FreeCADStateService:
         if not self.connected:
             raise ConnectionError("Not connected to Redis")
 
-        state1 = self.state_cache.retrieve_state(key1)
-        state2 = self.state_cache.retrieve_state(key2)
+        state1 = self._retrieve_state(key1)
+        state2 = self._retrieve_state(key2)
 
         if not state1 or not state2:
             return {"error": "One or both states not found"}
@@ -0,0 +1,114 @@
+"""
+Tests for export downloads: ranges, conditional requests and precompressed variants.
+"""
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ai_designer.api.deps import get_export_job_manager
+from ai_designer.api.routes import design
+from ai_designer.export.artifacts import prepare_artifact
+from ai_designer.export.jobs import ExportJob, ExportJobStatus
+
+
+class FixedJobs:
+    """Export job manager stand-in holding one finished job."""
+
+    def __init__(self, job):
+        self.job = job
+
+    def get(self, job_id):
+        return self.job if job_id == self.job.job_id else None
+
+    async def fetch(self, job_id):
+        return self.get(job_id)
+
+
+@pytest.fixture
+def stl_file(tmp_path):
+    path = tmp_path / "part.stl"
+    path.write_text("facet normal 0 0 1\n  outer loop\n  endloop\nendfacet\n" * 200)
+    prepare_artifact(path)
+    return path
+
+
+@pytest.fixture
+def client(stl_file):
+    job = ExportJob(
+        job_id="job1",
+        request_id=str(uuid4()),
+        format="stl",
+        status=ExportJobStatus.SUCCEEDED,
+        file_path=str(stl_file),
+    )
+    app = FastAPI()
+    app.include_router(design.router)
+    app.dependency_overrides[get_export_job_manager] = lambda: FixedJobs(job)
+    return TestClient(app)
+
+
+URL = "/exports/job1/download"
+
+
+class TestArtifactDownloads:
+    """Test GET /exports/{job_id}/download"""
+
+    def test_identity_download(self, client, stl_file):
+        response = client.get(URL, headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.content == stl_file.read_bytes()
+        assert "content-encoding" not in response.headers
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert not response.headers["etag"].startswith("W/")
+
+    def test_precompressed_gzip(self, client, stl_file):
+        response = client.get(URL, headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < stl_file.stat().st_size
+        # httpx transparently decodes the body
+        assert response.content == stl_file.read_bytes()
+
+    def test_not_modified(self, client):
+        etag = client.get(URL, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+        response = client.get(
+            URL, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+        # The identity representation has a different ETag
+        response = client.get(
+            URL, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+    def test_range_request(self, client, stl_file):
+        response = client.get(
+            URL, headers={"Accept-Encoding": "identity", "Range": "bytes=10-19"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == stl_file.read_bytes()[10:20]
+        assert response.headers["content-range"] == (
+            f"bytes 10-19/{stl_file.stat().st_size}"
+        )
+
+    def test_stale_if_range_sends_full_file(self, client, stl_file):
+        response = client.get(
+            URL,
+            headers={
+                "Accept-Encoding": "identity",
+                "Range": "bytes=10-19",
+                "If-Range": '"outdated"',
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.content == stl_file.read_bytes()
@@ -0,0 +1,165 @@
+"""
+Tests for batch design submission and bulk status endpoints.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, Request, Response
+from pydantic import ValidationError
+
+from ai_designer.api.routes import design
+from ai_designer.core.admission import AdmissionController
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.design_store import DesignStore
+from ai_designer.redis_utils.state_cache import StateCache
+from ai_designer.schemas.api_schemas import (
+    DesignBatchCreateRequest,
+    DesignBulkStatusRequest,
+)
+from ai_designer.schemas.design_state import DesignState, ExecutionStatus
+
+
+@pytest.fixture
+def store(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return DesignStore(state_cache=StateCache(client))
+
+
+@pytest.fixture
+def pipeline():
+    mock = MagicMock()
+    mock.execute = AsyncMock()
+    return mock
+
+
+async def submit(prompts, store, pipeline, admission=None):
+    background_tasks = BackgroundTasks()
+    result = await design.create_design_batch(
+        DesignBatchCreateRequest(prompts=prompts),
+        background_tasks,
+        Response(),
+        Request({"type": "http", "headers": [], "client": ("10.0.0.1", 1234)}),
+        pipeline=pipeline,
+        admission=admission or AdmissionController(enabled=False),
+        store=store,
+        export_jobs=None,
+    )
+    return result, background_tasks
+
+
+class TestBatchSubmission:
+    """Test POST /designs:batch"""
+
+    @pytest.mark.asyncio
+    async def test_creates_one_design_per_distinct_prompt(self, store, pipeline):
+        result, background_tasks = await submit(
+            [
+                "Create a 10x10x10mm cube",
+                "Create a cylinder radius 5 height 20",
+                "Create  a 10x10x10mm cube ",
+            ],
+            store,
+            pipeline,
+        )
+
+        assert result.accepted == 2
+        assert result.rejected == 0
+        assert [item.index for item in result.items] == [0, 1, 2]
+        assert result.items[2].duplicate_of == 0
+        assert result.items[2].request_id == result.items[0].request_id
+        assert len(background_tasks.tasks) == 1
+
+        stored = store.get_many([item.request_id for item in result.items])
+        assert len(stored) == 2
+        assert all(s.status == ExecutionStatus.PENDING for s in stored.values())
+
+    @pytest.mark.asyncio
+    async def test_partial_admission(self, store, pipeline):
+        admission = AdmissionController(max_in_flight=1)
+
+        result, _ = await submit(
+            ["Create a 10x10x10mm cube", "Create a sphere radius 10mm"],
+            store,
+            pipeline,
+            admission,
+        )
+
+        assert result.accepted == 1
+        assert result.rejected == 1
+        assert result.items[1].request_id is None
+        assert result.items[1].retry_after_seconds >= 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_batch_when_nothing_admitted(self, store, pipeline):
+        admission = AdmissionController(max_in_flight=0)
+
+        with pytest.raises(HTTPException) as exc:
+            await submit(["Create a 10x10x10mm cube"], store, pipeline, admission)
+
+        assert exc.value.status_code == 503
+        assert "Retry-After" in exc.value.headers
+
+    @pytest.mark.asyncio
+    async def test_background_task_runs_every_design(self, store, pipeline):
+        pipeline.execute.side_effect = lambda request, **kwargs: DesignState(
+            request_id=request.request_id,
+            user_prompt=request.user_prompt,
+            status=ExecutionStatus.COMPLETED,
+        )
+        result, background_tasks = await submit(
+            ["Create a 10x10x10mm cube", "Create a sphere radius 10mm"],
+            store,
+            pipeline,
+        )
+
+        await background_tasks()
+
+        assert pipeline.execute.await_count == 2
+        stored = store.get_many([item.request_id for item in result.items])
+        assert all(s.status == ExecutionStatus.COMPLETED for s in stored.values())
+
+    def test_prompt_length_validated(self):
+        with pytest.raises(ValidationError):
+            DesignBatchCreateRequest(prompts=["Create a 10x10x10mm cube", "short"])
+
+
+class TestBulkStatus:
+    """Test GET /designs and POST /designs:query"""
+
+    @pytest.mark.asyncio
+    async def test_returns_known_designs_in_order(self, store):
+        states = [DesignState(request_id=uuid4(), user_prompt="p") for _ in range(2)]
+        states[1].mark_failed("boom")
+        store.save_many(states)
+        unknown = str(uuid4())
+        ids = [str(states[1].request_id), unknown, str(states[0].request_id)]
+
+        result = await design.get_design_statuses(ids=[",".join(ids)], store=store)
+
+        assert [d.request_id for d in result.designs] == [ids[0], ids[2]]
+        assert result.designs[0].error_message == "boom"
+        assert result.missing == [unknown]
+
+    @pytest.mark.asyncio
+    async def test_query_body_variant(self, store):
+        state = DesignState(request_id=uuid4(), user_prompt="p")
+        store.save(state)
+
+        result = await design.query_design_statuses(
+            DesignBulkStatusRequest(ids=[str(state.request_id)] * 2), store=store
+        )
+
+        assert len(result.designs) == 1
+        assert result.designs[0].status == ExecutionStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_too_many_ids(self, store):
+        ids = [str(uuid4()) for _ in range(design.MAX_BATCH_SIZE + 1)]
+
+        with pytest.raises(HTTPException) as exc:
+            await design.get_design_statuses(ids=ids, store=store)
+
+        assert exc.value.status_code == 400
@@ -0,0 +1,319 @@
+"""
+Tests for the Server-Sent Events design progress stream.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+from fastapi import HTTPException
+
+from ai_designer.api.routes import design, events
+from ai_designer.redis_utils.audit import AuditEventType, AuditLogger
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.design_store import DesignStore
+from ai_designer.schemas.design_state import DesignState, ExecutionStatus
+
+
+class FakeRequest:
+    """Request stand-in that can simulate a client disconnect."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.fixture
+def audit_logger():
+    """Logger whose sync and asyncio clients share one fake server."""
+    server = fakeredis.FakeServer()
+    client = RedisClient()
+    client.connection = fakeredis.FakeRedis(server=server)
+    client.async_connection = aioredis.FakeRedis(server=server)
+    return AuditLogger(client, enable_pubsub=False)
+
+
+@pytest.fixture
+def request_id():
+    return uuid4()
+
+
+def log(audit_logger, request_id, event_type, message="step"):
+    return audit_logger.log_event(event_type, request_id, message)
+
+
+def parse_frames(chunks):
+    """Return (id, event, data) for every event frame."""
+    frames = []
+    for chunk in chunks:
+        fields = dict(
+            line.split(": ", 1)
+            for line in chunk.strip().splitlines()
+            if not line.startswith(":") and ": " in line
+        )
+        if "event" in fields:
+            frames.append((fields.get("id"), fields["event"], fields.get("data")))
+    return frames
+
+
+async def collect(stream, limit=50):
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        if len(chunks) >= limit:
+            break
+    return chunks
+
+
+def running_store(request_id):
+    """In-process store holding a design that is still being processed."""
+    store = DesignStore()
+    store.save(
+        DesignState(
+            request_id=request_id,
+            user_prompt="Create a box",
+            status=ExecutionStatus.GENERATING,
+        )
+    )
+    return store
+
+
+def open_stream(audit_logger, request_id, cursor=None, request=None, store=None):
+    slot = events._acquire_slot()
+    assert slot is not None
+    return events._event_stream(
+        request or FakeRequest(),
+        store or running_store(request_id),
+        audit_logger,
+        str(request_id),
+        cursor,
+        slot,
+    )
+
+
+class TestEventStream:
+    """Test replay, resume and live tailing"""
+
+    @pytest.mark.asyncio
+    async def test_replays_history_and_ends_on_terminal_event(
+        self, audit_logger, request_id
+    ):
+        first = log(audit_logger, request_id, AuditEventType.PIPELINE_STARTED)
+        log(audit_logger, request_id, AuditEventType.PLAN_GENERATED)
+        log(audit_logger, request_id, AuditEventType.PIPELINE_COMPLETED)
+
+        chunks = await collect(open_stream(audit_logger, request_id))
+
+        assert chunks[0].startswith("retry:")
+        frames = parse_frames(chunks)
+        assert [f[1] for f in frames] == [
+            "pipeline_started",
+            "plan_generated",
+            "pipeline_completed",
+        ]
+        assert frames[0][0] == first
+        assert json.loads(frames[0][2])["request_id"] == str(request_id)
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_event_id(self, audit_logger, request_id):
+        log(audit_logger, request_id, AuditEventType.PIPELINE_STARTED)
+        seen = log(audit_logger, request_id, AuditEventType.PLAN_GENERATED)
+        log(audit_logger, request_id, AuditEventType.PIPELINE_FAILED)
+
+        chunks = await collect(open_stream(audit_logger, request_id, cursor=seen))
+
+        assert [f[1] for f in parse_frames(chunks)] == ["pipeline_failed"]
+
+    @pytest.mark.asyncio
+    async def test_replays_in_batches(self, audit_logger, request_id, monkeypatch):
+        monkeypatch.setattr(events, "_BATCH_SIZE", 2)
+        for _ in range(5):
+            log(audit_logger, request_id, AuditEventType.NODE_STARTED)
+        log(audit_logger, request_id, AuditEventType.PIPELINE_COMPLETED)
+
+        chunks = await collect(open_stream(audit_logger, request_id))
+
+        assert len(parse_frames(chunks)) == 6
+
+    @pytest.mark.asyncio
+    async def test_tails_live_events_with_heartbeats(
+        self, audit_logger, request_id, monkeypatch
+    ):
+        monkeypatch.setattr(events, "_HEARTBEAT_SECONDS", 0.05)
+        log(audit_logger, request_id, AuditEventType.PIPELINE_STARTED)
+
+        async def finish_later():
+            await asyncio.sleep(0.2)
+            log(audit_logger, request_id, AuditEventType.PIPELINE_COMPLETED)
+
+        writer = asyncio.create_task(finish_later())
+        chunks = await asyncio.wait_for(
+            collect(open_stream(audit_logger, request_id)), timeout=5
+        )
+        await writer
+
+        assert ": heartbeat\n\n" in chunks
+        assert [f[1] for f in parse_frames(chunks)] == [
+            "pipeline_started",
+            "pipeline_completed",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_client_disconnects(self, audit_logger, request_id):
+        request = FakeRequest()
+        request.disconnected = True
+        log(audit_logger, request_id, AuditEventType.PIPELINE_STARTED)
+
+        chunks = await collect(open_stream(audit_logger, request_id, request=request))
+
+        assert [f[1] for f in parse_frames(chunks)] == ["pipeline_started"]
+
+    @pytest.mark.asyncio
+    async def test_stops_tailing_once_design_finished(
+        self, audit_logger, request_id, monkeypatch
+    ):
+        monkeypatch.setattr(events, "_HEARTBEAT_SECONDS", 0.05)
+        log(audit_logger, request_id, AuditEventType.PIPELINE_STARTED)
+        store = running_store(request_id)
+
+        async def finish_without_event():
+            await asyncio.sleep(0.1)
+            state = store.get(str(request_id))
+            state.mark_failed("Worker crashed")
+            store.save(state)
+
+        task = asyncio.create_task(finish_without_event())
+        chunks = await asyncio.wait_for(
+            collect(open_stream(audit_logger, request_id, store=store)), timeout=5
+        )
+        await task
+
+        assert [f[1] for f in parse_frames(chunks)] == ["pipeline_started"]
+
+    @pytest.mark.asyncio
+    async def test_stream_releases_slot(self, audit_logger, request_id):
+        log(audit_logger, request_id, AuditEventType.PIPELINE_COMPLETED)
+        before = events._active_streams
+
+        await collect(open_stream(audit_logger, request_id))
+
+        assert events._active_streams == before
+
+
+class TestEventEndpoint:
+    """Test request validation of the events endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_cursor(self, audit_logger):
+        with pytest.raises(HTTPException) as exc:
+            await events.stream_design_events(
+                str(uuid4()),
+                FakeRequest(),
+                last_event_id="not-an-id",
+                since=None,
+                store=DesignStore(),
+                audit_logger=audit_logger,
+            )
+        assert exc.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_unknown_design(self, audit_logger):
+        with pytest.raises(HTTPException) as exc:
+            await events.stream_design_events(
+                str(uuid4()),
+                FakeRequest(),
+                last_event_id=None,
+                since=None,
+                store=DesignStore(),
+                audit_logger=audit_logger,
+            )
+        assert exc.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_too_many_streams(self, audit_logger, monkeypatch):
+        monkeypatch.setattr(events, "_MAX_STREAMS", 0)
+        store = DesignStore()
+        state = DesignState(request_id=uuid4(), user_prompt="Create a box")
+        store.save(state)
+
+        with pytest.raises(HTTPException) as exc:
+            await events.stream_design_events(
+                str(state.request_id),
+                FakeRequest(),
+                last_event_id=None,
+                since=None,
+                store=store,
+                audit_logger=audit_logger,
+            )
+        assert exc.value.status_code == 503
+        assert "Retry-After" in exc.value.headers
+
+    @pytest.mark.asyncio
+    async def test_finished_design_has_no_content(self, audit_logger):
+        store = DesignStore()
+        state = DesignState(request_id=uuid4(), user_prompt="Create a box")
+        state.mark_completed()
+        store.save(state)
+        before = events._active_streams
+
+        response = await events.stream_design_events(
+            str(state.request_id),
+            FakeRequest(),
+            last_event_id="1-0",
+            since=None,
+            store=store,
+            audit_logger=audit_logger,
+        )
+
+        assert response.status_code == 204
+        assert events._active_streams == before
+
+
+class TestPipelineOutcome:
+    """Test the background pipeline task closes the event stream"""
+
+    @pytest.fixture
+    def store(self, request_id):
+        return running_store(request_id)
+
+    @pytest.fixture(autouse=True)
+    def audit_writer(self, audit_logger, monkeypatch):
+        monkeypatch.setattr(design, "get_audit_writer", lambda: audit_logger)
+
+    async def run_pipeline(self, request_id, store, pipeline):
+        await design._process_design_pipeline(
+            request_id, "Create a box", 3, pipeline, store=store
+        )
+
+    @pytest.mark.asyncio
+    async def test_completed_run_emits_terminal_event(
+        self, audit_logger, request_id, store
+    ):
+        result = DesignState(request_id=request_id, user_prompt="Create a box")
+        result.mark_completed()
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=result)
+
+        await self.run_pipeline(request_id, store, pipeline)
+
+        chunks = await collect(open_stream(audit_logger, request_id, store=store))
+        assert [f[1] for f in parse_frames(chunks)] == ["pipeline_completed"]
+
+    @pytest.mark.asyncio
+    async def test_crashed_run_emits_terminal_event(
+        self, audit_logger, request_id, store
+    ):
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await self.run_pipeline(request_id, store, pipeline)
+
+        events_ = audit_logger.read_after(request_id, None)
+        assert [e.event_type for e in events_] == [AuditEventType.PIPELINE_FAILED]
+        assert "boom" in events_[0].error
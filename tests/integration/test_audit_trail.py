@@ -48,7 +48,8 @@ class MockRedisClient:
                 del self.store[key]
                 del self.ttls[key]
                 return None
-            return self.store[key].encode("utf-8")
+            value = self.store[key]
+            return value if isinstance(value, bytes) else value.encode("utf-8")
         return None
 
     def delete(self, key: str) -> int:
@@ -75,12 +76,58 @@ class MockRedisClient:
             return self.store[name]
         return {}
 
-    def hdel(self, name: str, key: str) -> int:
+    def hdel(self, name: str, *keys: str) -> int:
+        removed = 0
         if name in self.store and isinstance(self.store[name], dict):
-            if key in self.store[name]:
-                del self.store[name][key]
-                return 1
-        return 0
+            for key in keys:
+                if key in self.store[name]:
+                    del self.store[name][key]
+                    removed += 1
+        return removed
+
+    def hsetnx(self, name: str, key: str, value: str) -> int:
+        if key in self.hgetall(name):
+            return 0
+        return self.hset(name, key, value)
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        value = int(self.hgetall(name).get(key, 0)) + amount
+        self.hset(name, key, str(value))
+        return value
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        value = float(self.hgetall(name).get(key, 0)) + amount
+        self.hset(name, key, str(value))
+        return value
+
+    def exists(self, key: str) -> bool:
+        return key in self.store
+
+    def rpush(self, name: str, *values) -> int:
+        self.store.setdefault(name, []).extend(values)
+        return len(self.store[name])
+
+    def ltrim(self, name: str, start: int, end: int) -> bool:
+        if name in self.store:
+            items = self.store[name]
+            self.store[name] = items[start:] if end == -1 else items[start : end + 1]
+        return True
+
+    def lrange(self, name: str, start: int, end: int) -> list:
+        items = self.store.get(name, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def hscan_iter(self, name: str, count: Optional[int] = None):
+        return iter(list(self.hgetall(name).items()))
+
+    def mget(self, keys: list) -> list:
+        return [self.get(key) for key in keys]
+
+    def unlink(self, *keys: str) -> int:
+        return sum(self.delete(key) for key in keys)
+
+    def pipeline(self, transaction: bool = False) -> "MockPipeline":
+        return MockPipeline(self)
 
     def xadd(
         self,
@@ -112,7 +159,17 @@ class MockRedisClient:
         if stream not in self.streams:
             return []
 
-        entries = self.streams[stream]
+        def position(entry_id):
+            if isinstance(entry_id, bytes):
+                entry_id = entry_id.decode("utf-8")
+            return tuple(int(part) for part in entry_id.split("-"))
+
+        entries = [
+            (entry_id, fields)
+            for entry_id, fields in self.streams[stream]
+            if (start == "-" or position(entry_id) >= position(start))
+            and (end == "+" or position(entry_id) <= position(end))
+        ]
         if count:
             entries = entries[:count]
 
@@ -169,6 +226,28 @@ def mock_redis():
     return MockRedisClient()
 
 
+class MockPipeline:
+    """Queues commands and runs them against the mock client on execute()."""
+
+    def __init__(self, client: MockRedisClient):
+        self.client = client
+        self.commands: list = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        results = [method(*args, **kwargs) for method, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
 @pytest.fixture
 def audit_logger(mock_redis):
     """Create AuditLogger with mock Redis."""
@@ -497,8 +576,9 @@ async def test_pubsub_bridge_forwards_to_websocket():
 
     bridge = PubSubBridge(mock_redis, mock_ws_manager)
 
-    # Simulate Pub/Sub message
+    # Simulate Pub/Sub message for a design watched on this node
     request_id = uuid4()
+    bridge.subscribe_to_design(request_id)
     event_data = {
         "event_type": "plan_generated",
         "request_id": str(request_id),
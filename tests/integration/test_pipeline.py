@@ -10,6 +10,7 @@ Tests cover:
 - Error handling
 """
 
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -18,6 +19,7 @@ import pytest
 from ai_designer.agents.generator import GeneratorAgent
 from ai_designer.agents.planner import PlannerAgent
 from ai_designer.agents.validator import ValidatorAgent
+from ai_designer.orchestration.nodes import PipelineNodes
 from ai_designer.orchestration.pipeline import PipelineExecutor, build_design_pipeline
 from ai_designer.orchestration.routing import (
     ROUTE_FAIL,
@@ -189,6 +191,49 @@ class TestPipelineState:
         assert pipeline_state.error_count == 2
         assert pipeline_state.retry_count["planner"] == 2
 
+    def test_best_so_far_and_plateau(self):
+        """Test keeping the best iteration and detecting a score plateau."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(
+            design_state, plateau_patience=2
+        )
+
+        for iteration, score in enumerate([0.71, 0.72, 0.70], start=1):
+            pipeline_state.workflow_iteration = iteration
+            pipeline_state.generated_scripts = {"main": f"# iteration {iteration}"}
+            pipeline_state.validation_result = ValidationResult(
+                request_id=str(request_id), is_valid=False, overall_score=score
+            )
+            pipeline_state.record_validation(pipeline_state.validation_result)
+
+        assert pipeline_state.score_history == [0.71, 0.72, 0.70]
+        assert pipeline_state.best_score == 0.72
+        assert pipeline_state.best_iteration == 2
+        assert pipeline_state.has_plateaued()
+
+        assert pipeline_state.restore_best()
+        assert pipeline_state.generated_scripts == {"main": "# iteration 2"}
+        assert pipeline_state.validation_result.overall_score == 0.72
+
+    def test_plateau_disabled(self):
+        """Test that patience 0 disables early stopping."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(
+            design_state, plateau_patience=0
+        )
+
+        for score in [0.6, 0.6, 0.6]:
+            pipeline_state.record_validation(
+                ValidationResult(
+                    request_id=str(request_id), is_valid=False, overall_score=score
+                )
+            )
+
+        assert not pipeline_state.has_plateaued()
+        assert not pipeline_state.restore_best()
+
 
 class TestRouting:
     """Test conditional routing logic."""
@@ -289,6 +334,120 @@ class TestRouting:
         assert decision == ROUTE_FAIL
         assert "iterations" in pipeline_state.routing_reason.lower()
 
+    def test_route_plateau_accepts_best(self):
+        """Test stopping early on a plateau and accepting the best score."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(design_state)
+        pipeline_state.best_score = 0.72
+        pipeline_state.plateau_count = 2
+        pipeline_state.validation_result = ValidationResult(
+            request_id=str(request_id),
+            is_valid=False,
+            overall_score=0.70,
+        )
+
+        decision = route_after_validation(pipeline_state)
+        assert decision == ROUTE_SUCCESS
+        assert "plateau" in pipeline_state.routing_reason.lower()
+        assert "0.72" in pipeline_state.routing_reason
+
+    def test_route_plateau_fails_below_refine_threshold(self):
+        """Test failing on a plateau when no iteration was good enough."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(design_state)
+        pipeline_state.best_score = 0.3
+        pipeline_state.plateau_count = 2
+        pipeline_state.validation_result = ValidationResult(
+            request_id=str(request_id),
+            is_valid=False,
+            overall_score=0.25,
+        )
+
+        assert route_after_validation(pipeline_state) == ROUTE_FAIL
+
+    def test_route_deadline_accepts_best_so_far(self):
+        """Test accepting a refinable design when the budget is spent."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(
+            design_state, deadline=datetime.utcnow() + timedelta(seconds=1)
+        )
+        pipeline_state.node_durations = {
+            "generator": 5.0,
+            "executor": 5.0,
+            "validator": 5.0,
+        }
+        pipeline_state.validation_result = ValidationResult(
+            request_id=str(request_id),
+            is_valid=False,
+            overall_score=0.6,  # Would normally refine
+        )
+
+        decision = route_after_validation(pipeline_state)
+        assert decision == ROUTE_SUCCESS
+        assert "best-so-far" in pipeline_state.routing_reason.lower()
+
+    def test_route_deadline_fails_without_acceptable_design(self):
+        """Test failing when the budget is spent and the design needs replanning."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(
+            design_state, deadline=datetime.utcnow() - timedelta(seconds=1)
+        )
+        pipeline_state.validation_result = ValidationResult(
+            request_id=str(request_id),
+            is_valid=False,
+            overall_score=0.3,  # Would normally replan
+        )
+
+        decision = route_after_validation(pipeline_state)
+        assert decision == ROUTE_FAIL
+        assert "deadline" in pipeline_state.routing_reason.lower()
+
+    def test_route_refine_with_budget_left(self):
+        """Test refining as usual when the budget fits another iteration."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(
+            design_state, deadline=datetime.utcnow() + timedelta(hours=1)
+        )
+        pipeline_state.validation_result = ValidationResult(
+            request_id=str(request_id),
+            is_valid=False,
+            overall_score=0.6,
+        )
+
+        assert route_after_validation(pipeline_state) == ROUTE_REFINE
+
+    def test_unvalidated_iteration_restores_best(self):
+        """Test an iteration the validator never scored falls back to the best one."""
+        request_id = uuid4()
+        design_state = DesignState(request_id=request_id, user_prompt="Test")
+        pipeline_state = PipelineState.from_design_state(design_state)
+
+        pipeline_state.increment_iteration()
+        pipeline_state.design_state.freecad_script = "# iteration 1"
+        pipeline_state.record_validation(
+            ValidationResult(
+                request_id=str(request_id), is_valid=False, overall_score=0.7
+            )
+        )
+
+        # Iteration 2 generates a new script, then the validator errors out
+        pipeline_state.increment_iteration()
+        pipeline_state.design_state.freecad_script = "# iteration 2"
+        assert not pipeline_state.is_validated()
+
+        decision = route_after_validation(pipeline_state)
+        assert decision == ROUTE_SUCCESS
+        assert "not validated" in pipeline_state.routing_reason
+
+        assert pipeline_state.restore_best()
+        assert pipeline_state.design_state.freecad_script == "# iteration 1"
+        assert pipeline_state.validation_result.overall_score == 0.7
+
     def test_route_fail_no_validation(self):
         """Test routing to fail when no validation result."""
         design_state = DesignState(request_id=uuid4(), user_prompt="Test")
@@ -299,6 +458,55 @@ class TestRouting:
         assert decision == ROUTE_FAIL
 
 
+class TestPlanCacheUpdates:
+    """Test the validator node keeps only validated plans in the plan cache."""
+
+    @pytest.fixture
+    def nodes(self, mock_planner, mock_generator, mock_validator):
+        mock_planner.remember_plan = AsyncMock(return_value=True)
+        mock_planner.forget_plan = AsyncMock(return_value=True)
+        return PipelineNodes(mock_planner, mock_generator, mock_validator)
+
+    def _state(self, design_request, plan_from_cache):
+        state = PipelineState.from_design_state(
+            DesignState(
+                request_id=design_request.request_id,
+                user_prompt=design_request.user_prompt,
+            )
+        )
+        state.task_graph = TaskGraph(request_id=design_request.request_id)
+        state.generated_scripts = {"main": "# script"}
+        state.plan_from_cache = plan_from_cache
+        return state
+
+    async def test_validated_plan_is_stored(
+        self, nodes, mock_planner, mock_validator, design_request
+    ):
+        mock_validator.validate.return_value = ValidationResult(
+            request_id=str(design_request.request_id), is_valid=True, overall_score=0.9
+        )
+
+        state = await nodes.validator_node(self._state(design_request, False))
+
+        assert state.next_action == ROUTE_SUCCESS
+        mock_planner.remember_plan.assert_awaited_once()
+        mock_planner.forget_plan.assert_not_called()
+
+    async def test_failing_cached_plan_is_invalidated(
+        self, nodes, mock_planner, mock_validator, design_request
+    ):
+        mock_validator.validate.return_value = ValidationResult(
+            request_id=str(design_request.request_id), is_valid=False, overall_score=0.3
+        )
+
+        state = await nodes.validator_node(self._state(design_request, True))
+
+        assert state.next_action == ROUTE_REPLAN
+        assert not state.plan_from_cache
+        mock_planner.forget_plan.assert_awaited_once()
+        mock_planner.remember_plan.assert_not_called()
+
+
 class TestPipelineConstruction:
     """Test pipeline construction and configuration."""
 
@@ -362,6 +570,7 @@ class TestPipelineExecution:
             generator=mock_generator,
             validator=mock_validator,
             max_iterations=5,
+            enable_fast_path=False,
         )
 
         result = await executor.execute(design_request)
@@ -412,6 +621,7 @@ class TestPipelineExecution:
             generator=mock_generator,
             validator=mock_validator,
             max_iterations=5,
+            enable_fast_path=False,
         )
 
         result = await executor.execute(design_request)
@@ -449,6 +659,7 @@ class TestPipelineExecution:
             generator=mock_generator,
             validator=mock_validator,
             max_iterations=2,
+            enable_fast_path=False,
         )
 
         result = await executor.execute(design_request)
@@ -477,9 +688,82 @@ class TestPipelineExecution:
             generator=mock_generator,
             validator=mock_validator,
             max_iterations=5,
+            enable_fast_path=False,
         )
 
         result = await executor.execute(design_request)
 
         assert result.status == ExecutionStatus.FAILED
         assert result.error_message is not None
+
+
+class TestFastPath:
+    """Test the rule-based fast path in PipelineExecutor."""
+
+    async def test_primitive_prompt_skips_llm_pipeline(
+        self, mock_planner, mock_generator, mock_llm_provider, design_request
+    ):
+        """A fully specified cube is answered without planner or generator."""
+        validator = ValidatorAgent(llm_provider=mock_llm_provider)
+        callback = AsyncMock()
+
+        executor = PipelineExecutor(
+            planner=mock_planner,
+            generator=mock_generator,
+            validator=validator,
+            websocket_callback=callback,
+        )
+
+        result = await executor.execute(design_request)
+
+        assert result.status == ExecutionStatus.COMPLETED
+        assert result.is_valid
+        assert result.execution_plan["fast_path"] is True
+        assert "Part::Box" in result.freecad_script
+        assert mock_planner.plan.call_count == 0
+        assert mock_generator.generate.call_count == 0
+        assert mock_llm_provider.complete_async.call_count == 0
+        assert callback.call_args.args[1]["node"] == "fast_path"
+
+    async def test_rejected_fast_path_falls_back(
+        self, mock_planner, mock_generator, mock_validator, design_request
+    ):
+        """A fast-path design that fails validation goes through the planner."""
+        mock_planner.plan.side_effect = Exception("Planning failed")
+        mock_validator.validate.return_value = ValidationResult(
+            request_id=str(design_request.request_id),
+            is_valid=False,
+            overall_score=0.3,
+        )
+
+        executor = PipelineExecutor(
+            planner=mock_planner,
+            generator=mock_generator,
+            validator=mock_validator,
+        )
+
+        result = await executor.execute(design_request)
+
+        assert mock_validator.validate.call_args.kwargs["skip_llm_review"] is True
+        assert mock_planner.plan.call_count == 1
+        assert result.status == ExecutionStatus.FAILED
+
+    async def test_complex_prompt_uses_llm_pipeline(
+        self, mock_planner, mock_generator, mock_validator
+    ):
+        """Prompts with features are never classified for the fast path."""
+        mock_planner.plan.side_effect = Exception("Planning failed")
+        request = DesignRequest(
+            user_prompt="Create a 10x10x10mm cube with a 3mm hole through it"
+        )
+
+        executor = PipelineExecutor(
+            planner=mock_planner,
+            generator=mock_generator,
+            validator=mock_validator,
+        )
+
+        await executor.execute(request)
+
+        assert mock_validator.validate.call_count == 0
+        assert mock_planner.plan.call_count == 1
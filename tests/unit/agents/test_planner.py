@@ -276,6 +276,33 @@ class TestPlannerAgentPlanning:
         with pytest.raises(RuntimeError, match="Failed to generate valid task graph"):
             await planner.plan(design_request)
 
+    @pytest.mark.asyncio
+    async def test_plan_uses_plan_cache(
+        self, mock_provider, design_request, valid_llm_response
+    ):
+        """Test cached templates skip the LLM and only validated plans are stored."""
+        mock_provider.generate = AsyncMock(return_value=valid_llm_response)
+        plan_cache = MagicMock()
+        plan_cache.lookup_async = AsyncMock(return_value=None)
+        plan_cache.store_async = AsyncMock(return_value=True)
+        planner = PlannerAgent(llm_provider=mock_provider, plan_cache=plan_cache)
+
+        task_graph = await planner.plan(design_request)
+        plan_cache.store_async.assert_not_called()
+
+        assert await planner.remember_plan(design_request, task_graph)
+        plan_cache.store_async.assert_awaited_once_with(
+            design_request.user_prompt, task_graph
+        )
+
+        plan_cache.lookup_async.return_value = task_graph
+        assert await planner.plan(design_request) is task_graph
+        mock_provider.generate.assert_called_once()
+
+        # Replanning goes back to the LLM
+        await planner.plan(design_request, use_cache=False)
+        assert mock_provider.generate.call_count == 2
+
 
 class TestPlannerAgentReplanning:
     """Test PlannerAgent replanning functionality."""
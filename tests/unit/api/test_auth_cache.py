@@ -0,0 +1,123 @@
+"""
+Unit tests for the verified-token cache of the auth middleware.
+"""
+
+import asyncio
+import time
+import weakref
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fakeredis import aioredis
+from fastapi import HTTPException
+
+from ai_designer.api.middleware import auth
+from ai_designer.redis_utils import connection
+
+
+@pytest.fixture
+def decode():
+    """Patch signature verification and start from an empty cache."""
+    decoder = MagicMock(
+        side_effect=lambda token: {"sub": token, "exp": time.time() + 3600}
+    )
+    with patch.object(auth, "_decode_token", decoder), patch.object(
+        auth, "_token_cache", auth._TokenCache(max_entries=2, max_seconds=300)
+    ):
+        yield decoder
+
+
+@pytest.fixture
+def revocations():
+    client = aioredis.FakeRedis(decode_responses=True)
+    with patch.object(auth, "_REVOCATION_SET", "revoked"), patch.object(
+        auth, "_REVOCATION_CHECK_SECONDS", 0
+    ), patch.object(auth, "_revocation_redis", client):
+        yield client
+
+
+class TestTokenCache:
+    """Test that verified tokens skip signature checks"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_verify_once(self, decode):
+        for _ in range(3):
+            claims = await auth._authenticate("alice")
+
+        assert claims["sub"] == "alice"
+        assert decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_is_bounded(self, decode):
+        for token in ["a", "b", "c", "a"]:
+            await auth._authenticate(token)
+
+        # "a" was evicted by "c" (cache holds two tokens)
+        assert decode.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_tokens_are_reverified(self, decode):
+        decode.side_effect = lambda token: {"sub": token, "exp": time.time() - 1}
+
+        await auth._authenticate("alice")
+        await auth._authenticate("alice")
+
+        assert decode.call_count == 2
+
+    def test_lifetime_capped_for_tokens_without_exp(self):
+        cache = auth._TokenCache(max_entries=10, max_seconds=60)
+
+        entry = cache.put(b"digest", {"sub": "alice"})
+
+        assert entry[1] <= time.time() + 60
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_not_cached(self, decode):
+        decode.side_effect = HTTPException(status_code=401, detail="bad")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await auth._authenticate("forged")
+
+        assert decode.call_count == 2
+
+
+class TestRevocation:
+    """Test the optional Redis revocation set"""
+
+    @pytest.mark.asyncio
+    async def test_revoked_jti_rejected(self, decode, revocations):
+        decode.side_effect = lambda token: {"sub": "alice", "jti": token}
+        await auth._authenticate("token-1")
+
+        await revocations.sadd("revoked", "token-1")
+
+        with pytest.raises(HTTPException) as exc:
+            await auth._authenticate("token-1")
+        assert exc.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_digest_used_without_jti(self, decode, revocations):
+        digest = auth.hashlib.sha256(b"alice").hexdigest()
+        await revocations.sadd("revoked", digest)
+
+        with pytest.raises(HTTPException):
+            await auth._authenticate("alice")
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fail_open(self, decode, revocations):
+        broken = MagicMock()
+        broken.sismember.side_effect = ConnectionError("down")
+
+        with patch.object(auth, "_revocation_redis", broken):
+            assert (await auth._authenticate("alice"))["sub"] == "alice"
+
+    def test_client_follows_event_loop(self, monkeypatch):
+        monkeypatch.setattr(connection, "_async_pools", weakref.WeakKeyDictionary())
+
+        async def pool():
+            return auth._revocation_client().connection_pool
+
+        first, second = asyncio.run(pool()), asyncio.run(pool())
+
+        assert first is not second
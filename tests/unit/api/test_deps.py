@@ -0,0 +1,50 @@
+"""
+Tests for lazily reconnecting API dependencies
+"""
+
+import pytest
+
+from ai_designer.api import deps
+from ai_designer.redis_utils.client import RedisClient
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(deps.time, "monotonic", lambda: now[0])
+    deps.reset_dependencies()
+    yield now
+    deps.reset_dependencies()
+
+
+class TestGetRedisClient:
+    """Test reconnect backoff after a Redis outage at startup"""
+
+    def test_retries_with_backoff(self, clock, monkeypatch, mock_redis):
+        attempts = []
+        reachable = [False]
+
+        def connect(client):
+            attempts.append(clock[0])
+            client.connection = mock_redis
+            return reachable[0]
+
+        monkeypatch.setattr(RedisClient, "connect", connect)
+
+        assert deps.get_redis_client() is None
+        assert deps.get_redis_client() is None  # Still backing off
+        store = deps.get_design_store()
+        assert not store.is_shared
+
+        clock[0] += 1
+        assert deps.get_redis_client() is None
+        clock[0] += 1.5
+        assert deps.get_redis_client() is None  # Second delay is 2s
+        assert len(attempts) == 2
+
+        reachable[0] = True
+        clock[0] += 0.5
+        assert deps.get_design_store() is store
+        assert store.is_shared
+        assert deps.get_redis_client() is not None
+        assert len(attempts) == 3
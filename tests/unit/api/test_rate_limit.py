@@ -0,0 +1,191 @@
+"""
+Unit tests for the GCRA rate-limit middleware.
+"""
+
+import asyncio
+import weakref
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ai_designer.api.middleware import rate_limit
+from ai_designer.api.middleware.rate_limit import (
+    _ROUTE_COSTS_SPEC,
+    RateLimitMiddleware,
+    _check_rate_limit,
+    _parse_route_costs,
+)
+from ai_designer.redis_utils import connection
+
+
+@pytest.fixture
+def fake_redis():
+    """Async fakeredis with Lua support (needs the lupa package)."""
+    pytest.importorskip("lupa")
+    from fakeredis import aioredis
+
+    client = aioredis.FakeRedis(decode_responses=True)
+    with patch.object(rate_limit, "_redis_pool", client), patch.object(
+        rate_limit, "_gcra_script", None
+    ):
+        yield client
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def call(middleware, method="GET", path="/api/v1/design/abc/status"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [],
+        "client": ("10.0.0.1", 1234),
+    }
+    await middleware(scope, None, send)
+    return messages[0]["status"], dict(messages[0]["headers"])
+
+
+class TestRouteCosts:
+    """Test per-route cost weights"""
+
+    def test_longest_prefix_wins(self):
+        middleware = RateLimitMiddleware(
+            ok_app,
+            route_costs="POST /api/v1/design=5,POST /api/v1/designs:batch=20",
+        )
+
+        assert middleware._route_cost("POST", "/api/v1/design") == 5
+        assert middleware._route_cost("POST", "/api/v1/designs:batch") == 20
+        assert middleware._route_cost("GET", "/api/v1/design/abc/status") == 1
+
+    def test_routes_match_whole_segments(self):
+        middleware = RateLimitMiddleware(ok_app, route_costs=_ROUTE_COSTS_SPEC)
+
+        assert middleware._route_cost("POST", "/api/v1/designs:query") == 1
+        assert middleware._route_cost("POST", "/api/v1/design/abc/exports") == 1
+        assert middleware._route_cost("POST", "/api/v1/design/abc/refine") == 5
+        assert middleware._route_cost("POST", "/api/v1/design/") == 5
+
+    def test_malformed_entries_ignored(self):
+        assert _parse_route_costs("POST /a=2, bogus, GET=3,,PUT /b=x") == [
+            ("POST", "/a", 2)
+        ]
+
+
+class TestGCRA:
+    """Test the Lua limiter against fakeredis"""
+
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_limits(self, fake_redis):
+        results = [await _check_rate_limit("client", 5, 60) for _ in range(6)]
+
+        assert [r[0] for r in results] == [True] * 5 + [False]
+        assert [r[1] for r in results[:5]] == [4, 3, 2, 1, 0]
+        # One token refills every 60 / 5 = 12 seconds
+        assert results[5][2] == 12
+
+    @pytest.mark.asyncio
+    async def test_constant_memory_per_client(self, fake_redis):
+        for _ in range(5):
+            await _check_rate_limit("client", 100, 60)
+
+        assert await fake_redis.type("rate_limit:client") == "string"
+        assert 0 < await fake_redis.pttl("rate_limit:client") <= 60_000
+
+    @pytest.mark.asyncio
+    async def test_cost_and_lease(self, fake_redis):
+        allowed, remaining, _, leased = await _check_rate_limit(
+            "client", 10, 60, cost=3, lease=4
+        )
+        assert (allowed, remaining, leased) == (True, 3, 4)
+
+        # Only as many lease tokens as are left are granted
+        allowed, remaining, _, leased = await _check_rate_limit(
+            "client", 10, 60, cost=3, lease=4
+        )
+        assert (allowed, remaining, leased) == (True, 0, 0)
+
+        allowed, _, retry_after, _ = await _check_rate_limit("client", 10, 60, cost=3)
+        assert not allowed
+        assert retry_after == 18
+
+    @pytest.mark.asyncio
+    async def test_script_runs_on_current_client(self, fake_redis):
+        from fakeredis import aioredis
+
+        await _check_rate_limit("client", 10, 60)
+        other = aioredis.FakeRedis(decode_responses=True)
+        with patch.object(rate_limit, "_redis_pool", other):
+            await _check_rate_limit("client", 10, 60)
+
+        assert await other.exists("rate_limit:client")
+
+    def test_client_follows_event_loop(self, monkeypatch):
+        monkeypatch.setattr(connection, "_async_pools", weakref.WeakKeyDictionary())
+
+        async def pool():
+            return rate_limit._redis().connection_pool
+
+        first, second = asyncio.run(pool()), asyncio.run(pool())
+
+        assert first is not second
+
+
+class TestMiddleware:
+    """Test request handling, leases and 429 responses"""
+
+    @pytest.mark.asyncio
+    async def test_lease_skips_redis(self):
+        check = AsyncMock(return_value=(True, 50, 0, 4))
+        middleware = RateLimitMiddleware(ok_app, max_requests=60, lease_tokens=4)
+
+        with patch.object(rate_limit, "_check_rate_limit", check):
+            statuses = [(await call(middleware))[0] for _ in range(5)]
+
+        assert statuses == [200] * 5
+        # First request reserved 4 extra tokens that cover the next 4
+        assert check.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_not_used_for_expensive_route(self):
+        check = AsyncMock(return_value=(True, 50, 0, 2))
+        middleware = RateLimitMiddleware(
+            ok_app, lease_tokens=2, route_costs="POST /api/v1/design=5"
+        )
+
+        with patch.object(rate_limit, "_check_rate_limit", check):
+            await call(middleware)
+            await call(middleware, "POST", "/api/v1/design")
+
+        assert check.await_count == 2
+        assert check.await_args.kwargs["cost"] == 5
+
+    @pytest.mark.asyncio
+    async def test_rejected_request(self):
+        check = AsyncMock(return_value=(False, 0, 7, 0))
+        middleware = RateLimitMiddleware(ok_app)
+
+        with patch.object(rate_limit, "_check_rate_limit", check):
+            status, headers = await call(middleware)
+
+        assert status == 429
+        assert headers[b"retry-after"] == b"7"
+
+    @pytest.mark.asyncio
+    async def test_headers_report_cost(self):
+        check = AsyncMock(return_value=(True, 40, 0, 0))
+        middleware = RateLimitMiddleware(ok_app, route_costs="POST /api/v1/design=5")
+
+        with patch.object(rate_limit, "_check_rate_limit", check):
+            _, headers = await call(middleware, "POST", "/api/v1/design")
+
+        assert headers[b"x-ratelimit-remaining"] == b"40"
+        assert headers[b"x-ratelimit-cost"] == b"5"
@@ -0,0 +1,163 @@
+"""
+Tests for backpressured WebSocket fan-out in ConnectionManager
+"""
+
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from ai_designer.api.routes.ws import ConnectionManager
+
+
+class FakeWebSocket:
+    """WebSocket double whose sends can be held back."""
+
+    def __init__(self, blocked=False, fail=False):
+        self.sent = []
+        self.closed_with = None
+        self.fail = fail
+        self.open = asyncio.Event()
+        if not blocked:
+            self.open.set()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        await self.open.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def frame(kind, n=0):
+    return {"type": kind, "data": {"n": n}}
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def manager():
+    return ConnectionManager(send_queue_size=4)
+
+
+class TestConnectionManager:
+    """Test per-connection queues, coalescing and slow-consumer handling"""
+
+    async def test_slow_client_does_not_delay_others(self, manager):
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, "r1")
+        await manager.connect(fast, "r1")
+
+        await manager.send_update("r1", frame("status"))
+        await settle()
+
+        assert fast.sent == [frame("status")]
+        assert slow.sent == []
+
+    async def test_progress_frames_are_coalesced(self, manager):
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, "r1")
+        await manager.send_update("r1", frame("progress", 0))
+        await settle()  # Frame 0 is now in flight
+
+        for n in range(1, 10):
+            await manager.send_update("r1", frame("progress", n))
+        await manager.send_update("r1", frame("completed"))
+        ws.open.set()
+        await settle()
+
+        assert ws.sent == [
+            frame("progress", 0),
+            frame("progress", 9),
+            frame("completed"),
+        ]
+        assert manager.active_connections == {"r1": [ws]}
+
+    async def test_progress_of_other_nodes_is_kept(self, manager):
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, "r1")
+        await manager.send_update("r1", frame("status"))
+        await settle()
+
+        for node in ("planner", "generator", "planner"):
+            await manager.send_update(
+                "r1", {"type": "progress", "data": {"node": node}}
+            )
+        ws.open.set()
+        await settle()
+
+        assert [m.get("data", {}).get("node") for m in ws.sent[1:]] == [
+            "generator",
+            "planner",
+        ]
+
+    async def test_own_replies_share_the_queue(self, manager):
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, "r1")
+        await manager.send_update("r1", frame("status", 0))
+        await settle()
+
+        for n in range(1, 4):
+            await manager.send_update("r1", frame("status", n))
+        sending = asyncio.create_task(manager.send(ws, "r1", frame("ack")))
+        await manager.send_update("r1", frame("status", 4))
+        await settle()
+        assert not sending.done()  # Waits for space instead of dropping
+
+        ws.open.set()
+        await sending
+        await settle()
+
+        assert ws.sent[-1] == frame("ack")
+        assert manager.active_connections == {"r1": [ws]}
+
+    async def test_overflowing_client_is_disconnected(self, manager):
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, "r1")
+        await manager.connect(fast, "r1")
+
+        for n in range(6):
+            await manager.send_update("r1", frame("status", n))
+            await settle()
+
+        assert manager.active_connections == {"r1": [fast]}
+        assert slow.closed_with == 1013
+        assert len(fast.sent) == 6
+
+    async def test_failed_socket_is_removed(self, manager):
+        broken = FakeWebSocket(fail=True)
+        await manager.connect(broken, "r1")
+
+        await manager.send_update("r1", frame("status"))
+        await settle()
+
+        assert manager.active_connections == {}
+        manager.disconnect(broken, "r1")  # The endpoint's own cleanup is a no-op
+
+    async def test_dropping_slow_client_wakes_blocked_reply(self, manager):
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, "r1")
+        await manager.send_update("r1", frame("status", 0))
+        await settle()
+
+        for n in range(1, 5):
+            await manager.send_update("r1", frame("status", n))
+        sending = asyncio.create_task(manager.send(ws, "r1", frame("ack")))
+        await settle()
+        assert not sending.done()
+
+        await manager.send_update("r1", frame("status", 5))  # Overflows
+        await settle()
+
+        assert sending.done()
+        with pytest.raises(WebSocketDisconnect):
+            await sending
+        assert ws.closed_with == 1013
@@ -0,0 +1,153 @@
+"""
+Tests for admission control and load shedding
+"""
+
+import asyncio
+
+import pytest
+
+from ai_designer.core import admission
+from ai_designer.core.admission import (
+    STAGE_EXECUTOR,
+    STAGE_GENERATOR,
+    STAGE_PLANNER,
+    STAGE_SLOT_WAIT,
+    STAGE_VALIDATOR,
+    AdmissionController,
+    LatencyTracker,
+)
+from ai_designer.freecad import headless_runner
+from ai_designer.freecad.headless_runner import HeadlessRunner
+
+
+@pytest.fixture
+def tracker():
+    """Latency tracker with 10s planner and 10s per stage per iteration."""
+    tracker = LatencyTracker()
+    for stage in (STAGE_PLANNER, STAGE_GENERATOR, STAGE_EXECUTOR, STAGE_VALIDATOR):
+        tracker.observe(stage, 10.0)
+    return tracker
+
+
+def make_controller(tracker, **kwargs):
+    defaults = {
+        "slo_seconds": 100.0,
+        "max_concurrent_pipelines": 2,
+        "max_in_flight": 10,
+        "degraded_max_iterations": 1,
+        "latency_tracker": tracker,
+        "enabled": True,
+    }
+    defaults.update(kwargs)
+    return AdmissionController(**defaults)
+
+
+class TestLatencyTracker:
+    """Test rolling stage latency estimates"""
+
+    def test_default_used_without_samples(self):
+        tracker = LatencyTracker()
+        assert tracker.estimate("unknown", default=3.0) == 3.0
+
+    def test_mean_of_window(self):
+        tracker = LatencyTracker(window=2)
+        for seconds in (100.0, 2.0, 4.0):
+            tracker.observe(STAGE_PLANNER, seconds)
+        assert tracker.estimate(STAGE_PLANNER) == pytest.approx(3.0)
+
+
+class TestAdmissionController:
+    """Test admit / degrade / reject decisions"""
+
+    def test_admits_within_slo(self, tracker):
+        controller = make_controller(tracker)
+        decision = controller.admit(max_iterations=2)
+
+        assert decision.admitted
+        assert not decision.degraded
+        assert decision.max_iterations == 2
+        assert controller.in_flight == 1
+
+    def test_degrades_when_full_run_exceeds_slo(self, tracker):
+        controller = make_controller(tracker)
+        # 10 + 5 * 30 = 160s > SLO, degraded 10 + 1 * 23 = 33s fits
+        decision = controller.admit(max_iterations=5)
+
+        assert decision.admitted
+        assert decision.degraded
+        assert decision.skip_llm_review
+        assert decision.max_iterations == 1
+
+    def test_rejects_with_retry_after(self, tracker):
+        controller = make_controller(tracker, slo_seconds=20.0)
+        decision = controller.admit(max_iterations=5)
+
+        assert not decision.admitted
+        assert decision.retry_after_seconds >= 1
+        assert controller.in_flight == 0
+
+    def test_rejects_at_in_flight_cap(self, tracker):
+        controller = make_controller(tracker, max_in_flight=1, slo_seconds=1e6)
+        assert controller.admit(max_iterations=1).admitted
+        assert not controller.admit(max_iterations=1).admitted
+
+    def test_queue_wait_grows_with_in_flight(self, tracker):
+        controller = make_controller(tracker)
+        idle_wait = controller.estimate_queue_wait(max_iterations=1)
+        for _ in range(4):
+            controller.admit(max_iterations=1)
+
+        assert controller.estimate_queue_wait(max_iterations=1) > idle_wait
+
+    def test_release_frees_slot(self, tracker):
+        controller = make_controller(tracker)
+        controller.admit(max_iterations=2)
+        controller.release(iterations=1)
+
+        assert controller.in_flight == 0
+        # Observed iteration counts shrink the estimate for later requests
+        assert controller.estimate_pipeline_seconds(5) == pytest.approx(40.0)
+
+    def test_disabled_always_admits(self, tracker):
+        controller = make_controller(tracker, slo_seconds=0.0, enabled=False)
+        decision = controller.admit(max_iterations=5)
+
+        assert decision.admitted
+        assert not decision.degraded
+        assert not controller.is_saturated()
+
+    def test_saturation_report(self, tracker):
+        controller = make_controller(tracker, slo_seconds=20.0)
+        report = controller.saturation()
+
+        assert report["state"] == "saturated"
+        assert controller.is_saturated()
+        assert report["execution_slots"]["capacity"] >= 1
+        assert STAGE_PLANNER in report["stage_latencies"]
+
+
+class TestExecutorSamples:
+    """Test that slot wait is not counted in executor service time"""
+
+    async def test_service_time_starts_at_slot_acquisition(self, monkeypatch):
+        tracker = LatencyTracker()
+        monkeypatch.setattr(admission, "_latency_tracker", tracker)
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setattr(
+            headless_runner, "get_execution_semaphore", lambda: semaphore
+        )
+        runner = HeadlessRunner.__new__(HeadlessRunner)
+
+        async def run(*args):
+            await asyncio.sleep(0.01)
+
+        monkeypatch.setattr(runner, "_execute_with_retry", run)
+
+        await semaphore.acquire()
+        execution = asyncio.ensure_future(runner.execute_script("x = 1"))
+        await asyncio.sleep(0.2)
+        semaphore.release()
+        await execution
+
+        assert tracker.estimate(STAGE_SLOT_WAIT) >= 0.2
+        assert tracker.estimate(STAGE_EXECUTOR) < 0.2
@@ -0,0 +1,67 @@
+"""
+Tests for end-to-end request deadlines
+"""
+
+import asyncio
+
+import pytest
+
+from ai_designer.core.deadline import (
+    Deadline,
+    budget_timeout,
+    current_deadline,
+    deadline_scope,
+)
+from ai_designer.core.exceptions import DeadlineExceededError
+
+
+class TestDeadline:
+    """Test Deadline arithmetic"""
+
+    def test_remaining_and_timeout_clipping(self):
+        deadline = Deadline.after(10)
+
+        assert 9 < deadline.remaining() <= 10
+        assert not deadline.expired
+        assert deadline.timeout(60) <= 10
+        assert deadline.timeout(1) == 1
+
+    def test_expired_deadline_raises(self):
+        deadline = Deadline.after(-1)
+
+        assert deadline.expired
+        assert deadline.remaining() == 0.0
+        with pytest.raises(DeadlineExceededError):
+            deadline.timeout(60)
+
+
+class TestDeadlineScope:
+    """Test propagation through the context variable"""
+
+    def test_no_deadline_uses_default(self):
+        assert current_deadline() is None
+        assert budget_timeout(60) == 60
+
+    def test_scope_sets_and_resets(self):
+        deadline = Deadline.after(5)
+
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+            assert budget_timeout(60) <= 5
+
+        assert current_deadline() is None
+
+    def test_scope_propagates_to_tasks(self):
+        async def child() -> float:
+            return budget_timeout(60)
+
+        async def parent() -> float:
+            with deadline_scope(Deadline.after(5)):
+                return await asyncio.create_task(child())
+
+        assert asyncio.run(parent()) <= 5
+
+    def test_budget_timeout_raises_when_expired(self):
+        with deadline_scope(Deadline.after(-1)):
+            with pytest.raises(DeadlineExceededError):
+                budget_timeout(60)
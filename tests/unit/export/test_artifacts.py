@@ -0,0 +1,129 @@
+"""
+Unit tests for download artifacts (content hashes and precompressed siblings).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+
+from ai_designer.export import artifacts
+from ai_designer.export.artifacts import (
+    load_artifact,
+    negotiate_encoding,
+    prepare_artifact,
+)
+
+
+@pytest.fixture
+def stl_file(tmp_path):
+    path = tmp_path / "part.stl"
+    path.write_text("facet normal 0 0 1\n  outer loop\n  endloop\nendfacet\n" * 200)
+    return path
+
+
+class TestPrepareArtifact:
+    """Test hashing, precompression and manifests"""
+
+    def test_hash_and_gzip_sibling(self, stl_file):
+        artifact = prepare_artifact(stl_file)
+
+        assert artifact.sha256 == hashlib.sha256(stl_file.read_bytes()).hexdigest()
+        gz_path = stl_file.with_name("part.stl.gz")
+        assert artifact.encodings["gzip"] == str(gz_path)
+        assert gzip.decompress(gz_path.read_bytes()) == stl_file.read_bytes()
+
+        manifest = json.loads(stl_file.with_name("part.stl.artifact.json").read_text())
+        assert manifest["sha256"] == artifact.sha256
+
+    @pytest.mark.skipif(artifacts.zstandard is None, reason="zstandard not installed")
+    def test_zstd_sibling(self, stl_file):
+        artifact = prepare_artifact(stl_file)
+
+        zst_path = stl_file.with_name("part.stl.zst")
+        assert artifact.encodings["zstd"] == str(zst_path)
+        decompressed = artifacts.zstandard.ZstdDecompressor().decompressobj()
+        assert decompressed.decompress(zst_path.read_bytes()) == stl_file.read_bytes()
+
+    def test_small_and_zip_files_are_not_compressed(self, tmp_path, stl_file):
+        small = tmp_path / "small.step"
+        small.write_text("ISO-10303-21;")
+        fcstd = tmp_path / "part.FCStd"
+        fcstd.write_bytes(stl_file.read_bytes())
+
+        assert prepare_artifact(small).encodings == {}
+        assert prepare_artifact(fcstd).encodings == {}
+        assert not (tmp_path / "part.FCStd.gz").exists()
+
+    def test_incompressible_sibling_is_dropped(self, tmp_path):
+        path = tmp_path / "noise.stl"
+        path.write_bytes(os.urandom(4096))
+
+        assert prepare_artifact(path).encodings == {}
+        assert not (tmp_path / "noise.stl.gz").exists()
+
+    def test_gzip_output_is_reproducible(self, stl_file):
+        prepare_artifact(stl_file)
+        first = stl_file.with_name("part.stl.gz").read_bytes()
+        prepare_artifact(stl_file)
+
+        assert stl_file.with_name("part.stl.gz").read_bytes() == first
+
+
+class TestLoadArtifact:
+    """Test manifest reuse and invalidation"""
+
+    def test_reuses_manifest(self, stl_file, monkeypatch):
+        prepared = prepare_artifact(stl_file)
+        artifacts._artifacts.clear()
+        monkeypatch.setattr(
+            artifacts, "prepare_artifact", lambda *a, **k: pytest.fail("rehashed")
+        )
+
+        assert load_artifact(stl_file) == prepared
+
+    def test_rebuilds_when_file_changes(self, stl_file):
+        before = prepare_artifact(stl_file)
+        stl_file.write_text("solid changed\n" * 500)
+        os.utime(stl_file, ns=(before.mtime_ns + 10**9, before.mtime_ns + 10**9))
+
+        after = load_artifact(stl_file)
+
+        assert after.sha256 != before.sha256
+        assert after.etag() != before.etag()
+
+    def test_prepares_legacy_exports(self, stl_file):
+        artifact = load_artifact(stl_file)
+
+        assert "gzip" in artifact.encodings
+
+    def test_etags_differ_per_encoding(self, stl_file):
+        artifact = prepare_artifact(stl_file)
+
+        assert artifact.etag() != artifact.etag("gzip")
+        assert artifact.etag().startswith('"')
+
+
+class TestNegotiateEncoding:
+    """Test Accept-Encoding negotiation"""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip, deflate, br", "gzip"),
+            ("gzip, zstd", "zstd"),
+            ("zstd;q=0.5, gzip", "gzip"),
+            ("gzip;q=0", None),
+            ("*", "zstd"),
+            ("x-gzip", "gzip"),
+        ],
+    )
+    def test_negotiation(self, header, expected):
+        assert negotiate_encoding(header, {"gzip", "zstd"}) == expected
+
+    def test_only_available_codings(self):
+        assert negotiate_encoding("zstd, gzip;q=0.1", {"gzip"}) == "gzip"
@@ -0,0 +1,99 @@
+"""
+Unit tests for the SQLite export cache index.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from ai_designer.export.cache_index import ExportCacheIndex
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "index.sqlite3"
+
+
+def make_export(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def record_many(db_path, worker, count):
+    index = ExportCacheIndex(db_path, max_bytes=0)
+    for i in range(count):
+        index.record(f"w{worker}-{i}", "step", f"/tmp/w{worker}-{i}.step", 1)
+
+
+class TestExportCacheIndex:
+    """Test lookups, eviction and concurrent writers"""
+
+    def test_record_and_lookup(self, db_path, tmp_path):
+        index = ExportCacheIndex(db_path)
+        path = make_export(tmp_path, "a.step", 10)
+
+        index.record("h1", "step", path, 10, sha256="abc")
+
+        assert index.lookup("h1", "step") == path
+        assert index.lookup("h1", "stl") is None
+        assert index.total_bytes() == 10
+
+    def test_rerecord_replaces_entry(self, db_path, tmp_path):
+        index = ExportCacheIndex(db_path)
+        index.record("h1", "step", make_export(tmp_path, "a.step", 10), 10)
+        index.record("h1", "step", make_export(tmp_path, "b.step", 20), 20)
+
+        assert len(index) == 1
+        assert index.lookup("h1", "step") == tmp_path / "b.step"
+        assert index.total_bytes() == 20
+
+    def test_lru_eviction_deletes_files(self, db_path, tmp_path):
+        index = ExportCacheIndex(db_path, max_bytes=25, touch_interval_seconds=0)
+        a = make_export(tmp_path, "a.step", 10)
+        sidecar = tmp_path / "a.step.json"
+        sidecar.write_text("{}")
+        b = make_export(tmp_path, "b.step", 10)
+        index.record("a", "step", a, 10)
+        time.sleep(0.01)
+        index.record("b", "step", b, 10)
+        time.sleep(0.01)
+        # Touch "a" so "b" becomes the least recently used entry
+        index.lookup("a", "step")
+
+        evicted = index.record("c", "step", make_export(tmp_path, "c.step", 10), 10)
+
+        assert evicted == [b]
+        assert not b.exists()
+        assert a.exists() and sidecar.exists()
+        assert index.lookup("b", "step") is None
+        assert index.total_bytes() == 20
+
+    def test_new_entry_is_never_evicted(self, db_path, tmp_path):
+        index = ExportCacheIndex(db_path, max_bytes=5)
+        path = make_export(tmp_path, "big.step", 10)
+
+        assert index.record("big", "step", path, 10) == []
+        assert index.lookup("big", "step") == path
+
+    def test_unbounded(self, db_path, tmp_path):
+        index = ExportCacheIndex(db_path, max_bytes=0)
+        for i in range(5):
+            index.record(str(i), "stl", make_export(tmp_path, f"{i}.stl", 100), 100)
+
+        assert len(index) == 5
+
+    def test_concurrent_processes(self, db_path):
+        ExportCacheIndex(db_path)
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=record_many, args=(db_path, w, 50)) for w in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        assert len(ExportCacheIndex(db_path)) == 150
@@ -6,6 +6,8 @@ Tests export functionality with metadata tracking, caching, and multi-format sup
 
 import asyncio
 import json
+import threading
+import zipfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID, uuid4
@@ -84,23 +86,26 @@ class TestCADExporter:
         hash3 = CADExporter.compute_prompt_hash("Different prompt")
         assert hash1 != hash3
 
-    def test_cache_index_persistence(self, cad_exporter, temp_cache_dir):
+    def test_cache_index_persistence(
+        self, cad_exporter, temp_outputs_dir, temp_cache_dir
+    ):
         """Test cache index save/load."""
         # Update cache
         prompt_hash = "abcd1234"
-        file_path = Path("outputs/test.step")
+        file_path = temp_outputs_dir / "test.step"
+        file_path.write_text("step content")
         cad_exporter._update_cache(prompt_hash, "step", file_path)
 
         # Verify saved
-        assert prompt_hash in cad_exporter._cache_index
-        assert cad_exporter._cache_index[prompt_hash]["step"] == str(file_path)
+        assert cad_exporter.cache_index.lookup(prompt_hash, "step") == file_path
+        assert cad_exporter.cache_index.total_bytes() == len("step content")
 
         # Create new exporter and verify index loaded
         new_exporter = CADExporter(
             outputs_dir=str(cad_exporter.outputs_dir),
             cache_dir=str(temp_cache_dir),
         )
-        assert prompt_hash in new_exporter._cache_index
+        assert new_exporter._check_cache(prompt_hash, "step") == file_path
 
     def test_check_cache_miss(self, cad_exporter):
         """Test cache miss."""
@@ -122,17 +127,19 @@ class TestCADExporter:
         assert cached == test_file
         assert cached.exists()
 
-    def test_check_cache_stale(self, cad_exporter):
+    def test_check_cache_stale(self, cad_exporter, temp_outputs_dir):
         """Test stale cache entry removal."""
-        # Add non-existent file to cache
+        # Cache a file, then delete it behind the index's back
         prompt_hash = "stale_hash"
-        fake_path = Path("outputs/nonexistent.step")
-        cad_exporter._cache_index[prompt_hash] = {"step": str(fake_path)}
+        fake_path = temp_outputs_dir / "nonexistent.step"
+        fake_path.write_text("gone soon")
+        cad_exporter._update_cache(prompt_hash, "step", fake_path)
+        fake_path.unlink()
 
         # Should return None and clean up
         cached = cad_exporter._check_cache(prompt_hash, "step")
         assert cached is None
-        assert "step" not in cad_exporter._cache_index.get(prompt_hash, {})
+        assert len(cad_exporter.cache_index) == 0
 
     def test_generate_metadata(self, cad_exporter, temp_outputs_dir):
         """Test metadata generation."""
@@ -230,12 +237,12 @@ class TestCADExporter:
         cached_file.write_text("cached content")
 
         prompt = "Create a box"
-        prompt_hash = CADExporter.compute_prompt_hash(prompt)
-        cad_exporter._update_cache(prompt_hash, "step", cached_file)
 
-        # Create mock document (won't be used due to cache)
+        # Create mock document (won't be exported due to cache)
         doc_path = temp_outputs_dir / "test.FCStd"
         doc_path.write_text("fake fcstd")
+        cache_key = cad_exporter.compute_cache_key(doc_path, "step", {})
+        cad_exporter._update_cache(cache_key, "step", cached_file)
 
         result = await cad_exporter.export_format(
             doc_path=doc_path,
@@ -395,6 +402,182 @@ class TestCADExporter:
         assert cached is None
 
 
+def write_fcstd(path, created, shape=b"box 10x10x10"):
+    """Write a minimal .FCStd archive with a given save timestamp."""
+    document = (
+        b'<Document SchemaVersion="4"><Properties>'
+        b'<Property name="CreationDate" type="App::PropertyString">'
+        b'<String value="' + created.encode() + b'"/></Property>'
+        b'<Property name="Label" type="App::PropertyString">'
+        b'<String value="Part"/></Property>'
+        b"</Properties></Document>"
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("Document.xml", document)
+        archive.writestr("GuiDocument.xml", created)
+        archive.writestr("PartShape.brp", shape)
+    return path
+
+
+class TestGeometryKeyedCache:
+    """Test that exports are cached on geometry rather than prompt text."""
+
+    def test_geometry_hash_ignores_save_noise(self, tmp_path):
+        """Test re-saving identical geometry keeps the hash."""
+        first = write_fcstd(tmp_path / "a.FCStd", "2024-01-01T00:00:00")
+        second = write_fcstd(tmp_path / "b.FCStd", "2025-06-30T12:00:00")
+        other = write_fcstd(tmp_path / "c.FCStd", "2024-01-01T00:00:00", b"cylinder")
+
+        assert CADExporter.compute_geometry_hash(
+            first
+        ) == CADExporter.compute_geometry_hash(second)
+        assert CADExporter.compute_geometry_hash(
+            first
+        ) != CADExporter.compute_geometry_hash(other)
+
+    def test_cache_key_includes_settings(self, cad_exporter, tmp_path):
+        """Test format and export settings are part of the key."""
+        doc = write_fcstd(tmp_path / "a.FCStd", "2024-01-01T00:00:00")
+
+        coarse = cad_exporter.compute_cache_key(doc, "stl", {"resolution": 0.5})
+        fine = cad_exporter.compute_cache_key(doc, "stl", {"resolution": 0.1})
+
+        assert coarse != fine
+        assert coarse != cad_exporter.compute_cache_key(doc, "step", {})
+
+    @pytest.mark.asyncio
+    async def test_same_geometry_different_prompts(
+        self, cad_exporter, temp_outputs_dir, mock_headless_runner
+    ):
+        """Test different prompts producing the same part share one export."""
+        output = temp_outputs_dir / "out.step"
+        output.write_text("step content")
+        mock_headless_runner.export_step.return_value = output
+        first_doc = write_fcstd(temp_outputs_dir / "a.FCStd", "2024-01-01")
+        second_doc = write_fcstd(temp_outputs_dir / "b.FCStd", "2024-02-01")
+
+        first = await cad_exporter.export_format(
+            first_doc, "step", "Create a 10mm cube", uuid4()
+        )
+        second = await cad_exporter.export_format(
+            second_doc, "step", "Make a cube with 10 mm sides", uuid4()
+        )
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.file_path == output
+        assert second.metadata.cache_key == first.metadata.cache_key
+        mock_headless_runner.export_step.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_same_prompt_new_geometry(
+        self, cad_exporter, temp_outputs_dir, mock_headless_runner
+    ):
+        """Test a rerun producing different geometry is exported again."""
+        output = temp_outputs_dir / "out.step"
+        output.write_text("step content")
+        mock_headless_runner.export_step.return_value = output
+        doc = temp_outputs_dir / "doc.FCStd"
+
+        write_fcstd(doc, "2024-01-01", b"box")
+        await cad_exporter.export_format(doc, "step", "Create a box", uuid4())
+        write_fcstd(doc, "2024-01-01", b"taller box")
+        result = await cad_exporter.export_format(doc, "step", "Create a box", uuid4())
+
+        assert result.cache_hit is False
+        assert mock_headless_runner.export_step.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_outputs_named_by_cache_key(
+        self, cad_exporter, temp_outputs_dir, mock_headless_runner
+    ):
+        """Test a rerun with new geometry does not overwrite the first export."""
+        mock_headless_runner.export_step.return_value = None
+        doc = temp_outputs_dir / "doc.FCStd"
+        request_id = uuid4()
+        keys = []
+
+        for shape in (b"box", b"taller box"):
+            write_fcstd(doc, "2024-01-01", shape)
+            keys.append(cad_exporter.compute_cache_key(doc, "step", {}))
+            await cad_exporter.export_format(doc, "step", "Create a box", request_id)
+
+        paths = [c.args[1] for c in mock_headless_runner.export_step.call_args_list]
+        assert paths == [temp_outputs_dir / f"{key}.step" for key in keys]
+        assert paths[0] != paths[1]
+
+    def test_legacy_index_is_removed(
+        self, mock_headless_runner, temp_outputs_dir, temp_cache_dir
+    ):
+        """Test the prompt-keyed index of earlier versions is dropped."""
+        legacy = temp_cache_dir / "export_cache_index.sqlite3"
+        legacy.write_bytes(b"old")
+
+        CADExporter(
+            headless_runner=mock_headless_runner,
+            outputs_dir=str(temp_outputs_dir),
+            cache_dir=str(temp_cache_dir),
+        )
+
+        assert not legacy.exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_exports_run_once(
+        self, cad_exporter, temp_outputs_dir, mock_headless_runner
+    ):
+        """Test concurrent requests for the same geometry share one export."""
+        output = temp_outputs_dir / "out.stl"
+        output.write_text("solid")
+        release = asyncio.Event()
+
+        async def slow_export(*args, **kwargs):
+            await release.wait()
+            return output
+
+        mock_headless_runner.export_stl.side_effect = slow_export
+        doc = write_fcstd(temp_outputs_dir / "a.FCStd", "2024-01-01")
+
+        tasks = [
+            asyncio.ensure_future(
+                cad_exporter.export_format(doc, "stl", f"prompt {i}", uuid4())
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert all(r.success and r.file_path == output for r in results)
+        assert sum(not r.cache_hit for r in results) == 1
+        mock_headless_runner.export_stl.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_index_used_off_the_event_loop(
+        self, cad_exporter, temp_outputs_dir, mock_headless_runner
+    ):
+        """Test index lookups and writes do not run on the event loop thread."""
+        output = temp_outputs_dir / "out.step"
+        output.write_text("step content")
+        mock_headless_runner.export_step.return_value = output
+        doc = write_fcstd(temp_outputs_dir / "a.FCStd", "2024-01-01")
+        loop_thread = threading.get_ident()
+        threads = []
+        index = cad_exporter.cache_index
+        for name in ("lookup", "record"):
+            original = getattr(index, name)
+
+            def spy(*args, _original=original, **kwargs):
+                threads.append(threading.get_ident())
+                return _original(*args, **kwargs)
+
+            setattr(index, name, spy)
+
+        await cad_exporter.export_format(doc, "step", "Create a box", uuid4())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+
 class TestExportMetadata:
     """Test ExportMetadata dataclass."""
 
@@ -0,0 +1,213 @@
+"""
+Unit tests for background export jobs.
+"""
+
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.export import jobs as jobs_module
+from ai_designer.export.exporter import ExportResult
+from ai_designer.export.jobs import ExportJob, ExportJobManager, ExportJobStatus
+from ai_designer.redis_utils.client import RedisClient
+
+
+class SlowExporter:
+    """Exporter stand-in whose exports finish when released."""
+
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.outputs_dir = tmp_path
+        self.calls = []
+        self.release = asyncio.Event()
+        self.fail = False
+
+    async def export_format(self, doc_path, format, prompt, request_id):
+        self.calls.append((str(request_id), format))
+        await self.release.wait()
+        if self.fail:
+            return ExportResult(success=False, format=format, error="mesh failed")
+        path = self.tmp_path / f"{request_id}.{format}"
+        path.write_text("data")
+        return ExportResult(success=True, format=format, file_path=path)
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    return SlowExporter(tmp_path)
+
+
+@pytest.fixture
+def request_id():
+    return str(uuid4())
+
+
+class TestExportJobs:
+    """Test job lifecycle and deduplication"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_background(self, exporter, request_id):
+        manager = ExportJobManager(exporter)
+
+        job = manager.submit(request_id, "step", Path("doc.FCStd"), "Create a box")
+        assert job.status == ExportJobStatus.QUEUED
+
+        exporter.release.set()
+        finished = await manager.wait(job.job_id)
+
+        assert finished.status == ExportJobStatus.SUCCEEDED
+        assert Path(finished.file_path).exists()
+        assert finished.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_in_flight_jobs_are_deduplicated(self, exporter, request_id):
+        manager = ExportJobManager(exporter)
+
+        first = manager.submit(request_id, "stl", Path("doc.FCStd"), "p")
+        second = manager.submit(request_id, "STL", Path("doc.FCStd"), "p")
+        other = manager.submit(request_id, "step", Path("doc.FCStd"), "p")
+
+        assert second.job_id == first.job_id
+        assert other.job_id != first.job_id
+
+        exporter.release.set()
+        await manager.wait(first.job_id)
+        await manager.wait(other.job_id)
+        assert exporter.calls.count((request_id, "stl")) == 1
+
+        # Finished jobs are no longer reused
+        again = manager.submit(request_id, "stl", Path("doc.FCStd"), "p")
+        assert again.job_id != first.job_id
+        await manager.wait(again.job_id)
+
+    @pytest.mark.asyncio
+    async def test_failed_export(self, exporter, request_id):
+        manager = ExportJobManager(exporter)
+        exporter.fail = True
+        exporter.release.set()
+
+        job = await manager.wait(
+            manager.submit(request_id, "stl", Path("doc.FCStd"), "p").job_id
+        )
+
+        assert job.status == ExportJobStatus.FAILED
+        assert job.error == "mesh failed"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, exporter):
+        manager = ExportJobManager(exporter, max_concurrent_jobs=1)
+
+        jobs = [
+            manager.submit(str(uuid4()), "step", Path("doc.FCStd"), "p")
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+
+        assert len(exporter.calls) == 1
+        exporter.release.set()
+        for job in jobs:
+            await manager.wait(job.job_id)
+        assert len(exporter.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_records_shared_through_redis(self, exporter, request_id, mock_redis):
+        client = RedisClient()
+        client.connection = mock_redis
+        worker_a = ExportJobManager(exporter, redis_client=client)
+        worker_b = ExportJobManager(exporter, redis_client=client)
+
+        job = worker_a.submit(request_id, "step", Path("doc.FCStd"), "p")
+        exporter.release.set()
+        await worker_a.wait(job.job_id)
+
+        seen = worker_b.get(job.job_id)
+        assert seen.status == ExportJobStatus.SUCCEEDED
+        assert seen.file_path == job.file_path
+
+    @pytest.mark.asyncio
+    async def test_workers_share_one_export(
+        self, exporter, tmp_path, request_id, mock_redis, monkeypatch
+    ):
+        monkeypatch.setattr(jobs_module, "_FOLLOW_POLL_SECONDS", 0.01)
+        client = RedisClient()
+        client.connection = mock_redis
+        other_exporter = SlowExporter(tmp_path)
+        worker_a = ExportJobManager(exporter, redis_client=client)
+        worker_b = ExportJobManager(other_exporter, redis_client=client)
+
+        owner = worker_a.submit(request_id, "stl", Path("doc.FCStd"), "p")
+        await asyncio.sleep(0.01)
+        follower = worker_b.submit(request_id, "stl", Path("doc.FCStd"), "p")
+        await asyncio.sleep(0.01)
+        exporter.release.set()
+        other_exporter.release.set()
+
+        done = await worker_b.wait(follower.job_id)
+        assert other_exporter.calls == []
+        assert done.status == ExportJobStatus.SUCCEEDED
+        assert done.file_path == (await worker_a.wait(owner.job_id)).file_path
+        assert mock_redis.keys("export_job:active:*") == []
+
+    def test_unsupported_format(self, exporter, request_id):
+        with pytest.raises(ValueError):
+            ExportJobManager(exporter).submit(request_id, "obj", Path("d"), "p")
+
+    def test_json_roundtrip(self, request_id):
+        job = ExportJob(job_id="j1", request_id=request_id, format="stl")
+        assert ExportJob.from_json(job.to_json()) == job
+
+
+class TestSpeculativeExports:
+    """Test per-client format preferences and prefetching"""
+
+    def test_preferences_need_history(self, exporter):
+        manager = ExportJobManager(exporter, speculative_min_requests=3)
+        manager.record_request("user:a", ["step"])
+
+        assert manager.preferred_formats("user:a") == []
+
+    def test_preferences_are_bounded(self, exporter, monkeypatch):
+        monkeypatch.setattr(jobs_module, "_PREFERENCES_MAX_CLIENTS", 2)
+        manager = ExportJobManager(exporter, speculative_min_requests=1)
+        for client_key in ("user:a", "user:b", "user:a", "user:c"):
+            manager.record_request(client_key, ["step"])
+
+        assert manager.preferred_formats("user:a") == ["step"]
+        assert manager.preferred_formats("user:b") == []
+
+    def test_preferred_formats_by_share(self, exporter):
+        manager = ExportJobManager(
+            exporter, speculative_min_requests=3, speculative_min_share=0.5
+        )
+        manager.record_request("user:a", ["step", "stl"])
+        manager.record_request("user:a", ["step"])
+        manager.record_request("user:a", ["fcstd"])
+        manager.record_request("user:b", ["stl"])
+
+        assert manager.preferred_formats("user:a") == ["step"]
+        assert manager.preferred_formats("user:b") == []
+
+    @pytest.mark.asyncio
+    async def test_prefetch_queues_usual_formats(self, exporter, request_id):
+        manager = ExportJobManager(exporter, speculative_min_requests=1)
+        manager.record_request("user:a", ["stl"])
+
+        jobs = manager.prefetch(request_id, "user:a", Path("doc.FCStd"), "p")
+
+        assert [(j.format, j.speculative) for j in jobs] == [("stl", True)]
+        # A client request for the same export joins the speculative job
+        assert manager.submit(request_id, "stl", Path("d"), "p").job_id == (
+            jobs[0].job_id
+        )
+        exporter.release.set()
+        await manager.wait(jobs[0].job_id)
+
+    def test_prefetch_disabled(self, exporter, request_id):
+        manager = ExportJobManager(
+            exporter, speculative_enabled=False, speculative_min_requests=1
+        )
+        manager.record_request("user:a", ["stl"])
+
+        assert manager.prefetch(request_id, "user:a", Path("d"), "p") == []
@@ -0,0 +1,88 @@
+"""
+Unit tests for state diffs and field-level state deltas.
+"""
+
+import json
+
+import pytest
+
+from ai_designer.freecad.state_diff import (
+    apply_state_delta,
+    compute_state_delta,
+    compute_state_diff,
+)
+
+
+def make_state(*objects, **extra):
+    state = {
+        "objects": [dict(obj) for obj in objects],
+        "object_count": len(objects),
+        "live_state": {"has_errors": False, "document_name": "Part"},
+    }
+    state.update(extra)
+    return state
+
+
+PAD = {"name": "Pad", "type": "PartDesign::Pad", "length": 10}
+SKETCH = {"name": "Sketch", "type": "Sketcher::SketchObject", "closed": True}
+POCKET = {"name": "Pocket", "type": "PartDesign::Pocket", "depth": 3}
+
+
+class TestComputeStateDiff:
+    """Test the structured summary diff"""
+
+    def test_added_removed_and_modified(self):
+        before = make_state(SKETCH, PAD)
+        after = make_state(dict(PAD, length=12), POCKET)
+
+        diff = compute_state_diff(before, after)
+
+        assert diff["objects_added"] == ["Pocket"]
+        assert diff["objects_removed"] == ["Sketch"]
+        assert diff["objects_modified"] == ["Pad"]
+
+
+class TestStateDelta:
+    """Test field-level deltas round-trip"""
+
+    @pytest.mark.parametrize(
+        "before, after",
+        [
+            (make_state(SKETCH), make_state(SKETCH, PAD)),
+            (make_state(SKETCH, PAD), make_state(PAD)),
+            (make_state(SKETCH, PAD), make_state(PAD, SKETCH)),
+            (make_state(SKETCH, PAD), make_state(SKETCH, dict(PAD, length=12))),
+            (make_state(PAD), make_state(PAD, live_state={"has_errors": True})),
+            (make_state(PAD, note="x"), make_state(PAD)),
+            ({"objects": [1, 2]}, {"objects": [1, 2, 3]}),
+            ({"objects": [PAD, PAD]}, {"objects": [PAD]}),
+            ({}, make_state(PAD)),
+        ],
+    )
+    def test_roundtrip(self, before, after):
+        delta = compute_state_delta(before, after)
+
+        assert apply_state_delta(before, delta) == after
+        # Deltas survive JSON encoding
+        assert apply_state_delta(before, json.loads(json.dumps(delta))) == after
+
+    def test_equal_states_give_empty_delta(self):
+        assert compute_state_delta(make_state(PAD), make_state(PAD)) == {}
+
+    def test_delta_holds_only_the_change(self):
+        objects = [{"name": f"Feature{i}", "length": i} for i in range(100)]
+        before = make_state(*objects)
+        after = make_state(*objects, POCKET)
+
+        delta = compute_state_delta(before, after)
+
+        assert delta["named"]["objects"] == {"set": {"Pocket": POCKET}}
+        assert len(json.dumps(delta)) * 20 < len(json.dumps(after))
+
+    def test_apply_does_not_modify_input(self):
+        before = make_state(SKETCH, PAD)
+        snapshot = json.loads(json.dumps(before))
+
+        apply_state_delta(before, compute_state_delta(before, make_state(POCKET)))
+
+        assert before == snapshot
@@ -0,0 +1,124 @@
+"""
+Tests for the rule-based fast path classifier
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.orchestration.fast_path import (
+    FAST_PATH_MIN_CONFIDENCE,
+    build_task_graph,
+    classify_prompt,
+)
+
+
+class TestClassifyPrompt:
+    """Test primitive recognition and dimension parsing"""
+
+    @pytest.mark.parametrize(
+        "prompt, shape, parameters",
+        [
+            (
+                "Create a box 50x30x20mm",
+                "box",
+                {"length": 50.0, "width": 30.0, "height": 20.0},
+            ),
+            (
+                "box length 4cm width 2cm height 1cm",
+                "box",
+                {"length": 40.0, "width": 20.0, "height": 10.0},
+            ),
+            (
+                "box 10mm long 20mm wide 30mm high",
+                "box",
+                {"length": 10.0, "width": 20.0, "height": 30.0},
+            ),
+            (
+                "cylinder radius 5mm 12mm tall",
+                "cylinder",
+                {"radius": 5.0, "height": 12.0},
+            ),
+            (
+                "Create a cube of 20 mm",
+                "box",
+                {"length": 20.0, "width": 20.0, "height": 20.0},
+            ),
+            (
+                "cylinder radius 10mm height 40mm",
+                "cylinder",
+                {"radius": 10.0, "height": 40.0},
+            ),
+            ("sphere of diameter 1 inch", "sphere", {"radius": 12.7}),
+            (
+                "a cube of 2 ft",
+                "box",
+                {"length": 609.6, "width": 609.6, "height": 609.6},
+            ),
+            ("sphere radius 1.5 meters", "sphere", {"radius": 1500.0}),
+            (
+                "cone radius 10mm height 30mm",
+                "cone",
+                {"radius1": 10.0, "radius2": 0.0, "height": 30.0},
+            ),
+        ],
+    )
+    def test_recognises_primitives(self, prompt, shape, parameters):
+        match = classify_prompt(prompt)
+
+        assert match is not None
+        assert match.shape == shape
+        assert match.operation_type == f"create_{shape}"
+        assert match.parameters == pytest.approx(parameters)
+        assert match.confidence >= FAST_PATH_MIN_CONFIDENCE
+
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "Create a mounting bracket 50x30x5mm",
+            "box 10x10x10mm with a hole",
+            "cube 20mm with rounded corners",
+            "a cylinder and a sphere of radius 5mm",
+            "cylinder radius 10mm",
+            "a box",
+            "2 cubes 10mm",
+            "box 10x20x30 furlongs",
+            "cylinder radius 5 yd height 10 yd",
+            "box 10x20x30 meters",
+        ],
+    )
+    def test_rejects_non_primitive_prompts(self, prompt):
+        assert classify_prompt(prompt) is None
+
+    def test_missing_unit_lowers_confidence(self):
+        with_unit = classify_prompt("box 50x30x20mm")
+        without_unit = classify_prompt("box 50x30x20")
+
+        assert without_unit.parameters == with_unit.parameters
+        assert without_unit.confidence < with_unit.confidence
+
+    def test_unused_numbers_fall_below_threshold(self):
+        match = classify_prompt("box 50x30x20mm rotated 45")
+
+        assert match is not None
+        assert match.confidence < FAST_PATH_MIN_CONFIDENCE
+
+    def test_analytic_geometry(self):
+        match = classify_prompt("box 10x20x30mm")
+
+        assert match.volume == pytest.approx(6000.0)
+        assert match.bounding_box == {"x": 10.0, "y": 20.0, "z": 30.0}
+        assert 'addObject("Part::Box"' in match.script
+
+
+class TestBuildTaskGraph:
+    """Test single-task graph construction"""
+
+    def test_single_task(self):
+        match = classify_prompt("cylinder radius 5mm height 10mm")
+        graph = build_task_graph(uuid4(), match)
+
+        assert graph.total_tasks == 1
+        task = next(iter(graph.nodes.values()))
+        assert task.operation_type == "create_cylinder"
+        assert task.parameters == {"radius": 5.0, "height": 10.0}
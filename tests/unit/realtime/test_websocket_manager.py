@@ -0,0 +1,123 @@
+"""
+Tests for event-loop-native message dispatch in the realtime WebSocketManager
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from ai_designer.realtime import websocket_manager as manager_module
+from ai_designer.realtime.websocket_manager import ProgressTracker, WebSocketManager
+
+
+class FakeServer:
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, frame):
+        self.frames.append(json.loads(frame))
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+async def manager(monkeypatch):
+    async def serve(*args, **kwargs):
+        return FakeServer()
+
+    monkeypatch.setattr(manager_module.websockets, "serve", serve)
+    manager = WebSocketManager()
+    await manager.start_server()
+    yield manager
+    await manager.stop_server()
+
+
+def join_client(manager, session_id="s1", client_id="c1", batch=True):
+    client = FakeClient()
+    manager.clients[client_id] = client
+    manager.register_client_session(client_id, session_id, batch=batch)
+    return client
+
+
+def messages(client):
+    """Unpack batch frames into the individual messages."""
+    unpacked = []
+    for frame in client.frames:
+        unpacked.extend(frame["messages"] if frame["type"] == "batch" else [frame])
+    return unpacked
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestWebSocketManager:
+    """Test queueing, cross-thread producers and batching"""
+
+    async def test_single_message_is_sent_unwrapped(self, manager):
+        client = join_client(manager)
+
+        manager.send_user_notification("hello", session_id="s1")
+        await settle()
+
+        assert [f["type"] for f in client.frames] == ["user_notification"]
+        assert client.frames[0]["data"]["message"] == "hello"
+
+    async def test_queued_messages_are_batched_per_session(self, manager):
+        client = join_client(manager)
+
+        for i in range(3):
+            manager.send_user_notification(f"n{i}", session_id="s1")
+        await settle()
+
+        assert len(client.frames) == 1
+        assert client.frames[0]["type"] == "batch"
+        assert [m["data"]["message"] for m in messages(client)] == ["n0", "n1", "n2"]
+
+    async def test_batches_are_opt_in(self, manager):
+        batching = join_client(manager)
+        plain = join_client(manager, client_id="c2", batch=False)
+
+        for i in range(3):
+            manager.send_user_notification(f"n{i}", session_id="s1")
+        await settle()
+
+        assert [f["type"] for f in batching.frames] == ["batch"]
+        assert [f["type"] for f in plain.frames] == ["user_notification"] * 3
+        assert messages(plain) == messages(batching)
+
+    async def test_progress_tracker_in_another_thread(self, manager):
+        client = join_client(manager)
+        tracker = ProgressTracker(manager)
+
+        def run_command():
+            tracker.start_tracking("cmd", total_steps=2, session_id="s1")
+            tracker.update_progress("cmd")
+            tracker.complete_tracking("cmd")
+
+        worker = threading.Thread(target=run_command)
+        worker.start()
+        worker.join()
+        await settle()
+
+        statuses = [m["data"]["status"] for m in messages(client)]
+        assert statuses == ["started", "running", "completed"]
+
+    async def test_messages_before_start_are_dropped(self):
+        manager = WebSocketManager()
+
+        manager.send_error("boom", session_id="s1")
+
+        assert manager.get_stats()["messages_dropped"] == 1
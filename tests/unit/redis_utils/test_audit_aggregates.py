@@ -0,0 +1,171 @@
+"""
+Tests for write-time audit aggregates and per-type indexes
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.redis_utils.audit import AuditEvent, AuditEventType, AuditLogger
+from ai_designer.redis_utils.client import RedisClient
+
+
+@pytest.fixture
+def audit_logger(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return AuditLogger(client)
+
+
+def log_pipeline_run(audit_logger, request_id):
+    audit_logger.log_event(AuditEventType.PROMPT_RECEIVED, request_id, "Start")
+    audit_logger.log_event(
+        AuditEventType.PLAN_GENERATED,
+        request_id,
+        "Plan",
+        node="planner_node",
+        metadata={"duration_ms": 120.5},
+    )
+    audit_logger.log_event(
+        AuditEventType.SCRIPT_GENERATED,
+        request_id,
+        "Script",
+        node="generator_node",
+        metadata={"duration_ms": 300},
+    )
+    audit_logger.log_event(
+        AuditEventType.PLAN_GENERATED,
+        request_id,
+        "Replan",
+        node="planner_node",
+        metadata={"duration_ms": 80},
+    )
+
+
+class TestTimelineSummary:
+    """Test summaries served from the aggregate hash"""
+
+    def test_summary_without_reading_stream(self, audit_logger, monkeypatch):
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+        monkeypatch.setattr(audit_logger, "get_history", pytest.fail)
+
+        summary = audit_logger.get_timeline_summary(request_id, include_timeline=False)
+
+        assert summary["total_events"] == 4
+        assert summary["event_counts"] == {
+            "prompt_received": 1,
+            "plan_generated": 2,
+            "script_generated": 1,
+        }
+        assert summary["first_event"] == summary["milestones"]["prompt_received"]
+        assert summary["first_event"] <= summary["last_event"]
+        assert summary["node_durations"] == {
+            "planner_node": {"total_ms": 200.5, "runs": 2},
+            "generator_node": {"total_ms": 300.0, "runs": 1},
+        }
+        assert "timeline" not in summary
+        assert audit_logger.get_event_counts(request_id)["plan_generated"] == 2
+
+    def test_summary_with_timeline(self, audit_logger):
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+
+        summary = audit_logger.get_timeline_summary(request_id)
+
+        assert [e["message"] for e in summary["timeline"]] == [
+            "Start",
+            "Plan",
+            "Script",
+            "Replan",
+        ]
+
+    def test_legacy_stream_is_scanned(self, audit_logger):
+        request_id = uuid4()
+        event = AuditEvent(
+            event_type=AuditEventType.PLAN_GENERATED,
+            request_id=request_id,
+            message="Old",
+            node="planner_node",
+            metadata={"duration_ms": 50},
+        )
+        audit_logger.redis_client.xadd(
+            f"design:{request_id}:audit", event.to_stream_fields()
+        )
+
+        summary = audit_logger.get_timeline_summary(request_id)
+        plans = audit_logger.get_events_by_type(
+            request_id, AuditEventType.PLAN_GENERATED
+        )
+
+        assert summary["event_counts"] == {"plan_generated": 1}
+        assert summary["milestones"] == {"plan_generated": summary["first_event"]}
+        assert summary["node_durations"] == {
+            "planner_node": {"total_ms": 50.0, "runs": 1}
+        }
+        assert [e.message for e in plans] == ["Old"]
+
+    def test_same_keys_on_both_paths(self, audit_logger):
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+        aggregated = audit_logger.get_timeline_summary(request_id)
+        audit_logger.redis_client.delete(f"design:{request_id}:audit:summary")
+
+        scanned = audit_logger.get_timeline_summary(request_id)
+        empty = audit_logger.get_timeline_summary(uuid4())
+
+        assert scanned == aggregated
+        assert empty.keys() == aggregated.keys()
+
+    def test_keys_expire_with_the_stream(self, mock_redis):
+        client = RedisClient()
+        client.connection = mock_redis
+        audit_logger = AuditLogger(client, ttl_seconds=60)
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+
+        keys = mock_redis.keys(f"design:{request_id}:audit*")
+        assert len(keys) == 5  # stream, summary and three type indexes
+        assert all(0 < mock_redis.ttl(key) <= 60 for key in keys)
+
+
+class TestEventsByType:
+    """Test per-type filtering through the entry index"""
+
+    def test_only_matching_entries_are_decoded(self, audit_logger, monkeypatch):
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+        decoded = []
+        original = AuditEvent.from_stream_entry
+
+        def counting(entry_id, fields):
+            decoded.append(entry_id)
+            return original(entry_id, fields)
+
+        monkeypatch.setattr(AuditEvent, "from_stream_entry", counting)
+
+        plans = audit_logger.get_events_by_type(
+            request_id, AuditEventType.PLAN_GENERATED
+        )
+
+        assert [e.message for e in plans] == ["Plan", "Replan"]
+        assert len(decoded) == 2
+        assert (
+            audit_logger.get_events_by_type(request_id, AuditEventType.PIPELINE_FAILED)
+            == []
+        )
+
+    def test_trimmed_entries_are_skipped(self, mock_redis):
+        client = RedisClient()
+        client.connection = mock_redis
+        audit_logger = AuditLogger(client, stream_max_length=3)
+        request_id = uuid4()
+        log_pipeline_run(audit_logger, request_id)
+        # Exact trim so the first PLAN_GENERATED entry is gone from the stream
+        mock_redis.xtrim(f"design:{request_id}:audit", maxlen=2, approximate=False)
+
+        plans = audit_logger.get_events_by_type(
+            request_id, AuditEventType.PLAN_GENERATED
+        )
+
+        assert [e.message for e in plans] == ["Replan"]
@@ -0,0 +1,188 @@
+"""
+Tests for pipelined audit writes and the buffered audit writer
+"""
+
+import asyncio
+import json
+import os
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from ai_designer.orchestration.callbacks import PipelineWebSocketCallback
+from ai_designer.redis_utils.audit import AuditEvent, AuditEventType, AuditLogger
+from ai_designer.redis_utils.audit_writer import BufferedAuditWriter
+from ai_designer.redis_utils.client import RedisClient
+
+
+@pytest.fixture
+def audit_logger(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return AuditLogger(client)
+
+
+@pytest.fixture
+def writer(audit_logger, tmp_path):
+    return BufferedAuditWriter(
+        audit_logger, flush_interval_ms=5, spool_path=str(tmp_path / "spool.jsonl")
+    )
+
+
+def make_event(request_id, message):
+    return AuditEvent(
+        event_type=AuditEventType.NODE_STARTED, request_id=request_id, message=message
+    )
+
+
+def messages(audit_logger, request_id):
+    return [e.message for e in audit_logger.get_history(request_id)]
+
+
+class TestLogEvents:
+    """Test the pipelined batch write"""
+
+    def test_writes_streams_and_publishes(self, audit_logger, mock_redis):
+        pubsub = mock_redis.pubsub()
+        first, second = uuid4(), uuid4()
+        pubsub.subscribe(f"design:{first}:events")
+        pubsub.get_message(timeout=0.1)
+        events = [
+            make_event(first, "a"),
+            make_event(second, "b"),
+            make_event(first, "c"),
+        ]
+
+        entry_ids = audit_logger.log_events(events)
+
+        assert len(entry_ids) == 3
+        assert [e.event_id for e in events] == entry_ids
+        assert messages(audit_logger, first) == ["a", "c"]
+        published = pubsub.get_message(timeout=0.1)
+        assert json.loads(published["data"])["message"] == "a"
+
+
+class TestBufferedAuditWriter:
+    """Test batching, ordering and spooling"""
+
+    async def test_batches_in_order(self, writer, audit_logger):
+        request_id = uuid4()
+        writer.start()
+
+        for i in range(5):
+            assert (
+                writer.log_event(AuditEventType.NODE_STARTED, request_id, f"{i}")
+                is None
+            )
+        assert messages(audit_logger, request_id) == []
+        await asyncio.sleep(0.05)
+
+        assert messages(audit_logger, request_id) == ["0", "1", "2", "3", "4"]
+        await writer.stop()
+
+    async def test_full_batch_flushes_early(self, audit_logger, tmp_path):
+        writer = BufferedAuditWriter(
+            audit_logger,
+            flush_interval_ms=10_000,
+            max_batch=2,
+            spool_path=str(tmp_path / "spool.jsonl"),
+        )
+        request_id = uuid4()
+        writer.start()
+
+        writer.log_event(AuditEventType.NODE_STARTED, request_id, "a")
+        writer.log_event(AuditEventType.NODE_COMPLETED, request_id, "b")
+        await asyncio.sleep(0.05)
+
+        assert messages(audit_logger, request_id) == ["a", "b"]
+        await writer.stop()
+
+    async def test_stop_flushes_queue(self, writer, audit_logger):
+        request_id = uuid4()
+        writer.start()
+        writer.log_event(AuditEventType.NODE_STARTED, request_id, "a")
+
+        await writer.stop()
+
+        assert messages(audit_logger, request_id) == ["a"]
+
+    async def test_spools_while_redis_is_down(self, writer, audit_logger, monkeypatch):
+        request_id = uuid4()
+
+        def redis_down(events):
+            raise ConnectionError("connection refused")
+
+        monkeypatch.setattr(audit_logger, "log_events", redis_down)
+        writer.start()
+        writer.log_event(AuditEventType.NODE_STARTED, request_id, "a")
+        writer.log_event(AuditEventType.NODE_COMPLETED, request_id, "b")
+        assert await writer.flush() == 0
+        with open(writer.spool_path) as f:
+            assert len(f.readlines()) == 2
+
+        monkeypatch.undo()
+        writer.log_event(AuditEventType.PIPELINE_COMPLETED, request_id, "c")
+        assert await writer.flush() == 3
+
+        assert messages(audit_logger, request_id) == ["a", "b", "c"]
+        assert not os.path.exists(writer.spool_path)
+        await writer.stop()
+
+    async def test_index_failure_does_not_respool_written_events(
+        self, writer, audit_logger, monkeypatch
+    ):
+        request_id = uuid4()
+
+        def index_down(events):
+            raise ConnectionError("connection reset")
+
+        monkeypatch.setattr(audit_logger, "_index_events", index_down)
+        writer.start()
+        writer.log_event(AuditEventType.NODE_STARTED, request_id, "a")
+
+        assert await writer.flush() == 1
+        assert not os.path.exists(writer.spool_path)
+        assert messages(audit_logger, request_id) == ["a"]
+        assert audit_logger.get_event_counts(request_id)["node_started"] == 1
+        await writer.stop()
+
+    async def test_replays_spool_of_previous_run(self, audit_logger, tmp_path):
+        request_id = uuid4()
+        spool_path = tmp_path / "spool.jsonl"
+        spool_path.write_text(make_event(request_id, "old").model_dump_json() + "\n")
+        writer = BufferedAuditWriter(
+            audit_logger, flush_interval_ms=5, spool_path=str(spool_path)
+        )
+
+        writer.start()
+        writer.log_event(AuditEventType.NODE_STARTED, request_id, "new")
+        await writer.stop()
+
+        assert messages(audit_logger, request_id) == ["old", "new"]
+        assert not spool_path.exists()
+
+    def test_writes_synchronously_when_not_started(self, writer, audit_logger):
+        request_id = uuid4()
+
+        entry_id = writer.log_event(AuditEventType.NODE_STARTED, request_id, "a")
+
+        assert entry_id
+        assert messages(audit_logger, request_id) == ["a"]
+
+
+class TestPipelineCallback:
+    """Test that pipeline node events are queued on the writer"""
+
+    async def test_node_events_are_buffered(self, writer, audit_logger):
+        request_id = uuid4()
+        callback = PipelineWebSocketCallback(None, writer)
+        writer.start()
+
+        await callback(request_id, {"node": "planner", "status": "completed"})
+        assert messages(audit_logger, request_id) == []
+
+        await writer.stop()
+        (event,) = audit_logger.get_history(request_id)
+        assert event.event_type == AuditEventType.NODE_COMPLETED
+        assert (event.node, event.status) == ("planner", "completed")
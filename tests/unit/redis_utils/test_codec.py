@@ -0,0 +1,114 @@
+"""
+Tests for the cached state payload codec
+"""
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.redis_utils import codec as codec_module
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.codec import StateCodec
+from ai_designer.redis_utils.state_cache import StateCache
+from ai_designer.schemas.design_state import DesignState
+
+FEATURE_TREE = {
+    "objects": [
+        {"name": f"Pad{i}", "type": "PartDesign::Pad", "length": 10.0 + i}
+        for i in range(200)
+    ],
+    "ok": True,
+}
+
+
+@pytest.fixture
+def client(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return client
+
+
+class TestStateCodec:
+    """Test encoding, compression and legacy decoding"""
+
+    def test_small_payload_is_not_compressed(self):
+        codec = StateCodec(serializer="json", compress_min_bytes=1024)
+        encoded = codec.dumps({"a": 1})
+
+        assert codec_module._FORMATS[encoded[0]] == ("json", None)
+        assert codec.loads(encoded) == {"a": 1}
+
+    def test_large_payload_is_compressed(self):
+        codec = StateCodec(serializer="json")
+        encoded = codec.dumps(FEATURE_TREE)
+
+        assert codec_module._FORMATS[encoded[0]] == ("json", codec.compression)
+        assert len(encoded) * 4 < len(json.dumps(FEATURE_TREE))
+        assert codec.loads(encoded) == FEATURE_TREE
+
+    def test_zlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(codec_module, "zstandard", None)
+        codec = StateCodec(serializer="json")
+        encoded = codec.dumps(FEATURE_TREE)
+
+        assert codec_module._FORMATS[encoded[0]] == ("json", "zlib")
+        assert codec.loads(encoded) == FEATURE_TREE
+
+    def test_msgpack(self):
+        pytest.importorskip("msgpack")
+        codec = StateCodec(serializer="msgpack", compress_min_bytes=-1)
+        encoded = codec.dumps(FEATURE_TREE)
+
+        assert codec_module._FORMATS[encoded[0]] == ("msgpack", None)
+        assert StateCodec(serializer="json").loads(encoded) == FEATURE_TREE
+
+    def test_decodes_legacy_json(self):
+        legacy = json.dumps(FEATURE_TREE)
+
+        assert StateCodec().loads(legacy) == FEATURE_TREE
+        assert StateCodec().loads(legacy.encode("utf-8")) == FEATURE_TREE
+
+    def test_corrupt_payload_raises_value_error(self):
+        codec = StateCodec(serializer="json")
+        encoded = codec.dumps(FEATURE_TREE)
+
+        with pytest.raises(ValueError):
+            codec.loads(encoded[:-10])
+
+    def test_unknown_serializer(self):
+        with pytest.raises(ValueError):
+            StateCodec(serializer="pickle")
+
+
+class TestStateCacheEncoding:
+    """Test StateCache reads old and new entries"""
+
+    def test_state_roundtrip_is_compact(self, client):
+        cache = StateCache(client)
+        key = cache.cache_state(FEATURE_TREE, document_name="Part", session_id="s1")
+
+        assert cache.retrieve_state(key) == FEATURE_TREE
+        assert len(client.get(key)) * 4 < len(json.dumps(FEATURE_TREE))
+        assert cache.get_latest_state("Part") == key
+
+    def test_reads_plain_json_entries(self, client):
+        cache = StateCache(client)
+        legacy = {"data": FEATURE_TREE, "metadata": {"type": "state"}}
+        client.set("freecad:state:old", json.dumps(legacy))
+
+        assert cache.retrieve_state("freecad:state:old") == FEATURE_TREE
+        assert cache.retrieve_with_metadata("freecad:state:old") == legacy
+
+    def test_design_state_roundtrip(self, client):
+        cache = StateCache(client)
+        state = DesignState(request_id=uuid4(), user_prompt="bracket " * 300)
+        legacy = DesignState(request_id=uuid4(), user_prompt="plate")
+        client.set(f"design:{legacy.request_id}:state", legacy.model_dump_json())
+
+        assert cache.cache_design_state(state)
+
+        assert cache.retrieve_design_state(state.request_id) == state
+        assert len(client.get(f"design:{state.request_id}:state")) < 1000
+        loaded = cache.retrieve_design_states([state.request_id, legacy.request_id])
+        assert loaded == {str(state.request_id): state, str(legacy.request_id): legacy}
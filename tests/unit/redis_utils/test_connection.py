@@ -0,0 +1,140 @@
+"""
+Tests for the shared sync and asyncio Redis connection pools
+"""
+
+import weakref
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+
+from ai_designer.redis_utils import connection
+from ai_designer.redis_utils.client import RedisClient
+
+URL = "redis://cache:6380/2"
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools(monkeypatch):
+    monkeypatch.setattr(connection, "_sync_pools", {})
+    monkeypatch.setattr(connection, "_async_pools", weakref.WeakKeyDictionary())
+    for name in ("REDIS_URL", "REDIS_HOST", "REDIS_PORT", "REDIS_DB"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestRedisUrl:
+    """Test URL resolution from the environment"""
+
+    def test_host_port_db(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "cache")
+        monkeypatch.setenv("REDIS_DB", "3")
+
+        assert connection.redis_url() == "redis://cache:6379/3"
+        assert connection.redis_url("other", 1, 0) == "redis://other:1/0"
+
+    def test_redis_url_wins(self, monkeypatch):
+        monkeypatch.setenv("REDIS_URL", URL)
+        monkeypatch.setenv("REDIS_HOST", "ignored")
+
+        assert connection.redis_url() == URL
+        client = RedisClient.from_env()
+        assert (client.url, client.host, client.port, client.db) == (
+            URL,
+            "cache",
+            6380,
+            2,
+        )
+
+
+class TestSyncPools:
+    """Test pool sharing and connection settings"""
+
+    def test_clients_share_one_pool(self):
+        first, second = RedisClient(url=URL), RedisClient(url=URL)
+        first.connect()
+        second.connect()
+
+        assert first.pool is second.pool
+        assert first.pool is connection.get_sync_pool(URL)
+        assert connection.get_sync_pool(URL, decode_responses=True) is not first.pool
+
+    def test_pool_is_bounded_with_health_checks_and_retries(self):
+        pool = connection.get_sync_pool(URL, max_connections=7)
+
+        assert pool.max_connections == 7
+        assert pool.connection_kwargs["health_check_interval"] == 30
+        assert pool.connection_kwargs["retry"]._retries == 3
+        assert pool.connection_kwargs["retry_on_error"]
+
+    def test_ping_never_raises(self):
+        server = fakeredis.FakeServer()
+        client = fakeredis.FakeRedis(server=server)
+        assert connection.ping(client)
+
+        server.connected = False
+        assert not connection.ping(client)
+
+    def test_execute_pipeline(self):
+        client = fakeredis.FakeRedis()
+
+        results = connection.execute_pipeline(
+            client,
+            lambda pipe: pipe.incr("n").incr("n").get("n"),
+            transaction=True,
+        )
+
+        assert results == [1, 2, b"2"]
+
+    def test_transaction(self, mock_redis):
+        client = RedisClient()
+        client.connection = mock_redis
+        mock_redis.set("balance", 10)
+
+        def withdraw(pipe):
+            balance = int(pipe.get("balance"))
+            pipe.multi()
+            pipe.set("balance", balance - 3)
+            return balance - 3
+
+        assert client.transaction(withdraw, "balance") == 7
+        assert client.get("balance") == b"7"
+
+
+class TestAsyncPools:
+    """Test the asyncio facade"""
+
+    async def test_pool_is_shared_within_a_loop(self):
+        client = RedisClient(url=URL)
+
+        assert client.async_connection.connection_pool is connection.get_async_pool(URL)
+        assert connection.get_async_pool(URL, decode_responses=True) is not (
+            connection.get_async_pool(URL)
+        )
+
+    async def test_named_pools_are_separate(self):
+        client = RedisClient(url=URL)
+
+        tail = client.dedicated_async_connection("tail", max_connections=3)
+
+        assert tail.connection_pool is connection.get_async_pool(URL, name="tail")
+        assert tail.connection_pool is not client.async_connection.connection_pool
+        assert tail.connection_pool.max_connections == 3
+
+    async def test_close_pools_forgets_pools(self):
+        pool = connection.get_async_pool(URL)
+        connection.get_sync_pool(URL)
+
+        await connection.close_pools()
+
+        assert connection._sync_pools == {}
+        assert connection.get_async_pool(URL) is not pool
+
+    async def test_execute_async_pipeline_and_ping(self):
+        client = aioredis.FakeRedis()
+
+        results = await connection.execute_async_pipeline(
+            client, lambda pipe: pipe.set("k", "v").get("k")
+        )
+
+        assert results == [True, b"v"]
+        assert await connection.async_ping(client)
@@ -0,0 +1,269 @@
+"""
+Tests for the Redis-backed design store
+"""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.design_store import DesignStore
+from ai_designer.redis_utils.state_cache import StateCache
+from ai_designer.schemas.design_state import DesignState, ExecutionStatus
+
+
+def make_store(redis_connection, **kwargs):
+    client = RedisClient()
+    client.connection = redis_connection
+    return DesignStore(state_cache=StateCache(client), **kwargs)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_async_store(server, **kwargs):
+    """Store whose sync and asyncio clients share one fake server."""
+    store = make_store(fakeredis.FakeRedis(server=server), **kwargs)
+    store.state_cache.redis_client.async_connection = aioredis.FakeRedis(server=server)
+    return store
+
+
+@pytest.fixture
+def design_state():
+    return DesignState(request_id=uuid4(), user_prompt="Create a bracket")
+
+
+class TestDesignStore:
+    """Test shared persistence and version-stamped local caching"""
+
+    def test_shared_between_workers(self, mock_redis, design_state):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+
+        worker_a.save(design_state)
+        loaded = worker_b.get(str(design_state.request_id))
+
+        assert loaded is not None
+        assert loaded.user_prompt == "Create a bracket"
+
+    def test_state_and_version_written_in_one_transaction(
+        self, mock_redis, design_state
+    ):
+        store = make_store(mock_redis)
+        client = store.state_cache.redis_client
+        transactions = []
+        pipeline = client.pipeline
+
+        def recording_pipeline(transaction=False):
+            transactions.append(transaction)
+            return pipeline(transaction=transaction)
+
+        client.pipeline = recording_pipeline
+        client.set = pytest.fail  # No separate round trip for the version
+
+        store.save(design_state)
+        store.save_many(
+            [design_state, DesignState(request_id=uuid4(), user_prompt="x")]
+        )
+
+        assert transactions == [True, True]
+        assert make_store(mock_redis).get(str(design_state.request_id)) is not None
+
+    def test_hot_read_served_locally(self, mock_redis, design_state):
+        store = make_store(mock_redis)
+        store.save(design_state)
+
+        # Same object back: no fetch or parse while the version is unchanged
+        assert store.get(str(design_state.request_id)) is design_state
+
+    def test_write_invalidates_other_workers(self, mock_redis, design_state):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+        request_id = str(design_state.request_id)
+
+        worker_a.save(design_state)
+        assert worker_b.get(request_id).status == ExecutionStatus.PENDING
+
+        updated = design_state.model_copy(deep=True)
+        updated.mark_completed()
+        worker_a.save(updated)
+
+        assert worker_b.get(request_id).status == ExecutionStatus.COMPLETED
+
+    def test_delete_visible_everywhere(self, mock_redis, design_state):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+        request_id = str(design_state.request_id)
+
+        worker_a.save(design_state)
+        worker_b.get(request_id)
+
+        assert worker_a.delete(request_id)
+        assert worker_b.get(request_id) is None
+        assert not worker_a.delete(request_id)
+
+    def test_local_lru_is_bounded(self, mock_redis):
+        store = make_store(mock_redis, local_max_entries=2)
+        states = [DesignState(request_id=uuid4(), user_prompt="p") for _ in range(3)]
+        for state in states:
+            store.save(state)
+
+        assert len(store._local) == 2
+        # Evicted locally but still readable from Redis
+        assert store.get(str(states[0].request_id)) is not None
+
+    def test_local_only_mode(self, design_state):
+        store = DesignStore(state_cache=None)
+        store.save(design_state)
+
+        assert not store.is_shared
+        assert str(design_state.request_id) in store
+        assert store.delete(str(design_state.request_id))
+        assert store.get(str(design_state.request_id)) is None
+
+    async def test_async_variants_run_off_the_loop(
+        self, mock_redis, design_state, monkeypatch
+    ):
+        store = make_store(mock_redis)
+        request_id = str(design_state.request_id)
+        threads = []
+        original = store.state_cache.redis_client.get
+
+        def spying_get(key):
+            threads.append(threading.get_ident())
+            return original(key)
+
+        monkeypatch.setattr(store.state_cache.redis_client, "get", spying_get)
+
+        await store.save_async(design_state)
+        assert (await store.get_async(request_id)).user_prompt == "Create a bracket"
+        assert list(await store.get_many_async([request_id])) == [request_id]
+        assert await store.delete_async(request_id)
+
+        assert threads
+        assert threading.get_ident() not in threads
+
+
+class TestDesignStoreVersions:
+    """Test version tokens used for ETags and long-polling"""
+
+    def test_version_changes_on_save(self, mock_redis, design_state):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+        request_id = str(design_state.request_id)
+
+        assert worker_a.version(request_id) is None
+        worker_a.save(design_state)
+        first = worker_b.version(request_id)
+
+        worker_a.save(design_state)
+        assert first is not None
+        assert worker_b.version(request_id) != first
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_save(self, server, design_state):
+        store = make_async_store(server, wait_poll_seconds=30)
+        request_id = str(design_state.request_id)
+        store.save(design_state)
+        version = store.version(request_id)
+
+        waiting = asyncio.create_task(store.wait_for_change(request_id, version, 5))
+        await asyncio.sleep(0)
+        store.save(design_state)
+
+        new_version = await asyncio.wait_for(waiting, timeout=1)
+        assert new_version == store.version(request_id) != version
+
+    @pytest.mark.asyncio
+    async def test_wait_sees_other_worker_writes(self, server, design_state):
+        worker_a = make_async_store(server)
+        worker_b = make_async_store(server, wait_poll_seconds=0.01)
+        request_id = str(design_state.request_id)
+        worker_a.save(design_state)
+        version = worker_b.version(request_id)
+
+        waiting = asyncio.create_task(worker_b.wait_for_change(request_id, version, 5))
+        await asyncio.sleep(0.02)
+        worker_a.save(design_state)
+
+        assert await asyncio.wait_for(waiting, timeout=1) != version
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_unchanged(self, server, design_state):
+        store = make_async_store(server, wait_poll_seconds=0.01)
+        request_id = str(design_state.request_id)
+        store.save(design_state)
+        version = store.version(request_id)
+
+        store.version = pytest.fail  # Waiting must not use the blocking client
+        assert await store.wait_for_change(request_id, version, 0.05) == version
+        assert store._waiters == {}
+
+
+class TestDesignStoreBulk:
+    """Test batched reads and writes"""
+
+    def test_save_many_visible_to_other_workers(self, mock_redis):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+        states = [DesignState(request_id=uuid4(), user_prompt="p") for _ in range(3)]
+
+        worker_a.save_many(states)
+        loaded = worker_b.get_many([str(s.request_id) for s in states])
+
+        assert set(loaded) == {str(s.request_id) for s in states}
+
+    def test_get_many_uses_local_copies_and_skips_missing(self, mock_redis):
+        store = make_store(mock_redis)
+        states = [DesignState(request_id=uuid4(), user_prompt="p") for _ in range(2)]
+        store.save_many(states)
+        unknown = str(uuid4())
+
+        loaded = store.get_many([str(states[0].request_id), unknown])
+
+        assert list(loaded) == [str(states[0].request_id)]
+        assert loaded[str(states[0].request_id)] is states[0]
+
+    def test_get_many_refreshes_stale_copies(self, mock_redis, design_state):
+        worker_a = make_store(mock_redis)
+        worker_b = make_store(mock_redis)
+        request_id = str(design_state.request_id)
+        worker_a.save(design_state)
+        worker_b.get_many([request_id])
+
+        updated = design_state.model_copy(deep=True)
+        updated.mark_completed()
+        worker_a.save(updated)
+
+        assert worker_b.get_many([request_id])[request_id].status == (
+            ExecutionStatus.COMPLETED
+        )
+
+    def test_bulk_local_only_mode(self):
+        store = DesignStore(state_cache=None)
+        states = [DesignState(request_id=uuid4(), user_prompt="p") for _ in range(2)]
+        store.save_many(states)
+
+        assert len(store.get_many([str(s.request_id) for s in states])) == 2
+
+
+class TestAttach:
+    """Test switching a local-only store to Redis"""
+
+    def test_local_designs_are_persisted(self, mock_redis, design_state):
+        store = DesignStore()
+        store.save(design_state)
+        client = RedisClient()
+        client.connection = mock_redis
+
+        store.attach(StateCache(client))
+
+        assert store.is_shared
+        other_worker = make_store(mock_redis)
+        assert other_worker.get(str(design_state.request_id)) is not None
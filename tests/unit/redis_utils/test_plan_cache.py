@@ -0,0 +1,155 @@
+"""
+Tests for the structural planner template cache
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.plan_cache import PlanCache, normalize_prompt
+from ai_designer.schemas.task_graph import TaskGraph, TaskNode
+
+PLATE_PROMPT = "Plate 100x80x6mm with 4 holes of diameter 10mm"
+
+
+@pytest.fixture
+def plan_cache(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return PlanCache(client, ttl_seconds=60, max_entries=10, min_confidence=0.9)
+
+
+@pytest.fixture
+def plate_graph():
+    graph = TaskGraph(request_id=uuid4())
+    graph.add_task(
+        TaskNode(
+            task_id="task_1",
+            operation_type="create_box",
+            description="Create plate 100x80x6mm",
+            parameters={"length": 100.0, "width": 80.0, "height": 6.0},
+        )
+    )
+    graph.add_task(
+        TaskNode(
+            task_id="task_2",
+            operation_type="create_cylinder",
+            description="Create 4 hole cylinders",
+            parameters={"radius": 5.0, "height": 6.0, "count": 4},
+        )
+    )
+    graph.add_task(
+        TaskNode(
+            task_id="task_3",
+            operation_type="boolean_cut",
+            description="Cut holes from plate",
+            parameters={"base_task_id": "task_1", "tool_task_id": "task_2"},
+        )
+    )
+    graph.add_dependency("task_1", "task_3")
+    graph.add_dependency("task_2", "task_3")
+    return graph
+
+
+class TestNormalizePrompt:
+    """Test structural keys and dimension extraction"""
+
+    def test_dimensions_do_not_change_key(self):
+        a = normalize_prompt("plate 100x80 with 4 holes")
+        b = normalize_prompt("Plate 12cm by 60 mm with 4 holes")
+
+        assert a.key == b.key
+        assert a.values == [100.0, 80.0]
+        assert b.values == [120.0, 60.0]
+
+    def test_feature_counts_change_key(self):
+        a = normalize_prompt("plate 100x80 with 4 holes")
+        b = normalize_prompt("plate 100x80 with 6 holes")
+
+        assert a.key != b.key
+        assert a.counts == [4]
+
+
+class TestPlanCache:
+    """Test template storage, re-binding and eviction"""
+
+    def test_hit_rebinds_parameters(self, plan_cache, plate_graph):
+        assert plan_cache.store(PLATE_PROMPT, plate_graph)
+
+        request_id = uuid4()
+        graph = plan_cache.lookup(
+            "plate 120x60x4mm with 4 holes of diameter 8mm", request_id
+        )
+
+        assert graph is not None
+        assert graph.request_id == request_id
+        assert graph.nodes["task_1"].parameters == {
+            "length": 120.0,
+            "width": 60.0,
+            "height": 4.0,
+        }
+        assert graph.nodes["task_2"].parameters == {
+            "radius": 4.0,
+            "height": 4.0,
+            "count": 4,
+        }
+        assert graph.nodes["task_1"].description == "Create plate 120x60x4mm"
+        assert sorted(graph.nodes["task_3"].depends_on) == ["task_1", "task_2"]
+
+    def test_structural_miss(self, plan_cache, plate_graph):
+        plan_cache.store(PLATE_PROMPT, plate_graph)
+
+        assert (
+            plan_cache.lookup("plate 120x60x4mm with 6 holes of diameter 8mm", uuid4())
+            is None
+        )
+
+    def test_unbound_parameters_are_not_cached(self, plan_cache, plate_graph):
+        # Hole positions derived by the LLM cannot be re-bound
+        plate_graph.nodes["task_2"].parameters["position"] = [15.0, 12.5, 0.0]
+
+        assert not plan_cache.store(PLATE_PROMPT, plate_graph)
+        assert plan_cache.lookup(PLATE_PROMPT, uuid4()) is None
+
+    def test_lru_eviction(self, plan_cache, plate_graph):
+        plan_cache.max_entries = 1
+        plan_cache.store(PLATE_PROMPT, plate_graph)
+        plan_cache.store("Plate 100x80x6mm with 4 holes of radius 5mm", plate_graph)
+
+        assert plan_cache.lookup(PLATE_PROMPT, uuid4()) is None
+        assert plan_cache.get_stats()["evictions"] == 1
+
+    def test_stats_hit_rate(self, plan_cache, plate_graph):
+        plan_cache.store(PLATE_PROMPT, plate_graph)
+        plan_cache.lookup(PLATE_PROMPT, uuid4())
+        plan_cache.lookup("a sphere of radius 5mm", uuid4())
+
+        stats = plan_cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_redis_failure_is_a_miss(self, plate_graph):
+        cache = PlanCache(RedisClient())  # never connected
+
+        assert cache.lookup(PLATE_PROMPT, uuid4()) is None
+        assert not cache.store(PLATE_PROMPT, plate_graph)
+
+    def test_invalidate_drops_template(self, plan_cache, plate_graph):
+        plan_cache.store(PLATE_PROMPT, plate_graph)
+
+        assert plan_cache.invalidate("Plate 120x60x5mm with 4 holes of diameter 8mm")
+        assert plan_cache.lookup(PLATE_PROMPT, uuid4()) is None
+        assert not plan_cache.invalidate(PLATE_PROMPT)
+
+        stats = plan_cache.get_stats()
+        assert stats["invalidations"] == 1
+        assert stats["entries"] == 0
+
+    async def test_async_variants(self, plan_cache, plate_graph):
+        assert await plan_cache.store_async(PLATE_PROMPT, plate_graph)
+        assert await plan_cache.lookup_async(PLATE_PROMPT, uuid4()) is not None
+        assert await plan_cache.invalidate_async(PLATE_PROMPT)
+        assert await plan_cache.lookup_async(PLATE_PROMPT, uuid4()) is None
@@ -0,0 +1,123 @@
+"""
+Tests for the asyncio pattern-subscription Pub/Sub bridge
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+from redis.exceptions import ConnectionError
+
+from ai_designer.redis_utils import pubsub_bridge as bridge_module
+from ai_designer.redis_utils.pubsub_bridge import PubSubBridge
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def publisher(server):
+    return aioredis.FakeRedis(server=server)
+
+
+async def wait_for(condition, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def publish(publisher, request_id, event_type="node_started"):
+    payload = json.dumps({"event_type": event_type, "message": "hi"})
+    await publisher.publish(f"design:{request_id}:events", payload)
+
+
+async def start(bridge):
+    await bridge.start_listener()
+    await wait_for(lambda: bridge.pubsub is not None and bridge.pubsub.subscribed)
+
+
+class TestPubSubBridge:
+    """Test pattern subscription and local dispatch"""
+
+    async def test_forwards_only_watched_designs(self, server, publisher):
+        manager = AsyncMock()
+        bridge = PubSubBridge(
+            None, manager, async_redis=aioredis.FakeRedis(server=server)
+        )
+        watched, other = uuid4(), uuid4()
+        bridge.subscribe_to_design(watched)
+        await start(bridge)
+
+        await publish(publisher, other)
+        await publish(publisher, watched, "pipeline_completed")
+        await wait_for(lambda: manager.send_update.await_count == 1)
+        await bridge.stop_listener()
+
+        request_id, message = manager.send_update.await_args[0]
+        assert request_id == str(watched)
+        assert message["type"] == "completed"
+
+    async def test_listener_refcount(self):
+        bridge = PubSubBridge(None)
+        request_id = uuid4()
+
+        bridge.subscribe_to_design(request_id)
+        bridge.subscribe_to_design(request_id)
+        bridge.unsubscribe_from_design(request_id)
+        assert bridge.has_listeners(request_id)
+        bridge.unsubscribe_from_design(request_id)
+        assert not bridge.has_listeners(request_id)
+
+    async def test_subscriber_queue_drops_oldest(self, server, publisher):
+        bridge = PubSubBridge(None, async_redis=aioredis.FakeRedis(server=server))
+        request_id = uuid4()
+        queue = bridge.add_subscriber(request_id, maxsize=2)
+        await start(bridge)
+
+        for event_type in ("node_started", "node_completed", "pipeline_completed"):
+            await publish(publisher, request_id, event_type)
+        await wait_for(
+            lambda: queue.full()
+            and queue._queue[-1]["event_type"] == "pipeline_completed"
+        )
+        await bridge.stop_listener()
+
+        assert [queue.get_nowait()["event_type"] for _ in range(2)] == [
+            "node_completed",
+            "pipeline_completed",
+        ]
+        bridge.remove_subscriber(request_id, queue)
+        assert not bridge.has_listeners(request_id)
+
+    async def test_reconnects_after_connection_error(
+        self, server, publisher, monkeypatch
+    ):
+        monkeypatch.setattr(bridge_module, "_RECONNECT_MIN_SECONDS", 0.01)
+        real = aioredis.FakeRedis(server=server)
+        attempts = []
+
+        class FlakyRedis:
+            def pubsub(self, **kwargs):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise ConnectionError("connection refused")
+                return real.pubsub(**kwargs)
+
+        manager = AsyncMock()
+        bridge = PubSubBridge(None, manager, async_redis=FlakyRedis())
+        request_id = uuid4()
+        bridge.subscribe_to_design(request_id)
+        await start(bridge)
+
+        await publish(publisher, request_id)
+        await wait_for(lambda: manager.send_update.await_count == 1)
+        await bridge.stop_listener()
+
+        assert len(attempts) == 2
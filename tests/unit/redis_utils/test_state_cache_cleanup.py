@@ -0,0 +1,134 @@
+"""
+Tests for batched StateCache cleanups and the background maintenance task
+"""
+
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from ai_designer.redis_utils import state_cache as state_cache_module
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.maintenance import StateCacheMaintenance
+from ai_designer.redis_utils.state_cache import StateCache
+from ai_designer.schemas.design_state import DesignState, ExecutionStatus
+
+
+@pytest.fixture
+def client(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return client
+
+
+@pytest.fixture
+def cache(client):
+    return StateCache(client, cleanup_batch_size=3)
+
+
+def completed_design(hours_ago):
+    state = DesignState(
+        request_id=uuid4(), user_prompt="bracket", status=ExecutionStatus.COMPLETED
+    )
+    state.completed_at = datetime.utcnow() - timedelta(hours=hours_ago)
+    return state
+
+
+class TestBulkClear:
+    """Test chunked clears with progress and pacing"""
+
+    def test_clear_reports_progress_per_chunk(self, cache, client):
+        for i in range(7):
+            cache.cache_state({"i": i}, f"freecad:state:Part:{i}", "Part", "s1")
+        progress = []
+
+        assert cache.clear_all_states("Part", progress=progress.append) == 7
+        assert progress == [3, 6, 7]
+        assert not list(client.scan_iter("freecad:metadata:*"))
+
+    def test_rate_cap_sleeps(self, client, monkeypatch):
+        cache = StateCache(client, cleanup_batch_size=2, cleanup_max_keys_per_second=4)
+        for i in range(4):
+            cache.cache_state({"i": i}, f"freecad:state:Part:{i}", "Part")
+        sleeps = []
+        monkeypatch.setattr(state_cache_module, "time", _FakeTime(sleeps), raising=True)
+
+        assert cache.clear_all_states() == 4
+        # 2 keys at 4 keys/s -> 0.5s per chunk
+        assert sleeps == pytest.approx([0.5, 0.5])
+
+
+class TestCleanupCompletedDesigns:
+    """Test the HSCAN-driven design cleanup"""
+
+    def test_deletes_only_old_completed_designs(self, cache):
+        old = [completed_design(48) for _ in range(5)]
+        recent = completed_design(1)
+        running = DesignState(request_id=uuid4(), user_prompt="plate")
+        cache.cache_design_states(old + [recent, running])
+        progress = []
+
+        deleted = cache.cleanup_completed_designs(24, progress=progress.append)
+
+        assert deleted == 5
+        assert progress[-1] == 5
+        remaining = set(cache.list_design_states())
+        assert remaining == {recent.request_id, running.request_id}
+        assert cache.retrieve_design_state(old[0].request_id) is None
+
+    def test_index_entries_without_completed_at(self, cache, client):
+        old = completed_design(48)
+        cache.cache_design_state(old)
+        # Index entry written before completed_at was recorded
+        entry = json.loads(client.hget("design:index", str(old.request_id)))
+        del entry["completed_at"]
+        client.hset("design:index", str(old.request_id), json.dumps(entry))
+        # Index entry whose state has expired
+        expired = completed_design(48)
+        cache.cache_design_state(expired)
+        client.delete(f"design:{expired.request_id}:state")
+
+        assert cache.cleanup_completed_designs(24) == 1
+        assert client.hgetall("design:index") == {}
+
+
+class TestStateCacheMaintenance:
+    """Test single-runner background maintenance"""
+
+    async def test_run_once_and_lock(self, cache):
+        cache.cache_design_state(completed_design(48))
+        first = StateCacheMaintenance(cache, interval_seconds=60, max_age_hours=24)
+        second = StateCacheMaintenance(cache, interval_seconds=60, max_age_hours=24)
+
+        assert await first.run_once() == 1
+        assert await second.run_once() is None
+        status = first.status()
+        assert status["last_deleted"] == 1
+        assert status["running"] is False
+
+    async def test_start_and_stop(self, cache):
+        maintenance = StateCacheMaintenance(cache, interval_seconds=3600)
+
+        maintenance.start()
+        await maintenance.stop()
+
+        assert maintenance._task is None
+
+
+class _FakeTime:
+    """Stand-in for the time module whose clock only advances on sleep."""
+
+    def __init__(self, sleeps):
+        self.sleeps = sleeps
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
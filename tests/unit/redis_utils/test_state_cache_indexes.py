@@ -0,0 +1,171 @@
+"""
+Tests for the sorted-set indexes of legacy StateCache entries
+"""
+
+import json
+import time
+
+import pytest
+
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.state_cache import StateCache
+
+
+@pytest.fixture
+def client(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return client
+
+
+@pytest.fixture
+def cache(client, monkeypatch):
+    def forbidden(*args, **kwargs):
+        raise AssertionError("StateCache must not use KEYS")
+
+    monkeypatch.setattr(client, "keys", forbidden)
+    return StateCache(client)
+
+
+def cache_states(cache, document_name, session_id, count):
+    return [
+        cache.cache_state(
+            {"step": i},
+            state_key=f"freecad:state:{document_name}:{session_id}:{i}",
+            document_name=document_name,
+            session_id=session_id,
+        )
+        for i in range(count)
+    ]
+
+
+class TestStateIndexes:
+    """Test listing, latest lookups and deletes through the indexes"""
+
+    def test_list_filters_by_document_and_session(self, cache):
+        part_s1 = cache_states(cache, "Part", "s1", 2)
+        part_s2 = cache_states(cache, "Part", "s2", 1)
+        gear_s1 = cache_states(cache, "Gear", "s1", 1)
+
+        assert cache.list_states() == part_s1 + part_s2 + gear_s1
+        assert cache.list_states("Part") == part_s1 + part_s2
+        assert cache.list_states(session_id="s1") == part_s1 + gear_s1
+        assert cache.list_states("Part", "s1") == part_s1
+
+    def test_pagination(self, cache):
+        keys = cache_states(cache, "Part", "s1", 5)
+
+        assert cache.list_states("Part", offset=1, limit=2) == keys[1:3]
+        assert cache.list_states("Part", offset=4, limit=2) == keys[4:]
+
+    def test_latest_is_most_recent_write(self, cache):
+        keys = cache_states(cache, "Part", "s1", 3)
+        # Rewriting an old key makes it the latest
+        cache.cache_state({"step": 0}, keys[0], "Part", "s1")
+
+        assert cache.get_latest_state("Part", "s1") == keys[0]
+        assert cache.get_latest_state("Gear") is None
+
+    def test_expired_entries_are_pruned(self, cache, client):
+        keys = cache_states(cache, "Part", "s1", 3)
+        client.connection.delete(keys[2])
+
+        assert cache.get_latest_state("Part") == keys[1]
+        assert cache.list_states("Part") == keys[:2]
+        assert client.zcard(cache._state_index("Part")) == 2
+
+    def test_delete_removes_from_every_index(self, cache, client):
+        keys = cache_states(cache, "Part", "s1", 2)
+
+        assert cache.delete_state(keys[1])
+        assert not cache.delete_state(keys[1])
+
+        for index_key in cache._indexes_for(
+            {"type": "state", "document_name": "Part", "session_id": "s1"}
+        ):
+            assert client.zrange(index_key, 0, -1) == keys[:1]
+        assert not client.exists(f"freecad:metadata:{keys[1]}")
+
+    def test_expiring_entries_bound_their_indexes(self, cache, client, monkeypatch):
+        meta = {"type": "state", "document_name": "Part", "session_id": "s1"}
+        old = cache.cache_state({"step": 0}, "freecad:state:old", "Part", "s1", 60)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+        new = cache.cache_state({"step": 1}, "freecad:state:new", "Part", "s1", 60)
+
+        # Members older than the entry TTL are trimmed on write
+        for index_key in cache._indexes_for(meta):
+            assert client.zrange(index_key, 0, -1) == [new]
+        assert old not in client.zrange(cache._state_index(), 0, -1)
+
+        # Document and session indexes expire with their entries
+        for index_key in cache._scoped_indexes(meta):
+            assert 0 < client.connection.ttl(index_key) <= 60
+        assert client.connection.ttl(cache._state_index()) == -1
+
+    def test_non_expiring_entry_keeps_indexes(self, cache, client):
+        cache.cache_state({"step": 0}, "freecad:state:a", "Part", "s1", 60)
+        cache.cache_state({"step": 1}, "freecad:state:b", "Part", "s1")
+
+        assert client.connection.ttl(cache._state_index(session_id="s1")) == -1
+        assert cache.list_states(session_id="s1") == [
+            "freecad:state:a",
+            "freecad:state:b",
+        ]
+
+
+class TestAnalysisIndexes:
+    """Test analysis listing by type and document"""
+
+    def test_list_and_latest(self, cache):
+        general = cache.cache_analysis({}, "freecad:analysis:a", "Part", "general")
+        detailed = cache.cache_analysis({}, "freecad:analysis:b", "Part", "detailed")
+        other = cache.cache_analysis({}, "freecad:analysis:c", "Gear", "general")
+
+        assert cache.list_analyses() == [general, detailed, other]
+        assert cache.list_analyses("Part") == [general, detailed]
+        assert cache.list_analyses(analysis_type="general") == [general, other]
+        assert cache.get_latest_analysis("Part", "general") == general
+
+
+class TestClearAndSummary:
+    """Test SCAN-based clearing, summaries and index rebuilds"""
+
+    def test_clear_document_keeps_others(self, cache, client):
+        cache_states(cache, "Part", "s1", 3)
+        gear = cache_states(cache, "Gear", "s1", 1)
+        # Unindexed key written by an older release
+        client.set("freecad:state:Part:legacy", json.dumps({"data": {}}))
+
+        assert cache.clear_all_states("Part") == 4
+        assert cache.list_states() == gear
+        assert cache.list_states(session_id="s1") == gear
+        assert not client.exists("freecad:state:Part:legacy")
+
+    def test_summary(self, cache):
+        cache_states(cache, "Part", "s1", 2)
+        cache.cache_analysis({}, "freecad:analysis:a", "Gear")
+
+        summary = cache.get_metadata_summary()
+
+        assert summary["total_states"] == 2
+        assert summary["total_analyses"] == 1
+        assert summary["documents"] == ["Part", "Gear"]
+
+    def test_clear_forgets_empty_documents(self, cache):
+        cache_states(cache, "Part", "s1", 1)
+        cache.cache_analysis({}, "freecad:analysis:a", "Gear")
+
+        cache.clear_all_states()
+
+        assert cache.get_metadata_summary()["documents"] == ["Gear"]
+
+    def test_rebuild_indexes(self, cache, client):
+        keys = cache_states(cache, "Part", "s1", 2)
+        for key in client.connection.scan_iter("freecad:index:*"):
+            client.delete(key)
+        assert cache.list_states() == []
+
+        assert cache.rebuild_indexes() == 2
+        assert sorted(cache.list_states("Part", "s1")) == keys
@@ -0,0 +1,159 @@
+"""
+Unit tests for the delta-encoded state history.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ai_designer.redis_utils.client import RedisClient
+from ai_designer.redis_utils.state_cache import StateCache
+from ai_designer.services import state_history
+from ai_designer.services.state_history import StateHistory
+
+
+@pytest.fixture
+def state_cache(mock_redis):
+    client = RedisClient()
+    client.connection = mock_redis
+    return StateCache(client)
+
+
+@pytest.fixture
+def history(state_cache):
+    return StateHistory(state_cache, snapshot_interval=4)
+
+
+def state_after_step(step):
+    return {
+        "objects": [
+            {
+                "name": f"Feature{i}",
+                "type": "PartDesign::Pad",
+                "length": i,
+                "placement": {"base": [0.0, 0.0, float(i)], "rotation": [0, 0, 0, 1]},
+                "valid": True,
+            }
+            for i in range(step + 1)
+        ],
+        "object_count": step + 1,
+        "step": step,
+    }
+
+
+def record_steps(history, count, **kwargs):
+    return [
+        history.append(state_after_step(i), "Part", "s1", label=f"step_{i}", **kwargs)
+        for i in range(count)
+    ]
+
+
+class TestStateHistory:
+    """Test appends, reconstruction and lookups"""
+
+    def test_every_entry_is_reconstructed(self, history):
+        keys = record_steps(history, 10)
+
+        for i, key in enumerate(keys):
+            assert history.get(key) == state_after_step(i)
+
+    def test_snapshots_every_interval(self, history, state_cache):
+        record_steps(history, 6)
+        stream = history._stream_key("Part", "s1")
+        entries = [
+            state_cache.codec.loads(raw)
+            for raw in state_cache.redis_client.lrange(stream, 0, -1)
+        ]
+
+        assert ["state" in entry for entry in entries] == [
+            True,
+            False,
+            False,
+            False,
+            True,
+            False,
+        ]
+
+    def test_history_is_smaller_than_snapshots(self, state_cache):
+        history = StateHistory(state_cache, snapshot_interval=20)
+        record_steps(history, 40)
+        stream = history._stream_key("Part", "s1")
+        stored = sum(len(raw) for raw in state_cache.redis_client.lrange(stream, 0, -1))
+        snapshots = sum(len(json.dumps(state_after_step(i))) for i in range(40))
+
+        assert stored * 4 < snapshots
+
+    def test_history_most_recent_first(self, history):
+        keys = record_steps(history, 7)
+
+        entries = history.history("Part", "s1", limit=3)
+
+        assert [e["key"] for e in entries] == keys[:3:-1]
+        assert [e["state"]["step"] for e in entries] == [6, 5, 4]
+        assert entries[0]["metadata"]["label"] == "step_6"
+        assert entries[0]["metadata"]["document_name"] == "Part"
+        assert entries[0]["metadata"]["key"] == keys[6]
+
+    def test_latest_with_partial_filters(self, history):
+        record_steps(history, 3)
+        history.append({"step": "other"}, "Gear", "s2")
+
+        assert history.latest("Part")["state"] == state_after_step(2)
+        assert history.latest(session_id="s2")["state"] == {"step": "other"}
+        assert history.latest()["state"] == {"step": "other"}
+        assert history.latest("Missing") is None
+
+    def test_state_at(self, history, monkeypatch):
+        clock = iter([100.0, 200.0, 300.0])
+        monkeypatch.setattr(
+            state_history, "time", SimpleNamespace(time=lambda: next(clock))
+        )
+        keys = record_steps(history, 3)
+
+        assert history.state_at(250.0, "Part", "s1")["key"] == keys[1]
+        assert history.state_at(50.0, "Part", "s1") is None
+
+    def test_appends_from_another_writer(self, history, state_cache):
+        other = StateHistory(state_cache, snapshot_interval=4)
+        history.append(state_after_step(0), "Part", "s1")
+        other.append(state_after_step(1), "Part", "s1")
+        key = history.append(state_after_step(2), "Part", "s1")
+
+        assert history.get(key) == state_after_step(2)
+        assert other.get(key) == state_after_step(2)
+
+    def test_long_history_is_trimmed(self, state_cache, monkeypatch):
+        clock = iter(float(t) for t in range(100))
+        monkeypatch.setattr(
+            state_history, "time", SimpleNamespace(time=lambda: next(clock))
+        )
+        history = StateHistory(state_cache, snapshot_interval=4, max_entries=6)
+        keys = record_steps(history, 11)
+        stream = history._stream_key("Part", "s1")
+
+        # Whole blocks of 4 are dropped, keeping at most 6 entries
+        assert state_cache.redis_client.llen(stream) == 3
+        assert state_cache.redis_client.zcard(f"{stream}:times") == 3
+        assert history.get(keys[7]) is None
+        assert history.get(keys[9]) == state_after_step(9)
+        assert [e["state"]["step"] for e in history.history("Part", "s1")] == [
+            10,
+            9,
+            8,
+        ]
+        assert history.state_at(5.0, "Part", "s1") is None
+        assert history.state_at(9.0, "Part", "s1")["key"] == keys[9]
+
+    def test_expiration(self, history, state_cache):
+        record_steps(history, 2, expiration=60)
+        stream = history._stream_key("Part", "s1")
+
+        assert 0 < state_cache.redis_client.ttl(stream) <= 60
+
+    def test_delete(self, history):
+        keys = record_steps(history, 2)
+
+        assert history.delete("Part", "s1")
+        assert history.get(keys[0]) is None
+        assert history.latest("Part") is None
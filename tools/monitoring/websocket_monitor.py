@@ -31,6 +31,7 @@ class SimpleWebSocketMonitor:
                 register_msg = {
                     "type": "register_session",
                     "session_id": self.session_id,
+                    "batch": True,
                 }
 
                 await websocket.send(json.dumps(register_msg))
@@ -55,6 +56,13 @@ class SimpleWebSocketMonitor:
         try:
             data = json.loads(message)
             msg_type = data.get("type", "unknown")
+
+            if msg_type == "batch":
+                # Several queued updates in one frame
+                for inner in data.get("messages", []):
+                    await self.handle_message(json.dumps(inner))
+                return
+
             timestamp = data.get("timestamp", datetime.now().isoformat())
             msg_data = data.get("data", {})
 